@@ -0,0 +1,10 @@
+# accounts/tasks.py
+
+from core.queue import task
+from .tokens import purge_expired_tokens
+
+
+@task('accounts.purge_expired_tokens')
+def purge_expired_tokens_task():
+    # 만료된 refresh 토큰(발급/폐기 목록) 삭제 - 토큰 테이블 크기를 유효 기간 안의 토큰 수로 유지
+    purge_expired_tokens()
@@ -1,12 +1,19 @@
 # accounts/tests.py
 
-from django.test import TestCase
+from datetime import timedelta
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
 from rest_framework_simplejwt.tokens import RefreshToken
 from members.models import Trainer, Member
+from .tokens import BloomFilter, RevocableRefreshToken, RevocationList, purge_expired_tokens, revocation_list
 import json
 
 User = get_user_model()
@@ -832,4 +839,120 @@ class IntegrationTest(APITestCase):
         
         # 3. 다시 정상 로그인
         final_response = self.client.post(self.login_url, login_data, format='json')
-        self.assertEqual(final_response.status_code, status.HTTP_200_OK)
\ No newline at end of file
+        self.assertEqual(final_response.status_code, status.HTTP_200_OK)
+
+
+class TokenRevocationTest(APITestCase):
+    # refresh 토큰 폐기(블랙리스트) 및 블룸 필터 테스트
+
+    def setUp(self):
+        cache.clear()
+        revocation_list.reset()
+        self.client = APIClient()
+        self.login_url = reverse('accounts:login_api')
+        self.logout_url = reverse('accounts:logout')
+        self.token_refresh_url = reverse('accounts:token_refresh')
+        self.trainer = Trainer.objects.create_user(
+            email='trainer@test.com',
+            name='테스트 트레이너',
+            password='testpass123!@#',
+            user_type='trainer'
+        )
+
+    def login(self):
+        response = self.client.post(
+            self.login_url, {'email': 'trainer@test.com', 'password': 'testpass123!@#'}, format='json'
+        )
+        return response.data['tokens']
+
+    def test_bloom_filter_has_no_false_negatives(self):
+        bloom = BloomFilter(1000, 0.01)
+        for i in range(1000):
+            bloom.add(f'jti-{i}')
+
+        self.assertTrue(all(f'jti-{i}' in bloom for i in range(1000)))
+        false_positives = sum(f'other-{i}' in bloom for i in range(1000))
+        self.assertLess(false_positives, 50)
+
+    def test_rotated_refresh_token_cannot_be_reused(self):
+        tokens = self.login()
+
+        response = self.client.post(self.token_refresh_url, {'refresh': tokens['refresh']}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.post(self.token_refresh_url, {'refresh': tokens['refresh']}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_logout_revokes_session_refresh_token(self):
+        tokens = self.login()
+        # 갱신 후 받은 access 토큰은 새 refresh 토큰을 가리킴
+        refreshed = self.client.post(self.token_refresh_url, {'refresh': tokens['refresh']}, format='json').data
+
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {refreshed['access']}")
+        response = self.client.post(self.logout_url, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data['token_revoked'])
+        response = self.client.post(self.token_refresh_url, {'refresh': refreshed['refresh']}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_logout_revokes_refresh_token_from_body(self):
+        tokens = self.login()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+
+        response = self.client.post(self.logout_url, {'refresh': tokens['refresh']}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data['token_revoked'])
+        response = self.client.post(self.logout_url, {'refresh': tokens['refresh']}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_logout_rejects_other_users_refresh_token(self):
+        other = Member.objects.create_user(email='member@test.com', password='testpass123!@#', user_type='member')
+        other_refresh = RevocableRefreshToken.for_user(other)
+        tokens = self.login()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+
+        response = self.client.post(self.logout_url, {'refresh': str(other_refresh)}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(BlacklistedToken.objects.exists())
+
+    def test_unrevoked_token_check_skips_blacklist_query(self):
+        refresh = RevocableRefreshToken.for_user(self.trainer)
+        revocation_list.is_revoked('warm-up')
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertFalse(revocation_list.is_revoked(refresh['jti']))
+
+        self.assertFalse(any('blacklistedtoken' in query['sql'] for query in queries.captured_queries))
+
+    @override_settings(TOKEN_REVOCATION_VERSION_CHECK=0)
+    def test_revocation_seen_by_other_worker(self):
+        other_worker = RevocationList()
+        refresh = RevocableRefreshToken.for_user(self.trainer)
+        self.assertFalse(other_worker.is_revoked(refresh['jti']))
+
+        refresh.blacklist()
+
+        self.assertTrue(other_worker.is_revoked(refresh['jti']))
+
+    def test_shared_version_checked_once_per_interval(self):
+        # 확인 주기 안에서는 공유 캐시(DatabaseCache) 조회 없이 워커 필터만 사용
+        refresh = RevocableRefreshToken.for_user(self.trainer)
+        revocation_list.is_revoked('warm-up')
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertFalse(revocation_list.is_revoked(refresh['jti']))
+
+        self.assertEqual(queries.captured_queries, [])
+
+    def test_purge_expired_tokens(self):
+        expired = RevocableRefreshToken.for_user(self.trainer)
+        expired.blacklist()
+        OutstandingToken.objects.filter(jti=expired['jti']).update(expires_at=timezone.now() - timedelta(seconds=1))
+        active = RevocableRefreshToken.for_user(self.trainer)
+
+        self.assertEqual(purge_expired_tokens(batch_size=1), 1)
+
+        self.assertEqual(list(OutstandingToken.objects.values_list('jti', flat=True)), [active['jti']])
+        self.assertFalse(BlacklistedToken.objects.exists())
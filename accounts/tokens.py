@@ -0,0 +1,183 @@
+# accounts/tokens.py
+# Refresh 토큰 폐기(블랙리스트) 확인
+# - 폐기된 JTI를 프로세스 내부 블룸 필터로 먼저 확인해, 필터에 없는 토큰(대부분)은 DB 조회 없이 통과
+# - 필터에 있으면 DB로 확인 (오탐률 TOKEN_REVOCATION_FILTER_ERROR_RATE)
+# - 폐기 시 공유 캐시의 버전을 바꾸고, 다른 워커는 다음 확인 때 새로 폐기된 행만 불러와 필터에 추가
+# - 공유 버전은 TOKEN_REVOCATION_VERSION_CHECK초에 한 번만 확인 (DatabaseCache에서도 요청마다 조회하지 않음)
+#   다른 워커에서 폐기한 토큰은 최대 이 시간만큼 늦게 반영됨 (같은 워커는 즉시 반영)
+# - TOKEN_REVOCATION_FILTER_REBUILD초마다 만료되지 않은 폐기 토큰으로 필터를 새로 만듦 (만료된 JTI 제거)
+
+import hashlib
+import math
+import threading
+import time
+from django.conf import settings
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
+from core import cache
+
+# 폐기 버전 (core.cache 태그 버전 사용 - 폐기할 때마다 새 버전)
+REVOCATION_TAG = 'accounts:revoked-tokens'
+
+# access 토큰에 담는 발급 refresh 토큰 JTI (로그아웃 시 요청 본문 없이 해당 refresh 토큰 폐기)
+REFRESH_JTI_CLAIM = 'rjti'
+
+# 증분 로딩 시 마지막 id보다 이만큼 앞에서부터 다시 읽음 (id 순서와 커밋 순서가 다른 행 포함)
+SYNC_OVERLAP = 100
+
+
+class BloomFilter:
+    # 고정 크기 비트 배열 블룸 필터 - 없다고 하면 반드시 없음, 있다고 하면 오탐 가능
+
+    def __init__(self, capacity, error_rate):
+        self.capacity = capacity
+        self.size = max(64, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item):
+        # 해시 하나를 두 값으로 나눠 hash_count개 위치 생성 (double hashing)
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        return [(first + i * second) % self.size for i in range(self.hash_count)]
+
+    def add(self, item):
+        if item in self:
+            return
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item):
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class RevocationList:
+    # 폐기된 refresh 토큰 JTI 목록 (워커별 블룸 필터 + DB)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self._filter = None
+        self._version = None
+        self._watermark = 0
+        self._built_at = 0.0
+        self._checked_at = 0.0
+
+    def is_revoked(self, jti):
+        self._sync()
+        if jti not in self._filter:
+            return False
+        return BlacklistedToken.objects.filter(token__jti=jti).exists()
+
+    def mark_revoked(self, jti):
+        # 이 워커 필터에 바로 추가하고 다른 워커가 다시 불러오도록 버전 변경 (커밋 후 한 번 더)
+        with self._lock:
+            if self._filter is not None:
+                self._filter.add(jti)
+        cache.invalidate_tags(REVOCATION_TAG)
+
+    def _sync(self):
+        # 불러오는 도중 추가된 폐기는 버전이 다시 바뀌므로 다음 확인 때 반영
+        if self._filter is not None and time.monotonic() - self._checked_at < settings.TOKEN_REVOCATION_VERSION_CHECK:
+            return
+        version = cache.get_tag_versions([REVOCATION_TAG])[REVOCATION_TAG]
+        with self._lock:
+            self._checked_at = time.monotonic()
+            if (
+                self._filter is None
+                or time.monotonic() - self._built_at > settings.TOKEN_REVOCATION_FILTER_REBUILD
+                or self._filter.count > self._filter.capacity
+            ):
+                self._rebuild()
+            elif version != self._version:
+                self._load_recent()
+            self._version = version
+
+    def _rebuild(self):
+        watermark = BlacklistedToken.objects.order_by('-id').values_list('id', flat=True).first() or 0
+        jtis = list(
+            BlacklistedToken.objects.filter(token__expires_at__gt=timezone.now()).values_list('token__jti', flat=True)
+        )
+        revoked = BloomFilter(
+            max(len(jtis) * 2, settings.TOKEN_REVOCATION_FILTER_CAPACITY),
+            settings.TOKEN_REVOCATION_FILTER_ERROR_RATE
+        )
+        for jti in jtis:
+            revoked.add(jti)
+        self._filter, self._watermark, self._built_at = revoked, watermark, time.monotonic()
+
+    def _load_recent(self):
+        rows = BlacklistedToken.objects.filter(id__gt=self._watermark - SYNC_OVERLAP).values_list('id', 'token__jti')
+        for row_id, jti in rows:
+            self._filter.add(jti)
+            self._watermark = max(self._watermark, row_id)
+
+
+revocation_list = RevocationList()
+
+
+class RevocableRefreshToken(RefreshToken):
+    # 블룸 필터로 폐기 여부를 확인하는 refresh 토큰
+
+    def check_blacklist(self):
+        if revocation_list.is_revoked(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_('Token is blacklisted'))
+
+    def blacklist(self):
+        result = super().blacklist()
+        revocation_list.mark_revoked(self.payload[api_settings.JTI_CLAIM])
+        return result
+
+    @property
+    def access_token(self):
+        access = super().access_token
+        access[REFRESH_JTI_CLAIM] = self.payload[api_settings.JTI_CLAIM]
+        return access
+
+
+class RevocableTokenRefreshSerializer(TokenRefreshSerializer):
+    token_class = RevocableRefreshToken
+
+    def validate(self, attrs):
+        data = super().validate(attrs)
+        if 'refresh' in data:
+            # 갱신 전 토큰 기준으로 만든 access 토큰을 새 refresh 토큰 기준으로 다시 발급
+            # (서명은 방금 만든 토큰이므로 다시 검증하지 않음)
+            data['access'] = str(self.token_class(data['refresh'], verify=False).access_token)
+        return data
+
+
+def revoke_refresh_jti(jti, user):
+    # 사용자의 refresh 토큰 폐기 (없거나 다른 사용자 토큰이면 False)
+    token = OutstandingToken.objects.filter(jti=jti, user=user).first()
+    if token is None:
+        return False
+    BlacklistedToken.objects.get_or_create(token=token)
+    revocation_list.mark_revoked(jti)
+    return True
+
+
+def purge_expired_tokens(batch_size=None):
+    # 만료된 발급/폐기 토큰 삭제 후 삭제한 발급 토큰 수 반환 (한 번에 batch_size개씩)
+    if batch_size is None:
+        batch_size = settings.TOKEN_PURGE_BATCH_SIZE
+    now = timezone.now()
+    deleted = 0
+    while True:
+        ids = list(OutstandingToken.objects.filter(expires_at__lte=now).values_list('id', flat=True)[:batch_size])
+        if not ids:
+            break
+        BlacklistedToken.objects.filter(token_id__in=ids).delete()
+        OutstandingToken.objects.filter(id__in=ids).delete()
+        deleted += len(ids)
+    return deleted
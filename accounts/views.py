@@ -3,22 +3,23 @@
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
 from django.db import IntegrityError, DatabaseError
-from drf_spectacular.utils import extend_schema_view,extend_schema, OpenApiResponse, OpenApiExample
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework_simplejwt.exceptions import TokenError, InvalidToken, TokenBackendError
 from rest_framework_simplejwt.serializers import TokenRefreshSerializer
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.settings import api_settings
 from rest_framework_simplejwt.views import TokenRefreshView
+from trainmate.schema import extend_schema_view, extend_schema, OpenApiResponse, OpenApiExample
 from .serializers import SignupSerializer, LoginSerializer
+from .tokens import REFRESH_JTI_CLAIM, RevocableRefreshToken, revoke_refresh_jti
 
 User = get_user_model()
 
 # 사용자 JWT 토큰 생성
 def get_tokens_for_user(user):
-    refresh = RefreshToken.for_user(user)
+    refresh = RevocableRefreshToken.for_user(user)
 
     # 커스텀 claim 추가
     refresh['user_type'] = user.user_type
@@ -260,7 +261,16 @@ def login_api(request):
 @extend_schema(
     operation_id='user_logout',
     summary="로그아웃",
-    description="클라이언트에서 토큰을 삭제하여 로그아웃합니다.",
+    description=(
+        "현재 세션의 refresh token을 폐기합니다. 요청 본문에 refresh token을 보내면 해당 토큰을, "
+        "없으면 access token을 발급한 refresh token을 폐기합니다. 클라이언트는 저장된 토큰을 삭제합니다."
+    ),
+    request={
+        'application/json': {
+            'type': 'object',
+            'properties': {'refresh': {'type': 'string', 'description': '폐기할 refresh token (선택)'}}
+        }
+    },
     responses={
         200: OpenApiResponse(
             response=dict,
@@ -270,11 +280,13 @@ def login_api(request):
                     "로그아웃 성공",
                     value={
                         "success": True,
-                        "message": "로그아웃이 완료되었습니다."
+                        "message": "로그아웃이 완료되었습니다.",
+                        "token_revoked": True
                     }
                 )
             ]
         ),
+        400: OpenApiResponse(description="유효하지 않거나 이미 폐기된 refresh token"),
         401: OpenApiResponse(description="인증 실패")
     },
     tags=["인증"]
@@ -282,10 +294,32 @@ def login_api(request):
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def logout_api(request):
+    refresh = request.data.get('refresh')
+    if refresh:
+        try:
+            token = RevocableRefreshToken(refresh)
+        except TokenError:
+            token = None
+        if token is None or str(token.payload.get(api_settings.USER_ID_CLAIM)) != str(request.user.id):
+            return Response({
+                'success': False,
+                'message': '유효하지 않거나 이미 폐기된 refresh 토큰입니다.',
+                'errors': {}
+            }, status=status.HTTP_400_BAD_REQUEST)
+
     try:
+        if refresh:
+            token.blacklist()
+            token_revoked = True
+        else:
+            # access 토큰을 발급한 refresh 토큰 폐기 (JWT 인증일 때만)
+            jti = request.auth.get(REFRESH_JTI_CLAIM) if hasattr(request.auth, 'payload') else None
+            token_revoked = bool(jti) and revoke_refresh_jti(jti, request.user)
+
         return Response({
             'success': True,
             'message': '로그아웃이 완료되었습니다.',
+            'token_revoked': token_revoked,
             'user_info': {
                 'id': request.user.id,
                 'email': request.user.email,
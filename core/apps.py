@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+from django.utils.module_loading import autodiscover_modules
+
+
+class CoreConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'core'
+
+    def ready(self):
+        # 각 앱의 tasks.py에 정의된 백그라운드 작업, events.py에 정의된 도메인 이벤트/구독자 등록
+        autodiscover_modules('tasks')
+        autodiscover_modules('events')
@@ -0,0 +1,117 @@
+# core/batch.py
+
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.db import connection
+from django.http import HttpRequest, QueryDict
+from django.urls import Resolver404, resolve
+
+logger = logging.getLogger(__name__)
+
+# 하위 요청에 넘기지 않는 헤더 (본문/조건부 요청 관련)
+_EXCLUDED_META = ('CONTENT_TYPE', 'CONTENT_LENGTH', 'HTTP_IF_NONE_MATCH', 'HTTP_IF_MODIFIED_SINCE', 'wsgi.input')
+
+
+class BatchError(Exception):
+    pass
+
+
+def parse_batch_items(payload):
+    # 요청 본문의 requests 목록 검증 -> [(id, path, query_string)]
+    items = payload.get('requests') if isinstance(payload, dict) else None
+    if not isinstance(items, list) or not items:
+        raise BatchError('requests 목록이 필요합니다.')
+    if len(items) > settings.BATCH_MAX_REQUESTS:
+        raise BatchError(f'한 번에 최대 {settings.BATCH_MAX_REQUESTS}개까지 요청할 수 있습니다.')
+
+    parsed = []
+    for index, item in enumerate(items):
+        if isinstance(item, str):
+            item = {'path': item}
+        path = item.get('path') if isinstance(item, dict) else None
+        if not isinstance(path, str) or not path.startswith(settings.BATCH_PATH_PREFIX):
+            raise BatchError(f'{index}번째 요청의 path는 {settings.BATCH_PATH_PREFIX}로 시작해야 합니다.')
+        method = item.get('method', 'GET')
+        if method != 'GET':
+            raise BatchError(f'{index}번째 요청: GET 요청만 묶을 수 있습니다.')
+        split = urlsplit(path)
+        parsed.append((item.get('id', index), split.path, split.query))
+    return parsed
+
+
+def _build_subrequest(request, path, query_string):
+    # 상위 요청에서 인증된 사용자를 그대로 넘김 (DRF 뷰는 권한 검사만 다시 수행)
+    subrequest = HttpRequest()
+    subrequest.method = 'GET'
+    subrequest.path = subrequest.path_info = path
+    subrequest.META = {key: value for key, value in request.META.items() if key not in _EXCLUDED_META}
+    subrequest.META.update(REQUEST_METHOD='GET', PATH_INFO=path, QUERY_STRING=query_string)
+    subrequest.GET = QueryDict(query_string)
+    subrequest.COOKIES = request.COOKIES
+    subrequest.user = request.user
+    subrequest._force_auth_user = request.user
+    subrequest._force_auth_token = request.auth
+    return subrequest
+
+
+def _error(status_code, message):
+    return status_code, {'success': False, 'message': message}
+
+
+def _execute(request, path, query_string):
+    # 하위 요청 하나 실행 -> (상태 코드, 본문)
+    try:
+        match = resolve(path)
+    except Resolver404:
+        return _error(404, '요청한 경로를 찾을 수 없습니다.')
+    if getattr(match.func, 'batch_exempt', False) or iscoroutinefunction(match.func):
+        return _error(400, '묶음 요청으로 호출할 수 없는 API입니다.')
+
+    try:
+        response = match.func(_build_subrequest(request, path, query_string), *match.args, **match.kwargs)
+    except Exception:
+        # DRF 뷰는 예외를 응답으로 바꾸므로 그 밖의 뷰에서 난 오류만 여기로 옴
+        logger.exception('묶음 하위 요청 실패: %s', path)
+        return _error(500, '서버 오류가 발생했습니다.')
+    if response.streaming:
+        # 파일 내보내기 등 스트리밍 응답은 개별 요청으로 받아야 함
+        response.close()
+        return _error(400, '스트리밍 응답은 묶음 요청으로 받을 수 없습니다.')
+
+    if hasattr(response, 'data'):
+        # DRF 응답은 렌더링 전 데이터를 그대로 사용 (상위 응답에서 한 번만 JSON으로 렌더링)
+        return response.status_code, response.data
+    data = None
+    if response.content and 'json' in response.get('Content-Type', ''):
+        data = json.loads(response.content)
+    return response.status_code, data
+
+
+def _execute_in_thread(request, path, query_string):
+    try:
+        return _execute(request, path, query_string)
+    finally:
+        # 스레드마다 열린 DB 연결 정리
+        connection.close()
+
+
+def execute_batch(request, items, concurrent=False):
+    # 하위 요청을 순서대로(또는 스레드 풀에서 동시에) 실행해 결과를 요청 순서대로 반환
+    if concurrent and len(items) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(items), settings.BATCH_MAX_WORKERS)) as executor:
+            futures = [
+                executor.submit(_execute_in_thread, request, path, query_string)
+                for _, path, query_string in items
+            ]
+            results = [future.result() for future in futures]
+    else:
+        results = [_execute(request, path, query_string) for _, path, query_string in items]
+
+    return [
+        {'id': item_id, 'status': status_code, 'body': body}
+        for (item_id, _, _), (status_code, body) in zip(items, results)
+    ]
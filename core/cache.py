@@ -0,0 +1,220 @@
+# core/cache.py
+# 2단계 캐시
+# - L1: 프로세스 내부 LRU (항목 수/유지 시간 제한, 스레드 안전) - 다른 워커의 무효화는 유지 시간이 지나야 반영
+# - L2: 공유 캐시 (CACHES['default'] - 기본 DB 테이블, CACHE_REDIS_URL 설정 시 Redis)
+# 태그: L2 항목에 저장 시점의 태그 버전을 함께 저장하고, 조회 시 현재 버전과 다르면 무효로 처리
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from django.conf import settings
+from django.core.cache import cache as shared_cache
+from django.db import transaction
+from rest_framework.response import Response
+
+_MISSING = object()
+
+
+class LocalCache:
+    # 프로세스 내부 LRU 캐시 - key -> (만료 시각, 값, 태그)
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            if entry[0] <= now:
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, value, ttl, tags=()):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value, frozenset(tags))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                # 가장 오래 사용하지 않은 항목부터 제거
+                self._entries.popitem(last=False)
+
+    def delete(self, keys):
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def delete_tags(self, tags):
+        tags = frozenset(tags)
+        with self._lock:
+            for key in [key for key, entry in self._entries.items() if entry[2] & tags]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+local_cache = LocalCache(settings.CACHE_LOCAL_MAX_ENTRIES)
+
+
+def tag_version_key(tag):
+    return f'cache:tag:{tag}'
+
+
+def get_tag_versions(tags):
+    # 태그 -> 현재 버전 (없으면 새로 만듦 - 캐시에서 밀려나도 이전 버전과 겹치지 않도록 현재 시각(ns) 사용)
+    if not tags:
+        return {}
+    keys = {tag_version_key(tag): tag for tag in tags}
+    versions = shared_cache.get_many(list(keys))
+    missing = [key for key in keys if key not in versions]
+    if missing:
+        for key in missing:
+            # 다른 워커가 먼저 만든 버전이 있으면 유지
+            shared_cache.add(key, time.time_ns(), None)
+        versions.update(shared_cache.get_many(missing))
+    return {keys[key]: version for key, version in versions.items()}
+
+
+def get(key, default=None, local_ttl=0):
+    # L1 -> L2 순으로 조회 (태그 버전이 바뀐 L2 항목은 없는 것으로 처리)
+    # local_ttl이 있으면 L2에서 읽은 값을 L1에 보관
+    value = local_cache.get(key, _MISSING)
+    if value is not _MISSING:
+        return value
+
+    entry = shared_cache.get(key)
+    if entry is None:
+        return default
+    value, tag_versions = entry
+    if tag_versions and get_tag_versions(list(tag_versions)) != tag_versions:
+        return default
+    if local_ttl:
+        local_cache.set(key, value, local_ttl, tag_versions)
+    return value
+
+
+def set(key, value, timeout, tags=(), local_ttl=0, tag_versions=None):
+    # L2에 값과 태그 버전을 저장 (tag_versions: 값을 만들기 전에 읽은 버전 - 그 사이 무효화되면 바로 무효)
+    if tag_versions is None:
+        tag_versions = get_tag_versions(tags)
+    shared_cache.set(key, (value, tag_versions), timeout)
+    if local_ttl:
+        local_cache.set(key, value, local_ttl, tag_versions)
+
+
+def set_many(mapping, timeout, local_ttl=0):
+    # 태그 없는 여러 항목 저장
+    shared_cache.set_many({key: (value, {}) for key, value in mapping.items()}, timeout)
+    if local_ttl:
+        for key, value in mapping.items():
+            local_cache.set(key, value, local_ttl)
+
+
+def get_or_set(key, default_func, timeout, tags=(), local_ttl=0):
+    # 캐시에 없으면 default_func() 결과를 저장해 반환 (None은 저장하지 않음)
+    value = get(key, _MISSING, local_ttl)
+    if value is not _MISSING:
+        return value
+    tag_versions = get_tag_versions(tags)
+    value = default_func()
+    if value is not None:
+        set(key, value, timeout, local_ttl=local_ttl, tag_versions=tag_versions)
+    return value
+
+
+def _on_commit_again(clear):
+    # 즉시 삭제 후 트랜잭션 커밋 뒤 한 번 더 삭제 (커밋 전에 다른 요청이 이전 값을 다시 적재한 경우 제거)
+    clear()
+    transaction.on_commit(clear)
+
+
+def delete(*keys):
+    keys = [key for key in keys if key is not None]
+    if not keys:
+        return
+
+    def clear():
+        local_cache.delete(keys)
+        shared_cache.delete_many(keys)
+
+    _on_commit_again(clear)
+
+
+def invalidate_tags(*tags):
+    # 태그가 붙은 모든 항목 무효화 (L2는 태그 버전 삭제 - 다음 조회 때 새 버전 생성)
+    tags = [tag for tag in tags if tag is not None]
+    if not tags:
+        return
+
+    def clear():
+        local_cache.delete_tags(tags)
+        shared_cache.delete_many([tag_version_key(tag) for tag in tags])
+
+    _on_commit_again(clear)
+
+
+def _digest(value):
+    return hashlib.md5(repr(value).encode(), usedforsecurity=False).hexdigest()
+
+
+def cached_call(timeout, tags=None, local_ttl=0, key_prefix=None):
+    # 함수 결과 캐시 - 인자의 repr로 키를 만들므로 인자는 숫자/문자열/날짜 등 repr이 값을 나타내는 타입만 사용
+    # tags: 태그 목록 또는 함수와 같은 인자를 받아 태그 목록을 반환하는 함수
+    # 데코레이트된 함수의 invalidate(*args, **kwargs)로 해당 인자의 캐시 삭제
+    def decorator(func):
+        prefix = key_prefix or f'{func.__module__}.{func.__qualname__}'
+
+        def cache_key(*args, **kwargs):
+            return f'call:{prefix}:{_digest((args, sorted(kwargs.items())))}'
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            call_tags = tags(*args, **kwargs) if callable(tags) else (tags or ())
+            return get_or_set(
+                cache_key(*args, **kwargs), lambda: func(*args, **kwargs), timeout, call_tags, local_ttl
+            )
+
+        wrapper.cache_key = cache_key
+        wrapper.invalidate = lambda *args, **kwargs: delete(cache_key(*args, **kwargs))
+        return wrapper
+    return decorator
+
+
+def cached_view(timeout, tags=None, per_user=True, local_ttl=0):
+    # DRF 함수 뷰의 GET 200 응답 데이터 캐시
+    # 인증/권한 검사 뒤에 실행되도록 @api_view, @permission_classes 아래에 둠
+    # per_user: 요청한 사용자별로 따로 캐시 (응답이 사용자와 무관한 경우만 False)
+    # tags: 태그 목록 또는 뷰와 같은 인자(request, **kwargs)를 받아 태그 목록을 반환하는 함수
+    def decorator(view):
+        prefix = f'{view.__module__}.{view.__qualname__}'
+
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.method != 'GET':
+                return view(request, *args, **kwargs)
+
+            user_key = request.user.pk if per_user else '-'
+            key = f'view:{prefix}:{user_key}:{_digest(request.get_full_path())}'
+            cached = get(key, local_ttl=local_ttl)
+            if cached is not None:
+                return Response(cached)
+
+            view_tags = tags(request, *args, **kwargs) if callable(tags) else (tags or ())
+            tag_versions = get_tag_versions(view_tags)
+            response = view(request, *args, **kwargs)
+            if response.status_code == 200 and getattr(response, 'data', None) is not None:
+                set(key, response.data, timeout, local_ttl=local_ttl, tag_versions=tag_versions)
+            return response
+        return wrapper
+    return decorator
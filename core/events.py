@@ -0,0 +1,210 @@
+# core/events.py
+
+import logging
+from collections import defaultdict
+from datetime import timedelta
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+from .models import Job, OutboxEvent
+from .queue import enqueue
+
+logger = logging.getLogger(__name__)
+
+# event_type -> 이벤트 클래스
+_event_classes = {}
+
+# event_type -> [(구독 함수, 중복 제거 키 함수)]
+_sync_subscribers = defaultdict(list)
+_async_subscribers = defaultdict(list)
+
+DISPATCH_TASK = 'core.dispatch_events'
+
+
+class DomainEvent:
+    # 도메인 이벤트 기본 클래스
+    # 하위 클래스는 event_type과 fields(필수 필드 이름)를 정의, 필드 값은 JSON으로 저장 가능해야 함
+    event_type = None
+    fields = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.event_type:
+            _event_classes[cls.event_type] = cls
+
+    def __init__(self, **payload):
+        missing = [field for field in self.fields if field not in payload]
+        if missing:
+            raise TypeError(f"{type(self).__name__}에 필요한 필드가 없습니다: {', '.join(missing)}")
+        self.payload = payload
+
+    def __getattr__(self, name):
+        try:
+            return self.__dict__['payload'][name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.payload!r})'
+
+    @staticmethod
+    def from_outbox(row):
+        event_class = _event_classes.get(row.event_type)
+        if event_class is None:
+            return None
+        return event_class(**row.payload)
+
+
+def subscribe(event_classes, handler, asynchronous=False, coalesce=None):
+    # 이벤트 구독 등록
+    # handler(events)는 이벤트 목록을 받음
+    # - 동기 구독자: 커밋 직후 요청 스레드에서 이벤트마다 호출 (실시간 피드 등 가벼운 작업)
+    # - 비동기 구독자: 작업 워커가 아웃박스에서 모아 호출 - coalesce(event)가 같은 이벤트는 마지막 것만 전달
+    if isinstance(event_classes, type):
+        event_classes = [event_classes]
+    subscribers = _async_subscribers if asynchronous else _sync_subscribers
+    for event_class in event_classes:
+        subscribers[event_class.event_type].append((handler, coalesce))
+
+
+def _call_handler(handler, events, coalesce):
+    if coalesce is not None:
+        latest = {}
+        for event in events:
+            key = coalesce(event)
+            # 나중 이벤트가 순서상 뒤에 오도록 기존 키를 지우고 다시 넣음
+            latest.pop(key, None)
+            latest[key] = event
+        events = list(latest.values())
+    handler(events)
+
+
+def _dispatch_sync(event):
+    for handler, coalesce in _sync_subscribers.get(event.event_type, ()):
+        try:
+            _call_handler(handler, [event], coalesce)
+        except Exception:
+            # 커밋 이후이므로 쓰기에는 영향 없음 - 기록만 남김
+            logger.exception('동기 이벤트 구독자 실패: %s', event.event_type)
+
+
+def _schedule_dispatch():
+    # 대기 중인 전달 작업이 없을 때만 등록 (연속된 쓰기의 이벤트를 한 작업이 모아서 전달)
+    if settings.JOB_QUEUE_EAGER:
+        enqueue(DISPATCH_TASK)
+        return
+    if not Job.objects.filter(name=DISPATCH_TASK, status=Job.STATUS_PENDING).exists():
+        enqueue(DISPATCH_TASK, run_at=timezone.now() + timedelta(seconds=settings.EVENT_DISPATCH_DELAY))
+
+
+def publish(event):
+    # 현재 트랜잭션에 이벤트 기록 (롤백되면 이벤트도 사라짐)
+    # 비동기 구독자가 없는 이벤트는 기록만 남기고 전달 완료로 저장
+    has_async = event.event_type in _async_subscribers
+    OutboxEvent.objects.create(
+        event_type=event.event_type,
+        payload=event.payload,
+        dispatched_at=None if has_async else timezone.now()
+    )
+    if has_async:
+        _schedule_dispatch()
+    if event.event_type in _sync_subscribers:
+        transaction.on_commit(lambda: _dispatch_sync(event))
+
+
+def _schedule_retry():
+    # 실패한 이벤트를 EVENT_DISPATCH_RETRY_DELAY초 후 다시 전달 (대기 중인 전달 작업이 있으면 그 작업이 처리)
+    if settings.JOB_QUEUE_EAGER:
+        return
+    if not Job.objects.filter(name=DISPATCH_TASK, status=Job.STATUS_PENDING).exists():
+        enqueue(DISPATCH_TASK, run_at=timezone.now() + timedelta(seconds=settings.EVENT_DISPATCH_RETRY_DELAY))
+
+
+def _deliver(handler, items, coalesce, failures):
+    # 구독자에게 이벤트 목록 전달 - 실패하면 이벤트별로 다시 호출해 실패한 이벤트만 찾음
+    # 각 호출은 savepoint 안에서 실행하므로 실패한 호출의 쓰기만 롤백됨
+    try:
+        with transaction.atomic():
+            _call_handler(handler, [event for _, event in items], coalesce)
+        return
+    except Exception:
+        logger.exception('비동기 이벤트 구독자 실패 - 이벤트별로 다시 전달: %s', items[0][1].event_type)
+
+    for row, event in items:
+        if row.id in failures:
+            continue
+        try:
+            with transaction.atomic():
+                handler([event])
+        except Exception as e:
+            failures[row.id] = f'{getattr(handler, "__qualname__", handler)}: {type(e).__name__}: {e}'[:1000]
+
+
+def dispatch_outbox(batch_size=None):
+    # 아직 전달하지 않은 이벤트를 배치 단위로 비동기 구독자에게 전달 (반환: 전달 완료한 이벤트 수)
+    # 구독자가 실패한 이벤트만 오류와 실패 횟수를 기록하고 나머지는 전달 완료로 커밋 (최소 한 번 전달)
+    # 실패한 이벤트는 다음 전달 작업에서 다시 시도하고, EVENT_DISPATCH_MAX_ATTEMPTS번 실패하면 전달 중단(parked)
+    if batch_size is None:
+        batch_size = settings.EVENT_DISPATCH_BATCH_SIZE
+
+    dispatched = 0
+    retry = False
+    last_id = 0
+    while True:
+        with transaction.atomic():
+            # 이번 실행에서 실패한 이벤트는 다시 읽지 않도록 마지막 id 이후만 조회
+            pending = OutboxEvent.objects.filter(
+                dispatched_at__isnull=True, parked_at__isnull=True, id__gt=last_id
+            ).order_by('id')
+            if connection.features.has_select_for_update_skip_locked:
+                # 다른 워커가 전달 중인 이벤트는 건너뜀
+                pending = pending.select_for_update(skip_locked=True)
+            rows = list(pending[:batch_size])
+            if not rows:
+                break
+            last_id = rows[-1].id
+
+            items_by_type = defaultdict(list)
+            for row in rows:
+                event = DomainEvent.from_outbox(row)
+                if event is not None:
+                    items_by_type[row.event_type].append((row, event))
+
+            failures = {}
+            for event_type, items in items_by_type.items():
+                for handler, coalesce in _async_subscribers.get(event_type, ()):
+                    _deliver(handler, items, coalesce, failures)
+
+            now = timezone.now()
+            delivered_ids = [row.id for row in rows if row.id not in failures]
+            OutboxEvent.objects.filter(id__in=delivered_ids).update(dispatched_at=now)
+            for row in rows:
+                if row.id not in failures:
+                    continue
+                parked = row.attempts + 1 >= settings.EVENT_DISPATCH_MAX_ATTEMPTS
+                OutboxEvent.objects.filter(id=row.id).update(
+                    attempts=F('attempts') + 1,
+                    last_error=failures[row.id],
+                    parked_at=now if parked else None
+                )
+                if parked:
+                    logger.error('이벤트 전달 중단 (%s번 실패): %s #%s', row.attempts + 1, row.event_type, row.id)
+                else:
+                    retry = True
+        dispatched += len(delivered_ids)
+        if len(rows) < batch_size:
+            break
+
+    if retry:
+        _schedule_retry()
+    return dispatched
+
+
+def purge_dispatched_events(days=None):
+    # 보관 기간이 지난 전달 완료 이벤트 삭제
+    if days is None:
+        days = settings.EVENT_RETENTION_DAYS
+    cutoff = timezone.now() - timedelta(days=days)
+    deleted, _ = OutboxEvent.objects.filter(dispatched_at__lt=cutoff).delete()
+    return deleted
@@ -0,0 +1,39 @@
+import json
+from django.core.management.base import BaseCommand, CommandError
+from core.startup import STARTUP_METRICS, sample_startup, summarize_startup
+
+# 비교할 설정 (API 문서 스키마 메타데이터를 불러올 때 / 건너뛸 때)
+STARTUP_MODES = {
+    'schema_enabled': {'API_SCHEMA_ENABLED': 'True'},
+    'schema_disabled': {'API_SCHEMA_ENABLED': 'False'},
+}
+
+
+class Command(BaseCommand):
+    help = '워커 시작 비용 비교 - 새 프로세스에서 django.setup() + URLconf 로딩 시간과 메모리를 스키마 사용 여부별로 측정'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=5, help='설정별 측정 횟수 (기본값: 5, 중앙값 사용)')
+        parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+
+    def handle(self, *args, **options):
+        if options['runs'] < 1:
+            raise CommandError('--runs는 1 이상이어야 합니다.')
+
+        results = {}
+        for mode, env in STARTUP_MODES.items():
+            try:
+                results[mode] = summarize_startup(sample_startup(options['runs'], env))
+            except RuntimeError as e:
+                raise CommandError(str(e))
+
+        if options['json']:
+            self.stdout.write(json.dumps(results, indent=2))
+            return
+
+        before, after = results['schema_enabled'], results['schema_disabled']
+        self.stdout.write(f"{'항목':<12}{'스키마 사용':>14}{'스키마 끔':>14}{'차이':>12}")
+        for metric in STARTUP_METRICS:
+            difference = after[metric] - before[metric]
+            self.stdout.write(f"{metric:<12}{before[metric]:>14,.1f}{after[metric]:>14,.1f}{difference:>+12,.1f}")
+        self.stdout.write(self.style.SUCCESS(f"✅ 측정 완료 (설정별 {options['runs']}회 중앙값)"))
@@ -0,0 +1,25 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from trainmate.openapi import write_schema_artifact
+
+
+class Command(BaseCommand):
+    help = 'OpenAPI 스키마를 생성해 내용 해시 파일(openapi.<해시>.json)과 manifest로 저장 (배포 빌드 단계에서 실행)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output-dir', type=str, help='저장할 디렉터리 (기본값: API_SCHEMA_DIR)')
+
+    def handle(self, *args, **options):
+        if not settings.API_SCHEMA_ENABLED:
+            # 스키마 메타데이터는 API_SCHEMA_ENABLED일 때만 뷰에 붙음
+            raise CommandError('API_SCHEMA_ENABLED=True 환경에서 실행해야 합니다.')
+
+        from drf_spectacular.generators import SchemaGenerator
+        from drf_spectacular.renderers import OpenApiJsonRenderer
+
+        schema = SchemaGenerator().get_schema(request=None, public=True)
+        content = OpenApiJsonRenderer().render(schema, renderer_context={})
+        manifest = write_schema_artifact(content, options['output_dir'])
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ 스키마 생성: {manifest['file']} ({manifest['size']:,}바이트)"
+        ))
@@ -0,0 +1,88 @@
+import json
+from pathlib import Path
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from core.startup import check_budgets, profile_imports, sample_startup, summarize_startup
+
+
+class Command(BaseCommand):
+    help = (
+        '콜드 스타트 프로파일 - 새 프로세스에서 trainmate/wsgi.py 로딩(django.setup()), URLconf, 첫 요청 시간과 '
+        '앱별 import 시간을 측정하고 예산(STARTUP_BUDGETS, STARTUP_IMPORT_BUDGETS)을 넘으면 실패'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=3, help='시간 측정 횟수 (기본값: 3, 중앙값 사용)')
+        parser.add_argument('--path', type=str, default='/api/members/', help='첫 요청 경로 (기본값: /api/members/)')
+        parser.add_argument('--top', type=int, default=15, help='보고서에 포함할 느린 모듈 수 (기본값: 15)')
+        parser.add_argument('--output', type=str, help='JSON 보고서를 저장할 파일 경로')
+        parser.add_argument('--no-budget', action='store_true', help='예산을 확인하지 않고 보고서만 작성')
+
+    def handle(self, *args, **options):
+        if options['runs'] < 1:
+            raise CommandError('--runs는 1 이상이어야 합니다.')
+        if not options['path'].startswith('/'):
+            raise CommandError('--path는 /로 시작해야 합니다.')
+
+        # 프로젝트 디렉터리 안의 앱 (trainmate 패키지는 프레임워크 로딩을 시작하므로 패키지로 집계)
+        local_apps = {
+            app_config.name for app_config in apps.get_app_configs()
+            if Path(app_config.path).is_relative_to(settings.BASE_DIR)
+        }
+
+        try:
+            samples = sample_startup(options['runs'], request_path=options['path'])
+            timings = summarize_startup(samples)
+            imports = profile_imports(local_apps, request_path=options['path'], top=options['top'])
+        except RuntimeError as e:
+            raise CommandError(str(e))
+
+        exceeded = [] if options['no_budget'] else check_budgets(
+            timings, imports, settings.STARTUP_BUDGETS, settings.STARTUP_IMPORT_BUDGETS
+        )
+        report = {
+            'runs': options['runs'],
+            'path': options['path'],
+            'status': samples[-1]['status'],
+            'timings': timings,
+            'imports': imports,
+            'budgets': {
+                'timings': settings.STARTUP_BUDGETS,
+                'imports': settings.STARTUP_IMPORT_BUDGETS,
+                'exceeded': [
+                    {'metric': metric, 'value': value, 'budget': budget} for metric, value, budget in exceeded
+                ],
+            },
+        }
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as output:
+                json.dump(report, output, ensure_ascii=False, indent=2)
+
+        self._write_report(report)
+        if exceeded:
+            raise CommandError(
+                '콜드 스타트 예산 초과: ' + ', '.join(f'{metric} {value} > {budget}' for metric, value, budget in exceeded)
+            )
+        self.stdout.write(self.style.SUCCESS('✅ 콜드 스타트 측정 완료'))
+
+    def _write_report(self, report):
+        self.stdout.write(f"[시간] {report['runs']}회 중앙값, 첫 요청: GET {report['path']} -> {report['status']}")
+        for metric, value in report['timings'].items():
+            budget = report['budgets']['timings'].get(metric)
+            suffix = f' (예산 {budget:,})' if budget is not None else ''
+            self.stdout.write(f'  {metric:<18}{value:>12,.1f}{suffix}')
+
+        self.stdout.write('[앱별 import 시간(ms)]  self / 외부 패키지 포함')
+        for app, group in report['imports']['apps'].items():
+            budget = report['budgets']['imports'].get(app)
+            suffix = f' (예산 {budget:,})' if budget is not None else ''
+            self.stdout.write(f"  {app:<18}{group['self_ms']:>10,.1f}{group['attributed_ms']:>10,.1f}{suffix}")
+
+        self.stdout.write('[패키지별 import 시간(ms)]')
+        for package, group in list(report['imports']['packages'].items())[:10]:
+            self.stdout.write(f"  {package:<18}{group['self_ms']:>10,.1f}  ({group['modules']}개 모듈)")
+
+        self.stdout.write('[느린 모듈(ms)]  self / cumulative')
+        for module in report['imports']['slowest_modules']:
+            self.stdout.write(f"  {module['module']:<40}{module['self_ms']:>8,.1f}{module['cumulative_ms']:>10,.1f}")
@@ -0,0 +1,84 @@
+import signal
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connection, connections
+from core.queue import claim_jobs, get_worker_id, release_stale_jobs, run_job, run_pending_jobs
+from core.schedule import PeriodicScheduler
+
+
+def _init_process():
+    # 자식 프로세스는 부모의 DB 연결을 쓰지 않고 새로 연결
+    import django
+    django.setup()
+    connections.close_all()
+
+
+def _run_in_worker(job_id):
+    # 스레드/프로세스 풀에서 작업 실행 후 DB 연결 정리
+    try:
+        close_old_connections()
+        return run_job(job_id)
+    finally:
+        connection.close()
+
+
+class Command(BaseCommand):
+    help = '백그라운드 작업 워커 실행 (작업 큐 처리 + 주기 작업 등록)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, help='동시에 실행할 작업 수 (기본값: JOB_WORKER_CONCURRENCY)')
+        parser.add_argument('--pool', choices=['thread', 'process'], help='실행 풀 종류 (기본값: JOB_WORKER_POOL)')
+        parser.add_argument('--poll-interval', type=float, help='대기 작업이 없을 때 확인 간격(초) (기본값: JOB_POLL_INTERVAL)')
+        parser.add_argument('--no-schedule', action='store_true', help='주기 작업을 등록하지 않음 (다른 워커가 등록하는 경우)')
+        parser.add_argument('--once', action='store_true', help='현재 실행 가능한 작업만 처리하고 종료')
+
+    def handle(self, *args, **options):
+        if options['once']:
+            executed = run_pending_jobs()
+            self.stdout.write(self.style.SUCCESS(f"✅ 작업 실행: {executed}개"))
+            return
+
+        concurrency = options['concurrency'] or settings.JOB_WORKER_CONCURRENCY
+        pool = options['pool'] or settings.JOB_WORKER_POOL
+        poll_interval = options['poll_interval'] or settings.JOB_POLL_INTERVAL
+        scheduler = None if options['no_schedule'] else PeriodicScheduler()
+        worker_id = get_worker_id()
+
+        stop = threading.Event()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, lambda *_: stop.set())
+
+        if pool == 'process':
+            executor = ProcessPoolExecutor(max_workers=concurrency, initializer=_init_process)
+        else:
+            executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='job-worker')
+
+        self.stdout.write(f"워커 시작: {worker_id} ({pool} × {concurrency})")
+        running = set()
+        last_maintenance = 0
+        try:
+            while not stop.is_set():
+                if time.monotonic() - last_maintenance >= 60:
+                    # 1분마다 중단된 작업 복구
+                    release_stale_jobs()
+                    last_maintenance = time.monotonic()
+                if scheduler is not None:
+                    scheduler.tick()
+
+                job_ids = claim_jobs(concurrency - len(running), worker_id)
+                for job_id in job_ids:
+                    running.add(executor.submit(_run_in_worker, job_id))
+
+                if running:
+                    # 빈 슬롯이 생기거나 대기 간격이 지나면 다시 가져옴
+                    _, running = wait(running, timeout=poll_interval, return_when=FIRST_COMPLETED)
+                    running = set(running)
+                elif not job_ids:
+                    stop.wait(poll_interval)
+        finally:
+            self.stdout.write("워커 종료 중 - 실행 중인 작업을 기다립니다.")
+            executor.shutdown(wait=True)
+            connection.close()
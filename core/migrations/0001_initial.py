@@ -0,0 +1,41 @@
+# Generated by Django 5.2.3 on 2026-10-19 06:14
+
+import django.core.serializers.json
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Job',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='tasks.py에 등록한 작업 이름 (예: workouts.archive_exercise_sets)', max_length=100, verbose_name='작업 이름')),
+                ('kwargs', models.JSONField(default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder, verbose_name='작업 인자')),
+                ('status', models.CharField(choices=[('pending', '대기'), ('running', '실행 중'), ('succeeded', '완료'), ('failed', '실패')], default='pending', max_length=10, verbose_name='상태')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='실행 횟수')),
+                ('max_attempts', models.PositiveSmallIntegerField(default=5, verbose_name='최대 실행 횟수')),
+                ('run_at', models.DateTimeField(default=django.utils.timezone.now, help_text='재시도 시 백오프만큼 뒤로 미룸', verbose_name='실행 가능 시각')),
+                ('locked_at', models.DateTimeField(blank=True, null=True, verbose_name='가져간 시각')),
+                ('locked_by', models.CharField(blank=True, max_length=100, verbose_name='가져간 워커')),
+                ('dedupe_key', models.CharField(blank=True, help_text='같은 키의 작업은 하나만 등록 (주기 작업의 실행 시각 등)', max_length=200, null=True, verbose_name='중복 방지 키')),
+                ('last_error', models.TextField(blank=True, verbose_name='마지막 오류')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='등록일시')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='종료일시')),
+            ],
+            options={
+                'verbose_name': '백그라운드 작업',
+                'verbose_name_plural': '백그라운드 작업들',
+                'db_table': 'job',
+                'indexes': [models.Index(fields=['status', 'run_at'], name='job_status_e8ee15_idx'), models.Index(fields=['status', 'locked_at'], name='job_status_43ea93_idx')],
+                'constraints': [models.UniqueConstraint(fields=('dedupe_key',), name='unique_job_dedupe_key')],
+            },
+        ),
+    ]
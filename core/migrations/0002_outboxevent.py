@@ -0,0 +1,30 @@
+# Generated by Django 5.2.3 on 2026-10-19 06:16
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboxEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('event_type', models.CharField(max_length=50, verbose_name='이벤트 종류')),
+                ('payload', models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder, verbose_name='이벤트 내용')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='발생일시')),
+                ('dispatched_at', models.DateTimeField(blank=True, null=True, verbose_name='전달일시')),
+            ],
+            options={
+                'verbose_name': '도메인 이벤트',
+                'verbose_name_plural': '도메인 이벤트들',
+                'db_table': 'outbox_event',
+                'indexes': [models.Index(fields=['dispatched_at', 'id'], name='outbox_even_dispatc_ac79e5_idx')],
+            },
+        ),
+    ]
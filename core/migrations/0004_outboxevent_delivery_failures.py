@@ -0,0 +1,28 @@
+# Generated by Django 5.2.3 on 2026-10-19 07:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_create_cache_table'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='outboxevent',
+            name='attempts',
+            field=models.PositiveIntegerField(default=0, verbose_name='전달 실패 횟수'),
+        ),
+        migrations.AddField(
+            model_name='outboxevent',
+            name='last_error',
+            field=models.TextField(blank=True, verbose_name='마지막 전달 오류'),
+        ),
+        migrations.AddField(
+            model_name='outboxevent',
+            name='parked_at',
+            field=models.DateTimeField(blank=True, help_text='EVENT_DISPATCH_MAX_ATTEMPTS번 실패하면 더 이상 전달하지 않음 (확인 후 직접 처리)', null=True, verbose_name='전달 중단일시'),
+        ),
+    ]
@@ -0,0 +1,166 @@
+# core/models.py
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils import timezone
+
+
+class Job(models.Model):
+    # 백그라운드 작업 큐
+    # 요청 트랜잭션 안에서 등록하면 커밋된 작업만 워커가 가져감 (롤백되면 작업도 사라짐)
+
+    STATUS_PENDING = 'pending'
+    STATUS_RUNNING = 'running'
+    STATUS_SUCCEEDED = 'succeeded'
+    STATUS_FAILED = 'failed'
+
+    STATUS_CHOICES = [
+        (STATUS_PENDING, '대기'),
+        (STATUS_RUNNING, '실행 중'),
+        (STATUS_SUCCEEDED, '완료'),
+        (STATUS_FAILED, '실패'),
+    ]
+
+    name = models.CharField(
+        max_length=100,
+        verbose_name="작업 이름",
+        help_text="tasks.py에 등록한 작업 이름 (예: workouts.archive_exercise_sets)"
+    )
+
+    kwargs = models.JSONField(
+        default=dict,
+        encoder=DjangoJSONEncoder,
+        verbose_name="작업 인자"
+    )
+
+    status = models.CharField(
+        max_length=10,
+        choices=STATUS_CHOICES,
+        default=STATUS_PENDING,
+        verbose_name="상태"
+    )
+
+    attempts = models.PositiveSmallIntegerField(
+        default=0,
+        verbose_name="실행 횟수"
+    )
+
+    max_attempts = models.PositiveSmallIntegerField(
+        default=5,
+        verbose_name="최대 실행 횟수"
+    )
+
+    run_at = models.DateTimeField(
+        default=timezone.now,
+        verbose_name="실행 가능 시각",
+        help_text="재시도 시 백오프만큼 뒤로 미룸"
+    )
+
+    locked_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name="가져간 시각"
+    )
+
+    locked_by = models.CharField(
+        max_length=100,
+        blank=True,
+        verbose_name="가져간 워커"
+    )
+
+    dedupe_key = models.CharField(
+        max_length=200,
+        null=True,
+        blank=True,
+        verbose_name="중복 방지 키",
+        help_text="같은 키의 작업은 하나만 등록 (주기 작업의 실행 시각 등)"
+    )
+
+    last_error = models.TextField(
+        blank=True,
+        verbose_name="마지막 오류"
+    )
+
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name="등록일시"
+    )
+
+    finished_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name="종료일시"
+    )
+
+    class Meta:
+        verbose_name = "백그라운드 작업"
+        verbose_name_plural = "백그라운드 작업들"
+        db_table = 'job'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['dedupe_key'],
+                name='unique_job_dedupe_key'
+            )
+        ]
+        indexes = [
+            models.Index(fields=['status', 'run_at']),
+            models.Index(fields=['status', 'locked_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.get_status_display()})"
+
+
+
+class OutboxEvent(models.Model):
+    # 도메인 이벤트 아웃박스
+    # 쓰기와 같은 트랜잭션에서 저장하므로 커밋된 쓰기의 이벤트는 유실되지 않음 (비동기 구독자는 여기서 읽어 전달)
+
+    event_type = models.CharField(
+        max_length=50,
+        verbose_name="이벤트 종류"
+    )
+
+    payload = models.JSONField(
+        encoder=DjangoJSONEncoder,
+        verbose_name="이벤트 내용"
+    )
+
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name="발생일시"
+    )
+
+    dispatched_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name="전달일시"
+    )
+
+    attempts = models.PositiveIntegerField(
+        default=0,
+        verbose_name="전달 실패 횟수"
+    )
+
+    last_error = models.TextField(
+        blank=True,
+        verbose_name="마지막 전달 오류"
+    )
+
+    parked_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name="전달 중단일시",
+        help_text="EVENT_DISPATCH_MAX_ATTEMPTS번 실패하면 더 이상 전달하지 않음 (확인 후 직접 처리)"
+    )
+
+    class Meta:
+        verbose_name = "도메인 이벤트"
+        verbose_name_plural = "도메인 이벤트들"
+        db_table = 'outbox_event'
+        indexes = [
+            models.Index(fields=['dispatched_at', 'id']),
+        ]
+
+    def __str__(self):
+        return f"{self.event_type} #{self.id}"
@@ -0,0 +1,169 @@
+# core/queue.py
+
+import logging
+import os
+import random
+import socket
+import traceback
+from datetime import timedelta
+from django.conf import settings
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F
+from django.utils import timezone
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+# 작업 이름 -> (함수, 최대 실행 횟수)
+_registry = {}
+
+
+class JobNotRegistered(Exception):
+    pass
+
+
+def task(name, max_attempts=None):
+    # 백그라운드 작업 등록 데코레이터 (각 앱의 tasks.py에서 사용)
+    def decorator(func):
+        _registry[name] = (func, max_attempts or settings.JOB_MAX_ATTEMPTS)
+        return func
+    return decorator
+
+
+def get_task(name):
+    try:
+        return _registry[name]
+    except KeyError:
+        raise JobNotRegistered(f'등록되지 않은 작업입니다: {name}')
+
+
+def enqueue(name, run_at=None, dedupe_key=None, **kwargs):
+    # 작업 등록 - 현재 트랜잭션에 포함되므로 커밋된 경우에만 실행됨
+    # JOB_QUEUE_EAGER면 큐를 거치지 않고 커밋 후 바로 실행 (개발/테스트용)
+    func, max_attempts = get_task(name)
+    if settings.JOB_QUEUE_EAGER:
+        transaction.on_commit(lambda: func(**kwargs))
+        return None
+
+    try:
+        with transaction.atomic():
+            return Job.objects.create(
+                name=name,
+                kwargs=kwargs,
+                max_attempts=max_attempts,
+                run_at=run_at or timezone.now(),
+                dedupe_key=dedupe_key
+            )
+    except IntegrityError:
+        # 같은 dedupe_key의 작업이 이미 있음
+        return None
+
+
+def get_worker_id():
+    return f'{socket.gethostname()}:{os.getpid()}'
+
+
+def claim_jobs(limit, worker_id=None):
+    # 실행할 작업을 최대 limit개 가져와 running으로 표시하고 id 목록 반환
+    # PostgreSQL: SELECT ... FOR UPDATE SKIP LOCKED로 여러 워커가 서로 기다리지 않고 다른 행을 가져감
+    # SQLite 등: 상태가 pending일 때만 바꾸는 조건부 UPDATE(CAS)로 한 워커만 성공
+    if limit <= 0:
+        return []
+    worker_id = worker_id or get_worker_id()
+    now = timezone.now()
+    candidates = Job.objects.filter(status=Job.STATUS_PENDING, run_at__lte=now).order_by('run_at', 'id')
+    claim_values = {
+        'status': Job.STATUS_RUNNING,
+        'locked_at': now,
+        'locked_by': worker_id,
+        'attempts': F('attempts') + 1,
+    }
+
+    if connection.features.has_select_for_update_skip_locked:
+        with transaction.atomic():
+            job_ids = list(
+                candidates.select_for_update(skip_locked=True).values_list('id', flat=True)[:limit]
+            )
+            Job.objects.filter(id__in=job_ids).update(**claim_values)
+        return job_ids
+
+    job_ids = []
+    for job_id in candidates.values_list('id', flat=True)[:limit]:
+        if Job.objects.filter(id=job_id, status=Job.STATUS_PENDING).update(**claim_values):
+            job_ids.append(job_id)
+    return job_ids
+
+
+def get_retry_delay(attempts):
+    # 지수 백오프 (JOB_RETRY_BASE_SECONDS × 2^(시도-1), 최대 JOB_RETRY_MAX_SECONDS) + 최대 10% 지터
+    delay = min(settings.JOB_RETRY_BASE_SECONDS * (2 ** max(attempts - 1, 0)), settings.JOB_RETRY_MAX_SECONDS)
+    return timedelta(seconds=delay * (1 + random.random() * 0.1))
+
+
+def run_job(job_id):
+    # 가져간 작업 하나 실행 후 결과 기록 (실패하면 백오프 후 재시도, 횟수를 넘기면 failed)
+    job = Job.objects.filter(id=job_id, status=Job.STATUS_RUNNING).first()
+    if job is None:
+        return False
+
+    try:
+        func, _ = get_task(job.name)
+    except JobNotRegistered as e:
+        # 재시도해도 실행할 수 없으므로 바로 실패 처리
+        Job.objects.filter(id=job.id).update(
+            status=Job.STATUS_FAILED, last_error=str(e), finished_at=timezone.now(), locked_at=None
+        )
+        return False
+
+    try:
+        func(**job.kwargs)
+    except Exception:
+        error = traceback.format_exc()
+        logger.exception('백그라운드 작업 실패: %s(%s)', job.name, job.id)
+        now = timezone.now()
+        if job.attempts >= job.max_attempts:
+            Job.objects.filter(id=job.id).update(
+                status=Job.STATUS_FAILED, last_error=error, finished_at=now, locked_at=None
+            )
+        else:
+            Job.objects.filter(id=job.id).update(
+                status=Job.STATUS_PENDING, last_error=error, locked_at=None, locked_by='',
+                run_at=now + get_retry_delay(job.attempts)
+            )
+        return False
+
+    Job.objects.filter(id=job.id).update(
+        status=Job.STATUS_SUCCEEDED, finished_at=timezone.now(), locked_at=None, last_error=''
+    )
+    return True
+
+
+def release_stale_jobs():
+    # 워커가 비정상 종료되어 running으로 남은 작업을 다시 대기 상태로 (반환: 되돌린 작업 수)
+    cutoff = timezone.now() - timedelta(seconds=settings.JOB_LOCK_TIMEOUT)
+    return Job.objects.filter(status=Job.STATUS_RUNNING, locked_at__lt=cutoff).update(
+        status=Job.STATUS_PENDING, locked_at=None, locked_by=''
+    )
+
+
+def purge_finished_jobs(days=None):
+    # 보관 기간이 지난 완료/실패 작업 삭제
+    if days is None:
+        days = settings.JOB_RETENTION_DAYS
+    cutoff = timezone.now() - timedelta(days=days)
+    deleted, _ = Job.objects.filter(
+        status__in=[Job.STATUS_SUCCEEDED, Job.STATUS_FAILED], finished_at__lt=cutoff
+    ).delete()
+    return deleted
+
+
+def run_pending_jobs(limit=None, worker_id=None):
+    # 현재 실행 가능한 작업을 이 스레드에서 모두 실행 (run_worker --once, 테스트용)
+    executed = 0
+    while limit is None or executed < limit:
+        job_ids = claim_jobs(1, worker_id)
+        if not job_ids:
+            break
+        run_job(job_ids[0])
+        executed += 1
+    return executed
@@ -0,0 +1,111 @@
+# core/schedule.py
+
+from datetime import timedelta
+from django.conf import settings
+from django.utils import timezone
+from .queue import enqueue
+
+# cron 필드: (이름, 최솟값, 최댓값)
+_CRON_FIELDS = [
+    ('minute', 0, 59),
+    ('hour', 0, 23),
+    ('day', 1, 31),
+    ('month', 1, 12),
+    ('weekday', 0, 6),   # 0 = 일요일
+]
+
+
+class CronError(ValueError):
+    pass
+
+
+def _parse_field(expression, minimum, maximum):
+    # '*', '*/15', '1-5', '0,30', '1-10/2' 형식 지원
+    values = set()
+    for part in expression.split(','):
+        step = 1
+        if '/' in part:
+            part, step_text = part.split('/', 1)
+            step = int(step_text)
+            if step <= 0:
+                raise CronError(f'잘못된 간격입니다: {expression}')
+        if part == '*':
+            start, end = minimum, maximum
+        elif '-' in part:
+            start, end = (int(value) for value in part.split('-', 1))
+        else:
+            start = end = int(part)
+        if start < minimum or end > maximum or start > end:
+            raise CronError(f'범위를 벗어난 값입니다: {expression}')
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+
+def parse_cron(expression):
+    # '분 시 일 월 요일' 5개 필드 -> 필드별 허용 값 집합
+    parts = expression.split()
+    if len(parts) != len(_CRON_FIELDS):
+        raise CronError(f'cron 식은 5개 필드여야 합니다: {expression}')
+    try:
+        return [
+            _parse_field(part, minimum, maximum)
+            for part, (_, minimum, maximum) in zip(parts, _CRON_FIELDS)
+        ]
+    except ValueError as e:
+        if isinstance(e, CronError):
+            raise
+        raise CronError(f'잘못된 cron 식입니다: {expression}')
+
+
+def cron_matches(fields, moment):
+    minutes, hours, days, months, weekdays = fields
+    return (
+        moment.minute in minutes
+        and moment.hour in hours
+        and moment.day in days
+        and moment.month in months
+        and (moment.isoweekday() % 7) in weekdays
+    )
+
+
+class PeriodicScheduler:
+    # JOB_SCHEDULE 설정의 주기 작업을 분 단위로 확인해 큐에 등록
+    # dedupe_key에 실행 시각(분)을 넣어 워커가 여러 개여도 한 번만 등록
+
+    def __init__(self, schedule=None):
+        schedule = settings.JOB_SCHEDULE if schedule is None else schedule
+        self.entries = [
+            (entry_name, entry['task'], parse_cron(entry['cron']), entry.get('kwargs', {}))
+            for entry_name, entry in schedule.items()
+        ]
+        self.last_checked = None
+
+    def tick(self, now=None):
+        # 마지막 확인 이후 지난 분마다 일치하는 작업 등록 (등록한 작업 수 반환)
+        now = (now or timezone.now()).replace(second=0, microsecond=0)
+        if self.last_checked is None:
+            moments = [now]
+        else:
+            # 워커가 바빠 확인이 늦어져도 최대 한 시간 전까지는 놓치지 않음
+            start = max(self.last_checked + timedelta(minutes=1), now - timedelta(hours=1))
+            moments = []
+            moment = start
+            while moment <= now:
+                moments.append(moment)
+                moment += timedelta(minutes=1)
+        self.last_checked = now
+
+        enqueued = 0
+        for moment in moments:
+            local_moment = timezone.localtime(moment)
+            for entry_name, task_name, fields, kwargs in self.entries:
+                if cron_matches(fields, local_moment):
+                    job = enqueue(
+                        task_name,
+                        run_at=moment,
+                        dedupe_key=f'periodic:{entry_name}:{moment.isoformat()}',
+                        **kwargs
+                    )
+                    if job is not None:
+                        enqueued += 1
+        return enqueued
@@ -0,0 +1,191 @@
+# core/startup.py
+# 워커 시작(콜드 스타트) 비용 측정
+# 새 파이썬 프로세스에서 trainmate/wsgi.py를 불러와 django.setup(), URLconf 로딩, 첫 요청 시간과 메모리를 측정
+
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+# 자식 프로세스가 이 모듈을 먼저 불러오므로 모듈 수준에서는 표준 라이브러리만 불러옴
+
+# 측정 항목 (중앙값으로 요약)
+STARTUP_METRICS = ('setup_ms', 'urlconf_ms', 'total_ms', 'max_rss_kb', 'modules')
+REQUEST_METRICS = ('first_request_ms', 'warm_request_ms')
+
+# 측정 코드 자신의 import가 core 앱 시간에 섞이지 않도록 모듈로 불러오지 않고 __main__으로 실행
+_CHILD_CODE = "import runpy; runpy.run_module('core.startup', run_name='__main__')"
+
+
+def _request(application, path, host):
+    # WSGI 앱에 GET 요청 하나를 보내고 (소요 시간 ms, 상태 코드) 반환
+    from wsgiref.util import setup_testing_defaults
+    environ = {'PATH_INFO': path, 'HTTP_HOST': host, 'SERVER_NAME': host}
+    setup_testing_defaults(environ)
+    status = []
+
+    start = time.perf_counter()
+    body = application(environ, lambda status_line, headers, exc_info=None: status.append(status_line))
+    try:
+        for _ in body:
+            pass
+    finally:
+        if hasattr(body, 'close'):
+            body.close()
+    return round((time.perf_counter() - start) * 1000, 1), int(status[0].split()[0])
+
+
+def measure_startup(request_path=None):
+    # 현재 프로세스에서 측정 - django.setup() 전에 호출해야 함
+    start = time.perf_counter()
+    # django.setup() + WSGI 핸들러(미들웨어) 로딩
+    from trainmate.wsgi import application
+    setup_done = time.perf_counter()
+
+    from django.urls import get_resolver
+    # url_patterns 접근 시 URLconf와 모든 뷰 모듈을 불러옴
+    get_resolver().url_patterns
+    urlconf_done = time.perf_counter()
+
+    result = {
+        'setup_ms': round((setup_done - start) * 1000, 1),
+        'urlconf_ms': round((urlconf_done - setup_done) * 1000, 1),
+        'total_ms': round((urlconf_done - start) * 1000, 1),
+    }
+    if request_path:
+        from django.conf import settings
+        host = next((host for host in settings.ALLOWED_HOSTS if host and '*' not in host), 'localhost')
+        # 첫 요청은 지연 로딩되는 모듈/연결 비용 포함, 두 번째 요청과 비교
+        result['first_request_ms'], result['status'] = _request(application, request_path, host.lstrip('.'))
+        result['warm_request_ms'], _ = _request(application, request_path, host.lstrip('.'))
+
+    result['max_rss_kb'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    result['modules'] = len(sys.modules)
+    return result
+
+
+def report_startup(request_path=None):
+    # 측정 결과를 마지막 줄에 JSON으로 출력
+    print(json.dumps(measure_startup(request_path)))
+
+
+def _run_child(env=None, request_path=None, importtime=False):
+    from django.conf import settings
+    command = [sys.executable]
+    if importtime:
+        command += ['-X', 'importtime']
+    command += ['-c', _CHILD_CODE]
+    if request_path:
+        command.append(request_path)
+
+    result = subprocess.run(
+        command,
+        cwd=settings.BASE_DIR,
+        env={**os.environ, **(env or {})},
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f'시작 시간 측정 실패:\n{result.stderr.strip()[-2000:]}')
+    return json.loads(result.stdout.strip().splitlines()[-1]), result.stderr
+
+
+def sample_startup(runs, env=None, request_path=None):
+    # 새 프로세스에서 runs번 측정 -> 측정값 목록 (env로 설정 값을 바꿔 비교)
+    return [_run_child(env, request_path)[0] for _ in range(runs)]
+
+
+def summarize_startup(samples):
+    # 항목별 중앙값
+    metrics = [metric for metric in STARTUP_METRICS + REQUEST_METRICS if metric in samples[0]]
+    return {metric: statistics.median(sample[metric] for sample in samples) for metric in metrics}
+
+
+def parse_importtime(stderr):
+    # -X importtime 출력 -> [(깊이, 모듈, self us, cumulative us)] (출력 순서 = 자식이 부모보다 먼저)
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            # 머리글 줄
+            continue
+        name = parts[2].rstrip()
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        modules.append((depth, name.strip(), int(parts[0]), int(parts[1])))
+    return modules
+
+
+def aggregate_importtime(modules, local_apps):
+    # 앱별 import 시간 집계
+    # - self_ms: 앱 자신의 모듈 시간
+    # - attributed_ms: 앱 모듈이 처음 불러온 외부 패키지까지 포함한 시간 (가장 가까운 로컬 앱 조상 기준)
+    # 로컬 앱에서 불러오지 않은 모듈은 최상위 패키지별로 packages에 집계
+    apps = defaultdict(lambda: {'self_ms': 0.0, 'attributed_ms': 0.0, 'modules': 0})
+    packages = defaultdict(lambda: {'self_ms': 0.0, 'modules': 0})
+
+    # 역순으로 보면 부모가 자식보다 먼저 나오므로 스택으로 조상 추적
+    ancestors = []
+    for depth, name, self_us, _ in reversed(modules):
+        while ancestors and ancestors[-1][0] >= depth:
+            ancestors.pop()
+        top_level = name.split('.')[0]
+        owner = top_level if top_level in local_apps else (ancestors[-1][1] if ancestors else None)
+        ancestors.append((depth, owner))
+
+        self_ms = self_us / 1000
+        if top_level in local_apps:
+            apps[top_level]['self_ms'] += self_ms
+            apps[top_level]['modules'] += 1
+        if owner is not None:
+            apps[owner]['attributed_ms'] += self_ms
+        else:
+            packages[top_level]['self_ms'] += self_ms
+            packages[top_level]['modules'] += 1
+
+    def rounded(groups):
+        return {
+            name: {key: round(value, 1) if isinstance(value, float) else value for key, value in group.items()}
+            for name, group in sorted(groups.items(), key=lambda item: -item[1]['self_ms'])
+        }
+
+    return rounded(apps), rounded(packages)
+
+
+def profile_imports(local_apps, env=None, request_path=None, top=15):
+    # -X importtime으로 한 번 실행해 앱/패키지별 import 시간과 가장 느린 모듈 목록 반환
+    _, stderr = _run_child(env, request_path, importtime=True)
+    modules = parse_importtime(stderr)
+    apps, packages = aggregate_importtime(modules, local_apps)
+    slowest = sorted(modules, key=lambda module: -module[2])[:top]
+    return {
+        'apps': apps,
+        'packages': packages,
+        'slowest_modules': [
+            {'module': name, 'self_ms': round(self_us / 1000, 1), 'cumulative_ms': round(cumulative_us / 1000, 1)}
+            for _, name, self_us, cumulative_us in slowest
+        ],
+    }
+
+
+def check_budgets(timings, imports, budgets, import_budgets):
+    # 예산을 넘은 항목 목록 -> [(항목, 측정값, 예산)]
+    exceeded = []
+    for metric, budget in budgets.items():
+        if metric in timings and timings[metric] > budget:
+            exceeded.append((metric, timings[metric], budget))
+    for app, budget in import_budgets.items():
+        value = imports['apps'].get(app, {}).get('attributed_ms', 0)
+        if value > budget:
+            exceeded.append((f'import:{app}', value, budget))
+    return exceeded
+
+
+if __name__ == '__main__':
+    # 자식 프로세스 진입점 (python -c ... [첫 요청 경로])
+    report_startup(*sys.argv[1:])
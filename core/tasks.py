@@ -0,0 +1,22 @@
+# core/tasks.py
+
+from .events import dispatch_outbox, purge_dispatched_events
+from .queue import purge_finished_jobs, task
+
+
+@task('core.purge_finished_jobs')
+def purge_finished_jobs_task():
+    # 보관 기간(JOB_RETENTION_DAYS)이 지난 완료/실패 작업 삭제
+    purge_finished_jobs()
+
+
+@task('core.dispatch_events')
+def dispatch_events_task():
+    # 아웃박스의 미전달 이벤트를 비동기 구독자에게 전달 (실패한 이벤트는 dispatch_outbox가 다시 전달 작업 등록)
+    dispatch_outbox()
+
+
+@task('core.purge_dispatched_events')
+def purge_dispatched_events_task():
+    # 보관 기간(EVENT_RETENTION_DAYS)이 지난 전달 완료 이벤트 삭제
+    purge_dispatched_events()
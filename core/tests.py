@@ -0,0 +1,499 @@
+# core/tests.py
+
+import json
+import tempfile
+from datetime import datetime, timedelta
+from unittest import skipIf
+from django.conf import settings
+from django.core.cache import cache as shared_cache
+from django.core.management import CommandError, call_command
+from django.db import transaction
+from django.http import Http404
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+from members.models import Member, Trainer
+from trainmate import schema
+from trainmate.openapi import serve_schema, write_schema_artifact
+from . import cache
+from .cache import LocalCache, cached_call, local_cache
+from .events import DomainEvent, dispatch_outbox, publish, purge_dispatched_events, subscribe
+from .models import Job, OutboxEvent
+from .queue import claim_jobs, enqueue, release_stale_jobs, run_job, run_pending_jobs, task
+from .schedule import CronError, PeriodicScheduler, cron_matches, parse_cron
+from .startup import aggregate_importtime, check_budgets, parse_importtime
+
+calls = []
+
+
+@task('core.tests.record')
+def record_task(value):
+    calls.append(value)
+
+
+@task('core.tests.fail', max_attempts=2)
+def fail_task():
+    raise RuntimeError('실패')
+
+
+class SomethingLogged(DomainEvent):
+    event_type = 'core.tests.something_logged'
+    fields = ('day', 'value')
+
+
+class SomethingNoted(DomainEvent):
+    event_type = 'core.tests.something_noted'
+    fields = ('value',)
+
+
+sync_received = []
+async_received = []
+
+subscribe(SomethingLogged, lambda events: sync_received.append([event.value for event in events]))
+subscribe(
+    SomethingLogged,
+    lambda events: async_received.append([event.value for event in events]),
+    asynchronous=True,
+    coalesce=lambda event: event.day
+)
+subscribe(SomethingNoted, lambda events: sync_received.append([event.value for event in events]))
+
+
+class JobQueueTest(TestCase):
+    # 백그라운드 작업 큐 테스트
+
+    def setUp(self):
+        calls.clear()
+
+    def test_enqueue_and_run(self):
+        job = enqueue('core.tests.record', value=1)
+
+        self.assertEqual(run_pending_jobs(), 1)
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.STATUS_SUCCEEDED)
+        self.assertEqual(job.attempts, 1)
+        self.assertEqual(calls, [1])
+
+    def test_claimed_job_not_claimed_twice(self):
+        enqueue('core.tests.record', value=1)
+        enqueue('core.tests.record', value=2)
+
+        first = claim_jobs(1, 'worker-a')
+        second = claim_jobs(5, 'worker-b')
+        self.assertEqual(len(first), 1)
+        self.assertEqual(len(second), 1)
+        self.assertNotEqual(first, second)
+        self.assertEqual(claim_jobs(5, 'worker-c'), [])
+
+    def test_failed_job_retried_with_backoff_then_marked_failed(self):
+        job = enqueue('core.tests.fail')
+
+        self.assertFalse(run_job(claim_jobs(1)[0]))
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.STATUS_PENDING)
+        self.assertGreater(job.run_at, timezone.now())
+        self.assertIn('RuntimeError', job.last_error)
+        # 백오프 시간 전에는 다시 가져가지 않음
+        self.assertEqual(claim_jobs(1), [])
+
+        Job.objects.filter(id=job.id).update(run_at=timezone.now())
+        run_pending_jobs()
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.STATUS_FAILED)
+        self.assertEqual(job.attempts, 2)
+
+    def test_dedupe_key(self):
+        self.assertIsNotNone(enqueue('core.tests.record', dedupe_key='once', value=1))
+        self.assertIsNone(enqueue('core.tests.record', dedupe_key='once', value=1))
+        self.assertEqual(Job.objects.count(), 1)
+
+    def test_stale_running_job_released(self):
+        job = enqueue('core.tests.record', value=1)
+        claim_jobs(1)
+        Job.objects.filter(id=job.id).update(locked_at=timezone.now() - timedelta(hours=1))
+
+        self.assertEqual(release_stale_jobs(), 1)
+        self.assertEqual(run_pending_jobs(), 1)
+        self.assertEqual(calls, [1])
+
+    @override_settings(JOB_QUEUE_EAGER=True)
+    def test_eager_mode_runs_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertIsNone(enqueue('core.tests.record', value=3))
+        self.assertEqual(calls, [3])
+        self.assertFalse(Job.objects.exists())
+
+
+class PeriodicScheduleTest(TestCase):
+    # cron 식과 주기 작업 등록 테스트
+
+    def test_parse_cron(self):
+        fields = parse_cron('*/15 9-10 * * 1-5')
+        self.assertTrue(cron_matches(fields, datetime(2026, 1, 5, 9, 45)))    # 월요일
+        self.assertFalse(cron_matches(fields, datetime(2026, 1, 5, 9, 50)))
+        self.assertFalse(cron_matches(fields, datetime(2026, 1, 4, 9, 45)))   # 일요일
+        with self.assertRaises(CronError):
+            parse_cron('61 * * * *')
+        with self.assertRaises(CronError):
+            parse_cron('* * *')
+
+    def test_scheduler_enqueues_each_slot_once(self):
+        schedule = {'record': {'task': 'core.tests.record', 'cron': '*/10 * * * *', 'kwargs': {'value': 1}}}
+        now = timezone.now().replace(minute=0, second=5, microsecond=0)
+
+        first_worker = PeriodicScheduler(schedule)
+        second_worker = PeriodicScheduler(schedule)
+        self.assertEqual(first_worker.tick(now), 1)
+        self.assertEqual(second_worker.tick(now), 0)
+
+        # 확인이 늦어져도 지나간 실행 시각을 모두 등록
+        self.assertEqual(first_worker.tick(now + timedelta(minutes=25)), 2)
+        self.assertEqual(Job.objects.filter(name='core.tests.record').count(), 3)
+
+
+class DomainEventTest(TestCase):
+    # 도메인 이벤트 / 아웃박스 테스트
+
+    def setUp(self):
+        sync_received.clear()
+        async_received.clear()
+
+    def test_missing_field_rejected(self):
+        with self.assertRaises(TypeError):
+            SomethingLogged(day='2024-01-01')
+
+    def test_sync_subscriber_runs_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            publish(SomethingNoted(value=1))
+            self.assertEqual(sync_received, [])
+
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(sync_received, [[1]])
+        # 비동기 구독자가 없으면 전달 완료로 기록
+        self.assertIsNotNone(OutboxEvent.objects.get().dispatched_at)
+
+    def test_rolled_back_event_not_recorded(self):
+        try:
+            with transaction.atomic():
+                publish(SomethingLogged(day='2024-01-01', value=1))
+                raise RuntimeError('롤백')
+        except RuntimeError:
+            pass
+
+        self.assertFalse(OutboxEvent.objects.exists())
+        self.assertFalse(Job.objects.exists())
+
+    def test_async_dispatch_coalesces_burst(self):
+        publish(SomethingLogged(day='2024-01-01', value=1))
+        publish(SomethingLogged(day='2024-01-01', value=2))
+        publish(SomethingLogged(day='2024-01-02', value=3))
+        publish(SomethingLogged(day='2024-01-01', value=4))
+
+        # 연속된 이벤트는 전달 작업 하나로 모음
+        self.assertEqual(Job.objects.filter(name='core.dispatch_events').count(), 1)
+        self.assertEqual(dispatch_outbox(), 4)
+        self.assertEqual(async_received, [[3, 4]])
+        self.assertFalse(OutboxEvent.objects.filter(dispatched_at__isnull=True).exists())
+        # 이미 전달한 이벤트는 다시 전달하지 않음
+        self.assertEqual(dispatch_outbox(), 0)
+
+    @override_settings(EVENT_DISPATCH_MAX_ATTEMPTS=2)
+    def test_failed_event_isolated_and_parked(self):
+        # 실패한 이벤트만 오류/실패 횟수를 기록하고 나머지는 전달, 정해진 횟수만큼 실패하면 전달 중단
+        received = []
+
+        def handler(events):
+            if any(event.value == 1 for event in events):
+                raise ZeroDivisionError('poison')
+            received.extend(event.value for event in events)
+
+        subscribe(SomethingNoted, handler, asynchronous=True)
+        try:
+            publish(SomethingNoted(value=1))
+            publish(SomethingNoted(value=2))
+            Job.objects.all().delete()
+
+            self.assertEqual(dispatch_outbox(), 1)
+            self.assertEqual(received, [2])
+            poison = OutboxEvent.objects.get(payload__value=1)
+            self.assertIsNone(poison.dispatched_at)
+            self.assertEqual(poison.attempts, 1)
+            self.assertIn('ZeroDivisionError', poison.last_error)
+            # 실패한 이벤트는 나중에 다시 전달하도록 작업 등록
+            self.assertTrue(Job.objects.filter(name='core.dispatch_events').exists())
+
+            self.assertEqual(dispatch_outbox(), 0)
+            poison.refresh_from_db()
+            self.assertEqual(poison.attempts, 2)
+            self.assertIsNotNone(poison.parked_at)
+            self.assertEqual(dispatch_outbox(), 0)
+            self.assertEqual(OutboxEvent.objects.get(payload__value=1).attempts, 2)
+        finally:
+            from .events import _async_subscribers
+            del _async_subscribers[SomethingNoted.event_type]
+
+    @override_settings(JOB_QUEUE_EAGER=True)
+    def test_eager_dispatch_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            publish(SomethingLogged(day='2024-01-01', value=1))
+
+        self.assertEqual(async_received, [[1]])
+
+    def test_purge_dispatched_events(self):
+        publish(SomethingNoted(value=1))
+        OutboxEvent.objects.update(dispatched_at=timezone.now() - timedelta(days=30))
+        publish(SomethingLogged(day='2024-01-01', value=1))
+
+        self.assertEqual(purge_dispatched_events(), 1)
+        self.assertEqual(OutboxEvent.objects.count(), 1)
+
+
+class BatchViewTest(TestCase):
+    # 묶음 조회 테스트
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse('batch')
+        self.trainer = Trainer.objects.create_user(
+            email='trainer@test.com', name='트레이너', password='testpass123', user_type='trainer'
+        )
+        self.member = Member.objects.create_user(
+            email='member@test.com', name='회원', password='testpass123', user_type='member',
+            assigned_trainer=self.trainer
+        )
+        self.other_member = Member.objects.create_user(
+            email='other@test.com', name='다른 회원', password='testpass123', user_type='member'
+        )
+        token = RefreshToken.for_user(self.trainer).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    def test_batch_runs_subrequests_with_permissions(self):
+        response = self.client.post(self.url, {'requests': [
+            {'id': 'profile', 'path': '/api/members/profile/'},
+            {'id': 'members', 'path': '/api/members/'},
+            {'id': 'heatmap', 'path': f'/api/workouts/{self.member.id}/heatmap/?year=2024'},
+            {'id': 'forbidden', 'path': f'/api/workouts/{self.other_member.id}/heatmap/'},
+            {'id': 'missing', 'path': '/api/unknown/'},
+        ]}, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        results = {item['id']: item for item in response.data['responses']}
+        self.assertEqual(list(results), ['profile', 'members', 'heatmap', 'forbidden', 'missing'])
+        self.assertEqual(results['profile']['status'], 200)
+        self.assertEqual(results['profile']['body']['user']['email'], 'trainer@test.com')
+        self.assertEqual(results['members']['status'], 200)
+        self.assertEqual(results['heatmap']['body']['data']['year'], 2024)
+        self.assertEqual(results['forbidden']['status'], 403)
+        self.assertEqual(results['missing']['status'], 404)
+
+    def test_streaming_and_nested_batch_rejected(self):
+        response = self.client.post(self.url, {'requests': [
+            f'/api/workouts/{self.member.id}/export/',
+            '/api/batch/',
+        ]}, format='json')
+
+        self.assertEqual([item['status'] for item in response.data['responses']], [400, 400])
+
+    def test_invalid_batch(self):
+        for payload in ({}, {'requests': ['/admin/']}, {'requests': [{'path': '/api/members/', 'method': 'POST'}]}):
+            response = self.client.post(self.url, payload, format='json')
+            self.assertEqual(response.status_code, 400)
+
+        with self.settings(BATCH_MAX_REQUESTS=1):
+            response = self.client.post(self.url, {'requests': ['/api/members/', '/api/members/']}, format='json')
+            self.assertEqual(response.status_code, 400)
+
+        self.client.credentials()
+        response = self.client.post(self.url, {'requests': ['/api/members/']}, format='json')
+        self.assertEqual(response.status_code, 401)
+
+    def test_concurrent_batch_keeps_order(self):
+        response = self.client.post(self.url, {
+            'requests': [{'id': index, 'path': f'/api/unknown/{index}/'} for index in range(3)],
+            'concurrent': True
+        }, format='json')
+
+        self.assertEqual([item['id'] for item in response.data['responses']], [0, 1, 2])
+        self.assertEqual({item['status'] for item in response.data['responses']}, {404})
+
+
+class ApiSchemaTest(TestCase):
+    def setUp(self):
+        schema_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(schema_dir.cleanup)
+        settings_override = override_settings(API_SCHEMA_DIR=schema_dir.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.factory = RequestFactory()
+
+    @skipIf(settings.API_SCHEMA_ENABLED, '스키마 메타데이터를 건너뛰는 설정에서만 확인')
+    def test_schema_decorators_are_skipped_when_disabled(self):
+        def view(request):
+            return None
+
+        decorated = schema.extend_schema(
+            parameters=[schema.OpenApiParameter(name='year', type=schema.OpenApiTypes.INT, location=schema.OpenApiParameter.QUERY)],
+            responses={200: schema.OpenApiResponse(description='성공')}
+        )(view)
+
+        self.assertIs(decorated, view)
+        self.assertEqual(schema.OpenApiTypes.INT, 'INT')
+        with self.assertRaises(CommandError):
+            call_command('build_schema')
+
+    def test_serve_prebuilt_schema(self):
+        manifest = write_schema_artifact(b'{"openapi": "3.0.3"}')
+        etag = f'"{manifest["hash"]}"'
+
+        response = serve_schema(self.factory.get('/api/schema/'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content), {'openapi': '3.0.3'})
+        self.assertEqual(response['ETag'], etag)
+        self.assertIn('no-cache', response['Cache-Control'])
+
+        response = serve_schema(self.factory.get('/api/schema/', HTTP_IF_NONE_MATCH=etag))
+        self.assertEqual(response.status_code, 304)
+
+        response = serve_schema(self.factory.get('/api/schema/'), digest=manifest['hash'])
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('immutable', response['Cache-Control'])
+
+        # 내용이 바뀌면 새 해시 파일, 이전 버전 주소는 계속 제공
+        new_manifest = write_schema_artifact(b'{"openapi": "3.1.0"}')
+        self.assertNotEqual(new_manifest['hash'], manifest['hash'])
+        self.assertEqual(json.loads(serve_schema(self.factory.get('/api/schema/')).content), {'openapi': '3.1.0'})
+        self.assertEqual(serve_schema(self.factory.get('/api/schema/'), digest=manifest['hash']).status_code, 200)
+
+    def test_missing_schema_returns_404(self):
+        with self.assertRaises(Http404):
+            serve_schema(self.factory.get('/api/schema/'))
+        with self.assertRaises(Http404):
+            serve_schema(self.factory.get('/api/schema/'), digest='0123456789ab')
+
+
+class StartupProfileTest(TestCase):
+    IMPORTTIME = """import time: self [us] | cumulative | imported package
+import time:      1000 |       1000 |       yaml
+import time:      3000 |       4000 |     workouts.views
+import time:       500 |       4500 |   workouts.urls
+import time:     20000 |      20000 |     django.db
+import time:       200 |      24700 | trainmate.urls
+"""
+
+    def test_parse_importtime(self):
+        modules = parse_importtime(self.IMPORTTIME)
+
+        self.assertEqual(modules[0], (3, 'yaml', 1000, 1000))
+        self.assertEqual(modules[-1], (0, 'trainmate.urls', 200, 24700))
+        self.assertEqual(len(modules), 5)
+
+    def test_aggregate_attributes_dependencies_to_importing_app(self):
+        apps, packages = aggregate_importtime(parse_importtime(self.IMPORTTIME), {'workouts'})
+
+        # workouts.views가 처음 불러온 yaml은 workouts 시간에 포함
+        self.assertEqual(apps['workouts'], {'self_ms': 3.5, 'attributed_ms': 4.5, 'modules': 2})
+        self.assertEqual(packages['django']['self_ms'], 20.0)
+        self.assertNotIn('yaml', packages)
+
+    def test_check_budgets(self):
+        timings = {'setup_ms': 900.0, 'urlconf_ms': 50.0}
+        imports = {'apps': {'workouts': {'attributed_ms': 120.0}}}
+
+        exceeded = check_budgets(timings, imports, {'setup_ms': 800, 'urlconf_ms': 100}, {'workouts': 100, 'core': 10})
+
+        self.assertEqual(exceeded, [('setup_ms', 900.0, 800), ('import:workouts', 120.0, 100)])
+
+
+class TwoTierCacheTest(TestCase):
+    # 2단계 캐시(L1 LRU + 공유 캐시)와 태그 무효화 테스트
+
+    def setUp(self):
+        shared_cache.clear()
+        local_cache.clear()
+        self.addCleanup(local_cache.clear)
+
+    def test_local_cache_evicts_least_recently_used(self):
+        lru = LocalCache(2)
+        lru.set('a', 1, 60)
+        lru.set('b', 2, 60)
+        lru.get('a')
+        lru.set('c', 3, 60)
+
+        self.assertEqual((lru.get('a'), lru.get('b'), lru.get('c')), (1, None, 3))
+
+    def test_local_cache_expires_entries(self):
+        lru = LocalCache(10)
+        lru.set('a', 1, 0)
+
+        self.assertIsNone(lru.get('a'))
+        self.assertEqual(len(lru), 0)
+
+    def test_invalidate_tags_expires_shared_entries(self):
+        cache.set('tagged', 'value', 60, tags=['catalogue'])
+        cache.set('other', 'value', 60, tags=['records'])
+
+        cache.invalidate_tags('catalogue')
+
+        self.assertIsNone(cache.get('tagged'))
+        self.assertEqual(cache.get('other'), 'value')
+
+    def test_invalidate_tags_clears_local_entries(self):
+        cache.set('tagged', 'value', 60, tags=['catalogue'], local_ttl=60)
+
+        cache.invalidate_tags('catalogue')
+
+        self.assertIsNone(local_cache.get('tagged'))
+        self.assertIsNone(cache.get('tagged'))
+
+    def test_get_or_set_discards_value_invalidated_while_computing(self):
+        def compute():
+            # 값을 만드는 도중 다른 요청이 무효화
+            cache.invalidate_tags('catalogue')
+            return 'stale'
+
+        self.assertEqual(cache.get_or_set('key', compute, 60, tags=['catalogue']), 'stale')
+        self.assertIsNone(cache.get('key'))
+        self.assertEqual(cache.get_or_set('key', lambda: 'fresh', 60, tags=['catalogue']), 'fresh')
+        self.assertEqual(cache.get('key'), 'fresh')
+
+    def test_get_or_set_does_not_store_none(self):
+        self.assertIsNone(cache.get_or_set('key', lambda: None, 60))
+        self.assertEqual(cache.get_or_set('key', lambda: 1, 60), 1)
+
+    def test_local_entry_served_until_expired(self):
+        cache.set('key', 'old', 60, local_ttl=60)
+        # 다른 워커가 공유 캐시만 갱신한 상황
+        shared_cache.set('key', ('new', {}), 60)
+
+        self.assertEqual(cache.get('key'), 'old')
+        local_cache.clear()
+        self.assertEqual(cache.get('key'), 'new')
+
+    def test_delete_clears_again_on_commit(self):
+        cache.set('key', 'value', 60)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            cache.delete('key')
+            # 커밋 전에 다른 요청이 이전 값을 다시 적재
+            cache.set('key', 'reloaded', 60)
+
+        self.assertIsNone(cache.get('key'))
+
+    def test_cached_call(self):
+        computed = []
+
+        @cached_call(60, tags=lambda member_id: [f'member:{member_id}'])
+        def load(member_id):
+            computed.append(member_id)
+            return member_id * 10
+
+        self.assertEqual((load(1), load(1), load(2)), (10, 10, 20))
+        self.assertEqual(computed, [1, 2])
+
+        load.invalidate(1)
+        cache.invalidate_tags('member:2')
+        load(1)
+        load(2)
+        self.assertEqual(computed, [1, 2, 1, 2])
@@ -0,0 +1,9 @@
+# core/urls.py
+
+from django.urls import path
+from .views import batch_view
+
+urlpatterns = [
+    # 묶음 조회 (여러 GET API를 한 번에 실행)
+    path('', batch_view, name='batch'),
+]
@@ -0,0 +1,64 @@
+# core/views.py
+
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from trainmate.schema import extend_schema, OpenApiResponse
+from .batch import BatchError, execute_batch, parse_batch_items
+
+
+# 묶음 조회
+@extend_schema(
+    summary="묶음 조회",
+    description=(
+        "여러 GET API를 한 번의 요청으로 실행합니다. 인증은 한 번만 하고 각 API의 권한 검사는 그대로 적용되며, "
+        "결과는 요청 순서대로 개별 상태 코드와 함께 반환됩니다. 스트리밍 API(내보내기, 실시간 피드)는 제외됩니다."
+    ),
+    request={
+        "application/json": {
+            "type": "object",
+            "properties": {
+                "requests": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "id": {"type": "string", "description": "응답에서 구분할 식별자 (기본값: 순번)"},
+                            "path": {"type": "string", "description": "쿼리 문자열을 포함한 경로 (예: /api/workouts/1/records/?date=2024-01-01)"}
+                        },
+                        "required": ["path"]
+                    }
+                },
+                "concurrent": {"type": "boolean", "description": "하위 요청 동시 실행 여부 (기본값: false)"}
+            },
+            "required": ["requests"]
+        }
+    },
+    responses={
+        200: OpenApiResponse(description="실행 완료 (항목별 status, body)"),
+        400: OpenApiResponse(description="잘못된 요청 목록"),
+        401: OpenApiResponse(description="인증 필요")
+    },
+    tags=["공통"]
+)
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def batch_view(request):
+    try:
+        items = parse_batch_items(request.data)
+    except BatchError as e:
+        return Response({
+            'success': False,
+            'message': str(e)
+        }, status=status.HTTP_400_BAD_REQUEST)
+
+    concurrent = request.data.get('concurrent') is True
+    return Response({
+        'success': True,
+        'responses': execute_batch(request, items, concurrent)
+    }, status=status.HTTP_200_OK)
+
+
+# 묶음 요청 안에서 다시 묶음 요청을 호출하지 않도록 표시
+batch_view.batch_exempt = True
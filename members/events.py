@@ -0,0 +1,9 @@
+# members/events.py
+
+from core.events import DomainEvent
+
+
+class MemberAssigned(DomainEvent):
+    # 회원의 담당 트레이너 변경 (배정 해제 시 trainer_id는 None)
+    event_type = 'members.member_assigned'
+    fields = ('member_id', 'trainer_id', 'previous_trainer_id')
@@ -0,0 +1,158 @@
+# members/images.py
+
+import logging
+import os
+from io import BytesIO
+from django.apps import apps
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.files.base import ContentFile
+from django.db import transaction
+from PIL import Image, ImageOps, UnidentifiedImageError
+from core.queue import enqueue
+
+logger = logging.getLogger(__name__)
+
+# 허용하는 원본 이미지 포맷
+ALLOWED_IMAGE_FORMATS = {'JPEG', 'PNG', 'WEBP', 'GIF', 'MPO'}
+
+# 원본 재인코딩 포맷 (업로드 포맷 → Pillow 포맷, 확장자, 저장 옵션)
+ORIGINAL_FORMATS = {
+    'JPEG': ('JPEG', 'jpg', {'quality': 90}),
+    'MPO': ('JPEG', 'jpg', {'quality': 90}),
+    'PNG': ('PNG', 'png', {'optimize': True}),
+    'WEBP': ('WEBP', 'webp', {'quality': 90}),
+    'GIF': ('GIF', 'gif', {}),
+}
+
+# 변환 결과 포맷 (확장자, Pillow 포맷, 저장 옵션)
+VARIANT_FORMATS = [
+    ('webp', 'WEBP', {'quality': 80, 'method': 4}),
+    ('jpeg', 'JPEG', {'quality': 82, 'optimize': True, 'progressive': True}),
+]
+
+
+def validate_profile_image(upload):
+    # 업로드 파일이 허용된 크기/포맷의 이미지인지 검사
+    if upload.size > settings.PROFILE_IMAGE_MAX_UPLOAD_SIZE:
+        raise ValidationError('이미지 파일 크기가 너무 큽니다.')
+
+    try:
+        upload.seek(0)
+        with Image.open(upload) as image:
+            image_format = image.format
+            width, height = image.size
+            image.verify()
+    except (UnidentifiedImageError, OSError, SyntaxError, Image.DecompressionBombError):
+        raise ValidationError('올바른 이미지 파일이 아닙니다.')
+    finally:
+        upload.seek(0)
+
+    if image_format not in ALLOWED_IMAGE_FORMATS:
+        raise ValidationError('지원하지 않는 이미지 형식입니다.')
+    if width * height > settings.PROFILE_IMAGE_MAX_PIXELS:
+        raise ValidationError('이미지 해상도가 너무 큽니다.')
+
+
+def strip_image_metadata(upload):
+    # 검증된 업로드를 픽셀 데이터만으로 다시 인코딩한 원본 파일 반환
+    # (EXIF/GPS, 주석 등 메타데이터와 이미지 뒤에 덧붙은 데이터는 저장/공개되지 않음)
+    upload.seek(0)
+    with Image.open(upload) as original:
+        image_format, extension, options = ORIGINAL_FORMATS[original.format]
+        image = ImageOps.exif_transpose(original)
+        if image_format == 'JPEG' and image.mode not in ('RGB', 'L'):
+            image = image.convert('RGB')
+        # 투명색 외의 부가 정보는 저장 시 다시 쓰이지 않도록 제거
+        image.info = {key: value for key, value in image.info.items() if key == 'transparency'}
+        buffer = BytesIO()
+        image.save(buffer, format=image_format, **options)
+    return ContentFile(buffer.getvalue(), name=f'profile.{extension}')
+
+
+def _render_variant(image, size, crop):
+    # 정사각형 크롭(avatar/card) 또는 비율 유지 축소(full)
+    if crop:
+        return ImageOps.fit(image, (size, size), Image.Resampling.LANCZOS)
+    resized = image.copy()
+    resized.thumbnail((size, size), Image.Resampling.LANCZOS)
+    return resized
+
+
+def render_profile_image_variants(image_field):
+    # 원본 이미지에서 메타데이터를 제거한 고정 크기 변환본을 생성하고 저장 경로를 반환
+    storage = image_field.storage
+    base_dir, filename = os.path.split(image_field.name)
+    stem = os.path.splitext(filename)[0]
+
+    with storage.open(image_field.name, 'rb') as source:
+        with Image.open(source) as original:
+            # EXIF 방향 반영 후 픽셀 데이터만 복사 (EXIF/GPS 등 메타데이터 제거)
+            image = ImageOps.exif_transpose(original).convert('RGB')
+
+    variants = {}
+    for variant_name, spec in settings.PROFILE_IMAGE_VARIANTS.items():
+        rendered = _render_variant(image, spec['size'], spec['crop'])
+        variants[variant_name] = {}
+        for extension, image_format, options in VARIANT_FORMATS:
+            buffer = BytesIO()
+            rendered.save(buffer, format=image_format, **options)
+            variant_path = os.path.join(base_dir, 'variants', f'{stem}_{variant_name}.{extension}')
+            variants[variant_name][extension] = storage.save(variant_path, ContentFile(buffer.getvalue()))
+
+    return variants
+
+
+def process_profile_image(model_label, pk):
+    # 프로필 변환본 생성 후 profile_image_variants 컬럼 갱신 (save 대신 update 사용)
+    model = apps.get_model(model_label)
+    try:
+        profile = model.objects.only('profile_image').get(pk=pk)
+        if not profile.profile_image:
+            return None
+
+        variants = render_profile_image_variants(profile.profile_image)
+        model.objects.filter(pk=pk, profile_image=profile.profile_image.name).update(
+            profile_image_variants=variants
+        )
+        # update()는 post_save 시그널을 보내지 않으므로 프로필 캐시 직접 무효화
+        from members.profiles import invalidate_profile_projection
+        invalidate_profile_projection(pk)
+        return variants
+
+    except model.DoesNotExist:
+        return None
+
+    except Exception:
+        logger.exception('프로필 이미지 변환 실패: %s(%s)', model_label, pk)
+        return None
+
+
+def schedule_profile_image_processing(profile):
+    # 커밋 이후 요청 스레드 밖(백그라운드 작업 워커)에서 변환 작업 실행
+    model_label = profile._meta.label
+    pk = profile.pk
+
+    if not settings.PROFILE_IMAGE_ASYNC:
+        transaction.on_commit(lambda: process_profile_image(model_label, pk))
+        return
+
+    enqueue('members.process_profile_image', model_label=model_label, pk=pk)
+
+
+def get_profile_image_urls(profile, preferred='full'):
+    # 응답용 이미지 URL 구성
+    # 변환본이 있으면 preferred 변환본(webp) URL, 없으면 원본 URL을 profile_image로 사용
+    if not profile.profile_image:
+        return None, None
+
+    storage = profile.profile_image.storage
+    stored_variants = getattr(profile, 'profile_image_variants', None) or {}
+    variant_urls = {
+        variant_name: {extension: storage.url(name) for extension, name in formats.items()}
+        for variant_name, formats in stored_variants.items()
+    }
+
+    if preferred in variant_urls:
+        return variant_urls[preferred]['webp'], variant_urls
+    return profile.profile_image.url, variant_urls or None
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.3 on 2026-10-19 05:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('members', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='member',
+            name='profile_image_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False, help_text='avatar/card/full 크기별 webp/jpeg 파일 경로', verbose_name='프로필 이미지 변환본'),
+        ),
+        migrations.AddField(
+            model_name='trainer',
+            name='profile_image_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False, help_text='avatar/card/full 크기별 webp/jpeg 파일 경로', verbose_name='프로필 이미지 변환본'),
+        ),
+    ]
@@ -15,6 +15,13 @@ class Trainer(User):
         verbose_name='프로필 이미지',
         help_text='프로필 수정에서 업로드'
     )
+    profile_image_variants = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        verbose_name='프로필 이미지 변환본',
+        help_text='avatar/card/full 크기별 webp/jpeg 파일 경로'
+    )
     age = models.PositiveIntegerField(
         blank=True,
         null=True,
@@ -64,6 +71,13 @@ class Trainer(User):
         verbose_name_plural = '트레이너들'
         db_table = 'trainer'
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        # 로드 시점의 몸무게 보관 (운동 칼로리 재계산 판단용)
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_weight_kg = instance.__dict__.get('weight_kg')
+        return instance
+
     def __str__(self):
         return f"트레이너 : {self.name}"
     
@@ -103,6 +117,13 @@ class Member(User):
         verbose_name='프로필 이미지',
         help_text='프로필 수정에서 업로드'
     )
+    profile_image_variants = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        verbose_name='프로필 이미지 변환본',
+        help_text='avatar/card/full 크기별 webp/jpeg 파일 경로'
+    )
     age = models.PositiveIntegerField(
         blank=True,
         null=True,
@@ -152,6 +173,14 @@ class Member(User):
         verbose_name_plural = '회원들'
         db_table = 'member'
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        # 로드 시점의 담당 트레이너/몸무게 보관 (권한 캐시 무효화, 운동 칼로리 재계산 판단용)
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_assigned_trainer_id = instance.__dict__.get('assigned_trainer_id')
+        instance._loaded_weight_kg = instance.__dict__.get('weight_kg')
+        return instance
+
     def __str__(self):
         trainer_name = self.assigned_trainer.name if self.assigned_trainer else "미배정"
         if hasattr(self, 'name') and self.name:
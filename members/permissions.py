@@ -0,0 +1,71 @@
+# members/permissions.py
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.permissions import BasePermission
+from core import cache
+from members.models import Member
+
+User = get_user_model()
+
+
+class MemberAccessDenied(APIException):
+    # 기존 응답 형식({'success': False, 'message': ...})을 그대로 유지하는 권한 예외
+    status_code = status.HTTP_403_FORBIDDEN
+    default_code = 'permission_denied'
+
+    def __init__(self, message, status_code=None):
+        self.detail = {'success': False, 'message': message}
+        if status_code is not None:
+            self.status_code = status_code
+
+
+def trainer_members_cache_key(trainer_id):
+    return f'members:trainer_members:{trainer_id}'
+
+
+def get_trainer_member_ids(trainer_id):
+    # 트레이너의 담당 회원 id 집합 (L1 -> 공유 캐시 -> DB 순으로 조회)
+    return cache.get_or_set(
+        trainer_members_cache_key(trainer_id),
+        lambda: frozenset(
+            Member.objects.filter(assigned_trainer_id=trainer_id).values_list('user_ptr_id', flat=True)
+        ),
+        settings.MEMBER_ACCESS_CACHE_TIMEOUT,
+        local_ttl=settings.MEMBER_ACCESS_LOCAL_TTL
+    )
+
+
+def invalidate_trainer_member_ids(*trainer_ids):
+    # 담당 회원이 바뀐 트레이너의 캐시 삭제 (커밋 후 한 번 더 삭제)
+    cache.delete(*(trainer_members_cache_key(trainer_id) for trainer_id in trainer_ids if trainer_id is not None))
+
+
+def can_access_member(user, member_id):
+    # 본인이거나 해당 회원의 담당 트레이너이면 접근 가능
+    if user.id == member_id:
+        return True
+    if getattr(user, 'user_type', None) == 'trainer':
+        return member_id in get_trainer_member_ids(user.id)
+    return False
+
+
+def can_manage_exercise_catalogue(user):
+    # 공용 운동 목록에 새 운동을 등록할 수 있는 사용자 (트레이너/관리자)
+    return getattr(user, 'user_type', None) == 'trainer' or user.is_staff
+
+
+class IsSelfOrAssignedTrainer(BasePermission):
+    # URL의 member_id에 대해 본인 또는 담당 트레이너만 허용
+    # 허용되는 경우 DB 조회 없음, 거부 시에만 회원 존재 여부를 확인해 404/403 구분
+
+    def has_permission(self, request, view):
+        member_id = view.kwargs.get('member_id')
+        if member_id is None or can_access_member(request.user, member_id):
+            return True
+
+        if request.user.user_type == 'trainer' and not User.objects.filter(id=member_id).exists():
+            raise MemberAccessDenied('해당 회원을 찾을 수 없습니다.', status_code=status.HTTP_404_NOT_FOUND)
+        raise MemberAccessDenied('해당 회원의 운동 기록에 접근할 권한이 없습니다.')
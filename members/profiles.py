@@ -0,0 +1,98 @@
+# members/profiles.py
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ObjectDoesNotExist
+from core import cache
+from members.images import get_profile_image_urls
+
+User = get_user_model()
+
+# 하위 프로필 모델 역참조 이름 (Trainer/Member가 User를 상속)
+PROFILE_ACCESSORS = ('trainer', 'member')
+
+PROFILE_FIELDS = ('age', 'height_cm', 'weight_kg', 'body_fat_percentage', 'muscle_mass_kg')
+
+
+def profile_cache_key(user_id):
+    return f'members:profile:{user_id}'
+
+
+def get_subclass_instance(user):
+    # select_related로 함께 조회된 Trainer/Member 인스턴스 반환 (없으면 User 그대로)
+    for accessor in PROFILE_ACCESSORS:
+        try:
+            return getattr(user, accessor)
+        except ObjectDoesNotExist:
+            continue
+    return user
+
+
+def resolve_user(user_id):
+    # User와 하위 프로필(트레이너/회원 및 담당 트레이너)을 한 번의 쿼리로 조회
+    user = User.objects.select_related(
+        'trainer', 'member', 'member__assigned_trainer'
+    ).filter(id=user_id).first()
+    if user is None:
+        return None
+    return get_subclass_instance(user)
+
+
+def build_profile_projection(profile):
+    # 응답 구성에 필요한 프로필 값만 추린 캐시용 딕셔너리
+    profile_image_url = profile.profile_image.url if getattr(profile, 'profile_image', None) else None
+    _, profile_image_variants = get_profile_image_urls(profile) if profile_image_url else (None, None)
+
+    projection = {
+        'id': profile.id,
+        'profile_type': profile._meta.model_name if profile._meta.model is not User else None,
+        'user_type': profile.user_type,
+        'name': profile.name,
+        'email': profile.email,
+        'phone': profile.phone,
+        'is_active': profile.is_active,
+        'date_joined': profile.date_joined,
+        'updated_at': profile.updated_at,
+        'profile_completed': getattr(profile, 'profile_completed', False),
+        'profile_image_url': profile_image_url,
+        'profile_image_variants': profile_image_variants,
+        'assigned_trainer_id': getattr(profile, 'assigned_trainer_id', None),
+    }
+    for field in PROFILE_FIELDS:
+        projection[field] = getattr(profile, field, None)
+    return projection
+
+
+def get_profile_projection(user_id):
+    # 캐시된 프로필 조회, 없으면 단일 쿼리로 조회 후 캐시 (사용자가 없으면 None)
+    projection = cache.get(profile_cache_key(user_id))
+    if projection is not None:
+        return projection
+
+    profile = resolve_user(user_id)
+    if profile is None:
+        return None
+
+    projection = build_profile_projection(profile)
+    to_cache = {profile_cache_key(profile.id): projection}
+
+    # 담당 트레이너도 같은 쿼리로 조회되었으므로 함께 캐시
+    trainer = getattr(profile, 'assigned_trainer', None)
+    if trainer is not None:
+        to_cache[profile_cache_key(trainer.id)] = build_profile_projection(trainer)
+
+    cache.set_many(to_cache, settings.PROFILE_CACHE_TIMEOUT)
+    return projection
+
+
+def get_preferred_image(projection, preferred='full'):
+    # 변환본이 있으면 preferred 변환본(webp), 없으면 원본 URL
+    variants = projection['profile_image_variants'] or {}
+    if preferred in variants:
+        return variants[preferred]['webp']
+    return projection['profile_image_url']
+
+
+def invalidate_profile_projection(*user_ids):
+    # 프로필 캐시 삭제 (트랜잭션 커밋 후 한 번 더 삭제해 커밋 전 재적재된 값 제거)
+    cache.delete(*(profile_cache_key(user_id) for user_id in user_ids if user_id is not None))
@@ -3,6 +3,7 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from .models import Trainer, Member
+from .images import get_profile_image_urls
 
 User = get_user_model()
 
@@ -12,12 +13,13 @@ class ProfileSerializer(serializers.ModelSerializer):
     email = serializers.EmailField(source='user.email', read_only=True)
     user_type = serializers.CharField(source='user.user_type', read_only=True)
     created_at = serializers.DateTimeField(source='user.date_joined', read_only=True)
+    profile_image_variants = serializers.SerializerMethodField()
     
     class Meta:
         model = Member  # 또는 실제 프로필 모델
         fields = [
             'name', 'email', 'user_type', 'created_at',
-            'profile_image', 'age', 'height_cm', 'weight_kg', 
+            'profile_image', 'profile_image_variants', 'age', 'height_cm', 'weight_kg', 
             'body_fat_percentage', 'muscle_mass_kg'
         ]
         extra_kwargs = {
@@ -29,6 +31,10 @@ class ProfileSerializer(serializers.ModelSerializer):
             'muscle_mass_kg': {'required': False, 'help_text': '골격근량 (kg)'},
         }
 
+    def get_profile_image_variants(self, obj):
+        # 크기별 변환본 URL (avatar/card/full)
+        return get_profile_image_urls(obj)[1]
+
 class ProfileUpdateSerializer(serializers.ModelSerializer):
     # 프로필 수정 serializer
     
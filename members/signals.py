@@ -0,0 +1,58 @@
+# members/signals.py
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from accounts.models import User
+from core.events import publish
+from members.events import MemberAssigned
+from members.models import Member, Trainer
+from members.permissions import invalidate_trainer_member_ids
+from members.profiles import invalidate_profile_projection
+
+
+@receiver(post_save, sender=User)
+@receiver(post_save, sender=Trainer)
+@receiver(post_save, sender=Member)
+def invalidate_profile_on_save(sender, instance, update_fields=None, **kwargs):
+    # 로그인 시각 갱신(update_last_login)은 프로필 응답에 영향 없음
+    if update_fields is not None and set(update_fields) <= {'last_login'}:
+        return
+    invalidate_profile_projection(instance.pk)
+
+
+@receiver(post_delete, sender=User)
+@receiver(post_delete, sender=Trainer)
+@receiver(post_delete, sender=Member)
+def invalidate_profile_on_delete(sender, instance, **kwargs):
+    invalidate_profile_projection(instance.pk)
+
+
+@receiver(post_save, sender=Member)
+def invalidate_trainer_members_on_assign(sender, instance, **kwargs):
+    # 담당 트레이너가 바뀐 경우 이전/새 트레이너의 담당 회원 캐시 삭제 후 배정 이벤트 발행
+    loaded_trainer_id = getattr(instance, '_loaded_assigned_trainer_id', None)
+    if loaded_trainer_id != instance.assigned_trainer_id:
+        invalidate_trainer_member_ids(loaded_trainer_id, instance.assigned_trainer_id)
+        publish(MemberAssigned(
+            member_id=instance.pk,
+            trainer_id=instance.assigned_trainer_id,
+            previous_trainer_id=loaded_trainer_id
+        ))
+    instance._loaded_assigned_trainer_id = instance.assigned_trainer_id
+
+
+@receiver(post_delete, sender=Member)
+def invalidate_trainer_members_on_delete(sender, instance, **kwargs):
+    invalidate_trainer_member_ids(instance.assigned_trainer_id)
+
+
+@receiver(post_save, sender=Trainer)
+def reset_trainer_members_on_create(sender, instance, created, **kwargs):
+    # 새 트레이너는 빈 집합에서 시작 (이전에 남아있던 캐시 제거)
+    if created:
+        invalidate_trainer_member_ids(instance.pk)
+
+
+@receiver(post_delete, sender=Trainer)
+def invalidate_trainer_members_on_trainer_delete(sender, instance, **kwargs):
+    invalidate_trainer_member_ids(instance.pk)
@@ -0,0 +1,10 @@
+# members/tasks.py
+
+from core.queue import task
+from members.images import process_profile_image
+
+
+@task('members.process_profile_image', max_attempts=3)
+def process_profile_image_task(model_label, pk):
+    # 프로필 이미지 변환본(avatar/card/full) 생성
+    process_profile_image(model_label, pk)
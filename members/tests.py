@@ -2,14 +2,22 @@
 
 import tempfile
 from PIL import Image
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth import get_user_model
 from django.urls import reverse
+from django.core.files.base import ContentFile
 from django.core.files.uploadedfile import SimpleUploadedFile
 from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
 from rest_framework_simplejwt.tokens import RefreshToken
+from core.models import OutboxEvent
+from members.events import MemberAssigned
 from members.models import Member, Trainer
+from members.profiles import resolve_user
+from workouts.models import MemberStreak
 import json
 
 User = get_user_model()
@@ -81,6 +89,32 @@ class MembersModelTest(TestCase):
         self.assertEqual(member.assigned_trainer, trainer)
         self.assertIn(member, trainer.members.all())
 
+    def test_member_assignment_publishes_event(self):
+        # 담당 트레이너가 바뀔 때만 배정 이벤트 기록
+        trainer = Trainer.objects.create_user(
+            email='trainer@test.com',
+            name='테스트 트레이너',
+            password='testpass123!@#',
+            user_type='trainer'
+        )
+        member = Member.objects.create_user(
+            email='member@test.com',
+            name='테스트 회원',
+            password='testpass123!@#',
+            user_type='member'
+        )
+        member.assigned_trainer = trainer
+        member.save()
+        member.save()
+
+        events = OutboxEvent.objects.filter(event_type=MemberAssigned.event_type)
+        self.assertEqual(events.count(), 1)
+        self.assertEqual(events.get().payload, {
+            'member_id': member.id,
+            'trainer_id': trainer.id,
+            'previous_trainer_id': None,
+        })
+
 
 class MyProfileAPITest(APITestCase):
     # 내 프로필 조회/수정 API 테스트
@@ -136,6 +170,41 @@ class MyProfileAPITest(APITestCase):
         self.assertEqual(response.data['user']['height_cm'], 175.5)
         self.assertEqual(response.data['user']['weight_kg'], 70.0)
     
+    def test_member_profile_includes_streak_and_updates_weekly_target(self):
+        # 회원 프로필에 연속 운동 기록 포함, 주간 목표 수정
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.member_access_token}')
+
+        response = self.client.patch(self.profile_url, {'weekly_target': 5}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        streak = response.data['user']['streak']
+        self.assertEqual(streak['weekly_target'], 5)
+        self.assertEqual(streak['current_streak'], 0)
+
+        response = self.client.patch(self.profile_url, {'weekly_target': 9}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_invalid_weekly_target_does_not_save_profile(self):
+        # 주간 목표가 잘못되면 함께 보낸 다른 필드도 저장하지 않음
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.member_access_token}')
+
+        for weekly_target in (9, 'abc'):
+            response = self.client.patch(self.profile_url, {'age': 40, 'weekly_target': weekly_target}, format='json')
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn('weekly_target', response.data['errors'])
+        self.assertEqual(Member.objects.get(id=self.member.id).age, 25)
+
+    def test_profile_get_does_not_create_streak(self):
+        # 프로필 조회는 연속 기록 행을 만들지 않고 기본값으로 응답
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.member_access_token}')
+
+        response = self.client.get(self.profile_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['user']['streak']['current_streak'], 0)
+        self.assertEqual(response.data['user']['streak']['weekly_target'], 3)
+        self.assertFalse(MemberStreak.objects.filter(member_id=self.member.id).exists())
+
     def test_successful_member_profile_get(self):
         # 회원 프로필 조회 성공 테스트
         self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.member_access_token}')
@@ -486,6 +555,7 @@ class MemberDetailAPITest(APITestCase):
         self.assertEqual(response.data['data']['member']['name'], '테스트 회원')
         self.assertIsNotNone(response.data['data']['member']['trainer_info'])
         self.assertEqual(response.data['data']['member']['trainer_info']['name'], '테스트 트레이너')
+        self.assertEqual(response.data['data']['member']['streak']['current_streak'], 0)
         
         # 운동 기록 데이터 포함 여부 확인
         self.assertIn('workout_records', response.data['data'])
@@ -523,6 +593,66 @@ class MemberDetailAPITest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
+class ProfileProjectionCacheTest(APITestCase):
+    # 프로필 단일 쿼리 조회 및 캐시 무효화 테스트
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+        self.trainer = Trainer.objects.create_user(
+            email='trainer@test.com',
+            name='테스트 트레이너',
+            password='testpass123!@#',
+            user_type='trainer'
+        )
+        self.member = Member.objects.create_user(
+            email='member@test.com',
+            name='테스트 회원',
+            password='testpass123!@#',
+            user_type='member',
+            assigned_trainer=self.trainer
+        )
+        self.client.force_authenticate(user=self.trainer)
+
+    def test_resolve_user_returns_subclass_in_one_query(self):
+        # User 조회 한 번으로 Member 하위 클래스와 담당 트레이너까지 반환
+        with self.assertNumQueries(1):
+            profile = resolve_user(self.member.id)
+            self.assertIsInstance(profile, Member)
+            self.assertEqual(profile.assigned_trainer.name, '테스트 트레이너')
+
+        self.assertIsInstance(resolve_user(self.trainer.id), Trainer)
+        self.assertIsNone(resolve_user(99999))
+
+    def test_member_detail_profile_cached(self):
+        # 두 번째 조회부터 프로필 조회 쿼리 없이 캐시 사용
+        url = reverse('member-detail', kwargs={'member_id': self.member.id})
+        self.client.get(url)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data']['member']['trainer_info']['name'], '테스트 트레이너')
+        self.assertFalse(any('"trainer"' in query['sql'] and '"member"' in query['sql'] for query in queries))
+
+    def test_save_invalidates_cached_profile(self):
+        # 트레이너 정보 수정 시 회원 상세의 trainer_info에도 반영
+        url = reverse('member-detail', kwargs={'member_id': self.member.id})
+        self.client.get(url)
+
+        self.trainer.name = '변경된 트레이너'
+        self.trainer.save()
+        self.member.age = 31
+        self.member.save()
+
+        response = self.client.get(url)
+        self.assertEqual(response.data['data']['member']['trainer_info']['name'], '변경된 트레이너')
+        self.assertEqual(response.data['data']['member']['age'], 31)
+
+
+
 class RegisterMemberAPITest(APITestCase):
     # 회원 등록 API 테스트 (URL이 추가되면 활성화)
     
@@ -792,4 +922,156 @@ class IntegrationTestCase(APITestCase):
                 response.status_code, 
                 status.HTTP_401_UNAUTHORIZED,
                 f"Endpoint {url} should require authentication"
-            )
\ No newline at end of file
+            )
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp(), PROFILE_IMAGE_ASYNC=False)
+class ProfileImagePipelineTest(APITestCase):
+    # 프로필 이미지 검증/변환본 생성 테스트
+
+    def setUp(self):
+        self.client = APIClient()
+        self.profile_url = reverse('my_profile')
+
+        self.trainer = Trainer.objects.create_user(
+            email='trainer@test.com',
+            name='테스트 트레이너',
+            password='testpass123!@#',
+            user_type='trainer'
+        )
+        self.member = Member.objects.create_user(
+            email='member@test.com',
+            name='테스트 회원',
+            password='testpass123!@#',
+            user_type='member',
+            assigned_trainer=self.trainer
+        )
+        self.client.force_authenticate(user=self.member)
+
+    def _make_upload(self, size=(1600, 1200)):
+        buffer = tempfile.SpooledTemporaryFile()
+        Image.new('RGB', size, color='blue').save(buffer, format='JPEG')
+        buffer.seek(0)
+        return SimpleUploadedFile('photo.jpg', buffer.read(), content_type='image/jpeg')
+
+    def test_upload_generates_variants(self):
+        # 업로드 후 avatar/card/full 변환본이 생성되는지 테스트
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(self.profile_url, {'profile_image': self._make_upload()}, format='multipart')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        member = Member.objects.get(id=self.member.id)
+        self.assertEqual(set(member.profile_image_variants), {'avatar', 'card', 'full'})
+
+        storage = member.profile_image.storage
+        with storage.open(member.profile_image_variants['avatar']['webp']) as avatar_file:
+            with Image.open(avatar_file) as avatar:
+                self.assertEqual(avatar.size, (96, 96))
+                self.assertNotIn('exif', avatar.info)
+        with storage.open(member.profile_image_variants['full']['jpeg']) as full_file:
+            with Image.open(full_file) as full:
+                self.assertEqual(max(full.size), 1080)
+
+        # 회원 목록은 avatar 변환본 URL 사용
+        self.client.force_authenticate(user=self.trainer)
+        response = self.client.get(reverse('trainer_member_list'))
+        member_info = response.data['data']['members'][0]
+        self.assertEqual(member_info['profile_image'], member_info['profile_image_variants']['avatar']['webp'])
+        self.assertIn('card', member_info['profile_image_variants'])
+
+    def test_original_stored_without_metadata(self):
+        # 원본 업로드의 EXIF(GPS 등) 메타데이터가 저장된 원본에서 제거되는지 테스트
+        exif = Image.Exif()
+        exif[0x010F] = 'TestCamera'
+        exif[0x8825] = {1: 'N', 2: (37.0, 33.0, 0.0)}
+        buffer = tempfile.SpooledTemporaryFile()
+        Image.new('RGB', (64, 48), color='red').save(buffer, format='JPEG', exif=exif.tobytes())
+        buffer.seek(0)
+        upload = SimpleUploadedFile('photo.jpg', buffer.read(), content_type='image/jpeg')
+
+        response = self.client.patch(self.profile_url, {'profile_image': upload}, format='multipart')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        member = Member.objects.get(id=self.member.id)
+        with member.profile_image.storage.open(member.profile_image.name) as stored_file:
+            with Image.open(stored_file) as stored:
+                self.assertEqual(stored.size, (64, 48))
+                self.assertNotIn('exif', stored.info)
+                self.assertEqual(len(stored.getexif()), 0)
+
+    def test_polyglot_upload_not_served_as_html(self):
+        # GIF/HTML 폴리글롯을 x.html 이름으로 올려도 이미지 확장자/타입으로만 저장·제공되는지 테스트
+        buffer = tempfile.SpooledTemporaryFile()
+        Image.new('P', (8, 8)).save(buffer, format='GIF')
+        buffer.seek(0)
+        polyglot = buffer.read() + b'<html><script>alert(document.cookie)</script></html>'
+        upload = SimpleUploadedFile('x.html', polyglot, content_type='text/html')
+
+        response = self.client.patch(self.profile_url, {'profile_image': upload}, format='multipart')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        profile_image = Member.objects.get(id=self.member.id).profile_image
+        self.assertRegex(profile_image.name, r'^member_profile/[0-9a-f]{2}/[0-9a-f]{64}\.gif$')
+        response = self.client.get(profile_image.url)
+        self.assertEqual(response['Content-Type'], 'image/gif')
+        self.assertEqual(response['X-Content-Type-Options'], 'nosniff')
+        self.assertNotIn(b'<script>', b''.join(response.streaming_content))
+
+        # 저장소에 직접 저장해도 확장자는 내용 기준, 이미지가 아니면 다운로드로만 제공
+        storage = profile_image.storage
+        self.assertTrue(storage.save('member_profile/x.html', ContentFile(polyglot)).endswith('.gif'))
+        html_name = storage.save('member_profile/x.html', ContentFile(b'<html><script>alert(1)</script></html>'))
+        self.assertTrue(html_name.endswith('.bin'))
+        response = self.client.get(storage.url(html_name))
+        self.assertEqual(response['Content-Type'], 'application/octet-stream')
+        self.assertTrue(response['Content-Disposition'].startswith('attachment'))
+        self.assertEqual(response['X-Content-Type-Options'], 'nosniff')
+
+    def test_invalid_image_rejected(self):
+        # 이미지가 아닌 파일 업로드 시 400 반환 테스트
+        upload = SimpleUploadedFile('photo.jpg', b'not an image', content_type='image/jpeg')
+
+        response = self.client.patch(self.profile_url, {'profile_image': upload}, format='multipart')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(response.data['success'])
+        self.assertFalse(Member.objects.get(id=self.member.id).profile_image)
+
+    def test_identical_uploads_are_deduplicated(self):
+        # 같은 내용의 이미지를 다시 올리면 같은 해시 파일명을 재사용하는지 테스트
+        content = self._make_upload().read()
+
+        self.client.patch(self.profile_url, {'profile_image': SimpleUploadedFile('a.jpg', content)}, format='multipart')
+        first_name = Member.objects.get(id=self.member.id).profile_image.name
+
+        self.client.force_authenticate(user=self.trainer)
+        self.client.patch(self.profile_url, {'profile_image': SimpleUploadedFile('b.jpg', content)}, format='multipart')
+        second_name = Trainer.objects.get(id=self.trainer.id).profile_image.name
+
+        self.assertEqual(first_name.rsplit('/', 1)[-1], second_name.rsplit('/', 1)[-1])
+        self.assertRegex(first_name, r'^member_profile/[0-9a-f]{2}/[0-9a-f]{64}\.jpg$')
+
+    def test_media_served_with_immutable_cache_and_range(self):
+        # 업로드 파일이 immutable 캐시 헤더와 Range 요청을 지원하는지 테스트
+        self.client.patch(self.profile_url, {'profile_image': self._make_upload()}, format='multipart')
+        profile_image = Member.objects.get(id=self.member.id).profile_image
+        media_url = profile_image.url
+        with profile_image.storage.open(profile_image.name) as stored_file:
+            content = stored_file.read()
+
+        response = self.client.get(media_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(b''.join(response.streaming_content), content)
+        self.assertIn('immutable', response['Cache-Control'])
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+
+        response = self.client.get(media_url, HTTP_RANGE='bytes=10-19')
+        self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertEqual(b''.join(response.streaming_content), content[10:20])
+        self.assertEqual(response['Content-Range'], f'bytes 10-19/{len(content)}')
+
+        response = self.client.get(media_url, HTTP_RANGE=f'bytes={len(content)}-')
+        self.assertEqual(response.status_code, status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE)
+
+        response = self.client.get(media_url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
@@ -2,69 +2,78 @@
 
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
-from django.db import DatabaseError, IntegrityError
+from django.db import DatabaseError, IntegrityError, transaction
 from django.db.models import Q
+from django.http import Http404
 from django.shortcuts import get_object_or_404
-from drf_spectacular.utils import extend_schema, OpenApiResponse, OpenApiExample, OpenApiParameter
-from drf_spectacular.openapi import OpenApiTypes
 from rest_framework import status
 from rest_framework.response import Response
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, parser_classes
+from rest_framework.parsers import JSONParser, MultiPartParser, FormParser
 from rest_framework.permissions import IsAuthenticated
+from trainmate.schema import extend_schema, OpenApiResponse, OpenApiExample, OpenApiParameter, OpenApiTypes
 from workouts.services import WorkoutRecordService
+from workouts.streaks import clean_weekly_target, get_streak_summary, set_weekly_target
 from members.models import Member, Trainer
+from members.images import validate_profile_image, strip_image_metadata, schedule_profile_image_processing, get_profile_image_urls
+from members.profiles import resolve_user, build_profile_projection, get_profile_projection, get_preferred_image
 
 User = get_user_model()
 
 def get_user_profile_data(user):
-    # 유저 타입에 따라 데이터 가져오기
-    profile_data = {
-        'id': user.id,
-        'name': user.name,
-        'email': user.email,
-        'phone': user.phone,
-        'user_type': user.user_type,
-        'created_at': user.date_joined,
-        # 기본값
-        'profile_image': None,
-        'age': None,
-        'height_cm': None,
-        'weight_kg': None,
-        'body_fat_percentage': None,
-        'muscle_mass_kg': None,
+    # 유저 타입에 따라 데이터 가져오기 (캐시된 프로필 사용, 캐시 미스 시 단일 쿼리)
+    projection = get_profile_projection(user.id) or build_profile_projection(user)
+    data = get_profile_response_data(projection)
+    if projection['user_type'] == 'member':
+        # 연속 운동 기록은 세트 변경마다 바뀌므로 프로필 캐시와 별도로 조회
+        data['streak'] = get_streak_summary(projection['id'])
+    return data
+
+
+def get_profile_response_data(projection):
+    # 프로필 조회 응답 구성
+    return {
+        'id': projection['id'],
+        'name': projection['name'],
+        'email': projection['email'],
+        'phone': projection['phone'],
+        'user_type': projection['user_type'],
+        'created_at': projection['date_joined'],
+        # 프로필이 아직 생성되지 않은 경우 None 유지
+        'profile_image': get_preferred_image(projection),
+        'profile_image_variants': projection['profile_image_variants'],
+        'age': projection['age'],
+        'height_cm': projection['height_cm'],
+        'weight_kg': projection['weight_kg'],
+        'body_fat_percentage': projection['body_fat_percentage'],
+        'muscle_mass_kg': projection['muscle_mass_kg'],
     }
 
-    try:
-        if user.user_type == 'trainer':
-            # 로그인 유저 타입이 트레이너일 때
-            trainer_profile = Trainer.objects.get(user_ptr_id=user.id)
-            profile_data.update({
-                'profile_image': trainer_profile.profile_image.url if trainer_profile.profile_image else None,
-                'age': trainer_profile.age,
-                'phone': trainer_profile.phone,
-                'height_cm': trainer_profile.height_cm,
-                'weight_kg': trainer_profile.weight_kg,
-                'body_fat_percentage': trainer_profile.body_fat_percentage,
-                'muscle_mass_kg': trainer_profile.muscle_mass_kg,
-            })
-        elif user.user_type == 'member':
-            # 로그인 유저 타입이 회원일 때
-            member_profile = Member.objects.get(user_ptr_id=user.id)
-            profile_data.update({
-                'profile_image': member_profile.profile_image.url if member_profile.profile_image else None,
-                'age': member_profile.age,
-                'phone': member_profile.phone,
-                'height_cm': member_profile.height_cm,
-                'weight_kg': member_profile.weight_kg,
-                'body_fat_percentage': member_profile.body_fat_percentage,
-                'muscle_mass_kg': member_profile.muscle_mass_kg,
-            })
-    
-    except (Trainer.DoesNotExist, Member.DoesNotExist):
-        # 프로필이 아직 생성되지 않은 경우 : 기본값 유지
-        pass
 
-    return profile_data
+def _to_float(value):
+    return float(value) if value else None
+
+
+def get_profile_detail_data(request, projection):
+    # 트레이너/회원 상세 응답 공통 필드
+    return {
+        'id': projection['id'],
+        'profile_image': get_preferred_image(projection),
+        'profile_image_variants': projection['profile_image_variants'],
+        'name': projection['name'],
+        'email': projection['email'],
+        'phone': projection['phone'],
+        'age': projection['age'],
+        'height_cm': _to_float(projection['height_cm']),
+        'weight_kg': _to_float(projection['weight_kg']),
+        'body_fat_percentage': _to_float(projection['body_fat_percentage']),
+        'muscle_mass_kg': _to_float(projection['muscle_mass_kg']),
+        'profile_completed': projection['profile_completed'],
+        'is_active': projection['is_active'],
+        'created_at': projection['date_joined'].isoformat() if projection['date_joined'] else None,
+        'updated_at': projection['updated_at'].isoformat() if projection['updated_at'] else None,
+        'is_my_profile': request.user.id == projection['id'],
+    }
 
 
 
@@ -83,6 +92,7 @@ def get_user_profile_data(user):
                 "weight_kg": {"type": "number", "description": "몸무게 (kg)"},
                 "body_fat_percentage": {"type": "number", "description": "체지방량 (%)"},
                 "muscle_mass_kg": {"type": "number", "description": "골격근량 (kg)"},
+                "weekly_target": {"type": "integer", "description": "주간 목표 운동 일수 (회원, 1~7)"},
             }
         }
     },
@@ -94,6 +104,7 @@ def get_user_profile_data(user):
 )
 @api_view(['GET', 'PUT', 'PATCH'])
 @permission_classes([IsAuthenticated])
+@parser_classes([JSONParser, MultiPartParser, FormParser])
 def my_profile_view(request):
     if request.method == 'GET':
         # 프로필 조회 로직
@@ -112,9 +123,8 @@ def my_profile_view(request):
 
         try:
             if user.user_type == 'trainer':
-                try:
-                    trainer_profile = Trainer.objects.get(user_ptr_id=user.id)
-                except Trainer.DoesNotExist:
+                trainer_profile = resolve_user(user.id)
+                if not isinstance(trainer_profile, Trainer):
                     return Response({
                         'success': False,
                         'message': '트레이너 프로필을 찾을 수 없습니다.'
@@ -125,27 +135,46 @@ def my_profile_view(request):
                         setattr(trainer_profile, field, request.data[field])
                 
                 if 'profile_image' in request.FILES:
-                    trainer_profile.profile_image = request.FILES['profile_image']
+                    validate_profile_image(request.FILES['profile_image'])
+                    # 원본도 메타데이터(EXIF/GPS 등)를 제거해 다시 인코딩한 파일로 저장
+                    trainer_profile.profile_image = strip_image_metadata(request.FILES['profile_image'])
+                    trainer_profile.profile_image_variants = {}
                 
                 trainer_profile.save()
 
+                if 'profile_image' in request.FILES:
+                    # 변환본(avatar/card/full)은 요청 스레드 밖에서 생성
+                    schedule_profile_image_processing(trainer_profile)
+
             elif user.user_type == 'member':
-                try:
-                    member_profile = Member.objects.get(user_ptr_id=user.id)
-                except Member.DoesNotExist:
+                member_profile = resolve_user(user.id)
+                if not isinstance(member_profile, Member):
                     return Response({
                         'success': False,
                         'message': '회원 프로필을 찾을 수 없습니다.'
                     }, status=status.HTTP_404_NOT_FOUND)
 
+                # 주간 목표 운동 일수 (1~7) - 잘못된 값이면 프로필을 저장하기 전에 400
+                weekly_target = clean_weekly_target(request.data['weekly_target']) if 'weekly_target' in request.data else None
+
                 for field in updatable_fields:
                     if field in request.data:
                         setattr(member_profile, field, request.data[field])
 
                 if 'profile_image' in request.FILES:
-                    member_profile.profile_image = request.FILES['profile_image']
-                
-                member_profile.save()
+                    validate_profile_image(request.FILES['profile_image'])
+                    # 원본도 메타데이터(EXIF/GPS 등)를 제거해 다시 인코딩한 파일로 저장
+                    member_profile.profile_image = strip_image_metadata(request.FILES['profile_image'])
+                    member_profile.profile_image_variants = {}
+
+                with transaction.atomic():
+                    member_profile.save()
+                    if weekly_target is not None:
+                        set_weekly_target(member_profile.id, weekly_target)
+
+                if 'profile_image' in request.FILES:
+                    # 변환본(avatar/card/full)은 요청 스레드 밖에서 생성
+                    schedule_profile_image_processing(member_profile)
             
             updated_profile = get_user_profile_data(user)
 
@@ -209,8 +238,10 @@ def my_profile_view(request):
 @permission_classes([IsAuthenticated])
 def get_user_profile(request, user_id):
     # 다른 사용자 프로필 조회
-    target_user = get_object_or_404(User, id=user_id)
-    profile_data = get_user_profile_data(target_user)
+    projection = get_profile_projection(user_id)
+    if projection is None:
+        raise Http404('사용자를 찾을 수 없습니다.')
+    profile_data = get_profile_response_data(projection)
 
     return Response({
         'success': True,
@@ -317,9 +348,11 @@ def trainer_member_list(request):
         except Exception as e:
             member_count = 0
 
-        # 트레이너 프로필 정보
+        # 트레이너 프로필 정보 (목록 화면은 avatar 변환본 사용)
+        trainer_image, trainer_image_variants = get_profile_image_urls(trainer, preferred='avatar')
         trainer_data = {
-            'profile_image': trainer.profile_image.url if trainer.profile_image else None,
+            'profile_image': trainer_image,
+            'profile_image_variants': trainer_image_variants,
             'name': getattr(trainer, 'name', 'Unknown'),
             'email': getattr(trainer, 'email', 'unknown@example.com'),
             'phone': getattr(trainer, 'phone', '010-1234-5678'),
@@ -338,9 +371,11 @@ def trainer_member_list(request):
         members_data = []
         for member in members:
             try:
+                member_image, member_image_variants = get_profile_image_urls(member, preferred='avatar')
                 member_info = {
                     'id': member.id,
-                    'profile_image': member.profile_image.url if member.profile_image else None,
+                    'profile_image': member_image,
+                    'profile_image_variants': member_image_variants,
                     'name': getattr(member, 'name', 'Unknown'),
                     'email': getattr(member, 'email', 'unknown@example.com'),
                     'phone': getattr(trainer, 'phone', '010-1234-5678'),
@@ -593,33 +628,16 @@ def trainer_detail(request, trainer_id):
     # 트레이너 상세 조회
     try:
         # 트레이너 정보 가져오기
-        try:
-            trainer = Trainer.objects.get(id=trainer_id)
-        except Trainer.DoesNotExist:
+        projection = get_profile_projection(trainer_id)
+        if projection is None or projection['profile_type'] != 'trainer':
             return Response({
                 'error': 'TRAINER_NOT_FOUND',
                 'message': '트레이너를 찾을 수 없습니다.'
             }, status=status.HTTP_404_NOT_FOUND)
 
         # 트레이너 상세 정보 구성
-        trainer_data = {
-            'id': trainer.id,
-            'profile_image': trainer.profile_image.url if trainer.profile_image else None,
-            'name': getattr(trainer, 'name', 'Unknown'),
-            'email': getattr(trainer, 'email', 'unknown@example.com'),
-            'phone': getattr(trainer, 'phone', '010-1234-5678'),
-            'age': getattr(trainer, 'age', None),
-            'height_cm': float(trainer.height_cm) if trainer.height_cm else None,
-            'weight_kg': float(trainer.weight_kg) if trainer.weight_kg else None,
-            'body_fat_percentage': float(trainer.body_fat_percentage) if trainer.body_fat_percentage else None,
-            'muscle_mass_kg': float(trainer.muscle_mass_kg) if trainer.muscle_mass_kg else None,
-            'profile_completed': getattr(trainer, 'profile_completed', False),
-            'is_active': getattr(trainer, 'is_active', True),
-            'created_at': trainer.date_joined.isoformat() if hasattr(trainer, 'date_joined') else None,
-            'updated_at': trainer.updated_at.isoformat() if hasattr(trainer, 'updated_at') and trainer.updated_at else None,
-            'is_my_profile': request.user.id == trainer.user_ptr_id,
-            'member_count': trainer.get_member_count() if hasattr(trainer, 'get_member_count') else 0
-        }
+        trainer_data = get_profile_detail_data(request, projection)
+        trainer_data['member_count'] = Member.objects.filter(assigned_trainer_id=trainer_id, is_active=True).count()
 
         return Response({
             'success': True,
@@ -663,77 +681,45 @@ def trainer_detail(request, trainer_id):
 def member_detail(request, member_id):
     # 회원 상세 정보 조회
     try:
-        user_data = None
-        user_type = None
-        # 조회하려는 회원 정보 가져오기
-        try:
-            member = Member.objects.get(id=member_id)
-            user_type = "member"
-        
-        # 회원 상세 정보 구성
-            user_data = {
-                'id': member.id,
-                'profile_image': member.profile_image.url if member.profile_image else None,
-                'name': getattr(member, 'name', 'Unknown'),
-                'email': getattr(member, 'email', 'unknown@example.com'),
-                'phone': getattr(member, 'phone', '010-1234-5678'),
-                'age': getattr(member, 'age', None),
-                'height_cm': float(member.height_cm) if member.height_cm else None,
-                'weight_kg': float(member.weight_kg) if member.weight_kg else None,
-                'body_fat_percentage': float(member.body_fat_percentage) if member.body_fat_percentage else None,
-                'muscle_mass_kg': float(member.muscle_mass_kg) if member.muscle_mass_kg else None,
-                'profile_completed': getattr(member, 'profile_completed', False),
-                'is_active': getattr(member, 'is_active', True),
-                'created_at': member.date_joined.isoformat() if hasattr(member, 'date_joined') else None,
-                'updated_at': member.updated_at.isoformat() if hasattr(member, 'updated_at') and member.updated_at else None,
-                'is_my_profile': request.user.id == member.user_ptr_id,
-            }
+        # 조회하려는 사용자 정보 가져오기 (회원/트레이너 구분 포함 단일 조회)
+        projection = get_profile_projection(member_id)
+        user_type = projection['profile_type'] if projection else None
+
+        if user_type == 'member':
+            # 회원 상세 정보 구성
+            user_data = get_profile_detail_data(request, projection)
 
             # 트레이너 정보 추가
-            if member.assigned_trainer:
+            trainer_projection = None
+            if projection['assigned_trainer_id']:
+                trainer_projection = get_profile_projection(projection['assigned_trainer_id'])
+
+            if trainer_projection:
                 user_data['trainer_info'] = {
-                    'id': member.assigned_trainer.id,
-                    'name': getattr(member.assigned_trainer, 'name', 'Unknown'),
-                    'email': getattr(member.assigned_trainer, 'email', 'unknown@example.com'),
-                    'phone': getattr(member.assigned_trainer, 'phone', '010-1234-5678'),
-                    'profile_image': member.assigned_trainer.profile_image.url if member.assigned_trainer.profile_image else None
+                    'id': trainer_projection['id'],
+                    'name': trainer_projection['name'],
+                    'email': trainer_projection['email'],
+                    'phone': trainer_projection['phone'],
+                    'profile_image': get_preferred_image(trainer_projection, preferred='avatar'),
+                    'profile_image_variants': trainer_projection['profile_image_variants']
                 }
             else:
                 user_data['trainer_info'] = None
 
-        except Member.DoesNotExist:
-            try:
-                trainer = Trainer.objects.get(id=member_id)
-                user_type = "trainer"
-                
-                user_data = {
-                    'id': trainer.id,
-                    'user_type': 'trainer',
-                    'profile_image': trainer.profile_image.url if trainer.profile_image else None,
-                    'name': getattr(trainer, 'name', 'Unknown'),
-                    'email': getattr(trainer, 'email', 'unknown@example.com'),
-                    'phone': getattr(trainer, 'phone', '010-1234-5678'),
-                    'age': getattr(trainer, 'age', None),
-                    'height_cm': float(trainer.height_cm) if trainer.height_cm else None,
-                    'weight_kg': float(trainer.weight_kg) if trainer.weight_kg else None,
-                    'body_fat_percentage': float(trainer.body_fat_percentage) if trainer.body_fat_percentage else None,
-                    'muscle_mass_kg': float(trainer.muscle_mass_kg) if trainer.muscle_mass_kg else None,
-                    'profile_completed': getattr(trainer, 'profile_completed', False),
-                    'is_active': getattr(trainer, 'is_active', True),
-                    'created_at': trainer.date_joined.isoformat() if hasattr(trainer, 'date_joined') else None,
-                    'updated_at': trainer.updated_at.isoformat() if hasattr(trainer, 'updated_at') and trainer.updated_at else None,
-                    'is_my_profile': request.user.id == trainer.user_ptr_id,
-                    'member_count': trainer.get_member_count() if hasattr(trainer, 'get_member_count') else 0
-                }
-                
-                user_data['trainer_info'] = None  # 트레이너는 담당 트레이너 없음
-                
-            except Trainer.DoesNotExist:
-                # 3. 둘 다 없으면 404 반환
-                return Response({
-                    'detail': 'User not found',
-                    'code': 'user_not_found'
-                }, status=status.HTTP_404_NOT_FOUND)
+            user_data['streak'] = get_streak_summary(member_id)
+
+        elif user_type == 'trainer':
+            user_data = get_profile_detail_data(request, projection)
+            user_data['user_type'] = 'trainer'
+            user_data['member_count'] = Member.objects.filter(assigned_trainer_id=member_id, is_active=True).count()
+            user_data['trainer_info'] = None  # 트레이너는 담당 트레이너 없음
+
+        else:
+            # 둘 다 없으면 404 반환
+            return Response({
+                'detail': 'User not found',
+                'code': 'user_not_found'
+            }, status=status.HTTP_404_NOT_FOUND)
 
         # 운동 기록 조회(workouts에서 처리)
         try:
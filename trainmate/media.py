@@ -0,0 +1,102 @@
+# trainmate/media.py
+
+import os
+import re
+from django.conf import settings
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseNotModified, StreamingHttpResponse
+from django.utils._os import safe_join
+from django.views.decorators.http import require_safe
+from .storage import is_content_addressed
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+CHUNK_SIZE = 64 * 1024
+
+# 브라우저에서 바로 표시하는 이미지 타입 (그 외 파일은 다운로드로만 제공)
+INLINE_CONTENT_TYPES = {
+    '.jpg': 'image/jpeg',
+    '.png': 'image/png',
+    '.webp': 'image/webp',
+    '.gif': 'image/gif',
+}
+
+
+def _cache_headers(response, name, size):
+    # 내용 해시 파일은 변경되지 않으므로 1년 immutable 캐시
+    if is_content_addressed(name):
+        response['Cache-Control'] = f'public, max-age={settings.MEDIA_CACHE_MAX_AGE}, immutable'
+        response['ETag'] = f'"{os.path.splitext(os.path.basename(name))[0]}"'
+    else:
+        response['Cache-Control'] = 'public, max-age=3600'
+    response['Accept-Ranges'] = 'bytes'
+    # 허용 목록 외 파일을 HTML 등으로 해석해 실행하지 않도록 타입 추측 금지 / 다운로드 처리
+    response['X-Content-Type-Options'] = 'nosniff'
+    if os.path.splitext(name)[1].lower() not in INLINE_CONTENT_TYPES:
+        response['Content-Disposition'] = 'attachment'
+    return response
+
+
+def _parse_range(header, size):
+    # 단일 바이트 범위(bytes=start-end)만 지원, 해석할 수 없으면 None
+    match = RANGE_RE.match(header.strip())
+    if not match or (not match.group(1) and not match.group(2)):
+        return None
+
+    start, end = match.group(1), match.group(2)
+    if start:
+        start = int(start)
+        end = min(int(end), size - 1) if end else size - 1
+    else:
+        # bytes=-N : 마지막 N바이트
+        length = int(end)
+        start = max(size - length, 0)
+        end = size - 1
+    return start, end
+
+
+def _iter_range(path, start, length):
+    with open(path, 'rb') as media_file:
+        media_file.seek(start)
+        remaining = length
+        while remaining > 0:
+            chunk = media_file.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+@require_safe
+def serve_media(request, path):
+    # 업로드 파일 제공 (immutable 캐시, ETag, Range 요청 지원)
+    try:
+        full_path = safe_join(settings.MEDIA_ROOT, path)
+    except ValueError:
+        raise Http404('잘못된 경로입니다.')
+    if not os.path.isfile(full_path):
+        raise Http404('파일을 찾을 수 없습니다.')
+
+    size = os.path.getsize(full_path)
+    content_type = INLINE_CONTENT_TYPES.get(os.path.splitext(path)[1].lower(), 'application/octet-stream')
+
+    if is_content_addressed(path):
+        etag = f'"{os.path.splitext(os.path.basename(path))[0]}"'
+        if request.headers.get('If-None-Match') == etag:
+            return _cache_headers(HttpResponseNotModified(), path, size)
+
+    range_header = request.headers.get('Range')
+    if range_header:
+        byte_range = _parse_range(range_header, size)
+        if byte_range is None or byte_range[0] >= size or byte_range[0] > byte_range[1]:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{size}'
+            return _cache_headers(response, path, size)
+
+        start, end = byte_range
+        length = end - start + 1
+        response = StreamingHttpResponse(_iter_range(full_path, start, length), status=206, content_type=content_type)
+        response['Content-Length'] = str(length)
+        response['Content-Range'] = f'bytes {start}-{end}/{size}'
+        return _cache_headers(response, path, size)
+
+    response = FileResponse(open(full_path, 'rb'), content_type=content_type)
+    return _cache_headers(response, path, size)
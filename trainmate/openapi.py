@@ -0,0 +1,97 @@
+# trainmate/openapi.py
+# 빌드 단계에서 만든 OpenAPI 스키마 파일 저장/제공
+# - openapi.<해시>.json: 내용 해시(sha256 앞 12자리)로 이름을 정한 스키마 (내용이 바뀌면 새 파일)
+# - manifest.json: 현재 스키마 파일 이름과 해시
+
+import hashlib
+import json
+import os
+from django.conf import settings
+from django.http import Http404, HttpResponse, HttpResponseNotModified
+from django.utils import timezone
+from django.views.decorators.http import require_safe
+
+MANIFEST_NAME = 'manifest.json'
+IMMUTABLE_MAX_AGE = 60 * 60 * 24 * 365
+
+# ((manifest 경로, 수정 시각), manifest) - 프로세스 내부 캐시
+_manifest_cache = None
+
+
+def schema_file_name(digest):
+    return f'openapi.{digest}.json'
+
+
+def write_schema_artifact(content, schema_dir=None):
+    # 스키마(JSON 바이트)를 내용 해시 파일로 저장하고 manifest 갱신 -> manifest
+    schema_dir = schema_dir or settings.API_SCHEMA_DIR
+    os.makedirs(schema_dir, exist_ok=True)
+    digest = hashlib.sha256(content).hexdigest()[:12]
+    name = schema_file_name(digest)
+
+    path = os.path.join(schema_dir, name)
+    if not os.path.exists(path):
+        _atomic_write(path, content)
+
+    manifest = {
+        'file': name,
+        'hash': digest,
+        'size': len(content),
+        'generated_at': timezone.now().isoformat(),
+    }
+    _atomic_write(os.path.join(schema_dir, MANIFEST_NAME), json.dumps(manifest, indent=2).encode())
+    return manifest
+
+
+def _atomic_write(path, content):
+    # 제공 중인 파일이 중간 상태로 읽히지 않도록 임시 파일에 쓴 뒤 교체
+    temp_path = f'{path}.tmp'
+    with open(temp_path, 'wb') as output:
+        output.write(content)
+    os.replace(temp_path, path)
+
+
+def get_schema_manifest():
+    # 현재 manifest (빌드된 스키마가 없으면 None) - 파일이 바뀔 때만 다시 읽음
+    global _manifest_cache
+    path = os.path.join(settings.API_SCHEMA_DIR, MANIFEST_NAME)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    if _manifest_cache is None or _manifest_cache[0] != (path, mtime):
+        with open(path, 'rb') as manifest_file:
+            _manifest_cache = ((path, mtime), json.load(manifest_file))
+    return _manifest_cache[1]
+
+
+def _read_schema(digest):
+    path = os.path.join(settings.API_SCHEMA_DIR, schema_file_name(digest))
+    try:
+        with open(path, 'rb') as schema_file:
+            return schema_file.read()
+    except FileNotFoundError:
+        raise Http404('스키마 파일을 찾을 수 없습니다.')
+
+
+@require_safe
+def serve_schema(request, digest=None):
+    # /api/schema/ : 현재 스키마 (ETag로 변경 여부 확인)
+    # /api/schema/<해시>.json : 해당 버전 스키마 (내용이 바뀌지 않으므로 immutable 캐시)
+    if digest is None:
+        manifest = get_schema_manifest()
+        if manifest is None:
+            raise Http404('빌드된 API 스키마가 없습니다.')
+        digest = manifest['hash']
+        cache_control = 'public, no-cache'
+    else:
+        cache_control = f'public, max-age={IMMUTABLE_MAX_AGE}, immutable'
+
+    etag = f'"{digest}"'
+    if request.headers.get('If-None-Match') == etag:
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(_read_schema(digest), content_type='application/json')
+    response['ETag'] = etag
+    response['Cache-Control'] = cache_control
+    return response
@@ -0,0 +1,54 @@
+# trainmate/schema.py
+# 뷰 모듈은 drf_spectacular 대신 여기서 스키마 데코레이터를 가져옴
+# API_SCHEMA_ENABLED가 꺼져 있으면 drf_spectacular를 불러오지 않고, 데코레이터는 뷰를 그대로 반환
+
+from django.conf import settings
+
+__all__ = [
+    'extend_schema', 'extend_schema_view',
+    'OpenApiExample', 'OpenApiParameter', 'OpenApiResponse', 'OpenApiTypes',
+]
+
+if settings.API_SCHEMA_ENABLED:
+    from drf_spectacular.types import OpenApiTypes
+    from drf_spectacular.utils import (
+        extend_schema, extend_schema_view, OpenApiExample, OpenApiParameter, OpenApiResponse
+    )
+else:
+    def _return_view(view):
+        return view
+
+    def extend_schema(*args, **kwargs):
+        return _return_view
+
+    def extend_schema_view(**kwargs):
+        return _return_view
+
+    class _SchemaObject:
+        # 데코레이터 인자로만 쓰이는 스키마 객체 - 인자를 보관하지 않음
+        __slots__ = ()
+
+        def __init__(self, *args, **kwargs):
+            pass
+
+    class OpenApiExample(_SchemaObject):
+        __slots__ = ()
+
+    class OpenApiResponse(_SchemaObject):
+        __slots__ = ()
+
+    class OpenApiParameter(_SchemaObject):
+        __slots__ = ()
+        QUERY = 'query'
+        PATH = 'path'
+        HEADER = 'header'
+        COOKIE = 'cookie'
+
+    class _OpenApiTypes:
+        # OpenApiTypes.INT 등 이름만 돌려줌
+        def __getattr__(self, name):
+            if name.startswith('_'):
+                raise AttributeError(name)
+            return name
+
+    OpenApiTypes = _OpenApiTypes()
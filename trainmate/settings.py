@@ -18,6 +18,10 @@ SECRET_KEY = config('SECRET_KEY')
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = config('DEBUG', default=False, cast=bool)
 
+# API 문서(drf-spectacular) 사용 여부 - 끄면 drf_spectacular와 뷰의 스키마 메타데이터를 불러오지 않음
+# 운영 환경에서는 꺼서 워커 시작 시간과 메모리를 줄이고, 빌드 단계에서 만든 스키마 파일(build_schema)만 제공
+API_SCHEMA_ENABLED = config('API_SCHEMA_ENABLED', default=DEBUG, cast=bool)
+
 ALLOWED_HOSTS = config('ALLOWED_HOSTS', default='localhost').split(',')
 
 # 커스텀 User 모델 설정
@@ -35,14 +39,18 @@ INSTALLED_APPS = [
     # second apps
     'rest_framework',
     'rest_framework_simplejwt',
+    'rest_framework_simplejwt.token_blacklist',
     'corsheaders',
-    'drf_spectacular',
     # third apps
+    'core',
     'accounts',
     'workouts',
     'members',
 ]
 
+if API_SCHEMA_ENABLED:
+    INSTALLED_APPS.append('drf_spectacular')
+
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
@@ -71,6 +79,7 @@ CORS_ALLOW_HEADERS = [
     'user-agent',
     'x-csrftoken',
     'x-requested-with',
+    'idempotency-key',
 ]
 
 CORS_ALLOW_ALL_ORIGINS = False
@@ -153,6 +162,30 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 
+# 업로드 파일 (프로필 이미지)
+MEDIA_URL = '/media/'
+MEDIA_ROOT = config('MEDIA_ROOT', default=str(BASE_DIR / 'media'))
+
+# 업로드 파일은 내용 해시(sha256)로 이름을 정해 저장 (동일 파일 중복 제거)
+STORAGES = {
+    'default': {
+        'BACKEND': 'trainmate.storage.ContentAddressedStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+    },
+}
+
+# 업로드를 메모리에 올리지 않고 청크 단위로 임시 파일에 기록
+FILE_UPLOAD_HANDLERS = [
+    'django.core.files.uploadhandler.TemporaryFileUploadHandler',
+]
+FILE_UPLOAD_MAX_MEMORY_SIZE = 256 * 1024
+
+# 로컬 미디어 핸들러 사용 여부 및 내용 해시 파일의 캐시 기간 (1년, immutable)
+SERVE_MEDIA = config('SERVE_MEDIA', default=True, cast=bool)
+MEDIA_CACHE_MAX_AGE = 60 * 60 * 24 * 365
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -172,9 +205,11 @@ REST_FRAMEWORK = {
     'DEFAULT_PARSER_CLASSES': [
         'rest_framework.parsers.JSONParser',
     ],
-    'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
 }
 
+if API_SCHEMA_ENABLED:
+    REST_FRAMEWORK['DEFAULT_SCHEMA_CLASS'] = 'drf_spectacular.openapi.AutoSchema'
+
 # JWT 설정
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=60),  # Access 토큰 만료시간: 1시간
@@ -182,6 +217,175 @@ SIMPLE_JWT = {
     'ROTATE_REFRESH_TOKENS': True,                   # Refresh 토큰 갱신 시 새 토큰 발행
     'BLACKLIST_AFTER_ROTATION': True,                # 기존 Refresh 토큰 블랙리스트 처리
     'UPDATE_LAST_LOGIN': True,
+    'TOKEN_REFRESH_SERIALIZER': 'accounts.tokens.RevocableTokenRefreshSerializer',
+}
+
+# Refresh 토큰 폐기 확인 (워커별 블룸 필터)
+# 필터 재생성 주기(초), 최소 크기, 오탐률 (오탐된 토큰만 DB 조회)
+# 공유 캐시의 폐기 버전 확인 주기(초) - 다른 워커의 폐기가 반영되기까지 걸리는 최대 시간
+TOKEN_REVOCATION_FILTER_REBUILD = config('TOKEN_REVOCATION_FILTER_REBUILD', default=600, cast=int)
+TOKEN_REVOCATION_VERSION_CHECK = config('TOKEN_REVOCATION_VERSION_CHECK', default=5, cast=int)
+TOKEN_REVOCATION_FILTER_CAPACITY = 10000
+TOKEN_REVOCATION_FILTER_ERROR_RATE = 0.001
+# 만료 토큰 정리 시 한 번에 삭제할 개수
+TOKEN_PURGE_BATCH_SIZE = 1000
+
+# 운동 세트 보관(아카이브) 설정
+# 기준 일수보다 오래된 세트는 archived_exercise_set 테이블로 옮겨 ExerciseSet 인덱스를 작게 유지
+WORKOUT_ARCHIVE_HORIZON_DAYS = config('WORKOUT_ARCHIVE_HORIZON_DAYS', default=90, cast=int)
+WORKOUT_ARCHIVE_BATCH_SIZE = config('WORKOUT_ARCHIVE_BATCH_SIZE', default=1000, cast=int)
+
+# 프로필 이미지 처리 설정
+# 업로드 원본은 검증 후 저장하고, 메타데이터를 제거한 고정 크기 변환본(webp/jpeg)을 요청 스레드 밖에서 생성
+PROFILE_IMAGE_MAX_UPLOAD_SIZE = config('PROFILE_IMAGE_MAX_UPLOAD_SIZE', default=10 * 1024 * 1024, cast=int)
+PROFILE_IMAGE_MAX_PIXELS = 40_000_000
+PROFILE_IMAGE_ASYNC = config('PROFILE_IMAGE_ASYNC', default=True, cast=bool)
+PROFILE_IMAGE_VARIANTS = {
+    'avatar': {'size': 96, 'crop': True},    # 회원 목록용
+    'card': {'size': 320, 'crop': True},     # 상세 카드용
+    'full': {'size': 1080, 'crop': False},   # 프로필 화면용 (비율 유지)
+}
+
+# 캐시 설정
+# 공유 캐시(L2): CACHE_REDIS_URL이 있으면 Redis, 없으면 DB 테이블 (core 마이그레이션에서 생성)
+CACHE_REDIS_URL = config('CACHE_REDIS_URL', default='')
+if CACHE_REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': CACHE_REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'cache_entry',
+            'OPTIONS': {'MAX_ENTRIES': config('CACHE_MAX_ENTRIES', default=50000, cast=int)},
+        }
+    }
+
+# 프로세스 내부 캐시(L1) 최대 항목 수
+CACHE_LOCAL_MAX_ENTRIES = config('CACHE_LOCAL_MAX_ENTRIES', default=2000, cast=int)
+
+# 운동 카탈로그(운동 목록) / 회원 운동 기록 응답 캐시 유지 시간(초) - 변경 시 태그로 무효화
+EXERCISE_CATALOGUE_CACHE_TIMEOUT = config('EXERCISE_CATALOGUE_CACHE_TIMEOUT', default=3600, cast=int)
+MEMBER_RECORDS_CACHE_TIMEOUT = config('MEMBER_RECORDS_CACHE_TIMEOUT', default=300, cast=int)
+
+# 프로필 응답용 캐시 유지 시간(초) - User/Trainer/Member 저장 시 무효화
+PROFILE_CACHE_TIMEOUT = config('PROFILE_CACHE_TIMEOUT', default=300, cast=int)
+
+# 트레이너-회원 권한 캐시 (공유 캐시 유지 시간, 프로세스 내부 캐시 유지 시간 - 초)
+MEMBER_ACCESS_CACHE_TIMEOUT = config('MEMBER_ACCESS_CACHE_TIMEOUT', default=600, cast=int)
+MEMBER_ACCESS_LOCAL_TTL = config('MEMBER_ACCESS_LOCAL_TTL', default=5, cast=int)
+
+# 실시간 운동 피드(SSE) 설정
+# 백엔드는 publish/subscribe/unsubscribe 인터페이스를 구현한 클래스 경로 (기본: 프로세스 내부)
+# 피드는 ASGI 서버(uvicorn 등)에서만 제공 - 기본 백엔드는 다른 프로세스의 이벤트를 받지 못하므로 워커 1개로 실행
+# WEB_CONCURRENCY는 gunicorn/uvicorn의 워커 수 환경 변수 - 2 이상이면 기본 백엔드 사용 시 시스템 체크 오류
+WORKOUT_LIVE_BACKEND = config('WORKOUT_LIVE_BACKEND', default='workouts.live.InProcessBackend')
+WEB_CONCURRENCY = config('WEB_CONCURRENCY', default=1, cast=int)
+# 구독 티켓 유효 시간(초) - 발급 후 바로 EventSource로 접속
+WORKOUT_LIVE_TICKET_TTL = config('WORKOUT_LIVE_TICKET_TTL', default=30, cast=int)
+WORKOUT_LIVE_HEARTBEAT_SECONDS = 15
+WORKOUT_LIVE_QUEUE_SIZE = 100
+WORKOUT_LIVE_RETRY_MS = 3000
+
+# 오프라인 동기화 설정
+# 스트림별 페이지 크기, 일괄 반영 최대 건수, 커밋 지연 대비 조회 유예 시간(초)
+SYNC_PAGE_SIZE = config('SYNC_PAGE_SIZE', default=500, cast=int)
+SYNC_MAX_BATCH_SIZE = 200
+SYNC_SETTLE_SECONDS = config('SYNC_SETTLE_SECONDS', default=2, cast=int)
+
+# Idempotency-Key 설정
+# 응답 보관 시간, 처리 중 키를 버려진 것으로 볼 시간(초), 동시 중복 요청의 대기 시간(초)
+IDEMPOTENCY_KEY_TTL_HOURS = config('IDEMPOTENCY_KEY_TTL_HOURS', default=24, cast=int)
+IDEMPOTENCY_PENDING_TIMEOUT = 60
+IDEMPOTENCY_WAIT_SECONDS = 5
+
+# 운동 기록 내보내기 - 서버 측 커서에서 한 번에 가져올 행 수
+EXPORT_CHUNK_SIZE = config('EXPORT_CHUNK_SIZE', default=2000, cast=int)
+
+# 운동 기록 가져오기(CSV) - 한 번에 처리할 행 수, PostgreSQL에서 세트 적재에 COPY 사용 여부
+IMPORT_BATCH_SIZE = config('IMPORT_BATCH_SIZE', default=5000, cast=int)
+IMPORT_USE_COPY = config('IMPORT_USE_COPY', default=True, cast=bool)
+
+# 칼로리 계산 (MET × 몸무게(kg) × 시간(h))
+# 몸무게를 입력하지 않은 회원의 기본 몸무게, MET 테이블 캐시 시간(공유/프로세스 내부 - 초), 재계산 배치 크기
+CALORIE_DEFAULT_WEIGHT_KG = 70
+MET_TABLE_CACHE_TIMEOUT = config('MET_TABLE_CACHE_TIMEOUT', default=3600, cast=int)
+MET_TABLE_LOCAL_TTL = 60
+CALORIE_RECOMPUTE_BATCH_SIZE = config('CALORIE_RECOMPUTE_BATCH_SIZE', default=2000, cast=int)
+
+# 백그라운드 작업 큐 (core.Job 테이블, manage.py run_worker로 실행)
+# JOB_QUEUE_EAGER=True면 워커 없이 커밋 직후 요청 스레드에서 실행 (개발용)
+JOB_QUEUE_EAGER = config('JOB_QUEUE_EAGER', default=False, cast=bool)
+JOB_WORKER_CONCURRENCY = config('JOB_WORKER_CONCURRENCY', default=4, cast=int)
+JOB_WORKER_POOL = config('JOB_WORKER_POOL', default='thread')   # thread 또는 process
+JOB_POLL_INTERVAL = 1.0
+JOB_MAX_ATTEMPTS = 5
+JOB_RETRY_BASE_SECONDS = 10           # 재시도 간격: 10초, 20초, 40초 ... 최대 1시간
+JOB_RETRY_MAX_SECONDS = 60 * 60
+JOB_LOCK_TIMEOUT = 60 * 30            # 이 시간 넘게 running인 작업은 워커 중단으로 보고 다시 대기 상태로
+JOB_RETENTION_DAYS = 7
+
+# 주기 작업 (cron 식: 분 시 일 월 요일, TIME_ZONE 기준)
+JOB_SCHEDULE = {
+    'archive-exercise-sets': {'task': 'workouts.archive_exercise_sets', 'cron': '0 4 * * *'},
+    'purge-idempotency-keys': {'task': 'workouts.purge_idempotency_keys', 'cron': '15 * * * *'},
+    'purge-finished-jobs': {'task': 'core.purge_finished_jobs', 'cron': '30 4 * * *'},
+    # 전달 작업 등록이 누락된 이벤트를 위한 안전망
+    'dispatch-events': {'task': 'core.dispatch_events', 'cron': '*/5 * * * *'},
+    'purge-dispatched-events': {'task': 'core.purge_dispatched_events', 'cron': '45 4 * * *'},
+    'compact-leaderboards': {'task': 'workouts.compact_leaderboards', 'cron': '0 3 * * *'},
+    'purge-expired-tokens': {'task': 'accounts.purge_expired_tokens', 'cron': '0 5 * * *'},
+}
+
+# 도메인 이벤트 (아웃박스)
+# 비동기 구독자 전달은 첫 이벤트 후 EVENT_DISPATCH_DELAY초 동안 모인 이벤트를 한 번에 처리
+EVENT_DISPATCH_DELAY = config('EVENT_DISPATCH_DELAY', default=2, cast=int)
+EVENT_DISPATCH_BATCH_SIZE = 500
+# 구독자가 실패한 이벤트는 EVENT_DISPATCH_RETRY_DELAY초 후 다시 전달, EVENT_DISPATCH_MAX_ATTEMPTS번 실패하면 전달 중단
+EVENT_DISPATCH_RETRY_DELAY = config('EVENT_DISPATCH_RETRY_DELAY', default=30, cast=int)
+EVENT_DISPATCH_MAX_ATTEMPTS = config('EVENT_DISPATCH_MAX_ATTEMPTS', default=5, cast=int)
+EVENT_RETENTION_DAYS = 3
+
+# 트레이너별 주간 리더보드 (기본/최대 조회 인원, 보관 주 수)
+LEADERBOARD_DEFAULT_LIMIT = 10
+LEADERBOARD_MAX_LIMIT = 100
+LEADERBOARD_RETENTION_WEEKS = 12
+
+# 연속 운동 기록 (과거 날짜 변경 시 앞뒤로 조회할 일 수, 주 단위 연속 계산 범위)
+STREAK_WINDOW_DAYS = 90
+STREAK_WEEK_WINDOW = 52
+
+# 트레이너 데이 보드 최대 조회 기간(일)
+DAY_BOARD_MAX_DAYS = 31
+
+# 묶음 조회 (한 번에 실행할 최대 요청 수, 동시 실행 스레드 수, 허용 경로)
+BATCH_MAX_REQUESTS = 20
+BATCH_MAX_WORKERS = 4
+BATCH_PATH_PREFIX = '/api/'
+
+# 운동 캘린더 히트맵 캐시 시간 (회원별 버전이 키에 포함되므로 세트 변경 시 자동으로 새 키 사용)
+HEATMAP_CACHE_TIMEOUT = config('HEATMAP_CACHE_TIMEOUT', default=60 * 60 * 24, cast=int)
+
+# 빌드된 OpenAPI 스키마 파일 위치 (manage.py build_schema로 생성, 파일 이름에 내용 해시 포함)
+API_SCHEMA_DIR = config('API_SCHEMA_DIR', default=str(BASE_DIR / 'schema'))
+
+# 콜드 스타트 예산 (manage.py profile_startup) - 넘으면 명령이 실패
+# 시간은 ms, 메모리는 KB / 앱별 import 예산은 앱 모듈이 처음 불러온 외부 패키지까지 포함한 시간(ms)
+STARTUP_BUDGETS = {
+    'setup_ms': 1500,
+    'urlconf_ms': 300,
+    'first_request_ms': 300,
+    'max_rss_kb': 150 * 1024,
+}
+STARTUP_IMPORT_BUDGETS = {
+    'core': 100,
+    'accounts': 150,
+    'members': 100,
+    'workouts': 150,
 }
 
 # drf-spectacular 설정
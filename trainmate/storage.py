@@ -0,0 +1,87 @@
+# trainmate/storage.py
+
+import hashlib
+import os
+import tempfile
+from django.core.files.storage import FileSystemStorage
+from django.utils.deconstruct import deconstructible
+from PIL import Image
+
+# 파일명이 내용 해시인지 판별할 때 사용하는 해시 길이 (sha256 hex)
+CONTENT_HASH_LENGTH = 64
+
+# Pillow가 판별한 이미지 포맷별 저장 확장자 (그 외 파일은 .bin)
+IMAGE_EXTENSIONS = {
+    'JPEG': '.jpg',
+    'MPO': '.jpg',
+    'PNG': '.png',
+    'WEBP': '.webp',
+    'GIF': '.gif',
+}
+DEFAULT_EXTENSION = '.bin'
+
+
+def detect_extension(path):
+    # 파일 내용으로 확장자 결정 (클라이언트가 보낸 파일명 확장자는 사용하지 않음)
+    try:
+        with Image.open(path) as image:
+            return IMAGE_EXTENSIONS.get(image.format, DEFAULT_EXTENSION)
+    except (OSError, SyntaxError, ValueError, Image.DecompressionBombError):
+        return DEFAULT_EXTENSION
+
+
+@deconstructible
+class ContentAddressedStorage(FileSystemStorage):
+    # 내용 해시(sha256)로 파일명을 정하는 로컬 파일 저장소
+    # - 업로드를 청크 단위로 임시 파일에 쓰면서 해시 계산 (메모리에 전체 파일을 올리지 않음)
+    # - 최종 경로: <upload_to>/<hash 앞 2자리>/<hash>.<확장자> (확장자는 내용으로 판별한 이미지 포맷 기준)
+    # - 같은 내용의 파일이 이미 있으면 새로 저장하지 않고 기존 파일명을 반환 (중복 제거)
+    # - 파일명이 바뀌지 않으므로 응답에 immutable 캐시 헤더를 붙일 수 있음
+
+    def get_available_name(self, name, max_length=None):
+        # 최종 파일명은 _save에서 해시로 결정하므로 중복 검사 생략
+        return name
+
+    def _save(self, name, content):
+        directory = os.path.dirname(name)
+
+        target_dir = self.path(directory) if directory else self.location
+        os.makedirs(target_dir, exist_ok=True)
+
+        # 같은 디렉터리에 임시 파일을 만들어 os.replace가 원자적으로 동작하도록 함
+        digest = hashlib.sha256()
+        fd, temp_path = tempfile.mkstemp(dir=target_dir, prefix='.upload-')
+        try:
+            with os.fdopen(fd, 'wb') as temp_file:
+                if hasattr(content, 'seek'):
+                    content.seek(0)
+                for chunk in content.chunks():
+                    digest.update(chunk)
+                    temp_file.write(chunk)
+
+            content_hash = digest.hexdigest()
+            extension = detect_extension(temp_path)
+            final_name = os.path.join(directory, content_hash[:2], f'{content_hash}{extension}')
+            final_path = self.path(final_name)
+
+            if os.path.exists(final_path):
+                # 동일한 내용의 파일이 이미 저장되어 있음
+                os.remove(temp_path)
+            else:
+                os.makedirs(os.path.dirname(final_path), exist_ok=True)
+                if self.file_permissions_mode is not None:
+                    os.chmod(temp_path, self.file_permissions_mode)
+                os.replace(temp_path, final_path)
+
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        return final_name.replace('\\', '/')
+
+
+def is_content_addressed(name):
+    # 파일명이 내용 해시 형식인지 확인 (immutable 캐시 적용 여부 판단)
+    stem = os.path.splitext(os.path.basename(name))[0]
+    return len(stem) == CONTENT_HASH_LENGTH and all(c in '0123456789abcdef' for c in stem)
@@ -1,9 +1,10 @@
 # trainmate/urls.py
 
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, re_path, include
 from django.conf import settings
-from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView, SpectacularRedocView
+from .media import serve_media
+from .openapi import serve_schema
 
 
 urlpatterns = [
@@ -11,13 +12,28 @@ urlpatterns = [
     path('auth/', include('accounts.urls')),
     path('api/members/', include('members.urls')),
     path('api/workouts/', include('workouts.urls')),
+    path('api/batch/', include('core.urls')),
 
 ]
 
-if settings.DEBUG:
+if settings.API_SCHEMA_ENABLED:
+    from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView, SpectacularRedocView
+
     urlpatterns += [
         # API 문서 관련 URL 추가
         path('api/schema/', SpectacularAPIView.as_view(), name='schema'), # OpenAPI JSON/YAML 스키마
         path('api/docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'), # Swagger UI
         path('api/redoc/', SpectacularRedocView.as_view(url_name='schema'), name='redoc'), # ReDoc UI
     ]
+else:
+    # 운영 환경에서는 빌드 단계에서 만든 스키마 파일 제공 (manage.py build_schema)
+    urlpatterns += [
+        path('api/schema/', serve_schema, name='schema'),
+        re_path(r'^api/schema/(?P<digest>[0-9a-f]{12})\.json$', serve_schema, name='schema-version'),
+    ]
+
+if settings.SERVE_MEDIA:
+    # 업로드 파일 제공 (내용 해시 파일은 immutable 캐시, Range 요청 지원)
+    urlpatterns += [
+        re_path(r'^%s(?P<path>.+)$' % settings.MEDIA_URL.lstrip('/'), serve_media, name='media'),
+    ]
@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class WorkoutsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'workouts'
+
+    def ready(self):
+        # MET/몸무게 변경 시 칼로리 재계산 시그널 등록
+        from workouts import signals  # noqa: F401
+        # 실시간 피드 배포 구성 시스템 체크 등록
+        from workouts import checks  # noqa: F401
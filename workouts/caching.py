@@ -0,0 +1,20 @@
+# workouts/caching.py
+# 운동 관련 캐시 태그
+
+from core import cache
+
+# 운동 카탈로그 (MET 테이블, 운동 목록 응답)
+EXERCISE_CATALOGUE_TAG = 'workouts:exercises'
+
+
+def member_records_tag(member_id):
+    return f'workouts:records:{member_id}'
+
+
+def invalidate_exercise_catalogue():
+    cache.invalidate_tags(EXERCISE_CATALOGUE_TAG)
+
+
+def invalidate_member_records(*member_ids):
+    # 세트가 바뀐 회원의 운동 기록 응답 캐시 무효화
+    cache.invalidate_tags(*{member_records_tag(member_id) for member_id in member_ids if member_id is not None})
@@ -0,0 +1,177 @@
+# workouts/calories.py
+
+from collections import defaultdict
+from datetime import timedelta
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, F, Value, When
+from django.utils import timezone
+from core import cache
+from core.queue import enqueue
+from members.profiles import get_profile_projection
+from .caching import EXERCISE_CATALOGUE_TAG, invalidate_exercise_catalogue, invalidate_member_records
+from .leaderboard import get_current_week_start, get_week_start
+from .models import Exercise, DailyWorkout, WorkoutExercise, ExerciseSet, ArchivedExerciseSet
+
+MET_TABLE_CACHE_KEY = 'workouts:met_table'
+
+
+def _load_met_table():
+    return {
+        exercise_id: float(met_value)
+        for exercise_id, met_value in Exercise.objects.values_list('id', 'met_value')
+    }
+
+
+def get_met_table():
+    # exercise_id -> MET 값 (L1 -> 공유 캐시 -> DB 순으로 조회, 운동 카탈로그 전체를 한 번에 적재)
+    return cache.get_or_set(
+        MET_TABLE_CACHE_KEY,
+        _load_met_table,
+        settings.MET_TABLE_CACHE_TIMEOUT,
+        tags=[EXERCISE_CATALOGUE_TAG],
+        local_ttl=settings.MET_TABLE_LOCAL_TTL
+    )
+
+
+def invalidate_met_table():
+    # 운동 추가/변경 시 운동 카탈로그 캐시(MET 테이블, 운동 목록) 무효화 (커밋 후 한 번 더 삭제)
+    invalidate_exercise_catalogue()
+
+
+def get_met_value(exercise_id):
+    met_value = get_met_table().get(exercise_id)
+    if met_value is None:
+        # 캐시 이후 추가된 운동 - 테이블을 다시 읽음
+        invalidate_met_table()
+        met_value = get_met_table().get(exercise_id, float(Exercise._meta.get_field('met_value').default))
+    return met_value
+
+
+def get_member_weight_kg(member_id):
+    # 프로필 캐시의 몸무게 (입력하지 않았으면 CALORIE_DEFAULT_WEIGHT_KG)
+    projection = get_profile_projection(member_id) if member_id else None
+    weight_kg = projection.get('weight_kg') if projection else None
+    return float(weight_kg) if weight_kg else float(settings.CALORIE_DEFAULT_WEIGHT_KG)
+
+
+def calculate_calories(met_value, weight_kg, duration):
+    # 칼로리 = MET × 체중(kg) × 시간(h)
+    if not duration:
+        return 0
+    return int(float(met_value) * float(weight_kg) * duration.total_seconds() / 3600)
+
+
+def calculate_set_calories(exercise_id, member_id, duration):
+    return calculate_calories(get_met_value(exercise_id), get_member_weight_kg(member_id), duration)
+
+
+def recompute_calories(exercise_id=None, member_id=None, met_value=None, weight_kg=None, batch_size=None):
+    # 운동의 MET 또는 회원의 몸무게가 바뀐 경우 영향받는 세트만 다시 계산 (현재 세트와 보관된 세트 모두)
+    # 직접 입력한 칼로리(calories_manual)는 유지, 배치마다 세트 bulk_update + 총합에 차이만 반영
+    # 변경한 세트 수를 반환
+    if exercise_id is None and member_id is None:
+        raise ValueError('exercise_id 또는 member_id가 필요합니다.')
+    if batch_size is None:
+        batch_size = settings.CALORIE_RECOMPUTE_BATCH_SIZE
+
+    # 변경된 값을 직접 받으면 캐시를 거치지 않고 사용 (무효화 직후 이전 값을 읽지 않도록)
+    met_table = {exercise_id: float(met_value)} if exercise_id is not None and met_value is not None else None
+    weights = {member_id: float(weight_kg)} if member_id is not None and weight_kg is not None else {}
+
+    updated_count = 0
+    changed_member_weeks = set()
+    for model in (ExerciseSet, ArchivedExerciseSet):
+        queryset = model.objects.filter(calories_manual=False)
+        if exercise_id is not None:
+            queryset = queryset.filter(workout_exercise__exercise_id=exercise_id)
+        if member_id is not None:
+            queryset = queryset.filter(member_id=member_id)
+        if met_table is None:
+            met_table = get_met_table()
+        updated_count += _recompute_set_calories(model, queryset, met_table, weights, changed_member_weeks, batch_size)
+
+    if changed_member_weeks:
+        _schedule_summary_refresh(changed_member_weeks)
+    return updated_count
+
+
+def _schedule_summary_refresh(changed_member_weeks):
+    # 세트 이벤트를 발행하지 않으므로 운동 기록 캐시 무효화 + 보관 기간 안의 회원-주 리더보드 갱신 작업 등록
+    invalidate_member_records(*{member_id for member_id, _ in changed_member_weeks})
+    oldest_week = get_current_week_start() - timedelta(weeks=settings.LEADERBOARD_RETENTION_WEEKS)
+    member_weeks = sorted(
+        [member_id, week_start.isoformat()]
+        for member_id, week_start in changed_member_weeks if week_start >= oldest_week
+    )
+    if member_weeks:
+        enqueue('workouts.refresh_leaderboards', member_weeks=member_weeks)
+
+
+def _recompute_set_calories(model, queryset, met_table, weights, changed_member_weeks, batch_size):
+    # 쿼리셋의 세트를 id 순 배치로 다시 계산하고 변경한 세트 수를 반환
+    updated_count = 0
+    last_id = 0
+    while True:
+        rows = list(
+            queryset.filter(id__gt=last_id).order_by('id').values_list(
+                'id', 'workout_exercise_id', 'workout_exercise__daily_workout_id',
+                'workout_exercise__exercise_id', 'member_id', 'workout_date', 'duration', 'calories'
+            )[:batch_size]
+        )
+        if not rows:
+            break
+        last_id = rows[-1][0]
+
+        changed_sets = []
+        exercise_deltas = defaultdict(int)
+        day_deltas = defaultdict(int)
+        for set_id, workout_exercise_id, daily_workout_id, row_exercise_id, row_member_id, workout_date, duration, calories in rows:
+            if row_member_id not in weights:
+                weights[row_member_id] = get_member_weight_kg(row_member_id)
+            row_met_value = met_table.get(row_exercise_id)
+            if row_met_value is None:
+                row_met_value = get_met_value(row_exercise_id)
+            new_calories = calculate_calories(row_met_value, weights[row_member_id], duration)
+            if new_calories == calories:
+                continue
+            changed_sets.append(model(id=set_id, calories=new_calories))
+            if workout_date is not None:
+                changed_member_weeks.add((row_member_id, get_week_start(workout_date)))
+            exercise_deltas[workout_exercise_id] += new_calories - calories
+            day_deltas[daily_workout_id] += new_calories - calories
+
+        if changed_sets:
+            _apply_calorie_changes(model, changed_sets, exercise_deltas, day_deltas)
+            updated_count += len(changed_sets)
+        if len(rows) < batch_size:
+            break
+    return updated_count
+
+
+def _delta_case(deltas):
+    return Case(
+        *[When(id=object_id, then=Value(delta)) for object_id, delta in deltas.items()],
+        default=Value(0)
+    )
+
+
+@transaction.atomic
+def _apply_calorie_changes(model, changed_sets, exercise_deltas, day_deltas):
+    # 세트 칼로리 갱신 후 운동 항목/일일 운동 총합에 차이만 더함 (테이블당 쿼리 하나)
+    # bulk_update/update()는 auto_now를 갱신하지 않으므로 동기화 커서용 updated_at 직접 지정 (보관된 세트 포함)
+    now = timezone.now()
+    for exercise_set in changed_sets:
+        exercise_set.updated_at = now
+    model.objects.bulk_update(changed_sets, ['calories', 'updated_at'])
+
+    exercise_deltas = {key: delta for key, delta in exercise_deltas.items() if delta}
+    if exercise_deltas:
+        WorkoutExercise.objects.filter(id__in=exercise_deltas).update(
+            total_calories=F('total_calories') + _delta_case(exercise_deltas), updated_at=now
+        )
+    day_deltas = {key: delta for key, delta in day_deltas.items() if delta}
+    if day_deltas:
+        DailyWorkout.objects.filter(id__in=day_deltas).update(
+            total_calories=F('total_calories') + _delta_case(day_deltas), updated_at=now
+        )
@@ -0,0 +1,26 @@
+# workouts/checks.py
+
+from django.conf import settings
+from django.core.checks import Error, register
+from django.utils.module_loading import import_string
+
+from .live import InProcessBackend
+
+
+@register()
+def check_live_backend(app_configs, **kwargs):
+    # 프로세스 내부 백엔드는 같은 프로세스에서 발행된 이벤트만 전달 - 여러 워커로 실행하면 피드가 이벤트를 놓침
+    try:
+        backend_class = import_string(settings.WORKOUT_LIVE_BACKEND)
+    except ImportError:
+        return [Error(
+            f'WORKOUT_LIVE_BACKEND를 불러올 수 없습니다: {settings.WORKOUT_LIVE_BACKEND}',
+            id='workouts.E001',
+        )]
+    if issubclass(backend_class, InProcessBackend) and settings.WEB_CONCURRENCY > 1:
+        return [Error(
+            '프로세스 내부 실시간 피드 백엔드는 단일 프로세스에서만 동작합니다.',
+            hint='WEB_CONCURRENCY=1로 실행하거나 WORKOUT_LIVE_BACKEND를 프로세스 간 pub/sub 백엔드로 교체하세요.',
+            id='workouts.E002',
+        )]
+    return []
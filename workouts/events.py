@@ -0,0 +1,100 @@
+# workouts/events.py
+
+from core.events import DomainEvent, subscribe
+from members.events import MemberAssigned
+from .caching import invalidate_member_records
+from .heatmap import bump_heatmap_version
+from .leaderboard import get_current_week_start, get_week_start, refresh_member_weeks
+from .streaks import update_streak
+from .live import SET_CREATED, SET_UPDATED, SET_DELETED, publish_live_events, serialize_set_event
+
+SET_EVENT_FIELDS = (
+    'member_id', 'workout_date', 'daily_workout_id', 'workout_exercise_id', 'exercise_id',
+    'set_id', 'set_number', 'repetitions', 'weight_kg', 'duration_sec', 'calories',
+)
+
+
+class SetEvent(DomainEvent):
+    # 세트 쓰기 이벤트 공통 (live_type: 실시간 피드 이벤트 종류)
+    fields = SET_EVENT_FIELDS
+    live_type = None
+
+    @classmethod
+    def from_set(cls, exercise_set):
+        # 삭제 이벤트는 삭제 전에 구성
+        payload = serialize_set_event(cls.live_type, exercise_set)
+        del payload['type']
+        workout_exercise = exercise_set.workout_exercise
+        payload['daily_workout_id'] = workout_exercise.daily_workout_id
+        payload['exercise_id'] = workout_exercise.exercise_id
+        return cls(**payload)
+
+
+class SetLogged(SetEvent):
+    event_type = 'workouts.set_logged'
+    live_type = SET_CREATED
+
+
+class SetUpdated(SetEvent):
+    event_type = 'workouts.set_updated'
+    live_type = SET_UPDATED
+
+
+class SetDeleted(SetEvent):
+    event_type = 'workouts.set_deleted'
+    live_type = SET_DELETED
+
+
+def _set_member_week(event):
+    return (event.member_id, get_week_start(event.workout_date))
+
+
+def update_leaderboards(events):
+    # 회원-주별로 모인 세트 이벤트마다 해당 주만 다시 집계
+    refresh_member_weeks(_set_member_week(event) for event in events if event.workout_date)
+
+
+def move_leaderboard_entry(events):
+    # 담당 트레이너가 바뀌면 이번 주 기록을 새 트레이너의 리더보드로 옮김 (지난 주는 그대로)
+    current_week = get_current_week_start()
+    refresh_member_weeks((event.member_id, current_week) for event in events)
+
+
+def update_streaks(events):
+    # 날짜별로 모인 세트 생성/삭제 이벤트마다 그 날짜의 활성 여부로 연속 기록 갱신
+    for event in events:
+        if event.workout_date:
+            update_streak(event.member_id, event.workout_date)
+
+
+def invalidate_heatmaps(events):
+    # 세트 수가 바뀐 회원의 히트맵 캐시 버전 증가
+    bump_heatmap_version(*(event.member_id for event in events))
+
+
+def invalidate_records(events):
+    # 세트가 바뀐 회원의 운동 기록 응답 캐시 무효화
+    invalidate_member_records(*(event.member_id for event in events))
+
+
+# 실시간 피드는 커밋 직후 요청 스레드에서 바로 전달
+subscribe([SetLogged, SetUpdated, SetDeleted], publish_live_events)
+subscribe([SetLogged, SetUpdated, SetDeleted], invalidate_records)
+subscribe([SetLogged, SetDeleted], invalidate_heatmaps)
+
+# 리더보드는 작업 워커에서 갱신 - 같은 회원-주의 연속된 세트 쓰기는 한 번만 집계
+subscribe(
+    [SetLogged, SetUpdated, SetDeleted],
+    update_leaderboards,
+    asynchronous=True,
+    coalesce=lambda event: _set_member_week(event) if event.workout_date else event.set_id
+)
+subscribe(MemberAssigned, move_leaderboard_entry, asynchronous=True, coalesce=lambda event: event.member_id)
+
+# 연속 기록은 날짜의 첫 세트/마지막 세트에서만 바뀌므로 수정 이벤트는 제외
+subscribe(
+    [SetLogged, SetDeleted],
+    update_streaks,
+    asynchronous=True,
+    coalesce=lambda event: (event.member_id, event.workout_date)
+)
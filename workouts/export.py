@@ -0,0 +1,129 @@
+# workouts/export.py
+
+import csv
+import heapq
+import json
+import zlib
+from datetime import date
+from django.conf import settings
+from django.db.models import F
+from .models import ExerciseSet, ArchivedExerciseSet
+
+# 내보내기 컬럼 (CSV 헤더, NDJSON 키 순서)
+EXPORT_COLUMNS = [
+    'set_id', 'workout_date', 'exercise_name', 'body_part', 'equipment', 'set_number',
+    'repetitions', 'weight_kg', 'duration_sec', 'calories', 'completed_at', 'archived',
+]
+
+EXPORT_FORMATS = {
+    'csv': ('text/csv; charset=utf-8', 'csv'),
+    'ndjson': ('application/x-ndjson', 'ndjson'),
+}
+
+# 조회 컬럼 (운동 정보는 조인으로 함께 가져옴 - 모델 인스턴스 생성 없이 튜플로 읽음)
+_QUERY_FIELDS = [
+    'id', 'workout_date', 'workout_exercise__exercise__exercise_name',
+    'workout_exercise__exercise__body_part', 'workout_exercise__exercise__equipment',
+    'set_number', 'repetitions', 'weight_kg', 'duration', 'calories', 'completed_at',
+    'workout_exercise_id',
+]
+
+# 출력 버퍼 크기 - 행마다 write/flush하지 않고 모아서 전송
+_BUFFER_SIZE = 64 * 1024
+
+
+def _sort_key(row):
+    # (운동 날짜, 운동 항목, 세트 번호) 순 - 백필 전 날짜 없는 세트가 먼저
+    return (row[1] or date.min, row[11], row[5])
+
+
+def _iter_queryset(model, member_id, archived, chunk_size):
+    queryset = model.objects.filter(member_id=member_id).order_by(
+        F('workout_date').asc(nulls_first=True), 'workout_exercise_id', 'set_number'
+    ).values_list(*_QUERY_FIELDS)
+    for row in queryset.iterator(chunk_size=chunk_size):
+        yield row + (archived,)
+
+
+def iter_member_sets(member_id, chunk_size=None):
+    # 회원의 현재 세트와 보관된 세트를 날짜순으로 합쳐 한 행씩 반환
+    # iterator(chunk_size)는 PostgreSQL에서 서버 측 커서를 사용하므로 세트 수와 무관하게 메모리 일정
+    if chunk_size is None:
+        chunk_size = settings.EXPORT_CHUNK_SIZE
+    current = _iter_queryset(ExerciseSet, member_id, False, chunk_size)
+    archived = _iter_queryset(ArchivedExerciseSet, member_id, True, chunk_size)
+
+    for row in heapq.merge(archived, current, key=_sort_key):
+        yield {
+            'set_id': row[0],
+            'workout_date': row[1].isoformat() if row[1] else None,
+            'exercise_name': row[2],
+            'body_part': row[3],
+            'equipment': row[4],
+            'set_number': row[5],
+            'repetitions': row[6],
+            'weight_kg': float(row[7]),
+            'duration_sec': int(row[8].total_seconds()) if row[8] else 0,
+            'calories': row[9],
+            'completed_at': row[10].isoformat() if row[10] else None,
+            'archived': row[12],
+        }
+
+
+class _Echo:
+    # csv.writer가 쓴 한 줄을 그대로 반환하는 파일 대용 객체
+    def write(self, value):
+        return value
+
+
+def _iter_csv(rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(EXPORT_COLUMNS)
+    for row in rows:
+        yield writer.writerow([row[column] for column in EXPORT_COLUMNS])
+
+
+def _iter_ndjson(rows):
+    for row in rows:
+        yield json.dumps(row, ensure_ascii=False) + '\n'
+
+
+def _buffered(lines):
+    # 문자열 행을 버퍼 크기 단위의 bytes 청크로 묶음
+    buffer = []
+    size = 0
+    for line in lines:
+        data = line.encode('utf-8')
+        buffer.append(data)
+        size += len(data)
+        if size >= _BUFFER_SIZE:
+            yield b''.join(buffer)
+            buffer = []
+            size = 0
+    if buffer:
+        yield b''.join(buffer)
+
+
+def _gzipped(chunks):
+    # 청크를 받는 즉시 gzip으로 압축해 전달 (전체 파일을 메모리에 두지 않음)
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def export_member_sets(member_id, export_format='csv', compress=False, chunk_size=None):
+    # 회원 세트 기록을 CSV/NDJSON bytes 청크로 스트리밍
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f'지원하지 않는 형식입니다: {export_format}')
+    rows = iter_member_sets(member_id, chunk_size)
+    lines = _iter_csv(rows) if export_format == 'csv' else _iter_ndjson(rows)
+    chunks = _buffered(lines)
+    return _gzipped(chunks) if compress else chunks
+
+
+def get_export_filename(member_id, export_format, compress=False):
+    filename = f'member_{member_id}_workouts.{EXPORT_FORMATS[export_format][1]}'
+    return f'{filename}.gz' if compress else filename
@@ -0,0 +1,74 @@
+# workouts/heatmap.py
+
+import base64
+import time
+from datetime import date
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Sum
+from .models import WorkoutExercise
+
+# 날짜별 강도(세트 수) 최댓값 - 1바이트
+MAX_INTENSITY = 255
+
+
+def heatmap_version_key(member_id):
+    return f'workouts:heatmap_version:{member_id}'
+
+
+def heatmap_cache_key(member_id, year, version):
+    return f'workouts:heatmap:{member_id}:{year}:{version}'
+
+
+def get_heatmap_version(member_id):
+    # 회원별 버전 - 캐시에서 밀려나도 이전 버전과 겹치지 않도록 현재 시각(ms)에서 시작
+    return cache.get_or_set(heatmap_version_key(member_id), int(time.time() * 1000), None)
+
+
+def bump_heatmap_version(*member_ids):
+    # 세트가 추가/삭제된 회원의 히트맵 캐시 무효화 (이전 버전 캐시는 만료로 정리)
+    for member_id in set(member_ids):
+        try:
+            cache.incr(heatmap_version_key(member_id))
+        except ValueError:
+            # 버전이 아직 없으면 다음 조회 때 새로 생성
+            pass
+
+
+def build_heatmap(member_id, year):
+    # 1년치 운동 기록을 일 단위로 인코딩
+    # - bitmap: 1월 1일부터 하루 1비트 (운동한 날 1, 비트 순서는 바이트 내 최상위 비트부터) - 366일이면 46바이트
+    # - intensity: 하루 1바이트, 그날의 세트 수 (최대 255)
+    first_day = date(year, 1, 1)
+    days = (date(year + 1, 1, 1) - first_day).days
+
+    bitmap = bytearray((days + 7) // 8)
+    intensity = bytearray(days)
+    rows = WorkoutExercise.objects.filter(
+        member_id=member_id,
+        workout_date__year=year,
+        total_sets__gt=0
+    ).values('workout_date').annotate(sets=Sum('total_sets')).order_by()
+    for row in rows:
+        index = (row['workout_date'] - first_day).days
+        bitmap[index // 8] |= 0x80 >> (index % 8)
+        intensity[index] = min(row['sets'], MAX_INTENSITY)
+
+    return {
+        'year': year,
+        'days': days,
+        'active_days': sum(1 for value in intensity if value),
+        'bitmap': base64.b64encode(bytes(bitmap)).decode('ascii'),
+        'intensity': base64.b64encode(bytes(intensity)).decode('ascii'),
+    }
+
+
+def get_heatmap(member_id, year):
+    # (회원, 연도, 버전) 단위로 캐시된 히트맵과 버전 반환
+    version = get_heatmap_version(member_id)
+    key = heatmap_cache_key(member_id, year, version)
+    heatmap = cache.get(key)
+    if heatmap is None:
+        heatmap = build_heatmap(member_id, year)
+        cache.set(key, heatmap, settings.HEATMAP_CACHE_TIMEOUT)
+    return heatmap, version
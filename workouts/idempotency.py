@@ -0,0 +1,130 @@
+# workouts/idempotency.py
+
+import hashlib
+import json
+import time
+from datetime import timedelta
+from functools import wraps
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.response import Response
+from .models import IdempotencyKey
+
+IDEMPOTENCY_HEADER = 'Idempotency-Key'
+REPLAYED_HEADER = 'Idempotent-Replayed'
+
+
+def _request_hash(request):
+    # 메서드 + 경로 + 본문(키 정렬 JSON)으로 요청 식별
+    body = json.dumps(request.data, sort_keys=True, cls=DjangoJSONEncoder, default=str)
+    return hashlib.sha256(f'{request.method}\n{request.path}\n{body}'.encode()).hexdigest()
+
+
+def _claim(user_id, key, request_hash):
+    # 처리 중 상태의 키 행을 삽입 - 유니크 제약으로 동시 중복 요청 중 하나만 성공
+    try:
+        with transaction.atomic():
+            IdempotencyKey.objects.create(user_id=user_id, key=key, request_hash=request_hash)
+        return True
+    except IntegrityError:
+        return False
+
+
+def _is_stale(record):
+    # 만료된 키 또는 처리 중 상태로 오래 남은 키(요청 도중 프로세스 종료)
+    now = timezone.now()
+    if record.created_at < now - timedelta(hours=settings.IDEMPOTENCY_KEY_TTL_HOURS):
+        return True
+    return record.is_pending and record.created_at < now - timedelta(seconds=settings.IDEMPOTENCY_PENDING_TIMEOUT)
+
+
+def _wait_for_result(user_id, key):
+    # 먼저 들어온 같은 키의 요청이 끝날 때까지 짧게 대기
+    deadline = time.monotonic() + settings.IDEMPOTENCY_WAIT_SECONDS
+    while True:
+        record = IdempotencyKey.objects.filter(user_id=user_id, key=key).first()
+        if record is None or not record.is_pending or time.monotonic() >= deadline:
+            return record
+        time.sleep(0.05)
+
+
+def _replay(record):
+    response = Response(record.response_body, status=record.status_code)
+    response[REPLAYED_HEADER] = 'true'
+    return response
+
+
+def idempotent(view_func):
+    # Idempotency-Key 헤더가 있는 요청은 한 번만 실행하고 재전송에는 저장된 응답 반환
+    # @api_view / @permission_classes 아래에 적용 (인증된 request.user 필요)
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        key = request.headers.get(IDEMPOTENCY_HEADER)
+        if not key:
+            return view_func(request, *args, **kwargs)
+
+        if len(key) > 255:
+            return Response({
+                'success': False,
+                'message': 'Idempotency-Key는 255자 이하여야 합니다.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        user_id = request.user.id
+        request_hash = _request_hash(request)
+
+        if not _claim(user_id, key, request_hash):
+            record = _wait_for_result(user_id, key)
+
+            if record is not None and _is_stale(record):
+                IdempotencyKey.objects.filter(pk=record.pk).delete()
+                record = None
+
+            if record is None:
+                if not _claim(user_id, key, request_hash):
+                    return Response({
+                        'success': False,
+                        'message': '같은 Idempotency-Key의 요청이 처리 중입니다.'
+                    }, status=status.HTTP_409_CONFLICT)
+
+            elif record.request_hash != request_hash:
+                return Response({
+                    'success': False,
+                    'message': '같은 Idempotency-Key로 다른 요청을 보낼 수 없습니다.'
+                }, status=status.HTTP_422_UNPROCESSABLE_ENTITY)
+
+            elif record.is_pending:
+                return Response({
+                    'success': False,
+                    'message': '같은 Idempotency-Key의 요청이 처리 중입니다.'
+                }, status=status.HTTP_409_CONFLICT)
+
+            else:
+                return _replay(record)
+
+        try:
+            response = view_func(request, *args, **kwargs)
+        except Exception:
+            IdempotencyKey.objects.filter(user_id=user_id, key=key).delete()
+            raise
+
+        if response.status_code >= 500:
+            # 서버 오류는 저장하지 않음 - 같은 키로 다시 시도 가능
+            IdempotencyKey.objects.filter(user_id=user_id, key=key).delete()
+        else:
+            IdempotencyKey.objects.filter(user_id=user_id, key=key).update(
+                status_code=response.status_code,
+                response_body=getattr(response, 'data', None)
+            )
+        return response
+
+    return wrapper
+
+
+def purge_expired_keys():
+    # 보관 기간(IDEMPOTENCY_KEY_TTL_HOURS)이 지난 키 삭제 후 삭제 건수 반환
+    cutoff = timezone.now() - timedelta(hours=settings.IDEMPOTENCY_KEY_TTL_HOURS)
+    deleted, _ = IdempotencyKey.objects.filter(created_at__lt=cutoff).delete()
+    return deleted
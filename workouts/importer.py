@@ -0,0 +1,407 @@
+# workouts/importer.py
+
+import csv
+import io
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from decimal import Decimal, InvalidOperation
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Max
+from django.utils import timezone
+from core.queue import enqueue
+from members.models import Member
+from .models import DailyWorkout, WorkoutExercise, ExerciseSet, ArchivedExerciseSet, Exercise
+from .caching import invalidate_member_records
+from .calories import calculate_calories, get_member_weight_kg, get_met_value, invalidate_met_table
+from .heatmap import bump_heatmap_version
+from .leaderboard import get_current_week_start, get_week_start
+
+# 필수 CSV 컬럼 (member_id는 회원을 지정하지 않은 경우에만 필요)
+# set_number, calories는 선택 - calories가 비어 있으면 MET × 회원 몸무게 × 시간으로 계산
+REQUIRED_COLUMNS = [
+    'workout_date', 'exercise_name', 'body_part', 'equipment',
+    'repetitions', 'weight_kg', 'duration_sec',
+]
+
+# 결과에 담을 오류 행 최대 개수 (나머지는 개수만 집계)
+MAX_REPORTED_ERRORS = 100
+
+# COPY로 적재할 ExerciseSet 컬럼
+_COPY_COLUMNS = [
+    'workout_exercise_id', 'set_number', 'repetitions', 'weight_kg', 'duration',
+    'calories', 'calories_manual', 'completed_at', 'updated_at', 'member_id', 'workout_date',
+]
+
+
+class WorkoutImportError(Exception):
+    # 파일 전체를 처리할 수 없는 오류 (헤더 누락 등)
+    pass
+
+
+class _Row:
+    __slots__ = ('line', 'member_id', 'workout_date', 'exercise_key', 'set_number',
+                 'repetitions', 'weight_kg', 'duration', 'calories')
+
+
+class WorkoutImporter:
+    # CSV 행을 배치 단위로 읽어 DailyWorkout -> WorkoutExercise -> ExerciseSet 트리로 묶어 일괄 저장
+    # 배치마다 운동/일일 운동/운동 항목을 한 번에 조회·생성하고, 총합은 배치당 한 번만 갱신
+    # 메모리는 배치 크기만큼만 사용 (파일 크기와 무관)
+
+    def __init__(self, member_id=None, trainer_id=None, batch_size=None, use_copy=None, create_exercises=False):
+        self.member_id = member_id            # 지정하면 모든 행을 이 회원으로 등록 (CSV의 member_id 무시)
+        self.trainer_id = trainer_id          # 지정하지 않으면 회원의 담당 트레이너로 등록
+        self.create_exercises = create_exercises  # 카탈로그에 없는 운동을 공용 카탈로그에 생성 (아니면 오류 행)
+        self.batch_size = batch_size or settings.IMPORT_BATCH_SIZE
+        if use_copy is None:
+            use_copy = settings.IMPORT_USE_COPY
+        self.use_copy = use_copy and connection.vendor == 'postgresql'
+
+        self._exercise_ids = {}               # (운동명, 부위, 도구) -> exercise_id
+        self._unknown_exercises = set()       # 카탈로그에 없는 (운동명, 부위, 도구) - 생성하지 않는 경우
+        self._trainer_ids = {}                # member_id -> 등록 트레이너 id (None이면 등록 불가)
+        self._weights = {}                    # member_id -> 칼로리 계산용 몸무게
+        self._imported_member_weeks = set()   # 가져온 세트의 (member_id, 주 시작일) - 리더보드/연속 기록 갱신용
+        self.total_rows = 0
+        self.imported_sets = 0
+        self.error_count = 0
+        self.errors = []
+
+    # 결과 집계
+
+    def _add_error(self, line, message):
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({'line': line, 'message': message})
+
+    def run(self, text_file):
+        # 텍스트 파일 객체(CSV)를 끝까지 읽어 가져오고 결과 요약 반환
+        started = time.monotonic()
+        reader = csv.DictReader(text_file)
+        columns = set(reader.fieldnames or [])
+        required = REQUIRED_COLUMNS if self.member_id else REQUIRED_COLUMNS + ['member_id']
+        missing = [column for column in required if column not in columns]
+        if missing:
+            raise WorkoutImportError(f"필수 컬럼이 없습니다: {', '.join(missing)}")
+
+        batch = []
+        for record in reader:
+            self.total_rows += 1
+            row = self._parse_row(reader.line_num, record)
+            if row is not None:
+                batch.append(row)
+            if len(batch) >= self.batch_size:
+                self._import_batch(batch)
+                batch = []
+        if batch:
+            self._import_batch(batch)
+        if self._imported_member_weeks:
+            self._schedule_summary_refresh()
+
+        elapsed = time.monotonic() - started
+        return {
+            'total_rows': self.total_rows,
+            'imported_sets': self.imported_sets,
+            'error_count': self.error_count,
+            'errors': self.errors,
+            'elapsed_seconds': round(elapsed, 3),
+            'rows_per_second': int(self.total_rows / elapsed) if elapsed > 0 else self.total_rows,
+        }
+
+    # 행 검증
+
+    def _parse_row(self, line, record):
+        row = _Row()
+        row.line = line
+        try:
+            row.member_id = self.member_id or int(record['member_id'])
+            row.workout_date = datetime.strptime(record['workout_date'].strip(), '%Y-%m-%d').date()
+            row.repetitions = int(record['repetitions'])
+            row.weight_kg = Decimal(record['weight_kg']).quantize(Decimal('0.01'))
+            row.duration = timedelta(seconds=int(record['duration_sec']))
+            calories = (record.get('calories') or '').strip()
+            row.calories = int(calories) if calories else None
+            set_number = (record.get('set_number') or '').strip()
+            row.set_number = int(set_number) if set_number else None
+        except (ValueError, TypeError, InvalidOperation, AttributeError):
+            self._add_error(line, '값의 형식이 올바르지 않습니다.')
+            return None
+
+        exercise_key = tuple((record.get(column) or '').strip() for column in ('exercise_name', 'body_part', 'equipment'))
+        if not all(exercise_key):
+            self._add_error(line, '운동명, 부위, 도구는 필수입니다.')
+            return None
+        if row.repetitions <= 0 or row.weight_kg < 0 or row.weight_kg >= 1000 \
+                or row.duration <= timedelta(0) or (row.calories is not None and row.calories < 0):
+            self._add_error(line, '값의 범위가 올바르지 않습니다.')
+            return None
+        row.exercise_key = exercise_key
+        return row
+
+    # 배치 처리
+
+    def _resolve_exercises(self, rows):
+        # 카탈로그에 없는 운동만 조회하고, 그래도 없으면 일괄 생성 (create_exercises일 때만)
+        missing = {row.exercise_key for row in rows} - self._exercise_ids.keys() - self._unknown_exercises
+        if not missing:
+            return
+        names = {key[0] for key in missing}
+        for exercise_id, name, body_part, equipment in Exercise.objects.filter(
+            exercise_name__in=names
+        ).order_by('-id').values_list('id', 'exercise_name', 'body_part', 'equipment'):
+            # 같은 운동이 여러 개면 가장 먼저 등록된 운동 사용
+            self._exercise_ids[(name, body_part, equipment)] = exercise_id
+
+        new_keys = sorted(missing - self._exercise_ids.keys())
+        if not self.create_exercises:
+            self._unknown_exercises.update(new_keys)
+            return
+        created = Exercise.objects.bulk_create([
+            Exercise(
+                exercise_name=name,
+                body_part=body_part,
+                equipment=equipment,
+                measurement_unit='회',
+                weight_unit='kg',
+                met_value=6.0,
+                is_active=True
+            )
+            for name, body_part, equipment in new_keys
+        ])
+        for key, exercise in zip(new_keys, created):
+            self._exercise_ids[key] = exercise.id
+        if created:
+            # bulk_create는 post_save 시그널을 보내지 않으므로 직접 무효화
+            invalidate_met_table()
+
+    def _resolve_trainers(self, rows):
+        # 회원별 등록 트레이너 (존재하지 않는 회원은 None)
+        missing = {row.member_id for row in rows} - self._trainer_ids.keys()
+        if not missing:
+            return
+        assigned = dict(Member.objects.filter(user_ptr_id__in=missing).values_list('user_ptr_id', 'assigned_trainer_id'))
+        for member_id in missing:
+            if member_id not in assigned:
+                self._trainer_ids[member_id] = None
+            else:
+                self._trainer_ids[member_id] = self.trainer_id or assigned[member_id]
+
+    def _get_weight_kg(self, member_id):
+        if member_id not in self._weights:
+            self._weights[member_id] = get_member_weight_kg(member_id)
+        return self._weights[member_id]
+
+    def _import_batch(self, rows):
+        self._resolve_exercises(rows)
+        self._resolve_trainers(rows)
+
+        valid_rows = []
+        for row in rows:
+            if row.exercise_key in self._unknown_exercises:
+                self._add_error(row.line, '운동 목록에 없는 운동입니다.')
+            elif self._trainer_ids[row.member_id] is None:
+                self._add_error(row.line, '회원을 찾을 수 없거나 담당 트레이너가 없습니다.')
+            else:
+                valid_rows.append(row)
+        if not valid_rows:
+            return
+
+        with transaction.atomic():
+            now = timezone.now()
+            daily_workouts = self._get_or_create_daily_workouts(valid_rows, now)
+            workout_exercises = self._get_or_create_workout_exercises(valid_rows, daily_workouts, now)
+            exercise_sets = self._build_sets(valid_rows, daily_workouts, workout_exercises, now)
+
+            if self.use_copy:
+                self._copy_sets(exercise_sets)
+            else:
+                ExerciseSet.objects.bulk_create(exercise_sets, batch_size=1000)
+
+            self._update_rollups(exercise_sets, daily_workouts, workout_exercises, now)
+        self.imported_sets += len(exercise_sets)
+        self._imported_member_weeks.update((row.member_id, get_week_start(row.workout_date)) for row in valid_rows)
+
+    def _schedule_summary_refresh(self):
+        # 세트 이벤트를 발행하지 않으므로 리더보드(보관 기간 안의 회원-주)와 연속 기록 갱신 작업 등록, 히트맵/운동 기록 캐시 무효화
+        oldest_week = get_current_week_start() - timedelta(weeks=settings.LEADERBOARD_RETENTION_WEEKS)
+        member_weeks = sorted(
+            [member_id, week_start.isoformat()]
+            for member_id, week_start in self._imported_member_weeks if week_start >= oldest_week
+        )
+        if member_weeks:
+            enqueue('workouts.refresh_leaderboards', member_weeks=member_weeks)
+        member_ids = sorted({member_id for member_id, _ in self._imported_member_weeks})
+        enqueue('workouts.refresh_streaks', member_ids=member_ids)
+        bump_heatmap_version(*member_ids)
+        invalidate_member_records(*member_ids)
+
+    def _get_or_create_daily_workouts(self, rows, now):
+        # (member_id, 날짜) -> DailyWorkout
+        day_keys = {(row.member_id, row.workout_date) for row in rows}
+        daily_workouts = {
+            (workout.member_id, workout.workout_date): workout
+            for workout in DailyWorkout.objects.filter(
+                member_id__in={key[0] for key in day_keys},
+                workout_date__in={key[1] for key in day_keys}
+            )
+            if (workout.member_id, workout.workout_date) in day_keys
+        }
+
+        # bulk_create는 save()를 거치지 않으므로 모든 컬럼을 직접 지정
+        new_workouts = [
+            DailyWorkout(
+                member_id=member_id,
+                trainer_id=self._trainer_ids[member_id],
+                workout_date=workout_date,
+                total_duration=timedelta(0),
+                total_calories=0,
+                is_completed=False,
+                updated_at=now
+            )
+            for member_id, workout_date in sorted(day_keys - daily_workouts.keys())
+        ]
+        for workout in DailyWorkout.objects.bulk_create(new_workouts):
+            daily_workouts[(workout.member_id, workout.workout_date)] = workout
+        return daily_workouts
+
+    def _get_or_create_workout_exercises(self, rows, daily_workouts, now):
+        # (daily_workout_id, exercise_id) -> WorkoutExercise (운동 순서는 파일에 처음 나온 순서)
+        day_ids = {workout.id for workout in daily_workouts.values()}
+        workout_exercises = {}
+        next_order = defaultdict(lambda: 1)
+        for workout_exercise in WorkoutExercise.objects.filter(daily_workout_id__in=day_ids).order_by('order_number'):
+            workout_exercises.setdefault((workout_exercise.daily_workout_id, workout_exercise.exercise_id), workout_exercise)
+            next_order[workout_exercise.daily_workout_id] = workout_exercise.order_number + 1
+
+        new_workout_exercises = []
+        for row in rows:
+            daily_workout = daily_workouts[(row.member_id, row.workout_date)]
+            key = (daily_workout.id, self._exercise_ids[row.exercise_key])
+            if key in workout_exercises:
+                continue
+            workout_exercise = WorkoutExercise(
+                daily_workout_id=daily_workout.id,
+                exercise_id=key[1],
+                order_number=next_order[daily_workout.id],
+                total_sets=0,
+                total_duration=timedelta(0),
+                total_calories=0,
+                member_id=daily_workout.member_id,
+                workout_date=daily_workout.workout_date,
+                updated_at=now
+            )
+            next_order[daily_workout.id] += 1
+            workout_exercises[key] = workout_exercise
+            new_workout_exercises.append(workout_exercise)
+
+        WorkoutExercise.objects.bulk_create(new_workout_exercises)
+        return workout_exercises
+
+    def _build_sets(self, rows, daily_workouts, workout_exercises, now):
+        # 운동 항목별로 세트를 모아 기존 세트 뒤에 이어서 번호 부여
+        # CSV에 set_number가 있으면 그 순서, 없으면 파일 순서
+        grouped = defaultdict(list)
+        for row in rows:
+            daily_workout = daily_workouts[(row.member_id, row.workout_date)]
+            grouped[workout_exercises[(daily_workout.id, self._exercise_ids[row.exercise_key])]].append(row)
+
+        # 마지막 번호는 현재 세트와 보관된 세트 중 큰 값 (보관된 세트 번호와 겹치지 않도록)
+        workout_exercise_ids = [workout_exercise.id for workout_exercise in grouped]
+        last_numbers = defaultdict(int)
+        for model in (ExerciseSet, ArchivedExerciseSet):
+            for workout_exercise_id, last in model.objects.filter(
+                workout_exercise_id__in=workout_exercise_ids
+            ).values('workout_exercise_id').annotate(last=Max('set_number')).values_list('workout_exercise_id', 'last'):
+                last_numbers[workout_exercise_id] = max(last_numbers[workout_exercise_id], last)
+
+        exercise_sets = []
+        for workout_exercise, group in grouped.items():
+            group.sort(key=lambda row: (row.set_number is None, row.set_number or 0, row.line))
+            start = last_numbers[workout_exercise.id]
+            for index, row in enumerate(group, start + 1):
+                calories = row.calories
+                if calories is None:
+                    calories = calculate_calories(
+                        get_met_value(workout_exercise.exercise_id), self._get_weight_kg(row.member_id), row.duration
+                    )
+                exercise_sets.append(ExerciseSet(
+                    workout_exercise_id=workout_exercise.id,
+                    set_number=index,
+                    repetitions=row.repetitions,
+                    weight_kg=row.weight_kg,
+                    duration=row.duration,
+                    calories=calories,
+                    calories_manual=row.calories is not None,
+                    completed_at=now,
+                    updated_at=now,
+                    member_id=workout_exercise.member_id,
+                    workout_date=workout_exercise.workout_date
+                ))
+        return exercise_sets
+
+    def _copy_sets(self, exercise_sets):
+        # PostgreSQL COPY로 세트 적재 (INSERT보다 빠름, 세트 id는 이후에 쓰지 않으므로 반환 불필요)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for exercise_set in exercise_sets:
+            writer.writerow([
+                exercise_set.workout_exercise_id, exercise_set.set_number, exercise_set.repetitions,
+                exercise_set.weight_kg, f'{int(exercise_set.duration.total_seconds())} seconds',
+                exercise_set.calories, exercise_set.calories_manual, exercise_set.completed_at.isoformat(), exercise_set.updated_at.isoformat(),
+                exercise_set.member_id, exercise_set.workout_date.isoformat(),
+            ])
+        buffer.seek(0)
+
+        sql = 'COPY {} ({}) FROM STDIN WITH (FORMAT csv)'.format(
+            connection.ops.quote_name(ExerciseSet._meta.db_table),
+            ', '.join(connection.ops.quote_name(column) for column in _COPY_COLUMNS)
+        )
+        with connection.cursor() as cursor:
+            if hasattr(cursor.cursor, 'copy_expert'):
+                cursor.cursor.copy_expert(sql, buffer)        # psycopg2
+            else:
+                with cursor.cursor.copy(sql) as copy:          # psycopg 3
+                    copy.write(buffer.getvalue())
+
+    def _update_rollups(self, exercise_sets, daily_workouts, workout_exercises, now):
+        # 추가된 세트의 합계를 운동 항목과 일일 운동 총합에 더함 (배치당 한 번)
+        set_deltas = defaultdict(lambda: [0, timedelta(0), 0])
+        for exercise_set in exercise_sets:
+            delta = set_deltas[exercise_set.workout_exercise_id]
+            delta[0] += 1
+            delta[1] += exercise_set.duration
+            delta[2] += exercise_set.calories
+
+        day_deltas = defaultdict(lambda: [timedelta(0), 0])
+        changed_workout_exercises = []
+        for workout_exercise in workout_exercises.values():
+            delta = set_deltas.get(workout_exercise.id)
+            if delta is None:
+                continue
+            workout_exercise.total_sets += delta[0]
+            workout_exercise.total_duration = (workout_exercise.total_duration or timedelta(0)) + delta[1]
+            workout_exercise.total_calories += delta[2]
+            workout_exercise.updated_at = now
+            changed_workout_exercises.append(workout_exercise)
+            day_deltas[workout_exercise.daily_workout_id][0] += delta[1]
+            day_deltas[workout_exercise.daily_workout_id][1] += delta[2]
+
+        changed_workouts = []
+        for workout in daily_workouts.values():
+            delta = day_deltas.get(workout.id)
+            if delta is None:
+                continue
+            workout.total_duration = (workout.total_duration or timedelta(0)) + delta[0]
+            workout.total_calories += delta[1]
+            workout.updated_at = now
+            changed_workouts.append(workout)
+
+        # bulk_update는 auto_now를 갱신하지 않으므로 동기화 커서용 updated_at 포함
+        WorkoutExercise.objects.bulk_update(
+            changed_workout_exercises, ['total_sets', 'total_duration', 'total_calories', 'updated_at'], batch_size=500
+        )
+        DailyWorkout.objects.bulk_update(
+            changed_workouts, ['total_duration', 'total_calories', 'updated_at'], batch_size=500
+        )
@@ -0,0 +1,156 @@
+# workouts/leaderboard.py
+
+from datetime import date, timedelta
+from decimal import Decimal
+from django.conf import settings
+from django.db.models import DecimalField, ExpressionWrapper, F, Sum
+from django.utils import timezone
+from members.models import Member
+from .models import ArchivedExerciseSet, ExerciseSet, MemberStreak, WeeklyLeaderboardEntry
+
+# 리더보드 지표 -> WeeklyLeaderboardEntry 컬럼
+LEADERBOARD_METRICS = {
+    'volume': 'total_volume',
+    'sessions': 'sessions',
+    'calories': 'total_calories',
+    'streak': 'current_streak',
+}
+
+_UNSET = object()
+
+
+def get_week_start(day):
+    # 월요일 시작 주
+    if isinstance(day, str):
+        day = date.fromisoformat(day)
+    return day - timedelta(days=day.weekday())
+
+
+def get_current_week_start():
+    return get_week_start(timezone.localdate())
+
+
+def _get_assigned_trainer_id(member_id):
+    return Member.objects.filter(pk=member_id).values_list('assigned_trainer_id', flat=True).first()
+
+
+def refresh_member_week(member_id, week_start, trainer_id=_UNSET):
+    # 회원 한 명의 한 주 세트만 다시 집계해 리더보드 행 갱신 (세트가 없거나 담당 트레이너가 없으면 행 삭제)
+    if trainer_id is _UNSET:
+        trainer_id = _get_assigned_trainer_id(member_id)
+
+    # 현재 세트와 보관된 세트를 합쳐 집계 (운동 일수는 두 테이블의 날짜 합집합)
+    totals = {'total_volume': Decimal('0'), 'total_calories': 0}
+    session_days = set()
+    for model in (ExerciseSet, ArchivedExerciseSet):
+        sets = model.objects.filter(
+            member_id=member_id,
+            workout_date__range=(week_start, week_start + timedelta(days=6))
+        )
+        model_totals = sets.aggregate(
+            total_volume=Sum(ExpressionWrapper(
+                F('repetitions') * F('weight_kg'),
+                output_field=DecimalField(max_digits=14, decimal_places=2)
+            )),
+            total_calories=Sum('calories'),
+        )
+        totals['total_volume'] += model_totals['total_volume'] or Decimal('0')
+        totals['total_calories'] += model_totals['total_calories'] or 0
+        session_days.update(sets.order_by().values_list('workout_date', flat=True).distinct())
+    totals['sessions'] = len(session_days)
+
+    if trainer_id is None or not totals['sessions']:
+        WeeklyLeaderboardEntry.objects.filter(member_id=member_id, week_start=week_start).delete()
+        return None
+
+    from .streaks import get_display_streak
+    streak = MemberStreak.objects.filter(member_id=member_id).first()
+    entry, _ = WeeklyLeaderboardEntry.objects.update_or_create(
+        member_id=member_id,
+        week_start=week_start,
+        defaults={
+            'trainer_id': trainer_id,
+            'total_volume': totals['total_volume'],
+            'sessions': totals['sessions'],
+            'total_calories': totals['total_calories'],
+            'current_streak': get_display_streak(streak) if streak else 0,
+        }
+    )
+    return entry
+
+
+def refresh_member_weeks(member_weeks):
+    # (회원 ID, 주 시작일) 목록 갱신 - 보관 기간이 지난 주는 건너뜀
+    oldest_week = get_current_week_start() - timedelta(weeks=settings.LEADERBOARD_RETENTION_WEEKS)
+    trainer_ids = {}
+    refreshed = 0
+    for member_id, week_start in sorted(set(member_weeks)):
+        if isinstance(week_start, str):
+            week_start = date.fromisoformat(week_start)
+        if week_start < oldest_week:
+            continue
+        if member_id not in trainer_ids:
+            trainer_ids[member_id] = _get_assigned_trainer_id(member_id)
+        refresh_member_week(member_id, week_start, trainer_ids[member_id])
+        refreshed += 1
+    return refreshed
+
+
+def get_leaderboard(trainer_id, week_start, metric='volume', limit=None):
+    # 상위 N명 - (트레이너, 주, 지표) 인덱스를 순서대로 읽으므로 담당 회원 수와 무관
+    field = LEADERBOARD_METRICS[metric]
+    limit = max(1, min(limit or settings.LEADERBOARD_DEFAULT_LIMIT, settings.LEADERBOARD_MAX_LIMIT))
+    rows = WeeklyLeaderboardEntry.objects.filter(
+        trainer_id=trainer_id, week_start=week_start
+    ).order_by(f'-{field}', 'member_id').values('member_id', 'member__name', field)[:limit]
+
+    entries = []
+    rank = 0
+    previous_value = None
+    for position, row in enumerate(rows, 1):
+        # 같은 값은 같은 순위 (1, 2, 2, 4)
+        if row[field] != previous_value:
+            rank = position
+            previous_value = row[field]
+        entries.append({
+            'rank': rank,
+            'member_id': row['member_id'],
+            'name': row['member__name'],
+            'value': _to_json_number(row[field]),
+        })
+    return entries
+
+
+def get_member_rank(member_id, week_start, metric='volume'):
+    # 회원의 순위 (리더보드에 없으면 None) - 자신보다 값이 큰 행 수 + 1
+    field = LEADERBOARD_METRICS[metric]
+    entry = WeeklyLeaderboardEntry.objects.filter(member_id=member_id, week_start=week_start).first()
+    if entry is None or entry.trainer_id is None:
+        return None
+    value = getattr(entry, field)
+    board = WeeklyLeaderboardEntry.objects.filter(trainer_id=entry.trainer_id, week_start=week_start)
+    return {
+        'rank': board.filter(**{f'{field}__gt': value}).count() + 1,
+        'value': _to_json_number(value),
+        'participants': board.count(),
+    }
+
+
+def _to_json_number(value):
+    return float(value) if isinstance(value, Decimal) else value
+
+
+def compact_leaderboards():
+    # 야간 정리 작업
+    # 1) 보관 기간이 지난 주 삭제
+    # 2) 이번 주/지난 주 행을 다시 집계 (이벤트 없이 바뀐 값 보정 - 칼로리 일괄 재계산, 배정 변경 등)
+    current_week = get_current_week_start()
+    oldest_week = current_week - timedelta(weeks=settings.LEADERBOARD_RETENTION_WEEKS)
+    deleted, _ = WeeklyLeaderboardEntry.objects.filter(week_start__lt=oldest_week).delete()
+
+    recent_weeks = [current_week - timedelta(weeks=1), current_week]
+    member_weeks = WeeklyLeaderboardEntry.objects.filter(
+        week_start__in=recent_weeks
+    ).values_list('member_id', 'week_start')
+    refreshed = refresh_member_weeks(list(member_weeks))
+    return {'deleted': deleted, 'refreshed': refreshed}
@@ -0,0 +1,140 @@
+# workouts/live.py
+
+import asyncio
+import secrets
+import threading
+from collections import defaultdict
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.module_loading import import_string
+
+# 실시간 피드 이벤트 종류
+SET_CREATED = 'set.created'
+SET_UPDATED = 'set.updated'
+SET_DELETED = 'set.deleted'
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def member_channel(member_id):
+    return f'member:{member_id}'
+
+
+class Subscription:
+    # 구독자 하나의 이벤트 큐 (구독한 이벤트 루프에 묶임)
+
+    def __init__(self, maxsize):
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=maxsize)
+
+    def _put(self, event):
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # 느린 구독자는 이벤트를 버림 (재연결 시 전체 기록 조회로 복구)
+            pass
+
+    def deliver(self, event):
+        # 다른 스레드(동기 뷰)에서 호출되어도 안전하게 구독자 루프에 전달
+        try:
+            self.loop.call_soon_threadsafe(self._put, event)
+        except RuntimeError:
+            # 이벤트 루프가 이미 종료된 경우
+            pass
+
+    async def get(self, timeout=None):
+        return await asyncio.wait_for(self.queue.get(), timeout)
+
+
+class InProcessBackend:
+    # 프로세스 내부 pub/sub 백엔드
+    # 단일 프로세스 배포용 - 여러 프로세스로 확장할 때는 같은 인터페이스의 백엔드로 교체
+
+    def __init__(self):
+        self._subscribers = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def subscribe(self, channel):
+        subscription = Subscription(settings.WORKOUT_LIVE_QUEUE_SIZE)
+        with self._lock:
+            self._subscribers[channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, channel, subscription):
+        with self._lock:
+            subscribers = self._subscribers.get(channel)
+            if subscribers is None:
+                return
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[channel]
+
+    def publish(self, channel, event):
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+        for subscription in subscribers:
+            subscription.deliver(event)
+        return len(subscribers)
+
+    def subscriber_count(self, channel):
+        with self._lock:
+            return len(self._subscribers.get(channel, ()))
+
+
+def get_live_backend():
+    # WORKOUT_LIVE_BACKEND 설정의 백엔드 인스턴스 (프로세스당 하나)
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = import_string(settings.WORKOUT_LIVE_BACKEND)()
+    return _backend
+
+
+def _ticket_key(ticket):
+    return f'live-ticket:{ticket}'
+
+
+def issue_stream_ticket(user_id, member_id):
+    # 피드 구독 전용 1회용 티켓 발급 (공유 캐시에 저장 - 다른 프로세스에서도 사용 가능)
+    # EventSource는 헤더를 지정할 수 없어 쿼리로 전달하므로 액세스 토큰 대신 짧게 만료되는 티켓 사용
+    ticket = secrets.token_urlsafe(32)
+    cache.set(_ticket_key(ticket), {'user_id': user_id, 'member_id': member_id}, settings.WORKOUT_LIVE_TICKET_TTL)
+    return ticket
+
+
+def redeem_stream_ticket(ticket, member_id):
+    # 티켓을 소비하고 발급받은 사용자 id 반환 (만료/사용됨/다른 회원 채널이면 None)
+    key = _ticket_key(ticket)
+    payload = cache.get(key)
+    # delete가 성공한 요청만 사용 - 같은 티켓으로 동시에 접속해도 한 번만 허용
+    if payload is None or not cache.delete(key):
+        return None
+    if payload['member_id'] != member_id:
+        return None
+    return payload['user_id']
+
+
+def serialize_set_event(event_type, exercise_set):
+    # 세트 이벤트 페이로드 (삭제 이벤트는 삭제 전에 구성)
+    return {
+        'type': event_type,
+        'member_id': exercise_set.member_id,
+        'workout_date': exercise_set.workout_date.isoformat() if exercise_set.workout_date else None,
+        'workout_exercise_id': exercise_set.workout_exercise_id,
+        'set_id': exercise_set.id,
+        'set_number': exercise_set.set_number,
+        'repetitions': exercise_set.repetitions,
+        'weight_kg': float(exercise_set.weight_kg),
+        'duration_sec': int(exercise_set.duration.total_seconds()) if exercise_set.duration else 0,
+        'calories': exercise_set.calories,
+    }
+
+
+def publish_live_events(events):
+    # 세트 도메인 이벤트 구독자 - 회원 채널로 실시간 피드 이벤트 발행
+    backend = get_live_backend()
+    for event in events:
+        live_event = {'type': event.live_type, **event.payload}
+        backend.publish(member_channel(live_event['member_id']), live_event)
@@ -0,0 +1,38 @@
+from datetime import datetime
+from django.core.management.base import BaseCommand
+from workouts.models import ExerciseSet
+from workouts.services import ExerciseSetArchiveService
+
+class Command(BaseCommand):
+    help = '보관 기준일이 지난 운동 세트를 archived_exercise_set 테이블로 이동'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, help='보관 기준 일수 (기본값: WORKOUT_ARCHIVE_HORIZON_DAYS)')
+        parser.add_argument('--before', type=str, help='이 날짜(YYYY-MM-DD) 이전 운동의 세트를 보관')
+        parser.add_argument('--batch-size', type=int, help='한 번에 이동할 세트 수 (기본값: WORKOUT_ARCHIVE_BATCH_SIZE)')
+        parser.add_argument('--dry-run', action='store_true', help='이동하지 않고 대상 세트 수만 출력')
+
+    def handle(self, *args, **options):
+        if options['before']:
+            try:
+                cutoff_date = datetime.strptime(options['before'], '%Y-%m-%d').date()
+            except ValueError:
+                self.stdout.write(self.style.ERROR(f"날짜 형식이 올바르지 않습니다: {options['before']}"))
+                return
+        else:
+            cutoff_date = ExerciseSetArchiveService.get_cutoff_date(options['days'])
+
+        if options['dry_run']:
+            target_count = ExerciseSet.objects.filter(
+                workout_date__lt=cutoff_date
+            ).count()
+            self.stdout.write(f"보관 대상 세트: {target_count}개 (기준일: {cutoff_date})")
+            return
+
+        archived_count = ExerciseSetArchiveService.archive_sets(
+            cutoff_date=cutoff_date,
+            batch_size=options['batch_size']
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f"✅ 보관 완료: {archived_count}개 (기준일: {cutoff_date})")
+        )
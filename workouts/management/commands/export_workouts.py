@@ -0,0 +1,41 @@
+import os
+from django.core.management.base import BaseCommand
+from members.models import Member
+from workouts.export import EXPORT_FORMATS, export_member_sets, get_export_filename
+
+class Command(BaseCommand):
+    help = '회원 운동 기록(보관된 세트 포함)을 CSV/NDJSON 파일로 내보내기'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--member', type=int, action='append', default=[], help='내보낼 회원 ID (여러 번 지정 가능)')
+        parser.add_argument('--trainer', type=int, help='이 트레이너의 담당 회원 전체를 내보내기')
+        parser.add_argument('--format', dest='export_format', choices=list(EXPORT_FORMATS), default='csv', help='파일 형식 (기본값: csv)')
+        parser.add_argument('--gzip', action='store_true', help='gzip으로 압축')
+        parser.add_argument('--output', type=str, default='.', help='파일을 저장할 디렉터리 (기본값: 현재 디렉터리)')
+        parser.add_argument('--chunk-size', type=int, help='한 번에 가져올 행 수 (기본값: EXPORT_CHUNK_SIZE)')
+
+    def handle(self, *args, **options):
+        member_ids = list(options['member'])
+        if options['trainer']:
+            member_ids += Member.objects.filter(
+                assigned_trainer_id=options['trainer']
+            ).order_by('user_ptr_id').values_list('user_ptr_id', flat=True)
+
+        if not member_ids:
+            self.stdout.write(self.style.ERROR("내보낼 회원이 없습니다. --member 또는 --trainer를 지정하세요."))
+            return
+
+        os.makedirs(options['output'], exist_ok=True)
+        for member_id in dict.fromkeys(member_ids):
+            filename = get_export_filename(member_id, options['export_format'], options['gzip'])
+            path = os.path.join(options['output'], filename)
+            size = 0
+            with open(path, 'wb') as f:
+                for chunk in export_member_sets(
+                    member_id, options['export_format'], options['gzip'], options['chunk_size']
+                ):
+                    f.write(chunk)
+                    size += len(chunk)
+            self.stdout.write(f"{path} ({size} bytes)")
+
+        self.stdout.write(self.style.SUCCESS(f"✅ 내보내기 완료: 회원 {len(set(member_ids))}명"))
@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand
+from workouts.importer import WorkoutImporter, WorkoutImportError
+
+class Command(BaseCommand):
+    help = 'CSV 파일의 세트 기록을 운동 기록으로 일괄 가져오기'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--file', type=str, required=True, help='CSV 파일 경로 (UTF-8)')
+        parser.add_argument('--member', type=int, help='모든 행을 이 회원으로 등록 (없으면 CSV의 member_id 컬럼 사용)')
+        parser.add_argument('--trainer', type=int, help='등록 트레이너 ID (기본값: 회원의 담당 트레이너)')
+        parser.add_argument('--batch-size', type=int, help='한 번에 처리할 행 수 (기본값: IMPORT_BATCH_SIZE)')
+        parser.add_argument('--no-copy', action='store_true', help='PostgreSQL COPY 대신 bulk_create 사용')
+        parser.add_argument('--create-exercises', action='store_true', help='운동 목록에 없는 운동을 새로 등록 (없으면 오류 행으로 처리)')
+
+    def handle(self, *args, **options):
+        importer = WorkoutImporter(
+            member_id=options['member'],
+            trainer_id=options['trainer'],
+            batch_size=options['batch_size'],
+            use_copy=False if options['no_copy'] else None,
+            create_exercises=options['create_exercises']
+        )
+        try:
+            with open(options['file'], 'r', encoding='utf-8-sig', newline='') as file:
+                result = importer.run(file)
+        except FileNotFoundError:
+            self.stdout.write(self.style.ERROR(f"파일을 찾을 수 없습니다: {options['file']}"))
+            return
+        except WorkoutImportError as e:
+            self.stdout.write(self.style.ERROR(str(e)))
+            return
+
+        for error in result['errors']:
+            self.stdout.write(self.style.WARNING(f"{error['line']}행: {error['message']}"))
+
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ 가져오기 완료: 세트 {result['imported_sets']}개 / 전체 {result['total_rows']}행, "
+            f"오류 {result['error_count']}행 ({result['elapsed_seconds']}초, {result['rows_per_second']}행/초)"
+        ))
@@ -0,0 +1,9 @@
+from django.core.management.base import BaseCommand
+from workouts.idempotency import purge_expired_keys
+
+class Command(BaseCommand):
+    help = '보관 기간(IDEMPOTENCY_KEY_TTL_HOURS)이 지난 Idempotency-Key 응답 기록 삭제'
+
+    def handle(self, *args, **options):
+        deleted = purge_expired_keys()
+        self.stdout.write(self.style.SUCCESS(f"✅ 만료된 Idempotency-Key 삭제: {deleted}개"))
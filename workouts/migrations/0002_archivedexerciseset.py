@@ -0,0 +1,34 @@
+# Generated by Django 5.2.3 on 2026-10-19 05:53
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workouts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedExerciseSet',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False, verbose_name='원본 세트 ID')),
+                ('set_number', models.PositiveIntegerField(verbose_name='세트 번호')),
+                ('repetitions', models.PositiveIntegerField(verbose_name='횟수')),
+                ('weight_kg', models.DecimalField(decimal_places=2, max_digits=5, verbose_name='중량(kg)')),
+                ('duration', models.DurationField(verbose_name='세트별 소요시간')),
+                ('calories', models.IntegerField(verbose_name='세트별 칼로리')),
+                ('completed_at', models.DateTimeField(verbose_name='세트 완료 시간')),
+                ('archived_at', models.DateTimeField(auto_now_add=True, verbose_name='보관 처리 일시')),
+                ('workout_exercise', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_sets', to='workouts.workoutexercise', verbose_name='운동 항목')),
+            ],
+            options={
+                'verbose_name': '보관된 운동 세트',
+                'verbose_name_plural': '보관된 운동 세트들',
+                'db_table': 'archived_exercise_set',
+                'ordering': ['workout_exercise', 'set_number'],
+            },
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 5.2.3 on 2026-10-19 05:54
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workouts', '0002_archivedexerciseset'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='archivedexerciseset',
+            name='member',
+            field=models.ForeignKey(db_index=False, editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='운동하는 사용자'),
+        ),
+        migrations.AddField(
+            model_name='archivedexerciseset',
+            name='workout_date',
+            field=models.DateField(editable=False, null=True, verbose_name='운동 날짜'),
+        ),
+        migrations.AddField(
+            model_name='exerciseset',
+            name='member',
+            field=models.ForeignKey(db_index=False, editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='운동하는 사용자'),
+        ),
+        migrations.AddField(
+            model_name='exerciseset',
+            name='workout_date',
+            field=models.DateField(editable=False, null=True, verbose_name='운동 날짜'),
+        ),
+        migrations.AddField(
+            model_name='workoutexercise',
+            name='member',
+            field=models.ForeignKey(db_index=False, editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='운동하는 사용자'),
+        ),
+        migrations.AddField(
+            model_name='workoutexercise',
+            name='workout_date',
+            field=models.DateField(editable=False, null=True, verbose_name='운동 날짜'),
+        ),
+        migrations.AddIndex(
+            model_name='archivedexerciseset',
+            index=models.Index(fields=['member', 'workout_date'], name='archived_ex_member__527a06_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='exerciseset',
+            index=models.Index(fields=['member', 'workout_date'], name='workouts_ex_member__fea2cc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='exerciseset',
+            index=models.Index(fields=['member', 'completed_at'], name='workouts_ex_member__63edbd_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='workoutexercise',
+            index=models.Index(fields=['member', 'workout_date'], name='workouts_wo_member__a5eb34_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='workoutexercise',
+            index=models.Index(fields=['member', 'exercise', 'workout_date'], name='workouts_wo_member__5a79f1_idx'),
+        ),
+    ]
@@ -0,0 +1,54 @@
+# 비정규화 컬럼(member, workout_date) 백필
+# 대용량 테이블 잠금을 피하기 위해 배치 단위로 나누어 각각 별도 트랜잭션에서 갱신
+
+from django.db import migrations, transaction
+from django.db.models import OuterRef, Subquery
+
+BATCH_SIZE = 1000
+
+
+def _backfill(model, source_model, source_fk, using):
+    # source_model에서 member/workout_date를 가져와 model의 비어있는 행을 배치 갱신
+    source = source_model.objects.using(using).filter(pk=OuterRef(source_fk))
+    last_pk = 0
+    while True:
+        pks = list(
+            model.objects.using(using).filter(
+                pk__gt=last_pk, member__isnull=True
+            ).order_by('pk').values_list('pk', flat=True)[:BATCH_SIZE]
+        )
+        if not pks:
+            break
+
+        with transaction.atomic(using=using):
+            model.objects.using(using).filter(pk__in=pks).update(
+                member_id=Subquery(source.values('member_id')[:1]),
+                workout_date=Subquery(source.values('workout_date')[:1]),
+            )
+        last_pk = pks[-1]
+
+
+def backfill_member_workout_date(apps, schema_editor):
+    using = schema_editor.connection.alias
+    DailyWorkout = apps.get_model('workouts', 'DailyWorkout')
+    WorkoutExercise = apps.get_model('workouts', 'WorkoutExercise')
+    ExerciseSet = apps.get_model('workouts', 'ExerciseSet')
+    ArchivedExerciseSet = apps.get_model('workouts', 'ArchivedExerciseSet')
+
+    # 운동 항목 먼저 채운 뒤 세트는 운동 항목의 값을 복사
+    _backfill(WorkoutExercise, DailyWorkout, 'daily_workout_id', using)
+    _backfill(ExerciseSet, WorkoutExercise, 'workout_exercise_id', using)
+    _backfill(ArchivedExerciseSet, WorkoutExercise, 'workout_exercise_id', using)
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('workouts', '0003_denormalize_member_workout_date'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_member_workout_date, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 5.2.3 on 2026-10-19 06:03
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('members', '0002_profile_image_variants'),
+        ('workouts', '0004_backfill_member_workout_date'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SyncTombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object_type', models.CharField(choices=[('daily_workout', '일일 운동'), ('workout_exercise', '운동 항목'), ('exercise_set', '운동 세트')], max_length=20, verbose_name='삭제된 객체 종류')),
+                ('object_id', models.BigIntegerField(verbose_name='삭제된 객체 ID')),
+                ('deleted_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='삭제 일시')),
+            ],
+            options={
+                'verbose_name': '삭제 기록',
+                'verbose_name_plural': '삭제 기록들',
+                'db_table': 'sync_tombstone',
+            },
+        ),
+        migrations.AddField(
+            model_name='exerciseset',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, verbose_name='수정일시'),
+        ),
+        migrations.AddField(
+            model_name='workoutexercise',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, verbose_name='수정일시'),
+        ),
+        migrations.AddIndex(
+            model_name='dailyworkout',
+            index=models.Index(fields=['member', 'updated_at'], name='workouts_da_member__650487_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='exerciseset',
+            index=models.Index(fields=['member', 'updated_at'], name='workouts_ex_member__f1d337_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='workoutexercise',
+            index=models.Index(fields=['member', 'updated_at'], name='workouts_wo_member__73a176_idx'),
+        ),
+        migrations.AddField(
+            model_name='synctombstone',
+            name='member',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='운동하는 사용자'),
+        ),
+        migrations.AddIndex(
+            model_name='synctombstone',
+            index=models.Index(fields=['member', 'deleted_at'], name='sync_tombst_member__a3ac36_idx'),
+        ),
+    ]
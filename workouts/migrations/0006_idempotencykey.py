@@ -0,0 +1,36 @@
+# Generated by Django 5.2.3 on 2026-10-19 06:05
+
+import django.core.serializers.json
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workouts', '0005_sync_change_tracking'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IdempotencyKey',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=255, verbose_name='Idempotency-Key')),
+                ('request_hash', models.CharField(help_text='메서드, 경로, 본문의 sha256 (같은 키로 다른 요청을 보냈는지 확인)', max_length=64, verbose_name='요청 해시')),
+                ('status_code', models.PositiveSmallIntegerField(blank=True, null=True, verbose_name='응답 상태 코드')),
+                ('response_body', models.JSONField(blank=True, encoder=django.core.serializers.json.DjangoJSONEncoder, null=True, verbose_name='응답 본문')),
+                ('created_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now, verbose_name='생성일시')),
+                ('user', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='요청 사용자')),
+            ],
+            options={
+                'verbose_name': '멱등성 키',
+                'verbose_name_plural': '멱등성 키들',
+                'db_table': 'idempotency_key',
+                'constraints': [models.UniqueConstraint(fields=('user', 'key'), name='unique_user_idempotency_key')],
+            },
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.3 on 2026-10-19 06:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workouts', '0006_idempotencykey'),
+    ]
+
+    # 기존 세트의 칼로리는 모두 클라이언트가 보낸 값이므로 직접 입력(True)으로 채운 뒤 기본값을 False로 변경
+    operations = [
+        migrations.AddField(
+            model_name='exerciseset',
+            name='calories_manual',
+            field=models.BooleanField(default=True, help_text='직접 입력한 칼로리는 MET/몸무게 변경 시 다시 계산하지 않음', verbose_name='칼로리 직접 입력 여부'),
+        ),
+        migrations.AlterField(
+            model_name='exerciseset',
+            name='calories_manual',
+            field=models.BooleanField(default=False, help_text='직접 입력한 칼로리는 MET/몸무게 변경 시 다시 계산하지 않음', verbose_name='칼로리 직접 입력 여부'),
+        ),
+    ]
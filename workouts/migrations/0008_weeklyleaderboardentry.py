@@ -0,0 +1,38 @@
+# Generated by Django 5.2.3 on 2026-10-19 06:19
+
+import django.db.models.deletion
+from decimal import Decimal
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('members', '0002_profile_image_variants'),
+        ('workouts', '0007_exerciseset_calories_manual'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WeeklyLeaderboardEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('week_start', models.DateField(verbose_name='주 시작일(월요일)')),
+                ('total_volume', models.DecimalField(decimal_places=2, default=Decimal('0.00'), help_text='반복 횟수 × 무게의 합', max_digits=14, verbose_name='총 볼륨(kg)')),
+                ('sessions', models.PositiveSmallIntegerField(default=0, verbose_name='운동한 날 수')),
+                ('total_calories', models.PositiveIntegerField(default=0, verbose_name='총 소모 칼로리')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일시')),
+                ('member', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='회원')),
+                ('trainer', models.ForeignKey(blank=True, db_index=False, help_text='집계 시점의 담당 트레이너 (배정 변경 시 이번 주 행만 옮김)', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='members.trainer', verbose_name='담당 트레이너')),
+            ],
+            options={
+                'verbose_name': '주간 리더보드',
+                'verbose_name_plural': '주간 리더보드들',
+                'db_table': 'weekly_leaderboard',
+                'indexes': [models.Index(fields=['trainer', 'week_start', '-total_volume'], name='leaderboard_volume_idx'), models.Index(fields=['trainer', 'week_start', '-sessions'], name='leaderboard_sessions_idx'), models.Index(fields=['trainer', 'week_start', '-total_calories'], name='leaderboard_calories_idx')],
+                'constraints': [models.UniqueConstraint(fields=('member', 'week_start'), name='unique_leaderboard_member_week')],
+            },
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.3 on 2026-10-19 06:22
+
+import django.core.validators
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+        ('members', '0002_profile_image_variants'),
+        ('workouts', '0008_weeklyleaderboardentry'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MemberStreak',
+            fields=[
+                ('member', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='workout_streak', serialize=False, to=settings.AUTH_USER_MODEL, verbose_name='회원')),
+                ('weekly_target', models.PositiveSmallIntegerField(default=3, validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(7)], verbose_name='주간 목표 운동 일수')),
+                ('current_streak', models.PositiveIntegerField(default=0, help_text='last_active_date에서 끝나는 연속 일수 (조회 시 어제 이전이면 0으로 표시)', verbose_name='현재 연속 운동 일수')),
+                ('longest_streak', models.PositiveIntegerField(default=0, verbose_name='최장 연속 운동 일수')),
+                ('last_active_date', models.DateField(blank=True, null=True, verbose_name='마지막 운동 날짜')),
+                ('current_week_streak', models.PositiveIntegerField(default=0, help_text='last_target_week에서 끝나는 연속 주 수', verbose_name='현재 연속 목표 달성 주 수')),
+                ('longest_week_streak', models.PositiveIntegerField(default=0, verbose_name='최장 연속 목표 달성 주 수')),
+                ('last_target_week', models.DateField(blank=True, null=True, verbose_name='마지막 목표 달성 주 시작일')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일시')),
+            ],
+            options={
+                'verbose_name': '연속 운동 기록',
+                'verbose_name_plural': '연속 운동 기록들',
+                'db_table': 'member_streak',
+            },
+        ),
+        migrations.AddField(
+            model_name='weeklyleaderboardentry',
+            name='current_streak',
+            field=models.PositiveIntegerField(default=0, help_text='MemberStreak의 현재 연속 일수 사본 (순위 정렬용)', verbose_name='연속 운동 일수'),
+        ),
+        migrations.AddIndex(
+            model_name='weeklyleaderboardentry',
+            index=models.Index(fields=['trainer', 'week_start', '-current_streak'], name='leaderboard_streak_idx'),
+        ),
+    ]
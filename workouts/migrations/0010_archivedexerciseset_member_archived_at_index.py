@@ -0,0 +1,19 @@
+# Generated by Django 5.2.3 on 2026-10-19 07:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workouts', '0009_memberstreak'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='archivedexerciseset',
+            index=models.Index(fields=['member', 'archived_at'], name='archived_ex_member__10fe17_idx'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.3 on 2026-10-19 07:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workouts', '0010_archivedexerciseset_member_archived_at_index'),
+    ]
+
+    operations = [
+        # 이미 보관된 세트는 직접 입력 여부를 알 수 없으므로 기존 칼로리를 유지하도록 True로 채움
+        migrations.AddField(
+            model_name='archivedexerciseset',
+            name='calories_manual',
+            field=models.BooleanField(default=True, help_text='직접 입력한 칼로리는 MET/몸무게 변경 시 다시 계산하지 않음', verbose_name='칼로리 직접 입력 여부'),
+        ),
+        migrations.AlterField(
+            model_name='archivedexerciseset',
+            name='calories_manual',
+            field=models.BooleanField(default=False, help_text='직접 입력한 칼로리는 MET/몸무게 변경 시 다시 계산하지 않음', verbose_name='칼로리 직접 입력 여부'),
+        ),
+    ]
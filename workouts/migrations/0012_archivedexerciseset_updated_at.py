@@ -0,0 +1,36 @@
+# Generated by Django 5.2.3 on 2026-10-19 07:14
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import F
+
+
+def copy_archived_at(apps, schema_editor):
+    # 기존 보관 세트의 수정일시는 보관 처리 일시로 채움 (동기화 커서가 이미 지난 행을 다시 보내지 않도록)
+    ArchivedExerciseSet = apps.get_model('workouts', 'ArchivedExerciseSet')
+    ArchivedExerciseSet.objects.using(schema_editor.connection.alias).update(updated_at=F('archived_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workouts', '0011_archivedexerciseset_calories_manual'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='archivedexerciseset',
+            name='archived_ex_member__10fe17_idx',
+        ),
+        migrations.AddField(
+            model_name='archivedexerciseset',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, help_text='보관 또는 칼로리 재계산 시각 (동기화 커서 기준)', verbose_name='수정일시'),
+        ),
+        migrations.RunPython(copy_archived_at, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='archivedexerciseset',
+            index=models.Index(fields=['member', 'updated_at'], name='archived_ex_member__71f712_idx'),
+        ),
+    ]
@@ -1,5 +1,6 @@
 # workouts/models.py
 
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
@@ -127,6 +128,13 @@ class Exercise(models.Model):
     def __str__(self):
         return f"{self.body_part} - {self.exercise_name}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        # 로드 시점의 MET 값 보관 (세트 칼로리 재계산 판단용)
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_met_value = instance.__dict__.get('met_value')
+        return instance
+
 
 
 class DailyWorkout(models.Model):
@@ -190,12 +198,38 @@ class DailyWorkout(models.Model):
         ]
         indexes = [
             models.Index(fields=['member', 'workout_date']),
+            models.Index(fields=['member', 'updated_at']),
             models.Index(fields=['trainer']),
             models.Index(fields=['is_completed']),
         ]
 
     def __str__(self):
         return f"{self.member} - {self.workout_date}"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        # 로드 시점의 member/workout_date 보관 (하위 비정규화 컬럼 동기화 판단용)
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_member_date = (instance.__dict__.get('member_id'), instance.__dict__.get('workout_date'))
+        return instance
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # member/workout_date가 바뀐 경우 하위 운동 항목과 세트의 비정규화 컬럼도 함께 갱신
+        loaded = getattr(self, '_loaded_member_date', None)
+        current = (self.member_id, self.workout_date)
+        if loaded is not None and loaded != current:
+            # update()는 auto_now를 갱신하지 않으므로 동기화 커서용 updated_at 직접 지정
+            WorkoutExercise.objects.filter(daily_workout=self).update(
+                member_id=self.member_id, workout_date=self.workout_date, updated_at=self.updated_at
+            )
+            ExerciseSet.objects.filter(workout_exercise__daily_workout=self).update(
+                member_id=self.member_id, workout_date=self.workout_date, updated_at=self.updated_at
+            )
+            ArchivedExerciseSet.objects.filter(workout_exercise__daily_workout=self).update(
+                member_id=self.member_id, workout_date=self.workout_date
+            )
+        self._loaded_member_date = current
     
     def calculate_total_calories(self):
         # 총 칼로리 계산 메서드
@@ -251,11 +285,33 @@ class WorkoutExercise(models.Model):
         verbose_name="해당 운동 총 칼로리"
     )
 
+    # 비정규화 컬럼 (daily_workout의 값을 복사, 조인 없이 회원/날짜로 조회)
+    member = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='+',
+        db_index=False,
+        null=True,
+        editable=False,
+        verbose_name="운동하는 사용자"
+    )
+
+    workout_date = models.DateField(
+        null=True,
+        editable=False,
+        verbose_name="운동 날짜"
+    )
+
     created_at = models.DateTimeField(
         auto_now_add=True,
         verbose_name="생성일시"
     )
 
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name="수정일시"
+    )
+
     class Meta:
         verbose_name = "운동 항목"
         verbose_name_plural = "운동 항목들"
@@ -268,19 +324,27 @@ class WorkoutExercise(models.Model):
         ]
         indexes = [
             models.Index(fields=['daily_workout', 'order_number']),
+            models.Index(fields=['member', 'workout_date']),
+            models.Index(fields=['member', 'exercise', 'workout_date']),
+            models.Index(fields=['member', 'updated_at']),
         ]
 
     def __str__(self):
         return f"{self.daily_workout} - {self.order_number:02d}. {self.exercise.exercise_name}"
+
+    def save(self, *args, **kwargs):
+        # daily_workout의 member/workout_date를 비정규화 컬럼에 동기화
+        if self.daily_workout_id:
+            self.member_id = self.daily_workout.member_id
+            self.workout_date = self.daily_workout.workout_date
+        super().save(*args, **kwargs)
     
-    def calculate_calories(self, member_weight_kg=70):
-        # 칼로리 계산 메서드 (MET 공식 사용)
-        if self.total_duration:
-            hours = self.total_duration.total_seconds() / 3600
-            # 칼로리 = MET × 체중(kg) × 시간(h)
-            calories = float(self.exercise.met_value) * member_weight_kg * hours
-            return int(calories)
-        return 0
+    def calculate_calories(self, member_weight_kg=None):
+        # 칼로리 계산 메서드 (MET 공식 사용, 체중을 주지 않으면 회원 프로필의 몸무게)
+        from .calories import calculate_calories, get_member_weight_kg, get_met_value
+        if member_weight_kg is None:
+            member_weight_kg = get_member_weight_kg(self.member_id)
+        return calculate_calories(get_met_value(self.exercise_id), member_weight_kg, self.total_duration)
 
 
 
@@ -321,11 +385,39 @@ class ExerciseSet(models.Model):
         verbose_name="세트별 칼로리"
     )
 
+    calories_manual = models.BooleanField(
+        default=False,
+        verbose_name="칼로리 직접 입력 여부",
+        help_text="직접 입력한 칼로리는 MET/몸무게 변경 시 다시 계산하지 않음"
+    )
+
     completed_at = models.DateTimeField(
         auto_now_add=True,
         verbose_name="세트 완료 시간"
     )
 
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name="수정일시"
+    )
+
+    # 비정규화 컬럼 (workout_exercise의 값을 복사, 조인 없이 회원/날짜로 조회)
+    member = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='+',
+        db_index=False,
+        null=True,
+        editable=False,
+        verbose_name="운동하는 사용자"
+    )
+
+    workout_date = models.DateField(
+        null=True,
+        editable=False,
+        verbose_name="운동 날짜"
+    )
+
     class Meta:
         verbose_name = "운동 세트"
         verbose_name_plural = "운동 세트들"
@@ -338,21 +430,387 @@ class ExerciseSet(models.Model):
         ]
         indexes = [
             models.Index(fields=['workout_exercise', 'set_number']),
+            models.Index(fields=['member', 'workout_date']),
+            models.Index(fields=['member', 'completed_at']),
+            models.Index(fields=['member', 'updated_at']),
         ]
 
     def __str__(self):
         return f"{self.workout_exercise} - 세트{self.set_number}"
+
+    def save(self, *args, **kwargs):
+        # workout_exercise의 member/workout_date를 비정규화 컬럼에 동기화
+        if self.workout_exercise_id:
+            workout_exercise = self.workout_exercise
+            if workout_exercise.member_id is None:
+                # 백필 전 데이터는 daily_workout에서 직접 가져옴
+                workout_exercise.member_id = workout_exercise.daily_workout.member_id
+                workout_exercise.workout_date = workout_exercise.daily_workout.workout_date
+            self.member_id = workout_exercise.member_id
+            self.workout_date = workout_exercise.workout_date
+        super().save(*args, **kwargs)
     
-    def calculate_calories(self, member_weight_kg=70):
-        # 개별 세트 칼로리 계산 
-        hours = self.duration.total_seconds() / 3600
-        # 칼로리 = MET × 체중(kg) × 시간(h)
-        calories = float(self.workout_exercise.exercise.met_value) * member_weight_kg * hours
-        return int(calories)
+    def calculate_calories(self, member_weight_kg=None):
+        # 개별 세트 칼로리 계산 (체중을 주지 않으면 회원 프로필의 몸무게)
+        from .calories import calculate_calories, get_member_weight_kg, get_met_value
+        if member_weight_kg is None:
+            member_weight_kg = get_member_weight_kg(self.member_id)
+        return calculate_calories(get_met_value(self.workout_exercise.exercise_id), member_weight_kg, self.duration)
     
     @property
     def display_weight(self):
         # 중량을 보기 좋게 표시
         if self.weight_kg == int(self.weight_kg):
             return f"{int(self.weight_kg)}kg"
-        return f"{self.weight_kg}kg"
\ No newline at end of file
+        return f"{self.weight_kg}kg"
+
+
+
+class ArchivedExerciseSet(models.Model):
+    # 보관 기간이 지난 운동 세트 (콜드 스토리지)
+    # ExerciseSet과 같은 컬럼을 갖지만 조회용 인덱스는 workout_exercise FK 하나만 유지
+    # id는 원본 ExerciseSet의 id를 그대로 사용
+
+    id = models.BigIntegerField(
+        primary_key=True,
+        verbose_name="원본 세트 ID"
+    )
+
+    workout_exercise = models.ForeignKey(
+        WorkoutExercise,
+        on_delete=models.CASCADE,
+        related_name='archived_sets',
+        verbose_name="운동 항목"
+    )
+
+    set_number = models.PositiveIntegerField(
+        verbose_name="세트 번호"
+    )
+
+    repetitions = models.PositiveIntegerField(
+        verbose_name="횟수"
+    )
+
+    weight_kg = models.DecimalField(
+        max_digits=5,
+        decimal_places=2,
+        verbose_name="중량(kg)"
+    )
+
+    duration = models.DurationField(
+        verbose_name="세트별 소요시간"
+    )
+
+    calories = models.IntegerField(
+        verbose_name="세트별 칼로리"
+    )
+
+    calories_manual = models.BooleanField(
+        default=False,
+        verbose_name="칼로리 직접 입력 여부",
+        help_text="직접 입력한 칼로리는 MET/몸무게 변경 시 다시 계산하지 않음"
+    )
+
+    completed_at = models.DateTimeField(
+        verbose_name="세트 완료 시간"
+    )
+
+    member = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='+',
+        db_index=False,
+        null=True,
+        editable=False,
+        verbose_name="운동하는 사용자"
+    )
+
+    workout_date = models.DateField(
+        null=True,
+        editable=False,
+        verbose_name="운동 날짜"
+    )
+
+    archived_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name="보관 처리 일시"
+    )
+
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name="수정일시",
+        help_text="보관 또는 칼로리 재계산 시각 (동기화 커서 기준)"
+    )
+
+    class Meta:
+        verbose_name = "보관된 운동 세트"
+        verbose_name_plural = "보관된 운동 세트들"
+        db_table = 'archived_exercise_set'
+        ordering = ['workout_exercise', 'set_number']
+        indexes = [
+            models.Index(fields=['member', 'workout_date']),
+            models.Index(fields=['member', 'updated_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.workout_exercise} - 세트{self.set_number} (보관)"
+
+    @property
+    def display_weight(self):
+        # 중량을 보기 좋게 표시
+        if self.weight_kg == int(self.weight_kg):
+            return f"{int(self.weight_kg)}kg"
+        return f"{self.weight_kg}kg"
+
+
+
+class SyncTombstone(models.Model):
+    # 삭제 기록 (오프라인 동기화 클라이언트에 삭제를 전달)
+    # 서비스 계층에서 사용자 요청으로 삭제할 때만 기록 - 보관(아카이브) 이동은 삭제가 아님
+
+    OBJECT_TYPE_CHOICES = [
+        ('daily_workout', '일일 운동'),
+        ('workout_exercise', '운동 항목'),
+        ('exercise_set', '운동 세트'),
+    ]
+
+    member = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='+',
+        db_index=False,
+        verbose_name="운동하는 사용자"
+    )
+
+    object_type = models.CharField(
+        max_length=20,
+        choices=OBJECT_TYPE_CHOICES,
+        verbose_name="삭제된 객체 종류"
+    )
+
+    object_id = models.BigIntegerField(
+        verbose_name="삭제된 객체 ID"
+    )
+
+    deleted_at = models.DateTimeField(
+        default=timezone.now,
+        verbose_name="삭제 일시"
+    )
+
+    class Meta:
+        verbose_name = "삭제 기록"
+        verbose_name_plural = "삭제 기록들"
+        db_table = 'sync_tombstone'
+        indexes = [
+            models.Index(fields=['member', 'deleted_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.object_type}#{self.object_id} 삭제 ({self.deleted_at})"
+
+
+
+class IdempotencyKey(models.Model):
+    # Idempotency-Key 헤더로 받은 쓰기 요청의 처리 결과 (재전송 시 저장된 응답 반환)
+    # status_code가 비어 있으면 처리 중인 요청
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='+',
+        db_index=False,
+        verbose_name="요청 사용자"
+    )
+
+    key = models.CharField(
+        max_length=255,
+        verbose_name="Idempotency-Key"
+    )
+
+    request_hash = models.CharField(
+        max_length=64,
+        verbose_name="요청 해시",
+        help_text="메서드, 경로, 본문의 sha256 (같은 키로 다른 요청을 보냈는지 확인)"
+    )
+
+    status_code = models.PositiveSmallIntegerField(
+        null=True,
+        blank=True,
+        verbose_name="응답 상태 코드"
+    )
+
+    response_body = models.JSONField(
+        null=True,
+        blank=True,
+        encoder=DjangoJSONEncoder,
+        verbose_name="응답 본문"
+    )
+
+    created_at = models.DateTimeField(
+        default=timezone.now,
+        db_index=True,
+        verbose_name="생성일시"
+    )
+
+    class Meta:
+        verbose_name = "멱등성 키"
+        verbose_name_plural = "멱등성 키들"
+        db_table = 'idempotency_key'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'key'],
+                name='unique_user_idempotency_key'
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.user_id}:{self.key}"
+
+    @property
+    def is_pending(self):
+        return self.status_code is None
+
+
+
+class WeeklyLeaderboardEntry(models.Model):
+    # 트레이너별 주간 리더보드 (회원 1명 × 주 1개 행)
+    # 세트 이벤트로 해당 회원-주만 다시 집계하고, 조회는 (트레이너, 주, 지표) 인덱스 순서대로 읽음
+
+    member = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='+',
+        db_index=False,
+        verbose_name="회원"
+    )
+
+    trainer = models.ForeignKey(
+        'members.Trainer',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+',
+        db_index=False,
+        verbose_name="담당 트레이너",
+        help_text="집계 시점의 담당 트레이너 (배정 변경 시 이번 주 행만 옮김)"
+    )
+
+    week_start = models.DateField(
+        verbose_name="주 시작일(월요일)"
+    )
+
+    total_volume = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=Decimal('0.00'),
+        verbose_name="총 볼륨(kg)",
+        help_text="반복 횟수 × 무게의 합"
+    )
+
+    sessions = models.PositiveSmallIntegerField(
+        default=0,
+        verbose_name="운동한 날 수"
+    )
+
+    total_calories = models.PositiveIntegerField(
+        default=0,
+        verbose_name="총 소모 칼로리"
+    )
+
+    current_streak = models.PositiveIntegerField(
+        default=0,
+        verbose_name="연속 운동 일수",
+        help_text="MemberStreak의 현재 연속 일수 사본 (순위 정렬용)"
+    )
+
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name="수정일시"
+    )
+
+    class Meta:
+        verbose_name = "주간 리더보드"
+        verbose_name_plural = "주간 리더보드들"
+        db_table = 'weekly_leaderboard'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['member', 'week_start'],
+                name='unique_leaderboard_member_week'
+            )
+        ]
+        indexes = [
+            models.Index(fields=['trainer', 'week_start', '-total_volume'], name='leaderboard_volume_idx'),
+            models.Index(fields=['trainer', 'week_start', '-sessions'], name='leaderboard_sessions_idx'),
+            models.Index(fields=['trainer', 'week_start', '-total_calories'], name='leaderboard_calories_idx'),
+            models.Index(fields=['trainer', 'week_start', '-current_streak'], name='leaderboard_streak_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.member_id} - {self.week_start}"
+
+
+
+class MemberStreak(models.Model):
+    # 회원별 연속 운동 기록 (운동한 날 = 세트가 1개 이상 있는 날)
+    # 날이 새로 활성화/비활성화될 때만 갱신 - 마지막 날 뒤에 붙는 경우는 이전 상태만으로 계산
+
+    member = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='workout_streak',
+        verbose_name="회원"
+    )
+
+    weekly_target = models.PositiveSmallIntegerField(
+        default=3,
+        validators=[MinValueValidator(1), MaxValueValidator(7)],
+        verbose_name="주간 목표 운동 일수"
+    )
+
+    current_streak = models.PositiveIntegerField(
+        default=0,
+        verbose_name="현재 연속 운동 일수",
+        help_text="last_active_date에서 끝나는 연속 일수 (조회 시 어제 이전이면 0으로 표시)"
+    )
+
+    longest_streak = models.PositiveIntegerField(
+        default=0,
+        verbose_name="최장 연속 운동 일수"
+    )
+
+    last_active_date = models.DateField(
+        null=True,
+        blank=True,
+        verbose_name="마지막 운동 날짜"
+    )
+
+    current_week_streak = models.PositiveIntegerField(
+        default=0,
+        verbose_name="현재 연속 목표 달성 주 수",
+        help_text="last_target_week에서 끝나는 연속 주 수"
+    )
+
+    longest_week_streak = models.PositiveIntegerField(
+        default=0,
+        verbose_name="최장 연속 목표 달성 주 수"
+    )
+
+    last_target_week = models.DateField(
+        null=True,
+        blank=True,
+        verbose_name="마지막 목표 달성 주 시작일"
+    )
+
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name="수정일시"
+    )
+
+    class Meta:
+        verbose_name = "연속 운동 기록"
+        verbose_name_plural = "연속 운동 기록들"
+        db_table = 'member_streak'
+
+    def __str__(self):
+        return f"{self.member_id} - {self.current_streak}일"
@@ -1,6 +1,28 @@
 # workouts/services.py
 
-from .models import DailyWorkout
+from collections import defaultdict
+from datetime import timedelta
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, F, Max, Value, When
+from django.utils import timezone
+from core.events import publish
+from members.models import Member
+from .models import DailyWorkout, WorkoutExercise, ExerciseSet, ArchivedExerciseSet, SyncTombstone
+from .events import SetLogged, SetUpdated, SetDeleted
+from .calories import calculate_set_calories
+
+# 세트 번호 재정렬 시 임시로 더하는 값 (실제 세트 번호와 겹치지 않을 만큼 큰 값)
+SET_NUMBER_OFFSET = 1_000_000
+
+
+def get_workout_exercise_sets(workout_exercise):
+    # 현재 세트와 보관된 세트를 합쳐 세트 번호 순으로 반환
+    # exercise_sets, archived_sets를 prefetch 해두면 추가 쿼리 없음
+    sets = list(workout_exercise.exercise_sets.all()) + list(workout_exercise.archived_sets.all())
+    sets.sort(key=lambda exercise_set: exercise_set.set_number)
+    return sets
+
 
 class WorkoutRecordService:
     @staticmethod
@@ -13,7 +35,8 @@ class WorkoutRecordService:
                 'member', 'trainer'
             ).prefetch_related(
                 'workout_exercises__exercise',
-                'workout_exercises__exercise_sets'
+                'workout_exercises__exercise_sets',
+                'workout_exercises__archived_sets'
             ).order_by('-workout_date', '-created_at')
             
             # 운동 기록 데이터 구성
@@ -42,7 +65,7 @@ class WorkoutRecordService:
                     
                     # 세트별 정보 구성
                     exercise_sets = []
-                    for exercise_set in workout_exercise.exercise_sets.all():
+                    for exercise_set in get_workout_exercise_sets(workout_exercise):
                         set_duration_display = "00:00:00"
                         if exercise_set.duration:
                             total_seconds = int(exercise_set.duration.total_seconds())
@@ -96,4 +119,285 @@ class WorkoutRecordService:
                 'workout_records': [],
                 'total_workouts': 0,
                 'has_records': False
-            }
\ No newline at end of file
+            }
+
+    @staticmethod
+    def get_trainer_day_board(trainer_id, start_date, end_date, include_exercises=False):
+        # 트레이너의 활성 담당 회원 전체의 기간 내 운동 요약 (회원 수와 무관하게 쿼리 2~3번)
+        # 1) 담당 회원 2) 일일 운동 ((member, workout_date) 인덱스) 3) 운동 항목 (include_exercises일 때만)
+        members = list(
+            Member.objects.filter(assigned_trainer_id=trainer_id, is_active=True)
+            .order_by('name', 'user_ptr_id')
+            .values('user_ptr_id', 'name')
+        )
+        member_ids = [member['user_ptr_id'] for member in members]
+
+        daily_workouts = DailyWorkout.objects.filter(
+            member_id__in=member_ids,
+            workout_date__range=(start_date, end_date)
+        ).order_by('workout_date').values(
+            'id', 'member_id', 'workout_date', 'total_duration', 'total_calories', 'is_completed'
+        )
+
+        exercises_by_workout = defaultdict(list)
+        if include_exercises and member_ids:
+            workout_exercises = WorkoutExercise.objects.filter(
+                member_id__in=member_ids,
+                workout_date__range=(start_date, end_date)
+            ).order_by('order_number', 'id').values(
+                'id', 'daily_workout_id', 'exercise_id', 'exercise__exercise_name', 'exercise__body_part',
+                'total_sets', 'total_duration', 'total_calories'
+            )
+            for workout_exercise in workout_exercises:
+                exercises_by_workout[workout_exercise['daily_workout_id']].append({
+                    'id': workout_exercise['id'],
+                    'exercise_id': workout_exercise['exercise_id'],
+                    'exercise_name': workout_exercise['exercise__exercise_name'],
+                    'body_part': workout_exercise['exercise__body_part'],
+                    'total_sets': workout_exercise['total_sets'],
+                    'total_duration_sec': _to_seconds(workout_exercise['total_duration']),
+                    'total_calories': workout_exercise['total_calories'],
+                })
+
+        days_by_member = defaultdict(list)
+        for workout in daily_workouts:
+            day = {
+                'daily_workout_id': workout['id'],
+                'workout_date': workout['workout_date'].isoformat(),
+                'total_duration_sec': _to_seconds(workout['total_duration']),
+                'total_calories': workout['total_calories'],
+                'is_completed': workout['is_completed'],
+            }
+            if include_exercises:
+                day['workout_exercises'] = exercises_by_workout.get(workout['id'], [])
+            days_by_member[workout['member_id']].append(day)
+
+        board = []
+        for member in members:
+            days = days_by_member.get(member['user_ptr_id'], [])
+            board.append({
+                'member_id': member['user_ptr_id'],
+                'name': member['name'],
+                'workout_days': len(days),
+                'total_duration_sec': sum(day['total_duration_sec'] for day in days),
+                'total_calories': sum(day['total_calories'] for day in days),
+                'days': days,
+            })
+        return board
+
+
+def _to_seconds(duration):
+    return int(duration.total_seconds()) if duration else 0
+
+
+class ExerciseSetService:
+    # 세트 생성/수정/삭제와 운동 항목·일일 운동 총합 재계산
+    # 뷰와 오프라인 동기화가 같은 경로로 쓰기를 수행 (삭제 기록, 실시간 피드 발행 포함)
+
+    @staticmethod
+    def last_archived_set_number(workout_exercise):
+        # 보관된 세트의 마지막 번호 (없으면 0) - 보관 이후 추가된 세트는 이 번호 다음부터 매김
+        return ArchivedExerciseSet.objects.filter(
+            workout_exercise=workout_exercise
+        ).aggregate(last=Max('set_number'))['last'] or 0
+
+    @staticmethod
+    def next_set_number(workout_exercise):
+        # 현재 세트와 보관된 세트를 합친 마지막 번호 다음
+        last_number = ExerciseSet.objects.filter(
+            workout_exercise=workout_exercise
+        ).aggregate(last=Max('set_number'))['last'] or 0
+        return max(last_number, ExerciseSetService.last_archived_set_number(workout_exercise)) + 1
+
+    @staticmethod
+    def calculate_calories(workout_exercise, duration):
+        member_id = workout_exercise.member_id or workout_exercise.daily_workout.member_id
+        return calculate_set_calories(workout_exercise.exercise_id, member_id, duration)
+
+    @staticmethod
+    def refresh_totals(workout_exercise):
+        # WorkoutExercise 총합 재계산 후 DailyWorkout 총합 재계산 (보관된 세트 포함)
+        exercise_sets = list(
+            ExerciseSet.objects.filter(workout_exercise=workout_exercise).values_list('duration', 'calories')
+        ) + list(
+            ArchivedExerciseSet.objects.filter(workout_exercise=workout_exercise).values_list('duration', 'calories')
+        )
+
+        workout_exercise.total_sets = len(exercise_sets)
+        total_seconds = sum(
+            int(duration.total_seconds()) for duration, _ in exercise_sets if duration
+        )
+        workout_exercise.total_duration = timedelta(seconds=total_seconds)
+        workout_exercise.total_calories = sum(calories for _, calories in exercise_sets)
+        workout_exercise.save()
+
+        daily_workout = workout_exercise.daily_workout
+        all_workout_exercises = WorkoutExercise.objects.filter(daily_workout=daily_workout)
+
+        daily_total_seconds = sum(
+            int(we.total_duration.total_seconds()) for we in all_workout_exercises if we.total_duration
+        )
+        daily_workout.total_duration = timedelta(seconds=daily_total_seconds)
+        daily_workout.total_calories = sum(we.total_calories for we in all_workout_exercises)
+        daily_workout.save()
+
+    @staticmethod
+    @transaction.atomic
+    def create_set(workout_exercise, repetitions, weight_kg, duration, calories=None):
+        # 다음 세트 번호로 세트 생성 (칼로리를 주지 않으면 MET × 회원 몸무게 × 시간으로 계산)
+        calories_manual = calories is not None
+        if not calories_manual:
+            calories = ExerciseSetService.calculate_calories(workout_exercise, duration)
+        exercise_set = ExerciseSet.objects.create(
+            workout_exercise=workout_exercise,
+            set_number=ExerciseSetService.next_set_number(workout_exercise),
+            repetitions=repetitions,
+            weight_kg=weight_kg,
+            duration=duration,
+            calories=calories,
+            calories_manual=calories_manual
+        )
+        ExerciseSetService.refresh_totals(workout_exercise)
+        publish(SetLogged.from_set(exercise_set))
+        return exercise_set
+
+    @staticmethod
+    def apply_changes(exercise_set, changes):
+        # 전달된 필드만 인스턴스에 반영하고 바뀐 필드 이름 목록 반환 (저장은 하지 않음)
+        # 칼로리를 직접 주면 직접 입력으로 표시, None이면 서버 계산으로 되돌림
+        # 계산된 칼로리의 세트는 시간이 바뀌면 다시 계산
+        changes = dict(changes)
+        if 'calories' in changes:
+            changes['calories_manual'] = changes['calories'] is not None
+        for field, value in changes.items():
+            setattr(exercise_set, field, value)
+        fields = list(changes)
+        if not exercise_set.calories_manual and ('duration' in changes or 'calories' in changes):
+            exercise_set.calories = ExerciseSetService.calculate_calories(
+                exercise_set.workout_exercise, exercise_set.duration
+            )
+            if 'calories' not in fields:
+                fields.append('calories')
+        return fields
+
+    @staticmethod
+    @transaction.atomic
+    def update_set(exercise_set, **changes):
+        # 전달된 필드만 수정
+        ExerciseSetService.apply_changes(exercise_set, changes)
+        exercise_set.save()
+        ExerciseSetService.refresh_totals(exercise_set.workout_exercise)
+        publish(SetUpdated.from_set(exercise_set))
+        return exercise_set
+
+    @staticmethod
+    @transaction.atomic
+    def update_sets(workout_exercise, set_changes):
+        # 같은 운동 항목의 세트 여러 개 수정 - [(세트, 변경 필드)]
+        # UPDATE는 bulk_update 한 번, 운동/일일 총합 재계산도 세트 수와 관계없이 한 번만 수행
+        # bulk_update는 auto_now를 갱신하지 않으므로 동기화 커서용 updated_at 직접 지정
+        now = timezone.now()
+        fields = {'updated_at'}
+        for exercise_set, changes in set_changes:
+            fields.update(ExerciseSetService.apply_changes(exercise_set, changes))
+            exercise_set.updated_at = now
+        exercise_sets = [exercise_set for exercise_set, _ in set_changes]
+        ExerciseSet.objects.bulk_update(exercise_sets, sorted(fields))
+
+        ExerciseSetService.refresh_totals(workout_exercise)
+        for exercise_set in exercise_sets:
+            publish(SetUpdated.from_set(exercise_set))
+        return exercise_sets
+
+    @staticmethod
+    def renumber_sets(workout_exercise):
+        # 남은 세트 번호를 보관된 세트 다음 번호(보관된 세트가 없으면 1)부터 다시 매김
+        # 세트 수와 관계없이 조회 2번 + UPDATE 2번
+        # unique_exercise_set_number는 행 단위로 검사되므로(지연 검사 아님) 바꿀 세트를 먼저 겹치지 않는 번호로 옮긴 뒤
+        # CASE 한 번으로 최종 번호 지정
+        first_number = ExerciseSetService.last_archived_set_number(workout_exercise) + 1
+        set_numbers = ExerciseSet.objects.filter(
+            workout_exercise=workout_exercise
+        ).order_by('set_number').values_list('id', 'set_number')
+        new_numbers = {
+            set_id: index
+            for index, (set_id, set_number) in enumerate(set_numbers, first_number) if set_number != index
+        }
+        if not new_numbers:
+            return 0
+
+        changed_sets = ExerciseSet.objects.filter(id__in=new_numbers)
+        changed_sets.update(set_number=F('set_number') + SET_NUMBER_OFFSET)
+        # update()는 auto_now를 갱신하지 않으므로 동기화 커서용 updated_at 직접 지정
+        changed_sets.update(
+            set_number=Case(*[When(id=set_id, then=Value(number)) for set_id, number in new_numbers.items()]),
+            updated_at=timezone.now()
+        )
+        return len(new_numbers)
+
+    @staticmethod
+    def delete_set(exercise_set):
+        ExerciseSetService.delete_sets(exercise_set.workout_exercise, [exercise_set])
+
+    @staticmethod
+    @transaction.atomic
+    def delete_sets(workout_exercise, exercise_sets):
+        # 같은 운동 항목의 세트들을 삭제 기록과 함께 삭제
+        # 남은 세트 번호 재정렬과 운동/일일 총합 재계산은 삭제한 세트 수와 관계없이 한 번만 수행
+        for exercise_set in exercise_sets:
+            publish(SetDeleted.from_set(exercise_set))
+        SyncTombstone.objects.bulk_create([
+            SyncTombstone(member_id=exercise_set.member_id, object_type='exercise_set', object_id=exercise_set.id)
+            for exercise_set in exercise_sets
+        ])
+        ExerciseSet.objects.filter(id__in=[exercise_set.id for exercise_set in exercise_sets]).delete()
+
+        ExerciseSetService.renumber_sets(workout_exercise)
+        ExerciseSetService.refresh_totals(workout_exercise)
+
+
+
+class ExerciseSetArchiveService:
+    # 오래된 ExerciseSet을 archived_exercise_set 테이블로 옮기는 서비스
+    ARCHIVE_FIELDS = [
+        'id', 'workout_exercise_id', 'set_number', 'repetitions', 'weight_kg',
+        'duration', 'calories', 'calories_manual', 'completed_at', 'member_id', 'workout_date'
+    ]
+
+    @staticmethod
+    def get_cutoff_date(horizon_days=None):
+        # 보관 기준일 계산 (기준일 이전 운동 날짜의 세트가 대상)
+        if horizon_days is None:
+            horizon_days = settings.WORKOUT_ARCHIVE_HORIZON_DAYS
+        return timezone.now().date() - timedelta(days=horizon_days)
+
+    @staticmethod
+    def archive_sets(cutoff_date=None, batch_size=None):
+        # 기준일 이전 세트를 배치 단위로 이동하고 이동한 세트 수를 반환
+        if cutoff_date is None:
+            cutoff_date = ExerciseSetArchiveService.get_cutoff_date()
+        if batch_size is None:
+            batch_size = settings.WORKOUT_ARCHIVE_BATCH_SIZE
+
+        archived_count = 0
+        while True:
+            with transaction.atomic():
+                rows = list(
+                    ExerciseSet.objects.filter(
+                        workout_date__lt=cutoff_date
+                    ).order_by('id').values(*ExerciseSetArchiveService.ARCHIVE_FIELDS)[:batch_size]
+                )
+                if not rows:
+                    break
+
+                ArchivedExerciseSet.objects.bulk_create(
+                    [ArchivedExerciseSet(**row) for row in rows],
+                    ignore_conflicts=True
+                )
+                ExerciseSet.objects.filter(id__in=[row['id'] for row in rows]).delete()
+
+            archived_count += len(rows)
+            if len(rows) < batch_size:
+                break
+
+        return archived_count
@@ -0,0 +1,52 @@
+# workouts/signals.py
+
+from decimal import Decimal
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from members.models import Member, Trainer
+from core.queue import enqueue
+from .caching import invalidate_member_records
+from .calories import invalidate_met_table
+from .models import Exercise
+
+
+def _as_decimal(value):
+    # 요청 데이터(문자열/실수)로 설정된 값과 DB 값을 같은 기준으로 비교
+    return Decimal(str(value)) if value is not None else None
+
+
+@receiver(post_save, sender=Exercise)
+def recompute_calories_on_met_change(sender, instance, created, **kwargs):
+    # 운동 추가/변경 시 운동 카탈로그 캐시(MET 테이블, 운동 목록) 무효화, MET가 바뀐 운동은 세트 칼로리 재계산 작업 등록
+    loaded_met_value = getattr(instance, '_loaded_met_value', None)
+    met_changed = loaded_met_value is not None and _as_decimal(loaded_met_value) != _as_decimal(instance.met_value)
+    invalidate_met_table()
+    if met_changed:
+        enqueue('workouts.recompute_calories', exercise_id=instance.pk, met_value=str(instance.met_value))
+    instance._loaded_met_value = instance.met_value
+
+
+@receiver(post_delete, sender=Exercise)
+def invalidate_met_table_on_delete(sender, instance, **kwargs):
+    invalidate_met_table()
+
+
+@receiver(post_save, sender=Trainer)
+@receiver(post_save, sender=Member)
+def recompute_calories_on_weight_change(sender, instance, created, **kwargs):
+    # 몸무게가 바뀐 경우 해당 사용자의 세트 칼로리 재계산 작업 등록 (로드한 인스턴스만 비교 가능)
+    if created or not hasattr(instance, '_loaded_weight_kg'):
+        instance._loaded_weight_kg = instance.weight_kg
+        return
+    if _as_decimal(instance._loaded_weight_kg) != _as_decimal(instance.weight_kg):
+        weight_kg = instance.weight_kg or settings.CALORIE_DEFAULT_WEIGHT_KG
+        enqueue('workouts.recompute_calories', member_id=instance.pk, weight_kg=str(weight_kg))
+    instance._loaded_weight_kg = instance.weight_kg
+
+
+@receiver(post_save, sender=Member)
+def reset_records_cache_on_member_create(sender, instance, created, **kwargs):
+    # 새 회원 ID에 남아 있을 수 있는 이전 운동 기록 응답 캐시 무효화 (삭제된 회원 ID를 재사용하는 DB 대비)
+    if created:
+        invalidate_member_records(instance.pk)
@@ -0,0 +1,238 @@
+# workouts/streaks.py
+
+from collections import Counter
+from datetime import date, timedelta
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils import timezone
+from .leaderboard import get_week_start
+from .models import MemberStreak, WeeklyLeaderboardEntry, WorkoutExercise
+
+ONE_DAY = timedelta(days=1)
+ONE_WEEK = timedelta(weeks=1)
+
+
+def _active_dates(member_id, start=None, end=None):
+    # 세트가 있는 운동 날짜 (보관된 세트도 운동 항목 총합에 남아 있으므로 WorkoutExercise 기준)
+    queryset = WorkoutExercise.objects.filter(member_id=member_id, total_sets__gt=0)
+    if start is not None:
+        queryset = queryset.filter(workout_date__gte=start)
+    if end is not None:
+        queryset = queryset.filter(workout_date__lte=end)
+    return set(queryset.order_by().values_list('workout_date', flat=True).distinct())
+
+
+def _is_active(member_id, day):
+    return WorkoutExercise.objects.filter(member_id=member_id, workout_date=day, total_sets__gt=0).exists()
+
+
+def _run_bounds(active, day):
+    # day를 포함하는 연속 구간의 (시작, 끝)
+    start = end = day
+    while start - ONE_DAY in active:
+        start -= ONE_DAY
+    while end + ONE_DAY in active:
+        end += ONE_DAY
+    return start, end
+
+
+def _run_length(bounds):
+    return (bounds[1] - bounds[0]).days + 1
+
+
+def _longest_run(dates, step):
+    # 정렬된 날짜(또는 주 시작일)에서 step 간격으로 이어지는 최장 구간 길이와 마지막 구간 길이
+    longest = current = 0
+    previous = None
+    for value in dates:
+        current = current + 1 if previous is not None and value - previous == step else 1
+        longest = max(longest, current)
+        previous = value
+    return longest, current
+
+
+def get_streak(member_id):
+    return MemberStreak.objects.filter(member_id=member_id).first() or _create_streak(member_id)
+
+
+def recompute_streak(streak):
+    # 전체 운동 날짜로 다시 계산 (창 밖까지 이어지는 구간, CSV 가져오기 등)
+    dates = sorted(_active_dates(streak.member_id))
+    streak.longest_streak, streak.current_streak = _longest_run(dates, ONE_DAY)
+    streak.last_active_date = dates[-1] if dates else None
+    _refresh_weeks(streak, reset_longest=True)
+
+
+def _refresh_weeks(streak, reset_longest=False):
+    # 최근 STREAK_WEEK_WINDOW주의 주별 운동 일수로 목표 달성 연속 주 계산
+    # 최장 기록은 목표 변경/달성 취소 시에만 창 안에서 다시 계산 (그 외에는 늘어나기만 함)
+    oldest_week = get_week_start(timezone.localdate()) - timedelta(weeks=settings.STREAK_WEEK_WINDOW)
+    counts = Counter(get_week_start(day) for day in _active_dates(streak.member_id, start=oldest_week))
+    target_weeks = sorted(week for week, count in counts.items() if count >= streak.weekly_target)
+    longest, current = _longest_run(target_weeks, ONE_WEEK)
+
+    streak.current_week_streak = current
+    streak.last_target_week = target_weeks[-1] if target_weeks else None
+    streak.longest_week_streak = longest if reset_longest else max(streak.longest_week_streak, longest)
+
+
+def _apply_activated(streak, day):
+    last = streak.last_active_date
+    if last is None or day > last + ONE_DAY:
+        # 새 연속 시작
+        streak.current_streak = 1
+        streak.last_active_date = day
+    elif day == last + ONE_DAY:
+        # 마지막 날 다음 날 - 이전 상태만으로 갱신
+        streak.current_streak += 1
+        streak.last_active_date = day
+    elif day >= last - timedelta(days=streak.current_streak - 1):
+        # 이미 현재 연속 구간 안의 날
+        return
+    else:
+        # 과거 날짜 추가 - 그 날짜 주변 창만 조회해 이어진 구간 계산
+        window = timedelta(days=settings.STREAK_WINDOW_DAYS)
+        active = _active_dates(streak.member_id, day - window, day + window)
+        active.add(day)
+        start, end = _run_bounds(active, day)
+        if start <= day - window or end >= day + window:
+            recompute_streak(streak)
+            return
+        if end >= last:
+            streak.current_streak = _run_length((start, end))
+        streak.longest_streak = max(streak.longest_streak, _run_length((start, end)))
+        return
+    streak.longest_streak = max(streak.longest_streak, streak.current_streak)
+
+
+def _apply_deactivated(streak, day):
+    last = streak.last_active_date
+    if last is None or day > last:
+        return
+
+    window = timedelta(days=settings.STREAK_WINDOW_DAYS)
+    active = _active_dates(streak.member_id, day - window, day + window)
+    active.discard(day)
+    left = _run_bounds(active, day - ONE_DAY) if day - ONE_DAY in active else None
+    right = _run_bounds(active, day + ONE_DAY) if day + ONE_DAY in active else None
+    if (left and left[0] <= day - window) or (right and right[1] >= day + window):
+        recompute_streak(streak)
+        return
+
+    if day == last:
+        if left is None:
+            # 이전 운동 날짜가 창 밖에 있을 수 있으므로 전체 계산
+            recompute_streak(streak)
+            return
+        streak.last_active_date = left[1]
+        streak.current_streak = _run_length(left)
+    elif right is not None and right[1] == last:
+        streak.current_streak = _run_length(right)
+
+    # 지워진 날이 속했던 구간이 최장 기록이었을 수 있으면 전체 계산
+    removed_run = 1 + (_run_length(left) if left else 0) + (_run_length(right) if right else 0)
+    if removed_run >= streak.longest_streak:
+        recompute_streak(streak)
+
+
+@transaction.atomic
+def update_streak(member_id, day):
+    # 운동 날짜 하나가 활성화(첫 세트)되거나 비활성화(마지막 세트 삭제)된 뒤 호출
+    # 현재 상태를 확인해 처리하므로 같은 날짜로 여러 번 호출해도 결과가 같음
+    if isinstance(day, str):
+        day = date.fromisoformat(day)
+    streak = MemberStreak.objects.select_for_update().filter(member_id=member_id).first()
+    if streak is None:
+        # 처음 추적하는 회원은 기존 기록으로 전체 계산
+        return _create_streak(member_id)
+
+    active = _is_active(member_id, day)
+    week_days = len(_active_dates(member_id, get_week_start(day), get_week_start(day) + timedelta(days=6)))
+    if active:
+        _apply_activated(streak, day)
+        # 이번 날짜로 주간 목표를 처음 달성한 경우만 주 단위 연속 다시 계산
+        if week_days == streak.weekly_target:
+            _refresh_weeks(streak)
+    else:
+        _apply_deactivated(streak, day)
+        if week_days == streak.weekly_target - 1:
+            _refresh_weeks(streak, reset_longest=True)
+    streak.save()
+    _sync_leaderboard(streak)
+    return streak
+
+
+def clean_weekly_target(value):
+    # 주간 목표 운동 일수 입력값 검증 (1~7 정수) - 다른 필드를 저장하기 전에 호출
+    try:
+        weekly_target = int(value)
+    except (TypeError, ValueError):
+        raise ValidationError({'weekly_target': ['주간 목표는 정수여야 합니다.']})
+    try:
+        MemberStreak._meta.get_field('weekly_target').run_validators(weekly_target)
+    except ValidationError as e:
+        raise ValidationError({'weekly_target': e.messages})
+    return weekly_target
+
+
+def set_weekly_target(member_id, weekly_target):
+    streak = get_streak(member_id)
+    streak.weekly_target = weekly_target
+    streak.full_clean(exclude=['member'])
+    _refresh_weeks(streak, reset_longest=True)
+    streak.save()
+    return streak
+
+
+def _create_streak(member_id):
+    streak, _ = MemberStreak.objects.get_or_create(member_id=member_id)
+    recompute_streak(streak)
+    streak.save()
+    _sync_leaderboard(streak)
+    return streak
+
+
+def refresh_streaks(member_ids):
+    # 이벤트 없이 세트가 추가된 회원(CSV 가져오기)의 연속 기록 전체 계산
+    for member_id in set(member_ids):
+        with transaction.atomic():
+            _create_streak(member_id)
+
+
+def get_display_streak(streak, today=None):
+    # 조회 시점 기준 연속 일수 (마지막 운동이 어제 이전이면 끊긴 것으로 표시)
+    today = today or timezone.localdate()
+    if streak.last_active_date is None or streak.last_active_date < today - ONE_DAY:
+        return 0
+    return streak.current_streak
+
+
+def _sync_leaderboard(streak):
+    # 이번 주 리더보드 행의 연속 일수 갱신
+    current_week = get_week_start(timezone.localdate())
+    WeeklyLeaderboardEntry.objects.filter(member_id=streak.member_id, week_start=current_week).update(
+        current_streak=get_display_streak(streak)
+    )
+
+
+def get_streak_summary(member_id):
+    # 프로필/회원 상세 응답용 연속 기록과 이번 주 목표 달성률
+    today = timezone.localdate()
+    # 조회에서는 행을 만들지 않음 - 아직 없으면 기본값으로 응답하고 세트 이벤트/갱신 작업에서 생성
+    streak = MemberStreak.objects.filter(member_id=member_id).first() or MemberStreak(member_id=member_id)
+    week_start = get_week_start(today)
+    week_days = len(_active_dates(member_id, week_start, week_start + timedelta(days=6)))
+    week_streak = streak.current_week_streak
+    if streak.last_target_week is None or streak.last_target_week < week_start - ONE_WEEK:
+        week_streak = 0
+    return {
+        'current_streak': get_display_streak(streak, today),
+        'longest_streak': streak.longest_streak,
+        'last_active_date': streak.last_active_date.isoformat() if streak.last_active_date else None,
+        'weekly_target': streak.weekly_target,
+        'this_week_days': week_days,
+        'weekly_adherence': round(min(week_days / streak.weekly_target, 1) * 100),
+        'current_week_streak': week_streak,
+        'longest_week_streak': streak.longest_week_streak,
+    }
@@ -0,0 +1,344 @@
+# workouts/sync.py
+
+import base64
+import json
+from datetime import datetime, timedelta
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils import timezone
+from members.models import Member, Trainer
+from members.permissions import can_manage_exercise_catalogue
+from .models import DailyWorkout, WorkoutExercise, ExerciseSet, ArchivedExerciseSet, Exercise, SyncTombstone
+from .services import ExerciseSetService
+
+
+# 중량 허용 범위와 저장 단위 (ExerciseSet.weight_kg: max_digits=5, decimal_places=2)
+WEIGHT_KG_LIMIT = Decimal('1000')
+WEIGHT_KG_STEP = Decimal('0.01')
+
+
+class SyncError(Exception):
+    # 동기화 요청 또는 개별 변경 사항 처리 실패
+    pass
+
+
+def _parse_decimal(value):
+    # 숫자/문자열을 Decimal로 변환 (float는 문자열을 거쳐 입력한 자릿수 유지, NaN/무한대 거부)
+    if isinstance(value, bool):
+        raise ValueError(value)
+    number = Decimal(str(value))
+    if not number.is_finite():
+        raise ValueError(value)
+    return number
+
+
+def _duration_seconds(duration):
+    return int(duration.total_seconds()) if duration else 0
+
+
+def _serialize_daily_workout(workout):
+    return {
+        'id': workout.id,
+        'workout_date': workout.workout_date.isoformat(),
+        'total_duration_sec': _duration_seconds(workout.total_duration),
+        'total_calories': workout.total_calories,
+        'is_completed': workout.is_completed,
+        'updated_at': workout.updated_at.isoformat(),
+    }
+
+
+def _serialize_workout_exercise(workout_exercise):
+    return {
+        'id': workout_exercise.id,
+        'daily_workout_id': workout_exercise.daily_workout_id,
+        'exercise_id': workout_exercise.exercise_id,
+        'exercise_name': workout_exercise.exercise.exercise_name,
+        'body_part': workout_exercise.exercise.body_part,
+        'equipment': workout_exercise.exercise.equipment,
+        'order_number': workout_exercise.order_number,
+        'total_sets': workout_exercise.total_sets,
+        'total_duration_sec': _duration_seconds(workout_exercise.total_duration),
+        'total_calories': workout_exercise.total_calories,
+        'updated_at': workout_exercise.updated_at.isoformat(),
+    }
+
+
+def _serialize_exercise_set(exercise_set):
+    return {
+        'id': exercise_set.id,
+        'workout_exercise_id': exercise_set.workout_exercise_id,
+        'set_number': exercise_set.set_number,
+        'repetitions': exercise_set.repetitions,
+        'weight_kg': float(exercise_set.weight_kg),
+        'duration_sec': _duration_seconds(exercise_set.duration),
+        'calories': exercise_set.calories,
+        'completed_at': exercise_set.completed_at.isoformat(),
+        'updated_at': exercise_set.updated_at.isoformat(),
+        'is_archived': False,
+    }
+
+
+def _serialize_archived_exercise_set(exercise_set):
+    return {
+        'id': exercise_set.id,
+        'workout_exercise_id': exercise_set.workout_exercise_id,
+        'set_number': exercise_set.set_number,
+        'repetitions': exercise_set.repetitions,
+        'weight_kg': float(exercise_set.weight_kg),
+        'duration_sec': _duration_seconds(exercise_set.duration),
+        'calories': exercise_set.calories,
+        'completed_at': exercise_set.completed_at.isoformat(),
+        'updated_at': exercise_set.updated_at.isoformat(),
+        'is_archived': True,
+    }
+
+
+def _serialize_tombstone(tombstone):
+    return {
+        'type': tombstone.object_type,
+        'id': tombstone.object_id,
+        'deleted_at': tombstone.deleted_at.isoformat(),
+    }
+
+
+# 동기화 스트림: (커서 키, 응답 키, 쿼리셋, 시각 필드, 직렬화 함수)
+# 모든 스트림은 (member, 시각) 인덱스를 타는 범위 조회
+# 보관된 세트도 exercise_sets로 내려보냄 (처음 동기화 시 보관된 기록까지 포함, 보관 이동/칼로리 재계산은 같은 id로 다시 전달)
+SYNC_STREAMS = [
+    ('dw', 'daily_workouts', lambda: DailyWorkout.objects.all(), 'updated_at', _serialize_daily_workout),
+    ('we', 'workout_exercises', lambda: WorkoutExercise.objects.select_related('exercise'), 'updated_at', _serialize_workout_exercise),
+    ('es', 'exercise_sets', lambda: ExerciseSet.objects.all(), 'updated_at', _serialize_exercise_set),
+    ('as', 'exercise_sets', lambda: ArchivedExerciseSet.objects.all(), 'updated_at', _serialize_archived_exercise_set),
+    ('ts', 'deleted', lambda: SyncTombstone.objects.all(), 'deleted_at', _serialize_tombstone),
+]
+
+
+def encode_cursor(positions):
+    # {스트림 키: [시각, id]} -> 불투명 문자열
+    payload = json.dumps(positions, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    # 빈 커서는 처음부터 전체 동기화
+    if not cursor:
+        return {}
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        positions = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return {
+            key: (datetime.fromisoformat(value[0]), int(value[1]))
+            for key, value in positions.items()
+        }
+    except (ValueError, TypeError, AttributeError, IndexError, KeyError):
+        raise SyncError('동기화 커서가 올바르지 않습니다.')
+
+
+def get_changes(member_id, cursor=None, limit=None):
+    # 커서 이후 변경된 행과 삭제 기록을 스트림별로 최대 limit개씩 반환
+    # 커밋이 늦게 끝난 행을 놓치지 않도록 SYNC_SETTLE_SECONDS 이전까지만 조회
+    if limit is None:
+        limit = settings.SYNC_PAGE_SIZE
+    positions = decode_cursor(cursor)
+    horizon = timezone.now() - timedelta(seconds=settings.SYNC_SETTLE_SECONDS)
+
+    changes = {}
+    next_positions = {}
+    has_more = False
+    for key, response_key, queryset_factory, time_field, serializer in SYNC_STREAMS:
+        queryset = queryset_factory().filter(member_id=member_id, **{f'{time_field}__lt': horizon})
+        position = positions.get(key)
+        if position is not None:
+            position_time, position_id = position
+            queryset = queryset.filter(
+                Q(**{f'{time_field}__gt': position_time}) | Q(**{time_field: position_time, 'id__gt': position_id})
+            )
+
+        rows = list(queryset.order_by(time_field, 'id')[:limit + 1])
+        if len(rows) > limit:
+            has_more = True
+            rows = rows[:limit]
+
+        changes.setdefault(response_key, []).extend(serializer(row) for row in rows)
+        if rows:
+            last = rows[-1]
+            next_positions[key] = [getattr(last, time_field).isoformat(), last.id]
+        elif position is not None:
+            next_positions[key] = [position[0].isoformat(), position[1]]
+
+    return {
+        'changes': changes,
+        'cursor': encode_cursor(next_positions),
+        'has_more': has_more,
+    }
+
+
+def parse_set_values(change, partial=False):
+    # 세트 입력값 검증 (partial=True면 전달된 필드만)
+    fields = {
+        'repetitions': ('repetitions', int),
+        'weight_kg': ('weight_kg', _parse_decimal),
+        'duration_sec': ('duration', lambda value: timedelta(seconds=int(value))),
+        'calories': ('calories', int),
+    }
+    values = {}
+    for key, (field, cast) in fields.items():
+        if key == 'calories' and change.get(key) is None:
+            # 칼로리를 생략하면 서버에서 계산 (수정 시 null이면 서버 계산으로 되돌림)
+            if key in change:
+                values[field] = None
+            continue
+        if key not in change:
+            if not partial:
+                raise SyncError(f'{key} 필드가 필요합니다.')
+            continue
+        try:
+            values[field] = cast(change[key])
+        except (ValueError, TypeError, InvalidOperation):
+            raise SyncError(f'{key} 값의 형식이 올바르지 않습니다.')
+
+    if 'weight_kg' in values:
+        # 저장되는 값(소수 둘째 자리)으로 맞춰 반영 - 응답과 DB 값이 같도록
+        if values['weight_kg'] >= WEIGHT_KG_LIMIT \
+                or values['weight_kg'].quantize(WEIGHT_KG_STEP, rounding=ROUND_HALF_UP) >= WEIGHT_KG_LIMIT:
+            raise SyncError(f'weight_kg 값은 {WEIGHT_KG_LIMIT} 미만이어야 합니다.')
+        values['weight_kg'] = values['weight_kg'].quantize(WEIGHT_KG_STEP, rounding=ROUND_HALF_UP)
+
+    if values.get('repetitions', 1) <= 0 or values.get('weight_kg', 0) < 0 \
+            or values.get('duration', timedelta(seconds=1)) <= timedelta(0) or (values.get('calories') or 0) < 0:
+        raise SyncError('값은 양수여야 합니다.')
+    if partial and not values:
+        raise SyncError('수정할 필드가 없습니다.')
+    return values
+
+
+def _get_registering_trainer_id(user, member_id):
+    # 일일 운동을 등록할 트레이너 (트레이너 본인 또는 회원의 담당 트레이너)
+    if user.user_type == 'trainer' and Trainer.objects.filter(user_ptr_id=user.id).exists():
+        return user.id
+    trainer_id = Member.objects.filter(user_ptr_id=member_id).values_list('assigned_trainer_id', flat=True).first()
+    if trainer_id is None:
+        raise SyncError('담당 트레이너가 없어 운동 기록을 등록할 수 없습니다.')
+    return trainer_id
+
+
+def _get_or_create_workout_exercise(user, member_id, change):
+    # 기존 운동 항목 id 또는 (운동명, 부위, 도구, 날짜)로 운동 항목 찾기/생성
+    if change.get('workout_exercise_id'):
+        workout_exercise = WorkoutExercise.objects.select_related('daily_workout').filter(
+            id=change['workout_exercise_id'], member_id=member_id
+        ).first()
+        if workout_exercise is None:
+            raise SyncError('운동 정보를 찾을 수 없습니다.')
+        return workout_exercise
+
+    for key in ('exercise_name', 'body_part', 'equipment'):
+        if not change.get(key):
+            raise SyncError(f'{key} 필드가 필요합니다.')
+    try:
+        workout_date = datetime.strptime(change['workout_date'], '%Y-%m-%d').date() \
+            if change.get('workout_date') else timezone.now().date()
+    except (ValueError, TypeError):
+        raise SyncError('workout_date 형식이 올바르지 않습니다. (YYYY-MM-DD)')
+
+    # 공용 운동 목록에 없는 운동은 트레이너/관리자만 새로 등록 (회원은 오류)
+    lookup = {key: change[key] for key in ('exercise_name', 'body_part', 'equipment')}
+    exercise = Exercise.objects.filter(**lookup).order_by('id').first()
+    if exercise is None:
+        if not can_manage_exercise_catalogue(user):
+            raise SyncError('운동 목록에 없는 운동입니다.')
+        exercise = Exercise.objects.create(
+            measurement_unit='회', weight_unit='kg', met_value=6.0, is_active=True, **lookup
+        )
+    daily_workout, _ = DailyWorkout.objects.get_or_create(
+        member_id=member_id,
+        workout_date=workout_date,
+        defaults={
+            'trainer_id': _get_registering_trainer_id(user, member_id),
+            'total_duration': timedelta(0),
+            'total_calories': 0,
+            'is_completed': False
+        }
+    )
+    workout_exercise, _ = WorkoutExercise.objects.get_or_create(
+        daily_workout=daily_workout,
+        exercise=exercise,
+        defaults={
+            'order_number': WorkoutExercise.objects.filter(daily_workout=daily_workout).count() + 1,
+            'total_sets': 0,
+            'total_duration': timedelta(0),
+            'total_calories': 0
+        }
+    )
+    return workout_exercise
+
+
+def _get_member_set(member_id, set_id):
+    return ExerciseSet.objects.select_related('workout_exercise__daily_workout').filter(
+        id=set_id, member_id=member_id
+    ).first()
+
+
+def _is_archived_member_set(member_id, set_id):
+    # 보관된 세트는 조회만 가능 (REST 수정/삭제 API와 같은 규칙)
+    return ArchivedExerciseSet.objects.filter(id=set_id, member_id=member_id).exists()
+
+
+def _apply_change(user, member_id, change):
+    op = change.get('op')
+
+    if op == 'create':
+        values = parse_set_values(change)
+        workout_exercise = _get_or_create_workout_exercise(user, member_id, change)
+        exercise_set = ExerciseSetService.create_set(workout_exercise, **values)
+        return {'set_id': exercise_set.id, 'workout_exercise_id': workout_exercise.id}
+
+    if op == 'update':
+        values = parse_set_values(change, partial=True)
+        exercise_set = _get_member_set(member_id, change.get('set_id'))
+        if exercise_set is None and _is_archived_member_set(member_id, change.get('set_id')):
+            raise SyncError('보관된 세트는 수정하거나 삭제할 수 없습니다.')
+        if exercise_set is None:
+            raise SyncError('세트를 찾을 수 없습니다.')
+        ExerciseSetService.update_set(exercise_set, **values)
+        return {'set_id': exercise_set.id}
+
+    if op == 'delete':
+        exercise_set = _get_member_set(member_id, change.get('set_id'))
+        if exercise_set is None and _is_archived_member_set(member_id, change.get('set_id')):
+            raise SyncError('보관된 세트는 수정하거나 삭제할 수 없습니다.')
+        # 이미 삭제된 세트는 성공으로 처리 (재전송된 요청)
+        if exercise_set is not None:
+            ExerciseSetService.delete_set(exercise_set)
+        return {'set_id': change.get('set_id')}
+
+    raise SyncError('지원하지 않는 작업입니다. (create, update, delete)')
+
+
+def apply_changes(user, member_id, changes):
+    # 오프라인에서 쌓인 변경 사항을 순서대로 적용
+    # 각 변경은 독립된 트랜잭션(savepoint)으로 처리해 하나가 실패해도 나머지는 반영
+    if not isinstance(changes, list):
+        raise SyncError('changes는 목록이어야 합니다.')
+    if len(changes) > settings.SYNC_MAX_BATCH_SIZE:
+        raise SyncError(f'한 번에 최대 {settings.SYNC_MAX_BATCH_SIZE}개까지 처리할 수 있습니다.')
+
+    results = []
+    for change in changes:
+        if not isinstance(change, dict):
+            results.append({'client_id': None, 'success': False, 'message': '변경 사항 형식이 올바르지 않습니다.'})
+            continue
+        result = {'client_id': change.get('client_id'), 'op': change.get('op')}
+        try:
+            with transaction.atomic():
+                result.update(_apply_change(user, member_id, change))
+            result['success'] = True
+        except SyncError as e:
+            result.update({'success': False, 'message': str(e)})
+        except (IntegrityError, ValidationError):
+            result.update({'success': False, 'message': '데이터 무결성 오류가 발생했습니다.'})
+        results.append(result)
+    return results
@@ -0,0 +1,43 @@
+# workouts/tasks.py
+
+from core.queue import task
+from .calories import recompute_calories
+from .idempotency import purge_expired_keys
+from .leaderboard import compact_leaderboards, refresh_member_weeks
+from .services import ExerciseSetArchiveService
+from .streaks import refresh_streaks
+
+
+@task('workouts.archive_exercise_sets')
+def archive_exercise_sets():
+    # 보관 기준일이 지난 세트를 archived_exercise_set 테이블로 이동
+    ExerciseSetArchiveService.archive_sets()
+
+
+@task('workouts.purge_idempotency_keys')
+def purge_idempotency_keys():
+    purge_expired_keys()
+
+
+@task('workouts.recompute_calories')
+def recompute_calories_task(exercise_id=None, member_id=None, met_value=None, weight_kg=None):
+    # MET 또는 몸무게 변경에 따른 세트 칼로리 재계산
+    recompute_calories(exercise_id=exercise_id, member_id=member_id, met_value=met_value, weight_kg=weight_kg)
+
+
+@task('workouts.refresh_leaderboards')
+def refresh_leaderboards_task(member_weeks):
+    # 이벤트 없이 세트가 추가된 경우(CSV 가져오기) 해당 회원-주 리더보드 갱신
+    refresh_member_weeks((member_id, week_start) for member_id, week_start in member_weeks)
+
+
+@task('workouts.compact_leaderboards')
+def compact_leaderboards_task():
+    # 오래된 주 삭제 + 최근 두 주 재집계
+    compact_leaderboards()
+
+
+@task('workouts.refresh_streaks')
+def refresh_streaks_task(member_ids):
+    # 이벤트 없이 세트가 추가된 회원(CSV 가져오기)의 연속 기록 전체 계산
+    refresh_streaks(member_ids)
@@ -1,15 +1,46 @@
 # workouts/tests.py
 
-from django.test import TestCase
+import asyncio
+import base64
+import csv
+import gzip
+import io
+import json
+import os
+import tempfile
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.conf import settings
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.contrib.auth import get_user_model
 from rest_framework.test import APIClient
 from rest_framework import status
+from rest_framework_simplejwt.tokens import RefreshToken
 from django.utils import timezone
 from datetime import timedelta
-from unittest.mock import patch
-from members.models import Trainer
-from .models import DailyWorkout, ExerciseSet, WorkoutExercise, Exercise
+from decimal import Decimal
+from unittest.mock import ANY, patch
+from members.models import Member, Trainer
+from members.permissions import can_access_member
+from core.events import dispatch_outbox
+from core.models import Job, OutboxEvent
+from core.queue import run_pending_jobs
+from .models import DailyWorkout, ExerciseSet, WorkoutExercise, Exercise, ArchivedExerciseSet, SyncTombstone, IdempotencyKey, WeeklyLeaderboardEntry, MemberStreak
+from .idempotency import purge_expired_keys
+from .streaks import get_streak_summary, set_weekly_target, update_streak
+from .heatmap import build_heatmap
+from .leaderboard import compact_leaderboards, get_current_week_start, get_leaderboard, get_member_rank, refresh_member_week
+from .calories import get_met_value, recompute_calories
+from .services import WorkoutRecordService, ExerciseSetArchiveService, ExerciseSetService
+from .sync import get_changes
+from .events import SetLogged, SetUpdated, SetDeleted
+from .checks import check_live_backend
+from .live import SET_UPDATED, get_live_backend, member_channel, serialize_set_event
 
 User = get_user_model()
 
@@ -33,11 +64,12 @@ class WorkoutViewsTestCase(TestCase):
         )
         self.trainer = self.trainer_user
         
-        # 일반 회원 사용자들 생성
-        self.member_user = User.objects.create_user(
+        # 일반 회원 사용자들 생성 (member_user는 트레이너의 담당 회원)
+        self.member_user = Member.objects.create_user(
             email=f'member{self.unique_id}@test.com',
             password='testpass123',
-            user_type='member'
+            user_type='member',
+            assigned_trainer=self.trainer
         )
         
         self.other_member = User.objects.create_user(
@@ -141,6 +173,38 @@ class MemberRecordsViewTestCase(WorkoutViewsTestCase):
         
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
+    def test_member_records_view_cache_invalidated_on_set_logged(self):
+        # 기록 조회 결과는 캐시되고, 세트 기록 시 해당 회원 캐시만 무효화
+        cache.clear()
+        self.client.force_authenticate(user=self.trainer_user)
+        url = reverse('member-records', kwargs={'member_id': self.member_user.id})
+        self.client.get(url)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        # 캐시 테이블만 조회 (운동 기록 테이블 조회 없음)
+        self.assertTrue(all('cache_entry' in query['sql'] for query in queries.captured_queries))
+        self.assertEqual(len(response.data['records']), 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse('workout-set-create', kwargs={'member_id': self.member_user.id}),
+                {
+                    'body_part': '등',
+                    'equipment': '머신',
+                    'exercise_name': '로잉 머신',
+                    'repetitions': 15,
+                    'weight_kg': 12.0,
+                    'duration_sec': 390,
+                    'calories': 120
+                },
+                format='json'
+            )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        response = self.client.get(url)
+        self.assertEqual(len(response.data['records']), 2)
+
 
 class WorkoutSetCreateViewTestCase(WorkoutViewsTestCase):
     # 운동 세트 등록 API 테스트
@@ -256,6 +320,168 @@ class WorkoutSetCreateViewTestCase(WorkoutViewsTestCase):
         self.assertFalse(response.data['success'])
 
 
+class MemberAccessPermissionTestCase(WorkoutViewsTestCase):
+    # 트레이너-회원 권한 검증 테스트
+
+    def setUp(self):
+        super().setUp()
+        self.other_trainer = Trainer.objects.create_user(
+            email=f'trainer2{self.unique_id}@test.com',
+            password='testpass123',
+            user_type='trainer'
+        )
+        self.set_url = reverse('exercise-set', kwargs={
+            'member_id': self.member_user.id,
+            'workout_exercise_id': self.workout_exercise.id,
+            'set_id': self.exercise_set.id
+        })
+
+    def test_unassigned_trainer_forbidden(self):
+        # 담당이 아닌 트레이너는 회원의 세트를 수정할 수 없음
+        self.client.force_authenticate(user=self.other_trainer)
+
+        response = self.client.patch(self.set_url, {'repetitions': 12}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(response.data['success'])
+
+    def test_reassignment_invalidates_cached_access(self):
+        # 담당 트레이너 변경 시 권한 캐시가 즉시 갱신되는지 테스트
+        self.client.force_authenticate(user=self.trainer)
+        self.assertEqual(self.client.get(self.set_url).status_code, status.HTTP_200_OK)
+
+        member = Member.objects.get(id=self.member_user.id)
+        member.assigned_trainer = self.other_trainer
+        member.save()
+
+        self.assertEqual(self.client.get(self.set_url).status_code, status.HTTP_403_FORBIDDEN)
+        self.client.force_authenticate(user=self.other_trainer)
+        self.assertEqual(self.client.get(self.set_url).status_code, status.HTTP_200_OK)
+
+    def test_cached_access_needs_no_query(self):
+        # 캐시된 이후에는 권한 확인에 DB 조회가 없음
+        self.assertTrue(can_access_member(self.trainer, self.member_user.id))
+
+        with self.assertNumQueries(0):
+            self.assertTrue(can_access_member(self.trainer, self.member_user.id))
+            self.assertFalse(can_access_member(self.trainer, self.other_member.id))
+
+
+
+class LiveFeedTestCase(WorkoutViewsTestCase):
+    # 실시간 운동 피드(SSE) 테스트
+
+    def _live_url(self, user, member_id=None):
+        # 구독 티켓을 발급받아 피드 URL 구성
+        member_id = member_id or self.member_user.id
+        self.client.force_authenticate(user=user)
+        response = self.client.post(reverse('member-live-ticket', kwargs={'member_id': member_id}))
+        self.client.force_authenticate(user=None)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['data']['expires_in'], settings.WORKOUT_LIVE_TICKET_TTL)
+        return reverse('member-live-feed', kwargs={'member_id': self.member_user.id}) + f"?ticket={response.data['data']['ticket']}"
+
+    async def test_live_feed_requires_ticket(self):
+        # 티켓 없이 접근하거나 액세스 토큰을 쿼리로 전달하면 401
+        url = reverse('member-live-feed', kwargs={'member_id': self.member_user.id})
+        response = await self.async_client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        token = await sync_to_async(lambda: str(RefreshToken.for_user(self.trainer).access_token))()
+        response = await self.async_client.get(url + f'?token={token}')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        response = await self.async_client.get(url + f'?ticket={token}')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_live_ticket_forbidden_for_other_member(self):
+        # 다른 회원의 피드 티켓 발급 시 403
+        self.client.force_authenticate(user=self.other_member)
+        response = self.client.post(reverse('member-live-ticket', kwargs={'member_id': self.member_user.id}))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    async def test_live_ticket_single_use_and_bound_to_member(self):
+        # 티켓은 한 번만 사용 가능하고 발급받은 회원 피드에만 사용 가능
+        url = await sync_to_async(self._live_url)(self.trainer)
+        response = await self.async_client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        await aiter(response.streaming_content).aclose()
+
+        response = await self.async_client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        other_url = await sync_to_async(self._live_url)(self.other_member, self.other_member.id)
+        response = await self.async_client.get(other_url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_live_feed_requires_asgi(self):
+        # WSGI 요청은 워커 스레드를 계속 점유하므로 503
+        response = self.client.get(self._live_url(self.trainer))
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+
+    def test_in_process_backend_requires_single_process(self):
+        # 프로세스 내부 백엔드를 여러 워커로 실행하면 시스템 체크 오류
+        self.assertEqual(check_live_backend(None), [])
+        with override_settings(WEB_CONCURRENCY=2):
+            self.assertEqual([error.id for error in check_live_backend(None)], ['workouts.E002'])
+        with override_settings(WEB_CONCURRENCY=2, WORKOUT_LIVE_BACKEND='core.missing.Backend'):
+            self.assertEqual([error.id for error in check_live_backend(None)], ['workouts.E001'])
+
+    async def test_live_feed_streams_published_events(self):
+        # 구독 후 발행된 오늘 운동의 세트 이벤트가 전달되는지 테스트
+        url = await sync_to_async(self._live_url)(self.trainer)
+        response = await self.async_client.get(url)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+
+        stream = aiter(response.streaming_content)
+        ready = await anext(stream)
+        self.assertIn(b'event: ready', ready)
+
+        event = serialize_set_event(SET_UPDATED, self.exercise_set)
+        delivered = await asyncio.to_thread(get_live_backend().publish, member_channel(self.member_user.id), event)
+        self.assertEqual(delivered, 1)
+
+        message = await asyncio.wait_for(anext(stream), timeout=5)
+        self.assertIn(b'event: set.updated', message)
+        self.assertIn(f'"set_id": {self.exercise_set.id}'.encode(), message)
+
+        await stream.aclose()
+
+    def test_set_update_publishes_after_commit(self):
+        # 세트 수정 시 커밋 후 회원 채널로 이벤트 발행
+        self.client.force_authenticate(user=self.trainer)
+        url = reverse('exercise-set', kwargs={
+            'member_id': self.member_user.id,
+            'workout_exercise_id': self.workout_exercise.id,
+            'set_id': self.exercise_set.id
+        })
+
+        with patch('workouts.live.get_live_backend') as mock_backend:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.client.patch(url, {'repetitions': 12}, format='json')
+
+        channel, event = mock_backend.return_value.publish.call_args.args
+        self.assertEqual(channel, member_channel(self.member_user.id))
+        self.assertEqual(event['type'], SET_UPDATED)
+        self.assertEqual(event['repetitions'], 12)
+
+    def test_set_writes_recorded_in_outbox(self):
+        # 세트 생성/수정/삭제 이벤트가 쓰기와 같은 트랜잭션에 기록됨
+        new_set = ExerciseSetService.create_set(self.workout_exercise, 10, 50, timedelta(seconds=60), calories=10)
+        new_set_id = new_set.id
+        ExerciseSetService.update_set(new_set, repetitions=8)
+        ExerciseSetService.delete_set(new_set)
+
+        events = list(OutboxEvent.objects.filter(event_type__startswith='workouts.').order_by('id'))
+        self.assertEqual(
+            [event.event_type for event in events],
+            [SetLogged.event_type, SetUpdated.event_type, SetDeleted.event_type]
+        )
+        self.assertEqual(events[0].payload['set_id'], new_set_id)
+        self.assertEqual(events[0].payload['daily_workout_id'], self.workout_exercise.daily_workout_id)
+        self.assertEqual(events[1].payload['repetitions'], 8)
+
+
+
 class ExerciseListViewTestCase(WorkoutViewsTestCase):
     # 운동 목록 조회 API 테스트
     
@@ -291,6 +517,26 @@ class ExerciseListViewTestCase(WorkoutViewsTestCase):
         
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
+    def test_exercise_list_view_cache_invalidated_on_exercise_change(self):
+        # 운동 목록은 캐시되고, 운동 추가/수정 시 무효화
+        cache.clear()
+        self.client.force_authenticate(user=self.trainer_user)
+        url = reverse('exercise-list')
+        self.client.get(url)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(url)
+        self.assertTrue(all('cache_entry' in query['sql'] for query in queries.captured_queries))
+
+        Exercise.objects.create(exercise_name='데드리프트', body_part='등', equipment='바벨', met_value=6.0)
+        response = self.client.get(url)
+        self.assertIn('등', response.data['data'])
+
+        self.exercise.exercise_name = '인클라인 벤치프레스'
+        self.exercise.save()
+        response = self.client.get(url)
+        self.assertEqual(response.data['data']['가슴'][0]['exercise_name'], '인클라인 벤치프레스')
+
 
 class WorkoutExerciseSetsViewTestCase(WorkoutViewsTestCase):
     # 특정 운동의 세트 목록 조회 API 테스트
@@ -328,6 +574,220 @@ class WorkoutExerciseSetsViewTestCase(WorkoutViewsTestCase):
             self.assertFalse(response.data['success'])
 
 
+class ExerciseSetBulkDeleteTestCase(WorkoutViewsTestCase):
+    # 세트 번호 일괄 재정렬 및 여러 세트 삭제 API 테스트
+
+    def setUp(self):
+        super().setUp()
+        # 세트 1(setUp에서 생성) + 세트 2~5
+        self.sets = [self.exercise_set] + [
+            ExerciseSet.objects.create(
+                workout_exercise=self.workout_exercise,
+                set_number=number,
+                repetitions=10,
+                weight_kg=80.0,
+                duration=timedelta(minutes=1),
+                calories=10
+            )
+            for number in range(2, 6)
+        ]
+        self.client.force_authenticate(user=self.trainer_user)
+        self.url = reverse('workout-exercise-sets', kwargs={
+            'member_id': self.member_user.id,
+            'workout_exercise_id': self.workout_exercise.id
+        })
+
+    def set_numbers(self):
+        return list(
+            ExerciseSet.objects.filter(workout_exercise=self.workout_exercise)
+            .order_by('set_number').values_list('id', 'set_number')
+        )
+
+    def test_renumber_uses_constant_queries(self):
+        for number in range(6, 21):
+            ExerciseSet.objects.create(
+                workout_exercise=self.workout_exercise, set_number=number, repetitions=10,
+                weight_kg=80.0, duration=timedelta(minutes=1), calories=10
+            )
+        self.exercise_set.delete()
+
+        # 조회 2번(보관된 세트 마지막 번호, 현재 세트) + UPDATE 2번 (세트 수와 무관)
+        with self.assertNumQueries(4):
+            changed = ExerciseSetService.renumber_sets(self.workout_exercise)
+
+        self.assertEqual(changed, 19)
+        self.assertEqual([number for _, number in self.set_numbers()], list(range(1, 20)))
+
+    def test_renumber_without_gaps_skips_updates(self):
+        with self.assertNumQueries(2):
+            self.assertEqual(ExerciseSetService.renumber_sets(self.workout_exercise), 0)
+
+    def test_bulk_delete_sets(self):
+        response = self.client.delete(self.url, {'set_ids': [self.sets[1].id, self.sets[3].id]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data['success'])
+        self.assertEqual(response.data['data']['deleted_set_ids'], [self.sets[1].id, self.sets[3].id])
+        self.assertEqual(
+            self.set_numbers(),
+            [(self.sets[0].id, 1), (self.sets[2].id, 2), (self.sets[4].id, 3)]
+        )
+
+        self.workout_exercise.refresh_from_db()
+        self.assertEqual(self.workout_exercise.total_sets, 3)
+        self.assertEqual(self.workout_exercise.total_calories, 170)
+        self.assertEqual(response.data['data']['total_calories'], 170)
+        self.assertEqual(
+            SyncTombstone.objects.filter(object_type='exercise_set').count(), 2
+        )
+        self.assertEqual(OutboxEvent.objects.filter(event_type=SetDeleted.event_type).count(), 2)
+
+    def test_bulk_delete_all_sets_forbidden(self):
+        response = self.client.delete(self.url, {'set_ids': [es.id for es in self.sets]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('마지막 세트', response.data['message'])
+        self.assertEqual(len(self.set_numbers()), 5)
+
+    def test_bulk_delete_unknown_set(self):
+        response = self.client.delete(self.url, {'set_ids': [self.sets[1].id, 99999]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.data['errors']['set_ids'], [99999])
+        self.assertEqual(len(self.set_numbers()), 5)
+
+    def test_bulk_delete_invalid_payload(self):
+        for data in [{}, {'set_ids': []}, {'set_ids': ['1']}, {'set_ids': self.sets[1].id}]:
+            with self.subTest(data=data):
+                response = self.client.delete(self.url, data, format='json')
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bulk_delete_other_member_forbidden(self):
+        self.client.force_authenticate(user=self.other_member)
+
+        response = self.client.delete(self.url, {'set_ids': [self.sets[1].id]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(len(self.set_numbers()), 5)
+
+
+class ExerciseSetBatchUpdateTestCase(WorkoutViewsTestCase):
+    # 여러 세트 수정 API 테스트
+
+    def setUp(self):
+        super().setUp()
+        self.sets = [self.exercise_set] + [
+            ExerciseSet.objects.create(
+                workout_exercise=self.workout_exercise,
+                set_number=number,
+                repetitions=10,
+                weight_kg=80.0,
+                duration=timedelta(minutes=1),
+                calories=10,
+                calories_manual=True
+            )
+            for number in range(2, 6)
+        ]
+        self.client.force_authenticate(user=self.trainer_user)
+        self.url = reverse('workout-exercise-sets', kwargs={
+            'member_id': self.member_user.id,
+            'workout_exercise_id': self.workout_exercise.id
+        })
+
+    def test_batch_update_rejects_invalid_weights(self):
+        # 범위를 벗어나거나 숫자가 아닌 중량은 500이 아닌 400 (아무 세트도 수정하지 않음)
+        for weight_kg in (5000, 'nan', 'Infinity', 999.999, '1e30', True):
+            data = {'sets': [{'set_id': self.sets[0].id, 'weight_kg': 60}, {'set_id': self.sets[1].id, 'weight_kg': weight_kg}]}
+            response = self.client.patch(self.url, data, format='json')
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, weight_kg)
+            self.assertIn(str(self.sets[1].id), response.data['errors'])
+            self.assertNotIn('error', response.data)
+        self.assertEqual(ExerciseSet.objects.get(id=self.sets[0].id).weight_kg, Decimal('80.00'))
+
+    def test_batch_update_rounds_weight_as_stored(self):
+        # 응답의 중량은 저장된 값(소수 둘째 자리)과 같음
+        data = {'sets': [{'set_id': self.sets[0].id, 'weight_kg': 12.345}]}
+
+        response = self.client.patch(self.url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data']['sets'][0]['weight_kg'], 12.35)
+        self.assertEqual(ExerciseSet.objects.get(id=self.sets[0].id).weight_kg, Decimal('12.35'))
+
+    def test_batch_update_weights(self):
+        data = {'sets': [{'set_id': es.id, 'weight_kg': 82.5} for es in self.sets]}
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.patch(self.url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data['success'])
+        self.assertEqual([s['weight_kg'] for s in response.data['data']['sets']], [82.5] * 5)
+        self.assertEqual([s['set_number'] for s in response.data['data']['sets']], [1, 2, 3, 4, 5])
+        self.assertEqual(ExerciseSet.objects.filter(weight_kg=Decimal('82.50')).count(), 5)
+
+        # 세트 UPDATE는 bulk_update 한 번
+        set_updates = [
+            query for query in queries.captured_queries
+            if query['sql'].startswith(f'UPDATE "{ExerciseSet._meta.db_table}"')
+        ]
+        self.assertEqual(len(set_updates), 1)
+        self.assertEqual(OutboxEvent.objects.filter(event_type=SetUpdated.event_type).count(), 5)
+
+    def test_batch_update_recomputes_totals_once(self):
+        data = {'sets': [
+            {'set_id': self.sets[1].id, 'calories': 30},
+            {'set_id': self.sets[2].id, 'duration_sec': 120, 'repetitions': 12},
+        ]}
+
+        with patch.object(ExerciseSetService, 'refresh_totals', wraps=ExerciseSetService.refresh_totals) as refresh:
+            response = self.client.patch(self.url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        refresh.assert_called_once()
+        self.sets[2].refresh_from_db()
+        self.assertEqual((self.sets[2].repetitions, self.sets[2].duration), (12, timedelta(minutes=2)))
+        self.workout_exercise.refresh_from_db()
+        self.assertEqual(self.workout_exercise.total_calories, 150 + 30 + 10 * 3)
+        self.assertEqual(response.data['data']['total_calories'], 210)
+
+    def test_batch_update_validates_all_changes_first(self):
+        data = {'sets': [
+            {'set_id': self.sets[0].id, 'weight_kg': 90.0},
+            {'set_id': self.sets[1].id, 'repetitions': -1},
+            {'set_id': self.sets[2].id},
+        ]}
+
+        response = self.client.patch(self.url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(set(response.data['errors']), {str(self.sets[1].id), str(self.sets[2].id)})
+        self.sets[0].refresh_from_db()
+        self.assertEqual(self.sets[0].weight_kg, Decimal('80.00'))
+
+    def test_batch_update_duplicate_set(self):
+        data = {'sets': [{'set_id': self.sets[0].id, 'repetitions': 5}, {'set_id': self.sets[0].id, 'repetitions': 6}]}
+
+        response = self.client.patch(self.url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_batch_update_unknown_set(self):
+        data = {'sets': [{'set_id': self.sets[0].id, 'repetitions': 5}, {'set_id': 99999, 'repetitions': 6}]}
+
+        response = self.client.patch(self.url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.data['errors']['set_ids'], [99999])
+
+    def test_batch_update_invalid_payload(self):
+        for data in [{}, {'sets': []}, {'sets': [1, 2]}]:
+            with self.subTest(data=data):
+                response = self.client.patch(self.url, data, format='json')
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
 class ExerciseSetViewTestCase(WorkoutViewsTestCase):
     # 개별 세트 조회/수정/삭제 API 테스트
     
@@ -375,6 +835,28 @@ class ExerciseSetViewTestCase(WorkoutViewsTestCase):
         self.assertEqual(updated_set.repetitions, 12)
         self.assertEqual(float(updated_set.weight_kg), 85.0)
     
+    def test_exercise_set_update_validates_values(self):
+        # 개별 세트 수정도 일괄 수정/동기화와 같은 값 검증을 거친다
+        self.client.force_authenticate(user=self.trainer_user)
+        url = reverse('exercise-set', kwargs={
+            'member_id': self.member_user.id,
+            'workout_exercise_id': self.workout_exercise.id,
+            'set_id': self.exercise_set.id
+        })
+        original_weight = ExerciseSet.objects.get(id=self.exercise_set.id).weight_kg
+
+        for weight in (5000, 'nan', -1):
+            response = self.client.patch(url, {'weight_kg': weight}, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertFalse(response.data['success'])
+        self.assertEqual(ExerciseSet.objects.get(id=self.exercise_set.id).weight_kg, original_weight)
+
+        response = self.client.patch(url, {'weight_kg': '12.345'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data']['weight_kg'], 12.35)
+        self.assertEqual(response.data['data']['updated_fields'], ['weight_kg'])
+        self.assertEqual(ExerciseSet.objects.get(id=self.exercise_set.id).weight_kg, Decimal('12.35'))
+
     def test_exercise_set_update_member_forbidden(self):
         # 회원이 다른 회원의 세트 수정 시도 시 금지 테스트
         self.client.force_authenticate(user=self.other_member)
@@ -700,4 +1182,906 @@ class WorkoutTotalsCalculationTestCase(WorkoutViewsTestCase):
         # DailyWorkout 총합 업데이트 확인
         self.daily_workout.refresh_from_db()
         # 실제 총합이 정확히 계산되는지는 구현에 따라 다를 수 있음
-        self.assertIsNotNone(self.daily_workout.total_calories)
\ No newline at end of file
+        self.assertIsNotNone(self.daily_workout.total_calories)
+
+
+class ExerciseSetArchiveTestCase(WorkoutViewsTestCase):
+    # 오래된 세트 보관(아카이브) 테스트
+
+    def setUp(self):
+        super().setUp()
+        # 보관 기준일보다 오래된 운동 기록 생성
+        self.old_workout = DailyWorkout.objects.create(
+            member=self.member_user,
+            trainer=self.trainer,
+            workout_date=timezone.now().date() - timedelta(days=200),
+            total_duration=timedelta(minutes=20),
+            total_calories=100,
+        )
+        self.old_workout_exercise = WorkoutExercise.objects.create(
+            daily_workout=self.old_workout,
+            exercise=self.exercise,
+            order_number=1,
+            total_sets=2,
+            total_duration=timedelta(minutes=20),
+            total_calories=100
+        )
+        for set_number in (1, 2):
+            ExerciseSet.objects.create(
+                workout_exercise=self.old_workout_exercise,
+                set_number=set_number,
+                repetitions=10,
+                weight_kg=60.0,
+                duration=timedelta(minutes=10),
+                calories=50
+            )
+
+    def test_archive_moves_only_old_sets(self):
+        # 기준일 이전 세트만 보관 테이블로 이동하는지 테스트
+        archived_count = ExerciseSetArchiveService.archive_sets(batch_size=1)
+
+        self.assertEqual(archived_count, 2)
+        self.assertFalse(ExerciseSet.objects.filter(workout_exercise=self.old_workout_exercise).exists())
+        self.assertEqual(ArchivedExerciseSet.objects.filter(workout_exercise=self.old_workout_exercise).count(), 2)
+        # 최근 세트는 그대로 유지
+        self.assertTrue(ExerciseSet.objects.filter(id=self.exercise_set.id).exists())
+
+    def test_records_read_across_archive(self):
+        # 보관 후에도 운동 기록 조회 결과가 동일한지 테스트
+        ExerciseSetArchiveService.archive_sets()
+
+        records = WorkoutRecordService.get_member_workout_records(self.member_user.id)
+        old_record = next(r for r in records['workout_records'] if r['id'] == self.old_workout.id)
+        self.assertEqual(len(old_record['workout_exercises'][0]['exercise_sets']), 2)
+
+        self.client.force_authenticate(user=self.trainer_user)
+        url = reverse('member-records', kwargs={'member_id': self.member_user.id})
+        response = self.client.get(url, {'date': self.old_workout.workout_date.strftime('%Y-%m-%d')})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['records']), 1)
+
+        url = reverse('workout-exercise-sets', kwargs={
+            'member_id': self.member_user.id,
+            'workout_exercise_id': self.old_workout_exercise.id
+        })
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([s['set_number'] for s in response.data['data']['sets']], [1, 2])
+        self.assertTrue(all(s['is_archived'] for s in response.data['data']['sets']))
+
+    def test_add_set_after_archive_keeps_totals_and_numbering(self):
+        # 보관 후 세트를 추가해도 합계와 세트 번호가 보관된 세트를 포함해 유지되는지 테스트
+        ExerciseSetArchiveService.archive_sets()
+        self.client.force_authenticate(user=self.trainer_user)
+        url = reverse('exercise-set-create', kwargs={
+            'member_id': self.member_user.id,
+            'workout_exercise_id': self.old_workout_exercise.id
+        })
+
+        response = self.client.post(url, {
+            'repetitions': 8, 'weight_kg': 70.0, 'duration_sec': 300, 'calories': 30
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['data']['set_number'], 3)
+        self.old_workout_exercise.refresh_from_db()
+        self.assertEqual(self.old_workout_exercise.total_sets, 3)
+        self.assertEqual(self.old_workout_exercise.total_calories, 130)
+        self.assertEqual(self.old_workout_exercise.total_duration, timedelta(minutes=25))
+        self.old_workout.refresh_from_db()
+        self.assertEqual(self.old_workout.total_calories, 130)
+
+        # 새 세트 삭제 후 번호를 다시 매겨도 보관된 세트 번호와 겹치지 않음
+        new_set = ExerciseSet.objects.get(workout_exercise=self.old_workout_exercise)
+        ExerciseSetService.delete_sets(self.old_workout_exercise, [new_set])
+        self.old_workout_exercise.refresh_from_db()
+        self.assertEqual(self.old_workout_exercise.total_sets, 2)
+        self.assertEqual(self.old_workout_exercise.total_calories, 100)
+
+    def test_archived_set_is_read_only(self):
+        # 보관된 세트는 조회만 가능하고 수정/삭제 요청은 400
+        ExerciseSetArchiveService.archive_sets()
+        archived_set = ArchivedExerciseSet.objects.filter(workout_exercise=self.old_workout_exercise).first()
+        self.client.force_authenticate(user=self.trainer_user)
+        url = reverse('exercise-set', kwargs={
+            'member_id': self.member_user.id,
+            'workout_exercise_id': self.old_workout_exercise.id,
+            'set_id': archived_set.id
+        })
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data['data']['is_archived'])
+
+        response = self.client.patch(url, {'repetitions': 12}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.delete(url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertTrue(ArchivedExerciseSet.objects.filter(id=archived_set.id).exists())
+
+        sets_url = reverse('workout-exercise-sets', kwargs={
+            'member_id': self.member_user.id,
+            'workout_exercise_id': self.old_workout_exercise.id
+        })
+        response = self.client.patch(sets_url, {'sets': [{'set_id': archived_set.id, 'repetitions': 12}]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['errors']['set_ids'], [archived_set.id])
+
+
+class DenormalizedColumnsTestCase(WorkoutViewsTestCase):
+    # member/workout_date 비정규화 컬럼 동기화 테스트
+
+    def test_columns_copied_on_create(self):
+        # 생성 시 상위 DailyWorkout 값이 복사되는지 테스트
+        self.assertEqual(self.workout_exercise.member_id, self.member_user.id)
+        self.assertEqual(self.workout_exercise.workout_date, self.daily_workout.workout_date)
+        self.assertEqual(self.exercise_set.member_id, self.member_user.id)
+        self.assertEqual(self.exercise_set.workout_date, self.daily_workout.workout_date)
+
+    def test_columns_follow_daily_workout_date_change(self):
+        # DailyWorkout 날짜 변경 시 하위 행도 함께 갱신되는지 테스트
+        daily_workout = DailyWorkout.objects.get(id=self.daily_workout.id)
+        new_date = daily_workout.workout_date - timedelta(days=1)
+        daily_workout.workout_date = new_date
+        daily_workout.save()
+
+        self.assertEqual(WorkoutExercise.objects.get(id=self.workout_exercise.id).workout_date, new_date)
+        self.assertEqual(ExerciseSet.objects.get(id=self.exercise_set.id).workout_date, new_date)
+
+    def test_set_lookup_scoped_by_member(self):
+        # 다른 회원 ID로 세트 조회 시 찾을 수 없는지 테스트
+        self.client.force_authenticate(user=self.trainer_user)
+        url = reverse('exercise-set', kwargs={
+            'member_id': self.other_member.id,
+            'workout_exercise_id': self.workout_exercise.id,
+            'set_id': self.exercise_set.id
+        })
+
+        response = self.client.get(url)
+
+        self.assertGreaterEqual(response.status_code, 400)
+
+
+@override_settings(SYNC_SETTLE_SECONDS=0)
+class MemberSyncTestCase(WorkoutViewsTestCase):
+    # 오프라인 동기화 테스트
+
+    def setUp(self):
+        super().setUp()
+        self.sync_url = reverse('member-sync', kwargs={'member_id': self.member_user.id})
+        self.client.force_authenticate(user=self.member_user)
+
+    def test_cursor_returns_only_changes_since_last_sync(self):
+        # 전체 동기화 후 커서로 요청하면 이후 변경된 세트만 반환
+        response = self.client.get(self.sync_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.data['data']
+        self.assertEqual([row['id'] for row in data['changes']['exercise_sets']], [self.exercise_set.id])
+        self.assertEqual(len(data['changes']['daily_workouts']), 1)
+
+        response = self.client.get(self.sync_url, {'cursor': data['cursor']})
+        self.assertEqual(response.data['data']['changes']['exercise_sets'], [])
+
+        ExerciseSetService.update_set(self.exercise_set, repetitions=12)
+        response = self.client.get(self.sync_url, {'cursor': data['cursor']})
+        changed_sets = response.data['data']['changes']['exercise_sets']
+        self.assertEqual(len(changed_sets), 1)
+        self.assertEqual(changed_sets[0]['repetitions'], 12)
+
+    def test_invalid_cursor_rejected(self):
+        response = self.client.get(self.sync_url, {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(response.data['success'])
+
+    def test_batch_offline_writes(self):
+        # 오프라인 생성/수정/삭제 일괄 반영 및 변경별 결과 반환
+        second_set = ExerciseSetService.create_set(
+            self.workout_exercise, repetitions=8, weight_kg=70, duration=timedelta(minutes=5), calories=50
+        )
+        changes = [
+            {'op': 'create', 'client_id': 'a1', 'exercise_name': '벤치프레스', 'body_part': '가슴',
+             'equipment': '바벨', 'workout_date': '2026-01-05',
+             'repetitions': 5, 'weight_kg': 100, 'duration_sec': 120, 'calories': 30},
+            {'op': 'update', 'client_id': 'a2', 'set_id': self.exercise_set.id, 'repetitions': 15},
+            {'op': 'delete', 'client_id': 'a3', 'set_id': second_set.id},
+            {'op': 'update', 'client_id': 'a4', 'set_id': self.exercise_set.id, 'repetitions': -1},
+        ]
+
+        response = self.client.post(self.sync_url, {'changes': changes}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data['data']['results']
+        self.assertEqual([result['success'] for result in results], [True, True, True, False])
+
+        created = ExerciseSet.objects.get(id=results[0]['set_id'])
+        self.assertEqual(created.workout_date.isoformat(), '2026-01-05')
+        self.assertEqual(created.workout_exercise.daily_workout.trainer_id, self.trainer.id)
+        self.assertEqual(ExerciseSet.objects.get(id=self.exercise_set.id).repetitions, 15)
+        self.assertEqual(
+            response.data['data']['changes']['deleted'],
+            [{'type': 'exercise_set', 'id': second_set.id, 'deleted_at': ANY}]
+        )
+
+    def test_member_cannot_add_exercise_to_catalogue(self):
+        # 운동 목록에 없는 운동은 회원 동기화로 등록할 수 없고, 트레이너는 등록 가능
+        change = {'op': 'create', 'client_id': 'n1', 'exercise_name': '새운동', 'body_part': '가슴',
+                  'equipment': '바벨', 'repetitions': 5, 'weight_kg': 50, 'duration_sec': 60}
+
+        response = self.client.post(self.sync_url, {'changes': [change]}, format='json')
+
+        result = response.data['data']['results'][0]
+        self.assertFalse(result['success'])
+        self.assertEqual(result['message'], '운동 목록에 없는 운동입니다.')
+        self.assertFalse(Exercise.objects.filter(exercise_name='새운동').exists())
+
+        self.client.force_authenticate(user=self.trainer_user)
+        response = self.client.post(self.sync_url, {'changes': [change]}, format='json')
+        self.assertTrue(response.data['data']['results'][0]['success'])
+        self.assertTrue(Exercise.objects.filter(exercise_name='새운동').exists())
+
+    def test_archived_set_changes_rejected(self):
+        # 보관된 세트의 수정/삭제는 성공으로 처리하지 않고 변경별 오류 반환
+        ExerciseSetArchiveService.archive_sets(cutoff_date=timezone.now().date() + timedelta(days=1))
+        changes = [
+            {'op': 'update', 'client_id': 'u1', 'set_id': self.exercise_set.id, 'repetitions': 12},
+            {'op': 'delete', 'client_id': 'd1', 'set_id': self.exercise_set.id},
+        ]
+
+        response = self.client.post(self.sync_url, {'changes': changes}, format='json')
+
+        results = response.data['data']['results']
+        self.assertEqual([result['success'] for result in results], [False, False])
+        self.assertTrue(ArchivedExerciseSet.objects.filter(id=self.exercise_set.id, repetitions=10).exists())
+
+    def test_archive_does_not_create_tombstones(self):
+        # 보관(아카이브) 이동은 삭제로 기록하지 않음
+        ExerciseSetArchiveService.archive_sets(cutoff_date=timezone.now().date() + timedelta(days=1))
+
+        self.assertFalse(ExerciseSet.objects.filter(id=self.exercise_set.id).exists())
+        self.assertFalse(SyncTombstone.objects.exists())
+
+    def test_initial_sync_includes_archived_sets(self):
+        # 처음 동기화할 때 보관된 세트도 exercise_sets에 포함
+        ExerciseSetArchiveService.archive_sets(cutoff_date=timezone.now().date() + timedelta(days=1))
+
+        response = self.client.get(self.sync_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        exercise_sets = response.data['data']['changes']['exercise_sets']
+        self.assertEqual([row['id'] for row in exercise_sets], [self.exercise_set.id])
+        self.assertTrue(exercise_sets[0]['is_archived'])
+
+        response = self.client.get(self.sync_url, {'cursor': response.data['data']['cursor']})
+        self.assertEqual(response.data['data']['changes']['exercise_sets'], [])
+
+
+class IdempotencyKeyTestCase(WorkoutViewsTestCase):
+    # Idempotency-Key 중복 요청 처리 테스트
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_authenticate(user=self.trainer_user)
+        self.url = reverse('exercise-set-create', kwargs={
+            'member_id': self.member_user.id,
+            'workout_exercise_id': self.workout_exercise.id
+        })
+        self.data = {'repetitions': 8, 'weight_kg': 85.0, 'duration_sec': 600, 'calories': 90}
+
+    def test_retry_replays_original_response(self):
+        # 같은 키로 재전송하면 세트를 다시 만들지 않고 처음 응답을 그대로 반환
+        first = self.client.post(self.url, self.data, format='json', HTTP_IDEMPOTENCY_KEY='retry-1')
+        second = self.client.post(self.url, self.data, format='json', HTTP_IDEMPOTENCY_KEY='retry-1')
+
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(second.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(second['Idempotent-Replayed'], 'true')
+        self.assertEqual(second.json()['data']['set_id'], first.data['data']['set_id'])
+        self.assertEqual(ExerciseSet.objects.filter(workout_exercise=self.workout_exercise).count(), 2)
+
+    def test_same_key_with_different_body_rejected(self):
+        self.client.post(self.url, self.data, format='json', HTTP_IDEMPOTENCY_KEY='retry-2')
+        response = self.client.post(
+            self.url, {**self.data, 'repetitions': 9}, format='json', HTTP_IDEMPOTENCY_KEY='retry-2'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+        self.assertFalse(response.data['success'])
+        self.assertEqual(ExerciseSet.objects.filter(workout_exercise=self.workout_exercise).count(), 2)
+
+    def test_expired_keys_purged_and_reusable(self):
+        self.client.post(self.url, self.data, format='json', HTTP_IDEMPOTENCY_KEY='retry-3')
+        IdempotencyKey.objects.update(created_at=timezone.now() - timedelta(days=2))
+
+        self.assertEqual(purge_expired_keys(), 1)
+        response = self.client.post(self.url, self.data, format='json', HTTP_IDEMPOTENCY_KEY='retry-3')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(ExerciseSet.objects.filter(workout_exercise=self.workout_exercise).count(), 3)
+
+
+class MemberExportTestCase(WorkoutViewsTestCase):
+    # 운동 기록 스트리밍 내보내기 테스트
+
+    def setUp(self):
+        super().setUp()
+        # 기존 세트는 보관 테이블로 옮기고 새 세트를 추가 (두 테이블 모두 내보내기 대상)
+        ExerciseSetArchiveService.archive_sets(cutoff_date=timezone.now().date() + timedelta(days=1))
+        self.new_set = ExerciseSet.objects.create(
+            workout_exercise=self.workout_exercise,
+            set_number=2,
+            repetitions=8,
+            weight_kg=85.5,
+            duration=timedelta(minutes=5),
+            calories=60
+        )
+        self.url = reverse('member-export', kwargs={'member_id': self.member_user.id})
+        self.client.force_authenticate(user=self.trainer_user)
+
+    def test_csv_export_includes_archived_sets(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertIn('attachment', response['Content-Disposition'])
+        rows = list(csv.DictReader(io.StringIO(b''.join(response.streaming_content).decode())))
+        self.assertEqual([int(row['set_id']) for row in rows], [self.exercise_set.id, self.new_set.id])
+        self.assertEqual([row['archived'] for row in rows], ['True', 'False'])
+        self.assertEqual(rows[1]['exercise_name'], '벤치프레스')
+        self.assertEqual(rows[1]['weight_kg'], '85.5')
+        self.assertEqual(rows[1]['duration_sec'], '300')
+
+    def test_gzip_ndjson_export(self):
+        response = self.client.get(self.url, {'file_format': 'ndjson', 'gzip': 'true'})
+
+        self.assertEqual(response['Content-Type'], 'application/gzip')
+        lines = gzip.decompress(b''.join(response.streaming_content)).decode().splitlines()
+        self.assertEqual([json.loads(line)['set_number'] for line in lines], [1, 2])
+
+    def test_unsupported_format_rejected(self):
+        response = self.client.get(self.url, {'file_format': 'xml'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(response.data['success'])
+
+    def test_other_member_cannot_export(self):
+        self.client.force_authenticate(user=self.other_member)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_command_exports_all_members_of_trainer(self):
+        with tempfile.TemporaryDirectory() as output:
+            call_command('export_workouts', trainer=self.trainer.id, output=output, stdout=io.StringIO())
+
+            self.assertEqual(os.listdir(output), [f'member_{self.member_user.id}_workouts.csv'])
+            with open(os.path.join(output, os.listdir(output)[0]), encoding='utf-8') as f:
+                self.assertEqual(len(list(csv.DictReader(f))), 2)
+
+
+class WorkoutImportTestCase(WorkoutViewsTestCase):
+    # CSV 운동 기록 가져오기 테스트
+
+    def setUp(self):
+        super().setUp()
+        self.today = timezone.now().date().isoformat()
+        self.url = reverse('member-import', kwargs={'member_id': self.member_user.id})
+        self.client.force_authenticate(user=self.trainer_user)
+
+    def _upload(self, content, **extra):
+        return self.client.post(
+            self.url, {'file': SimpleUploadedFile('history.csv', content.encode('utf-8'), content_type='text/csv'), **extra},
+            format='multipart'
+        )
+
+    def test_import_groups_rows_into_days_and_rollups(self):
+        content = (
+            'workout_date,exercise_name,body_part,equipment,set_number,repetitions,weight_kg,duration_sec,calories\n'
+            '2025-03-01,스쿼트,대퇴사두,바벨,2,5,100,120,30\n'
+            '2025-03-01,스쿼트,대퇴사두,바벨,1,5,90,60,20\n'
+            f'{self.today},벤치프레스,가슴,바벨,,8,70,300,40\n'
+            '2025-03-01,스쿼트,대퇴사두,바벨,,-1,90,60,20\n'
+        )
+        response = self._upload(content, create_exercises='true')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.data['data']
+        self.assertEqual(data['total_rows'], 4)
+        self.assertEqual(data['imported_sets'], 3)
+        self.assertEqual(data['errors'], [{'line': 5, 'message': ANY}])
+        self.assertIn('rows_per_second', data)
+
+        # 새 날짜는 일일 운동/운동 항목을 만들고, CSV의 set_number 순서대로 번호 부여
+        workout = DailyWorkout.objects.get(member=self.member_user, workout_date='2025-03-01')
+        self.assertEqual(workout.trainer_id, self.trainer.id)
+        self.assertEqual(workout.total_calories, 50)
+        self.assertEqual(workout.total_duration, timedelta(seconds=180))
+        squat_sets = ExerciseSet.objects.filter(workout_exercise__daily_workout=workout).order_by('set_number')
+        self.assertEqual([(s.set_number, float(s.weight_kg)) for s in squat_sets], [(1, 90.0), (2, 100.0)])
+        self.assertEqual(squat_sets[0].member_id, self.member_user.id)
+        self.assertEqual(squat_sets[0].workout_date.isoformat(), '2025-03-01')
+
+        # 기존 운동 항목에는 마지막 세트 뒤에 추가하고 총합에 더함
+        self.workout_exercise.refresh_from_db()
+        self.daily_workout.refresh_from_db()
+        self.assertEqual(self.workout_exercise.total_sets, 2)
+        self.assertEqual(self.workout_exercise.total_calories, 190)
+        self.assertEqual(self.daily_workout.total_calories, 190)
+        self.assertEqual(
+            list(self.workout_exercise.exercise_sets.values_list('set_number', flat=True)), [1, 2]
+        )
+
+    def test_import_numbers_after_archived_sets(self):
+        # 보관된 세트가 있는 운동 항목에는 보관된 세트 번호 뒤에 이어서 번호 부여
+        ExerciseSetArchiveService.archive_sets(cutoff_date=timezone.now().date() + timedelta(days=1))
+
+        response = self._upload(
+            'workout_date,exercise_name,body_part,equipment,repetitions,weight_kg,duration_sec,calories\n'
+            f'{self.today},벤치프레스,가슴,바벨,8,70,300,40\n'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data']['imported_sets'], 1)
+        self.assertEqual(
+            list(self.workout_exercise.exercise_sets.values_list('set_number', flat=True)), [2]
+        )
+
+    def test_unknown_exercise_reported_as_row_error(self):
+        # 운동 목록에 없는 운동은 새로 만들지 않고 오류 행으로 처리
+        self.client.force_authenticate(user=self.member_user)
+        content = (
+            'workout_date,exercise_name,body_part,equipment,repetitions,weight_kg,duration_sec,calories\n'
+            f'{self.today},없는운동,가슴,바벨,8,70,300,40\n'
+            f'{self.today},벤치프레스,가슴,바벨,8,70,300,40\n'
+        )
+        response = self._upload(content)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data']['imported_sets'], 1)
+        self.assertEqual(response.data['data']['errors'], [{'line': 2, 'message': '운동 목록에 없는 운동입니다.'}])
+        self.assertFalse(Exercise.objects.filter(exercise_name='없는운동').exists())
+
+        # 회원은 새 운동 등록을 요청할 수 없음
+        response = self._upload(content, create_exercises='true')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(Exercise.objects.filter(exercise_name='없는운동').exists())
+
+    def test_missing_columns_rejected(self):
+        response = self._upload('workout_date,exercise_name\n2025-03-01,스쿼트\n')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(response.data['success'])
+
+    def test_other_member_cannot_import(self):
+        self.client.force_authenticate(user=self.other_member)
+        response = self._upload('workout_date\n')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_command_imports_member_column(self):
+        content = (
+            'member_id,workout_date,exercise_name,body_part,equipment,repetitions,weight_kg,duration_sec,calories\n'
+            f'{self.member_user.id},2025-04-01,벤치프레스,가슴,바벨,10,60,90,15\n'
+            f'{self.other_member.id},2025-04-01,벤치프레스,가슴,바벨,10,60,90,15\n'
+        )
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', encoding='utf-8', delete=False) as f:
+            f.write(content)
+        self.addCleanup(os.remove, f.name)
+
+        out = io.StringIO()
+        call_command('import_workouts', file=f.name, batch_size=1, stdout=out)
+
+        self.assertIn('세트 1개', out.getvalue())
+        self.assertEqual(ExerciseSet.objects.filter(workout_date='2025-04-01').count(), 1)
+        self.assertEqual(Exercise.objects.filter(exercise_name='벤치프레스').count(), 1)
+
+
+class CalorieEngineTestCase(WorkoutViewsTestCase):
+    # 서버 칼로리 계산 및 일괄 재계산 테스트
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_authenticate(user=self.trainer_user)
+        self.url = reverse('exercise-set-create', kwargs={
+            'member_id': self.member_user.id,
+            'workout_exercise_id': self.workout_exercise.id
+        })
+        # 기존 세트는 직접 입력한 칼로리로 취급
+        ExerciseSet.objects.filter(id=self.exercise_set.id).update(calories_manual=True)
+
+    def _create_set(self, **data):
+        response = self.client.post(self.url, {'repetitions': 8, 'weight_kg': 60, 'duration_sec': 600, **data}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return ExerciseSet.objects.get(id=response.data['data']['set_id'])
+
+    def test_calories_computed_from_member_weight_when_omitted(self):
+        # MET 6.0 × 기본 몸무게 70kg × 10분
+        self.assertEqual(self._create_set().calories, 70)
+
+        self.member_user.refresh_from_db()
+        self.member_user.weight_kg = '90.00'
+        self.member_user.save()
+        computed = self._create_set()
+        self.assertEqual(computed.calories, 90)
+        self.assertFalse(computed.calories_manual)
+
+        manual = self._create_set(calories=33)
+        self.assertEqual(manual.calories, 33)
+        self.assertTrue(manual.calories_manual)
+
+    def test_met_change_recomputes_only_computed_sets(self):
+        computed = self._create_set()
+        manual = self._create_set(calories=33)
+        self.workout_exercise.refresh_from_db()
+        self.assertEqual(self.workout_exercise.total_calories, 150 + 70 + 33)
+
+        exercise = Exercise.objects.get(id=self.exercise.id)
+        exercise.met_value = '9.0'
+        exercise.save()
+        # 칼로리 재계산 + 리더보드 갱신
+        self.assertEqual(run_pending_jobs(), 2)
+
+        self.assertEqual(get_met_value(self.exercise.id), 9.0)
+        computed.refresh_from_db()
+        manual.refresh_from_db()
+        self.assertEqual(computed.calories, 105)
+        self.assertEqual(manual.calories, 33)
+
+        # 총합에는 차이(+35)만 반영
+        self.workout_exercise.refresh_from_db()
+        self.daily_workout.refresh_from_db()
+        self.assertEqual(self.workout_exercise.total_calories, 150 + 105 + 33)
+        self.assertEqual(self.daily_workout.total_calories, 150 + 105 + 33)
+
+    def test_weight_change_recomputes_member_sets(self):
+        computed = self._create_set()
+
+        member = Member.objects.get(id=self.member_user.id)
+        member.weight_kg = '35.00'
+        member.save()
+        # 칼로리 재계산 + 리더보드 갱신
+        self.assertEqual(run_pending_jobs(), 2)
+
+        computed.refresh_from_db()
+        self.assertEqual(computed.calories, 35)
+        # 몸무게가 같으면 다시 계산할 세트 없음
+        self.assertEqual(recompute_calories(member_id=self.member_user.id, weight_kg=35), 0)
+
+    @override_settings(SYNC_SETTLE_SECONDS=0)
+    def test_met_change_recomputes_archived_sets(self):
+        # 보관된 세트도 다시 계산하고 총합에 차이만 반영 (직접 입력 칼로리는 보관 후에도 유지)
+        computed = self._create_set()
+        ExerciseSetArchiveService.archive_sets(cutoff_date=timezone.now().date() + timedelta(days=1))
+        self.assertTrue(ArchivedExerciseSet.objects.get(id=self.exercise_set.id).calories_manual)
+        cursor = get_changes(self.member_user.id)['cursor']
+
+        self.assertEqual(recompute_calories(exercise_id=self.exercise.id, met_value=9.0), 1)
+
+        self.assertEqual(ArchivedExerciseSet.objects.get(id=computed.id).calories, 105)
+        self.assertEqual(ArchivedExerciseSet.objects.get(id=self.exercise_set.id).calories, 150)
+        # 재계산한 보관 세트는 동기화 커서 이후 변경으로 다시 전달, 리더보드 갱신 작업 등록
+        changed_sets = get_changes(self.member_user.id, cursor)['changes']['exercise_sets']
+        self.assertEqual([(row['id'], row['calories']) for row in changed_sets], [(computed.id, 105)])
+        self.assertTrue(Job.objects.filter(name='workouts.refresh_leaderboards').exists())
+        self.workout_exercise.refresh_from_db()
+        self.daily_workout.refresh_from_db()
+        self.assertEqual(self.workout_exercise.total_calories, 150 + 105)
+        self.assertEqual(self.daily_workout.total_calories, 150 + 105)
+
+    def test_update_duration_recomputes_computed_calories(self):
+        computed = self._create_set()
+        ExerciseSetService.update_set(computed, duration=timedelta(minutes=20))
+        computed.refresh_from_db()
+        self.assertEqual(computed.calories, 140)
+
+
+class LeaderboardTestCase(WorkoutViewsTestCase):
+    # 트레이너별 주간 리더보드 테스트
+
+    def setUp(self):
+        super().setUp()
+        self.second_member = Member.objects.create_user(
+            email=f'member3{self.unique_id}@test.com',
+            password='testpass123',
+            user_type='member',
+            assigned_trainer=self.trainer
+        )
+        second_workout = DailyWorkout.objects.create(
+            member=self.second_member, trainer=self.trainer, workout_date=timezone.now().date()
+        )
+        self.second_workout_exercise = WorkoutExercise.objects.create(
+            daily_workout=second_workout, exercise=self.exercise, order_number=1
+        )
+        self.week_start = get_current_week_start()
+
+    def _log_set(self, workout_exercise, repetitions, weight_kg):
+        return ExerciseSetService.create_set(workout_exercise, repetitions, weight_kg, timedelta(seconds=60), calories=10)
+
+    def test_refresh_counts_archived_sets(self):
+        # 보관된 세트가 있는 주를 다시 집계해도 중량/운동 일수/칼로리 유지
+        before = refresh_member_week(self.member_user.id, self.week_start)
+        ExerciseSetArchiveService.archive_sets(cutoff_date=timezone.now().date() + timedelta(days=1))
+
+        after = refresh_member_week(self.member_user.id, self.week_start)
+
+        self.assertEqual(after.total_volume, before.total_volume)
+        self.assertEqual(after.sessions, 1)
+        self.assertEqual(after.total_calories, 150)
+
+    def test_set_events_update_leaderboard(self):
+        self._log_set(self.workout_exercise, 10, 50)
+        self._log_set(self.second_workout_exercise, 10, 100)
+        self._log_set(self.second_workout_exercise, 5, 100)
+        dispatch_outbox()
+
+        entries = get_leaderboard(self.trainer.id, self.week_start, 'volume')
+        # 기존 세트(10 × 80) + 10 × 50 = 1300, 두 번째 회원 1500
+        self.assertEqual([(entry['member_id'], entry['value']) for entry in entries], [
+            (self.second_member.id, 1500.0),
+            (self.member_user.id, 1300.0),
+        ])
+        self.assertEqual(get_member_rank(self.member_user.id, self.week_start, 'volume'), {
+            'rank': 2, 'value': 1300.0, 'participants': 2
+        })
+        # 같은 값은 같은 순위
+        sessions = get_leaderboard(self.trainer.id, self.week_start, 'sessions')
+        self.assertEqual([entry['rank'] for entry in sessions], [1, 1])
+
+    def test_deleting_last_set_removes_entry(self):
+        exercise_set = self._log_set(self.second_workout_exercise, 10, 100)
+        dispatch_outbox()
+        self.assertTrue(WeeklyLeaderboardEntry.objects.filter(member_id=self.second_member.id).exists())
+
+        ExerciseSetService.delete_set(exercise_set)
+        dispatch_outbox()
+        self.assertFalse(WeeklyLeaderboardEntry.objects.filter(member_id=self.second_member.id).exists())
+
+    def test_reassignment_moves_current_week(self):
+        self._log_set(self.second_workout_exercise, 10, 100)
+        dispatch_outbox()
+
+        other_trainer = Trainer.objects.create_user(
+            email=f'trainer2{self.unique_id}@test.com', password='testpass123', user_type='trainer'
+        )
+        member = Member.objects.get(id=self.second_member.id)
+        member.assigned_trainer = other_trainer
+        member.save()
+        dispatch_outbox()
+
+        self.assertNotIn(
+            self.second_member.id, [entry['member_id'] for entry in get_leaderboard(self.trainer.id, self.week_start)]
+        )
+        self.assertEqual(
+            [entry['member_id'] for entry in get_leaderboard(other_trainer.id, self.week_start)], [self.second_member.id]
+        )
+
+    def test_leaderboard_reads_constant_queries(self):
+        self._log_set(self.workout_exercise, 10, 50)
+        dispatch_outbox()
+        with self.assertNumQueries(1):
+            get_leaderboard(self.trainer.id, self.week_start)
+
+    def test_compaction_removes_old_weeks_and_fixes_drift(self):
+        self._log_set(self.workout_exercise, 10, 50)
+        dispatch_outbox()
+        old_week = self.week_start - timedelta(weeks=52)
+        WeeklyLeaderboardEntry.objects.create(member=self.second_member, trainer=self.trainer, week_start=old_week, sessions=1)
+        # 이벤트 없이 바뀐 값
+        ExerciseSet.objects.filter(id=self.exercise_set.id).update(calories=500)
+
+        self.assertEqual(compact_leaderboards(), {'deleted': 1, 'refreshed': 1})
+        entry = WeeklyLeaderboardEntry.objects.get(member_id=self.member_user.id, week_start=self.week_start)
+        self.assertEqual(entry.total_calories, 510)
+
+    def test_leaderboard_view(self):
+        self._log_set(self.workout_exercise, 10, 50)
+        dispatch_outbox()
+        url = reverse('leaderboard')
+
+        self.client.force_authenticate(user=self.trainer)
+        response = self.client.get(url, {'metric': 'calories'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data']['entries'][0]['member_id'], self.member_user.id)
+
+        # 회원은 본인 순위만
+        self.client.force_authenticate(user=self.member_user)
+        response = self.client.get(url)
+        self.assertEqual(response.data['data']['entries'], [])
+        self.assertEqual(response.data['data']['my_rank']['rank'], 1)
+
+        response = self.client.get(url, {'metric': 'unknown'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class MemberStreakTestCase(WorkoutViewsTestCase):
+    # 연속 운동 기록 테스트
+
+    def setUp(self):
+        super().setUp()
+        self.streak_member = Member.objects.create_user(
+            email=f'streak{self.unique_id}@test.com',
+            password='testpass123',
+            user_type='member',
+            assigned_trainer=self.trainer
+        )
+        self.today = timezone.localdate()
+
+    def _set_active(self, days_ago, active=True):
+        # 날짜에 세트 추가(첫 세트) 또는 마지막 세트 삭제 후 연속 기록 갱신
+        day = self.today - timedelta(days=days_ago)
+        if active:
+            workout, _ = DailyWorkout.objects.get_or_create(
+                member=self.streak_member, workout_date=day, defaults={'trainer': self.trainer}
+            )
+            WorkoutExercise.objects.create(daily_workout=workout, exercise=self.exercise, order_number=1, total_sets=1)
+        else:
+            WorkoutExercise.objects.filter(member_id=self.streak_member.id, workout_date=day).delete()
+        return update_streak(self.streak_member.id, day)
+
+    def test_consecutive_days_extend_streak(self):
+        for days_ago in (3, 2, 1, 0):
+            streak = self._set_active(days_ago)
+        self.assertEqual((streak.current_streak, streak.longest_streak), (4, 4))
+        self.assertEqual(streak.last_active_date, self.today)
+
+        # 같은 날짜를 다시 처리해도 그대로
+        streak = update_streak(self.streak_member.id, self.today)
+        self.assertEqual(streak.current_streak, 4)
+
+    def test_gap_starts_new_streak_and_keeps_longest(self):
+        for days_ago in (10, 9, 8, 1, 0):
+            streak = self._set_active(days_ago)
+        self.assertEqual((streak.current_streak, streak.longest_streak), (2, 3))
+
+    def test_backdated_insert_joins_runs(self):
+        for days_ago in (5, 4, 2, 1, 0):
+            streak = self._set_active(days_ago)
+        self.assertEqual((streak.current_streak, streak.longest_streak), (3, 3))
+
+        streak = self._set_active(3)
+        self.assertEqual((streak.current_streak, streak.longest_streak), (6, 6))
+
+    def test_deleting_days_shortens_streak(self):
+        for days_ago in (4, 3, 2, 1, 0):
+            self._set_active(days_ago)
+
+        # 중간 날짜 삭제 - 현재 연속은 뒤쪽 구간, 최장 기록도 다시 계산
+        streak = self._set_active(2, active=False)
+        self.assertEqual((streak.current_streak, streak.longest_streak), (2, 2))
+
+        # 마지막 날짜 삭제 - 이전 구간으로 되돌아감
+        streak = self._set_active(0, active=False)
+        self.assertEqual(streak.last_active_date, self.today - timedelta(days=1))
+        self.assertEqual(streak.current_streak, 1)
+
+    def test_weekly_target_streak(self):
+        set_weekly_target(self.streak_member.id, 1)
+        week_start = self.today - timedelta(days=self.today.weekday())
+        for weeks_ago in (2, 1, 0):
+            day = week_start - timedelta(weeks=weeks_ago)
+            streak = self._set_active((self.today - day).days)
+        self.assertEqual((streak.current_week_streak, streak.longest_week_streak), (3, 3))
+
+        summary = get_streak_summary(self.streak_member.id)
+        self.assertEqual(summary['weekly_target'], 1)
+        self.assertEqual(summary['this_week_days'], 1)
+        self.assertEqual(summary['weekly_adherence'], 100)
+        self.assertEqual(summary['current_week_streak'], 3)
+
+    def test_broken_streak_shown_as_zero(self):
+        self._set_active(5)
+        self.assertEqual(get_streak_summary(self.streak_member.id)['current_streak'], 0)
+        self.assertEqual(get_streak_summary(self.streak_member.id)['longest_streak'], 1)
+
+    def test_set_events_update_streak(self):
+        ExerciseSetService.create_set(self.workout_exercise, 10, 50, timedelta(seconds=60), calories=10)
+        dispatch_outbox()
+        streak = MemberStreak.objects.get(member_id=self.member_user.id)
+        self.assertEqual((streak.current_streak, streak.last_active_date), (1, timezone.now().date()))
+
+
+class MemberHeatmapTestCase(WorkoutViewsTestCase):
+    # 운동 캘린더 히트맵 테스트
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.client.force_authenticate(user=self.trainer)
+        self.url = reverse('member-heatmap', kwargs={'member_id': self.member_user.id})
+        workout = DailyWorkout.objects.create(member=self.member_user, trainer=self.trainer, workout_date='2024-12-31')
+        WorkoutExercise.objects.create(daily_workout=workout, exercise=self.exercise, order_number=1, total_sets=3)
+        WorkoutExercise.objects.create(daily_workout=workout, exercise=self.exercise, order_number=2, total_sets=2)
+
+    def test_build_heatmap_encodes_days(self):
+        heatmap = build_heatmap(self.member_user.id, 2024)
+        bitmap = base64.b64decode(heatmap['bitmap'])
+        intensity = base64.b64decode(heatmap['intensity'])
+
+        # 2024년은 366일 - 마지막 날(인덱스 365)만 운동
+        self.assertEqual(heatmap['days'], 366)
+        self.assertEqual(heatmap['active_days'], 1)
+        self.assertEqual(len(bitmap), 46)
+        self.assertEqual(bitmap[45], 0x80 >> 5)
+        self.assertEqual(intensity[365], 5)
+        self.assertEqual(sum(intensity), 5)
+
+    def test_heatmap_etag_and_invalidation(self):
+        response = self.client.get(self.url, {'year': 2024})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertLess(len(response.content), 1024)
+        etag = response['ETag']
+
+        response = self.client.get(self.url, {'year': 2024}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        # 세트가 추가되면 버전이 바뀌어 새로 계산
+        with self.captureOnCommitCallbacks(execute=True):
+            ExerciseSetService.create_set(self.workout_exercise, 10, 50, timedelta(seconds=60), calories=10)
+        response = self.client.get(self.url, {'year': 2024}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_heatmap_invalid_year_and_permission(self):
+        response = self.client.get(self.url, {'year': 'abc'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.client.force_authenticate(user=self.other_member)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class TrainerDayBoardTestCase(WorkoutViewsTestCase):
+    # 트레이너 데이 보드 테스트
+
+    def setUp(self):
+        super().setUp()
+        self.url = reverse('trainer-day-board')
+        self.today = timezone.now().date()
+        # 운동 기록이 없는 담당 회원
+        self.idle_member = Member.objects.create_user(
+            email=f'idle{self.unique_id}@test.com',
+            password='testpass123',
+            user_type='member',
+            assigned_trainer=self.trainer
+        )
+
+    def _get(self, **params):
+        self.client.force_authenticate(user=self.trainer)
+        return self.client.get(self.url, params)
+
+    def test_day_board_summarizes_all_members(self):
+        response = self._get(start_date=self.today.isoformat())
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        members = {member['member_id']: member for member in response.data['data']['members']}
+        self.assertEqual(set(members), {self.member_user.id, self.idle_member.id})
+
+        active = members[self.member_user.id]
+        self.assertEqual(active['workout_days'], 1)
+        self.assertEqual(active['total_calories'], 150)
+        self.assertEqual(active['days'][0]['daily_workout_id'], self.daily_workout.id)
+        self.assertNotIn('workout_exercises', active['days'][0])
+        self.assertEqual(members[self.idle_member.id]['days'], [])
+
+    def test_day_board_query_count_independent_of_members(self):
+        for index in range(5):
+            member = Member.objects.create_user(
+                email=f'extra{index}{self.unique_id}@test.com',
+                password='testpass123',
+                user_type='member',
+                assigned_trainer=self.trainer
+            )
+            workout = DailyWorkout.objects.create(member=member, trainer=self.trainer, workout_date=self.today)
+            WorkoutExercise.objects.create(daily_workout=workout, exercise=self.exercise, order_number=1, total_sets=1)
+
+        board = WorkoutRecordService.get_trainer_day_board(self.trainer.id, self.today, self.today)
+        self.assertEqual(len(board), 7)
+        with self.assertNumQueries(3):
+            board = WorkoutRecordService.get_trainer_day_board(
+                self.trainer.id, self.today - timedelta(days=6), self.today, include_exercises=True
+            )
+        breakdown = next(member for member in board if member['member_id'] == self.member_user.id)['days'][0]['workout_exercises']
+        self.assertEqual(breakdown[0]['exercise_name'], '벤치프레스')
+
+    def test_day_board_validation(self):
+        response = self._get(start_date='2024-01-10', end_date='2024-01-01')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self._get(start_date='2024-01-01', end_date='2024-03-01')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.client.force_authenticate(user=self.member_user)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -1,7 +1,7 @@
 # workouts/urls.py
 
 from django.urls import path
-from .views import member_records_view, workout_set_create_view, exercise_list_view, workout_exercise_sets_view, exercise_set_view, exercise_set_create_view
+from .views import member_records_view, workout_set_create_view, exercise_list_view, workout_exercise_sets_view, exercise_set_view, exercise_set_create_view, member_live_feed_view, member_live_ticket_view, member_sync_view, member_export_view, member_import_view, member_heatmap_view, leaderboard_view, trainer_day_board_view
 
 urlpatterns = [
     # 운동 세트 등록
@@ -21,4 +21,28 @@ urlpatterns = [
 
     # 개별 세트 조회/수정
     path('<int:member_id>/records/<int:workout_exercise_id>/sets/<int:set_id>/', exercise_set_view, name='exercise-set'),
+
+    # 오프라인 동기화 (GET: 커서 이후 변경 사항, POST: 오프라인 변경 일괄 반영)
+    path('<int:member_id>/sync/', member_sync_view, name='member-sync'),
+
+    # 실시간 운동 피드 (SSE, 오늘 운동의 세트 생성/수정/삭제 이벤트)
+    path('<int:member_id>/live/', member_live_feed_view, name='member-live-feed'),
+
+    # 실시간 피드 구독 티켓 발급 (EventSource는 헤더를 못 붙이므로 ?ticket=으로 1회 사용)
+    path('<int:member_id>/live/ticket/', member_live_ticket_view, name='member-live-ticket'),
+
+    # 운동 기록 내보내기 (CSV/NDJSON 스트리밍, ?file_format=ndjson&gzip=true)
+    path('<int:member_id>/export/', member_export_view, name='member-export'),
+
+    # 운동 기록 가져오기 (CSV 업로드, multipart/form-data의 file 필드)
+    path('<int:member_id>/import/', member_import_view, name='member-import'),
+
+    # 운동 캘린더 히트맵 (?year=2024, 1년치 운동 여부 비트맵 + 날짜별 강도)
+    path('<int:member_id>/heatmap/', member_heatmap_view, name='member-heatmap'),
+
+    # 트레이너 데이 보드 (담당 회원 전체의 기간 내 운동 요약, ?start_date=&end_date=&exercises=true)
+    path('day-board/', trainer_day_board_view, name='trainer-day-board'),
+
+    # 트레이너별 주간 리더보드 (?metric=volume|sessions|calories&week=YYYY-MM-DD&limit=10)
+    path('leaderboard/', leaderboard_view, name='leaderboard'),
 ]
\ No newline at end of file
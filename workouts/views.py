@@ -1,25 +1,58 @@
 # workouts/views.py
 
-import traceback
-from django.shortcuts import render
+import asyncio
+import csv
+import io
+import json
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponseNotModified, JsonResponse, StreamingHttpResponse
 from rest_framework import status
-from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.decorators import api_view, permission_classes
-from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse
-from drf_spectacular.openapi import OpenApiTypes
+from rest_framework.decorators import api_view, permission_classes, parser_classes
+from rest_framework.parsers import MultiPartParser
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from trainmate.schema import extend_schema, OpenApiParameter, OpenApiResponse, OpenApiTypes
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
-from django.db import models
-from datetime import timedelta
-from .models import DailyWorkout, ExerciseSet, WorkoutExercise, Exercise
-from django.contrib.auth import get_user_model
+from datetime import date, timedelta
+from .models import DailyWorkout, ExerciseSet, WorkoutExercise, Exercise, ArchivedExerciseSet
+from .services import get_workout_exercise_sets, ExerciseSetService, WorkoutRecordService
+from .live import member_channel, get_live_backend, issue_stream_ticket, redeem_stream_ticket
+from .sync import SyncError, apply_changes, get_changes, parse_set_values
+from .idempotency import idempotent
+from .export import EXPORT_FORMATS, export_member_sets, get_export_filename
+from .importer import WorkoutImporter, WorkoutImportError
+from .caching import EXERCISE_CATALOGUE_TAG, member_records_tag
+from .heatmap import get_heatmap
+from .leaderboard import LEADERBOARD_METRICS, get_current_week_start, get_leaderboard, get_member_rank, get_week_start
+from core.cache import cached_view
 from members.models import Trainer
+from members.permissions import IsSelfOrAssignedTrainer, can_access_member, can_manage_exercise_catalogue
 from collections import defaultdict
 from django.db import DatabaseError, IntegrityError
 from django.core.exceptions import ValidationError as DjangoValidationError
 
+
+def _archived_set_ids(member_id, workout_exercise_id, set_ids):
+    # 요청한 세트 중 보관된 세트 id (보관된 기록은 조회만 가능, 수정/삭제는 현재 세트만 대상)
+    return sorted(ArchivedExerciseSet.objects.filter(
+        id__in=set_ids, workout_exercise_id=workout_exercise_id, member_id=member_id
+    ).values_list('id', flat=True))
+
+
+def _archived_sets_response(set_ids):
+    return Response({
+        'success': False,
+        'message': '보관된 세트는 수정하거나 삭제할 수 없습니다.',
+        'errors': {'set_ids': set_ids}
+    }, status=status.HTTP_400_BAD_REQUEST)
+
 @extend_schema(
     summary="회원 운동 기록 조회",
     description="특정 회원의 운동 기록을 운동별로 그룹화하여 조회합니다.",
@@ -48,6 +81,12 @@ from django.core.exceptions import ValidationError as DjangoValidationError
 )
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@cached_view(
+    settings.MEMBER_RECORDS_CACHE_TIMEOUT,
+    # 응답이 요청한 사용자와 무관하므로 회원별로 한 번만 캐시 (세트 변경/운동 카탈로그 변경 시 무효화)
+    tags=lambda request, member_id: [member_records_tag(member_id), EXERCISE_CATALOGUE_TAG],
+    per_user=False
+)
 def member_records_view(request, member_id):
     # 회원의 운동 기록을 운동별로 그룹화하여 조회 
     try:
@@ -56,16 +95,16 @@ def member_records_view(request, member_id):
         
         # WorkoutExercise 조회 (운동별로 그룹화된 단위)
         workout_exercises = WorkoutExercise.objects.filter(
-            daily_workout__member_id=member_id
+            member_id=member_id
         ).select_related(
             'exercise',
             'daily_workout'
-        ).prefetch_related('exercise_sets')
+        ).prefetch_related('exercise_sets', 'archived_sets')
         
         # 날짜 필터 적용 (필요시)
         if date_filter:
             workout_exercises = workout_exercises.filter(
-                daily_workout__workout_date=date_filter
+                workout_date=date_filter
             )
         
         # 운동 기록이 없는 경우 빈 배열 반환
@@ -82,10 +121,10 @@ def member_records_view(request, member_id):
         daily_total_calories = 0
 
         for workout_exercise in workout_exercises:
-            # 해당 운동의 모든 세트 조회
-            exercise_sets = workout_exercise.exercise_sets.all()
+            # 해당 운동의 모든 세트 조회 (보관된 세트 포함)
+            exercise_sets = get_workout_exercise_sets(workout_exercise)
             
-            if exercise_sets.exists():
+            if exercise_sets:
                 records_data.append({
                     'id': workout_exercise.id,
                     'is_trainer': workout_exercise.daily_workout.member == workout_exercise.daily_workout.trainer,
@@ -131,9 +170,9 @@ def member_records_view(request, member_id):
                 "repetitions": {"type": "integer", "description": "횟수 (예: 15)"},
                 "weight_kg": {"type": "number", "description": "중량 (예: 12.0)"},
                 "duration_sec": {"type": "integer", "description": "시간 초 단위 (예: 390)"},
-                "calories": {"type": "integer", "description": "칼로리 (예: 120)"},
+                "calories": {"type": "integer", "description": "칼로리 (예: 120, 생략 시 MET × 회원 몸무게 × 시간으로 계산)"},
             },
-            "required": ["body_part", "equipment", "exercise_name", "repetitions", "weight_kg", "duration_sec", "calories"]
+            "required": ["body_part", "equipment", "exercise_name", "repetitions", "weight_kg", "duration_sec"]
         }
     },
     responses={
@@ -144,44 +183,16 @@ def member_records_view(request, member_id):
     tags=["운동 관리"]
 )
 @api_view(['POST'])
-@permission_classes([IsAuthenticated])
+@permission_classes([IsAuthenticated, IsSelfOrAssignedTrainer])
+@idempotent
 def workout_set_create_view(request, member_id):
     # 운동 세트 등록 
     try:
         data = request.data
         current_user = request.user
 
-        User = get_user_model()
-        
-        if current_user.user_type == 'trainer':
-            if current_user.id == member_id:
-                target_user = current_user
-                is_trainer_workout = True
-            else:
-                try:
-                    target_user = User.objects.get(id=member_id, user_type='member')
-                    is_trainer_workout = False
-                except User.DoesNotExist:
-                    return Response({
-                        'success': False,
-                        'message': '해당 회원을 찾을 수 없습니다.'
-                    }, status=status.HTTP_404_NOT_FOUND)
-        elif current_user.user_type == 'member':
-            if current_user.id != member_id:
-                return Response({
-                    'success': False,
-                    'message': '본인의 운동 기록만 등록할 수 있습니다.'
-                }, status=status.HTTP_403_FORBIDDEN)
-            target_user = current_user
-            is_trainer_workout = False
-        else:
-            return Response({
-                'success': False,
-                'message': '유효하지 않은 사용자 타입입니다.'
-            }, status=status.HTTP_400_BAD_REQUEST)
-
         # 필수 필드 검증
-        required_fields = ['body_part', 'equipment', 'exercise_name', 'repetitions', 'weight_kg', 'duration_sec', 'calories']
+        required_fields = ['body_part', 'equipment', 'exercise_name', 'repetitions', 'weight_kg', 'duration_sec']
         for field in required_fields:
             if field not in data:
                 return Response({
@@ -214,7 +225,7 @@ def workout_set_create_view(request, member_id):
         # 3. 오늘 날짜 DailyWorkout 찾기/생성
         today = timezone.now().date()
         daily_workout, created = DailyWorkout.objects.get_or_create(
-            member=target_user,          # ✅ User 인스턴스 바로 사용!
+            member_id=member_id,
             trainer=registering_trainer,
             workout_date=today,
             defaults={
@@ -236,51 +247,14 @@ def workout_set_create_view(request, member_id):
             }
         )
         
-        # 5. 세트 번호 자동 계산
-        last_set = ExerciseSet.objects.filter(
-            workout_exercise=workout_exercise
-        ).order_by('-set_number').first()
-        
-        next_set_number = (last_set.set_number + 1) if last_set else 1
-        
-        # 6. ExerciseSet 생성
-        exercise_set = ExerciseSet.objects.create(
-            workout_exercise=workout_exercise,
-            set_number=next_set_number,
+        # 5. ExerciseSet 생성 (세트 번호 자동 계산, 운동/일일 총합 갱신)
+        exercise_set = ExerciseSetService.create_set(
+            workout_exercise,
             repetitions=data['repetitions'],
             weight_kg=data['weight_kg'],
             duration=timedelta(seconds=data['duration_sec']),
-            calories=data['calories']
-        )
-        
-        # 7. WorkoutExercise 총합 업데이트
-        exercise_sets = ExerciseSet.objects.filter(workout_exercise=workout_exercise)
-        
-        # 총 세트 수
-        workout_exercise.total_sets = exercise_sets.count()
-        
-        # 총 시간 계산
-        total_seconds = sum(
-            int(es.duration.total_seconds()) for es in exercise_sets if es.duration
+            calories=data.get('calories')
         )
-        workout_exercise.total_duration = timedelta(seconds=total_seconds)
-        
-        # 총 칼로리 계산
-        workout_exercise.total_calories = sum(es.calories for es in exercise_sets)
-        workout_exercise.save()
-        
-        # 8. DailyWorkout 총합 업데이트
-        all_workout_exercises = WorkoutExercise.objects.filter(daily_workout=daily_workout)
-        
-        # 일일 총 시간
-        daily_total_seconds = sum(
-            int(we.total_duration.total_seconds()) for we in all_workout_exercises if we.total_duration
-        )
-        daily_workout.total_duration = timedelta(seconds=daily_total_seconds)
-        
-        # 일일 총 칼로리
-        daily_workout.total_calories = sum(we.total_calories for we in all_workout_exercises)
-        daily_workout.save()
 
         # 응답 데이터 구성
         return Response({
@@ -323,6 +297,7 @@ def workout_set_create_view(request, member_id):
 )
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@cached_view(settings.EXERCISE_CATALOGUE_CACHE_TIMEOUT, tags=[EXERCISE_CATALOGUE_TAG], per_user=False)
 def exercise_list_view(request):
     # 운동 목록 조회 API
     try:
@@ -357,26 +332,101 @@ def exercise_list_view(request):
 
 
 
-# 운동 세트 목록 조회
+# 운동 세트 목록 조회 / 여러 세트 수정 / 여러 세트 삭제
 @extend_schema(
+    methods=['GET'],
     summary="특정 운동의 세트 목록 조회",
     description="특정 운동의 모든 세트 목록을 조회합니다",
     tags=["운동 관리"]
 )
-@api_view(['GET'])
-@permission_classes([IsAuthenticated])
+@extend_schema(
+    methods=['PATCH'],
+    summary="여러 세트 수정",
+    description=(
+        "특정 운동의 세트 여러 개를 한 번에 수정합니다. 모든 변경을 먼저 검증하고, "
+        "하나라도 올바르지 않으면 아무것도 반영하지 않습니다. 운동/일일 총합은 한 번만 다시 계산합니다."
+    ),
+    request={
+        "application/json": {
+            "type": "object",
+            "properties": {
+                "sets": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "set_id": {"type": "integer", "description": "세트 ID"},
+                            "repetitions": {"type": "integer", "description": "횟수"},
+                            "weight_kg": {"type": "number", "description": "중량"},
+                            "duration_sec": {"type": "integer", "description": "시간 초 단위"},
+                            "calories": {"type": "integer", "description": "칼로리 (null이면 서버 계산으로 되돌림)"},
+                        },
+                        "required": ["set_id"]
+                    }
+                },
+            },
+            "required": ["sets"]
+        }
+    },
+    responses={
+        200: OpenApiResponse(description="세트 수정 성공"),
+        400: OpenApiResponse(description="잘못된 요청 (세트별 오류는 errors에 set_id 기준으로 포함)"),
+        401: OpenApiResponse(description="인증 필요"),
+        403: OpenApiResponse(description="권한 없음"),
+        404: OpenApiResponse(description="운동 또는 세트를 찾을 수 없음"),
+        500: OpenApiResponse(description="서버 내부 오류")
+    },
+    tags=["운동 관리"]
+)
+@extend_schema(
+    methods=['DELETE'],
+    summary="여러 세트 삭제",
+    description="특정 운동의 세트 여러 개를 한 트랜잭션으로 삭제합니다. 남은 세트 번호는 1부터 다시 매깁니다.",
+    request={
+        "application/json": {
+            "type": "object",
+            "properties": {
+                "set_ids": {"type": "array", "items": {"type": "integer"}, "description": "삭제할 세트 ID 목록"},
+            },
+            "required": ["set_ids"]
+        }
+    },
+    responses={
+        200: OpenApiResponse(description="세트 삭제 성공"),
+        400: OpenApiResponse(description="잘못된 요청 (모든 세트 삭제 포함)"),
+        401: OpenApiResponse(description="인증 필요"),
+        403: OpenApiResponse(description="권한 없음"),
+        404: OpenApiResponse(description="운동 또는 세트를 찾을 수 없음"),
+        500: OpenApiResponse(description="서버 내부 오류")
+    },
+    tags=["운동 관리"]
+)
+@api_view(['GET', 'PATCH', 'DELETE'])
+@permission_classes([IsAuthenticated, IsSelfOrAssignedTrainer])
 def workout_exercise_sets_view(request, member_id, workout_exercise_id):
+    if request.method == 'PATCH':
+        return workout_exercise_sets_update(request, member_id, workout_exercise_id)
+    if request.method == 'DELETE':
+        return workout_exercise_sets_delete(request, member_id, workout_exercise_id)
+    return workout_exercise_sets_list(request, member_id, workout_exercise_id)
+
+
+
+def workout_exercise_sets_list(request, member_id, workout_exercise_id):
     try:
         workout_exercise = get_object_or_404(
             WorkoutExercise.objects.select_related('exercise'),
             id=workout_exercise_id,
-            daily_workout__member_id=member_id
+            member_id=member_id
         )
 
-        # 해당 운동의 모든 세트 조회
-        exercise_sets = ExerciseSet.objects.filter(
-            workout_exercise=workout_exercise
-        ).order_by('set_number')
+        # 해당 운동의 모든 세트 조회 (보관된 세트 포함)
+        exercise_sets = list(
+            ExerciseSet.objects.filter(workout_exercise=workout_exercise)
+        ) + list(
+            ArchivedExerciseSet.objects.filter(workout_exercise=workout_exercise)
+        )
+        exercise_sets.sort(key=lambda es: es.set_number)
 
         # 세트 목록 구성
         sets_data = []
@@ -392,6 +442,7 @@ def workout_exercise_sets_view(request, member_id, workout_exercise_id):
                 'duration_display': f"{duration_minutes:02d}:{duration_seconds:02d}",
                 'calories': es.calories,
                 'is_completed': True,
+                'is_archived': isinstance(es, ArchivedExerciseSet),
                 'completed_at': es.completed_at.strftime('%H:%M:%S')
             })
 
@@ -423,6 +474,187 @@ def workout_exercise_sets_view(request, member_id, workout_exercise_id):
 
 
 
+def workout_exercise_sets_update(request, member_id, workout_exercise_id):
+    # 권한 검증은 workout_exercise_sets_view의 IsSelfOrAssignedTrainer에서 처리
+    changes = request.data.get('sets')
+    if not isinstance(changes, list) or not changes or not all(isinstance(change, dict) for change in changes):
+        return Response({
+            'success': False,
+            'message': 'sets는 세트 변경 사항 목록이어야 합니다.'
+        }, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        workout_exercise = WorkoutExercise.objects.filter(
+            id=workout_exercise_id, member_id=member_id
+        ).select_related('exercise').first()
+        if workout_exercise is None:
+            return Response({
+                'success': False,
+                'message': '운동을 찾을 수 없습니다.'
+            }, status=status.HTTP_404_NOT_FOUND)
+
+        exercise_sets = {
+            es.id: es for es in ExerciseSet.objects.filter(workout_exercise=workout_exercise)
+        }
+
+        # 모든 변경을 먼저 검증 (하나라도 실패하면 반영하지 않음)
+        set_changes = []
+        errors = {}
+        missing_ids = []
+        seen_ids = set()
+        for change in changes:
+            set_id = change.get('set_id')
+            if not isinstance(set_id, int) or isinstance(set_id, bool):
+                errors['set_id'] = 'set_id는 정수여야 합니다.'
+                continue
+            if set_id in seen_ids:
+                errors[str(set_id)] = '같은 세트가 여러 번 포함되어 있습니다.'
+                continue
+            seen_ids.add(set_id)
+            if set_id not in exercise_sets:
+                missing_ids.append(set_id)
+                continue
+            try:
+                set_changes.append((exercise_sets[set_id], parse_set_values(change, partial=True)))
+            except SyncError as e:
+                errors[str(set_id)] = str(e)
+
+        if missing_ids:
+            archived_ids = _archived_set_ids(member_id, workout_exercise_id, missing_ids)
+            if archived_ids:
+                return _archived_sets_response(archived_ids)
+            return Response({
+                'success': False,
+                'message': '세트를 찾을 수 없습니다.',
+                'errors': {'set_ids': sorted(missing_ids)}
+            }, status=status.HTTP_404_NOT_FOUND)
+        if errors:
+            return Response({
+                'success': False,
+                'message': '세트 변경 사항이 올바르지 않습니다.',
+                'errors': errors
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        # 세트 수정(bulk_update) 및 운동/일일 총합 재계산
+        for es, _ in set_changes:
+            es.workout_exercise = workout_exercise
+        updated_sets = ExerciseSetService.update_sets(workout_exercise, set_changes)
+
+        sets_data = []
+        for es in sorted(updated_sets, key=lambda es: es.set_number):
+            duration_minutes = int(es.duration.total_seconds()) // 60
+            duration_seconds = int(es.duration.total_seconds()) % 60
+            sets_data.append({
+                'set_id': es.id,
+                'set_number': es.set_number,
+                'repetitions': es.repetitions,
+                'weight_kg': float(es.weight_kg),
+                'duration_sec': int(es.duration.total_seconds()),
+                'duration_display': f"{duration_minutes:02d}:{duration_seconds:02d}",
+                'calories': es.calories
+            })
+
+        return Response({
+            'success': True,
+            'message': f'세트 {len(updated_sets)}개가 수정되었습니다.',
+            'data': {
+                'workout_exercise_id': workout_exercise.id,
+                'exercise_name': workout_exercise.exercise.exercise_name,
+                'total_sets': workout_exercise.total_sets,
+                'total_duration_sec': int(workout_exercise.total_duration.total_seconds()),
+                'total_calories': workout_exercise.total_calories,
+                'sets': sets_data
+            }
+        }, status=status.HTTP_200_OK)
+
+    except Exception:
+        return Response({
+            'success': False,
+            'message': '세트 수정 중 오류가 발생했습니다.'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+def workout_exercise_sets_delete(request, member_id, workout_exercise_id):
+    # 권한 검증은 workout_exercise_sets_view의 IsSelfOrAssignedTrainer에서 처리
+    set_ids = request.data.get('set_ids')
+    if (
+        not isinstance(set_ids, list) or not set_ids
+        or not all(isinstance(set_id, int) and not isinstance(set_id, bool) for set_id in set_ids)
+    ):
+        return Response({
+            'success': False,
+            'message': 'set_ids는 세트 ID(정수) 목록이어야 합니다.'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    set_ids = list(dict.fromkeys(set_ids))
+
+    try:
+        workout_exercise = WorkoutExercise.objects.filter(
+            id=workout_exercise_id, member_id=member_id
+        ).first()
+        if workout_exercise is None:
+            return Response({
+                'success': False,
+                'message': '운동을 찾을 수 없습니다.'
+            }, status=status.HTTP_404_NOT_FOUND)
+
+        exercise_sets = list(
+            ExerciseSet.objects.filter(workout_exercise=workout_exercise).select_related('workout_exercise')
+        )
+        requested_ids = set(set_ids)
+        to_delete = [es for es in exercise_sets if es.id in requested_ids]
+        missing_ids = sorted(requested_ids - {es.id for es in to_delete})
+        if missing_ids:
+            archived_ids = _archived_set_ids(member_id, workout_exercise_id, missing_ids)
+            if archived_ids:
+                return _archived_sets_response(archived_ids)
+            return Response({
+                'success': False,
+                'message': '세트를 찾을 수 없습니다.',
+                'errors': {'set_ids': missing_ids}
+            }, status=status.HTTP_404_NOT_FOUND)
+
+        if len(to_delete) == len(exercise_sets):
+            return Response({
+                'success': False,
+                'message': '운동의 마지막 세트는 삭제할 수 없습니다. 운동 전체를 삭제해주세요.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            ExerciseSetService.delete_sets(workout_exercise, to_delete)
+
+        except IntegrityError:
+            return Response({
+                'success': False,
+                'message': '데이터 무결성 제약으로 인해 삭제할 수 없습니다.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        except DatabaseError:
+            return Response({
+                'success': False,
+                'message': '데이터베이스 연결 오류가 발생했습니다.'
+            }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+
+        return Response({
+            'success': True,
+            'message': f'세트 {len(to_delete)}개가 삭제되었습니다.',
+            'data': {
+                'workout_exercise_id': workout_exercise.id,
+                'deleted_set_ids': [es.id for es in to_delete],
+                'total_sets': workout_exercise.total_sets,
+                'total_duration_sec': int(workout_exercise.total_duration.total_seconds()),
+                'total_calories': workout_exercise.total_calories
+            }
+        }, status=status.HTTP_200_OK)
+
+    except Exception:
+        return Response({
+            'success': False,
+            'message': '세트 삭제 중 예상치 못한 오류가 발생했습니다.'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
 @extend_schema(
     methods=['GET'],
     summary="개별 세트 상세 조회",
@@ -440,7 +672,7 @@ def workout_exercise_sets_view(request, member_id, workout_exercise_id):
                 "repetitions": {"type": "integer", "description": "횟수"},
                 "weight_kg": {"type": "number", "description": "중량"},
                 "duration_sec": {"type": "integer", "description": "시간 초 단위"},
-                "calories": {"type": "integer", "description": "칼로리"},
+                "calories": {"type": "integer", "description": "칼로리 (null이면 서버 계산으로 되돌림)"},
             }
         }
     },
@@ -461,8 +693,13 @@ def workout_exercise_sets_view(request, member_id, workout_exercise_id):
     tags=["운동 관리"]
 )
 @api_view(['GET', 'PATCH', 'DELETE'])
-@permission_classes([IsAuthenticated])
+@permission_classes([IsAuthenticated, IsSelfOrAssignedTrainer])
 def exercise_set_view(request, member_id, workout_exercise_id, set_id):
+    if request.method in ('PATCH', 'DELETE'):
+        archived_ids = _archived_set_ids(member_id, workout_exercise_id, [set_id])
+        if archived_ids:
+            return _archived_sets_response(archived_ids)
+
     if request.method == 'GET':
         return exercise_set_detail(request, member_id, workout_exercise_id, set_id)
     
@@ -476,15 +713,13 @@ def exercise_set_view(request, member_id, workout_exercise_id, set_id):
 
 def exercise_set_detail(request, member_id, workout_exercise_id, set_id):
     try:
-        exercise_set = get_object_or_404(
-            ExerciseSet.objects.select_related(
-                'workout_exercise__exercise',
-                'workout_exercise__daily_workout'
-            ),
-            id=set_id,
-            workout_exercise_id=workout_exercise_id,
-            workout_exercise__daily_workout__member_id=member_id
-        )
+        # 현재 세트에 없으면 보관된 세트에서 조회
+        lookup = {'id': set_id, 'workout_exercise_id': workout_exercise_id, 'member_id': member_id}
+        exercise_set = ExerciseSet.objects.select_related('workout_exercise__exercise').filter(**lookup).first()
+        if exercise_set is None:
+            exercise_set = get_object_or_404(
+                ArchivedExerciseSet.objects.select_related('workout_exercise__exercise'), **lookup
+            )
 
         duration_minutes = int(exercise_set.duration.total_seconds()) // 60
         duration_seconds = int(exercise_set.duration.total_seconds()) % 60
@@ -501,6 +736,7 @@ def exercise_set_detail(request, member_id, workout_exercise_id, set_id):
                 'duration_display': f"{duration_minutes:02d}:{duration_seconds:02d}",
                 'calories': exercise_set.calories,
                 'is_completed': True,
+                'is_archived': isinstance(exercise_set, ArchivedExerciseSet),
                 'completed_at': exercise_set.completed_at.strftime('%H:%M:%S')
             }
         }, status=status.HTTP_200_OK)
@@ -515,34 +751,8 @@ def exercise_set_detail(request, member_id, workout_exercise_id, set_id):
 
 
 def exercise_set_update(request, member_id, workout_exercise_id, set_id):
+    # 권한 검증은 exercise_set_view의 IsSelfOrAssignedTrainer에서 처리
     try:
-        current_user = request.user
-
-        User = get_user_model()
-
-        if current_user.user_type == 'trainer':
-            # 트레이너는 본인이거나 담당 회원의 기록을 수정 가능
-            if current_user.id != member_id:
-                try:
-                    target_user = User.objects.get(id=member_id, user_type='member')
-                except User.DoesNotExist:
-                    return Response({
-                        'success': False,
-                        'message': '해당 회원을 찾을 수 없습니다.'
-                    }, status=status.HTTP_404_NOT_FOUND)
-        elif current_user.user_type == 'member':
-            # 회원은 본인의 기록만 수정 가능
-            if current_user.id != member_id:
-                return Response({
-                    'success': False,
-                    'message': '본인의 운동 기록만 수정할 수 있습니다.'
-                }, status=status.HTTP_403_FORBIDDEN)
-        else:
-            return Response({
-                'success': False,
-                'message': '유효하지 않은 사용자 타입입니다.'
-            }, status=status.HTTP_400_BAD_REQUEST)
-        
         # 세트 조회 (추가됨: 세트 존재 여부 확인)
         exercise_set = get_object_or_404(
             ExerciseSet.objects.select_related(
@@ -551,65 +761,23 @@ def exercise_set_update(request, member_id, workout_exercise_id, set_id):
             ),
             id=set_id,
             workout_exercise_id=workout_exercise_id,
-            workout_exercise__daily_workout__member_id=member_id
+            member_id=member_id
         )
 
         data = request.data
-        updated_fields = []
+        updated_fields = [field for field in ('repetitions', 'weight_kg', 'duration_sec', 'calories') if field in data]
 
-        if 'repetitions' in data:
-            exercise_set.repetitions = data['repetitions']
-            updated_fields.append('repetitions')
-            
-        if 'weight_kg' in data:
-            exercise_set.weight_kg = data['weight_kg']
-            updated_fields.append('weight_kg')
-            
-        if 'duration_sec' in data:
-            exercise_set.duration = timedelta(seconds=data['duration_sec'])
-            updated_fields.append('duration_sec')
-            
-        if 'calories' in data:
-            exercise_set.calories = data['calories']
-            updated_fields.append('calories')
-
-        if not updated_fields:
+        # 일괄 수정/동기화와 같은 검증 (중량 범위, 소수 둘째 자리 반올림 등)
+        try:
+            changes = parse_set_values(data, partial=True)
+        except SyncError as e:
             return Response({
                 'success': False,
-                'message': '수정할 필드가 없습니다.'
+                'message': str(e)
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        exercise_set.save()
-
-        workout_exercise = exercise_set.workout_exercise
-        exercise_sets = ExerciseSet.objects.filter(workout_exercise=workout_exercise)
-
-        # 총 세트 수
-        workout_exercise.total_sets = exercise_sets.count()
-
-        # 총 시간 재계산
-        total_seconds = sum(
-            int(es.duration.total_seconds()) for es in exercise_sets if es.duration
-        )
-        workout_exercise.total_duration = timedelta(seconds=total_seconds)
-
-        # 총 칼로리 재계산
-        workout_exercise.total_calories = sum(es.calories for es in exercise_sets)
-        workout_exercise.save()
-
-        # DailyWorkout 총합 재계산
-        daily_workout = workout_exercise.daily_workout
-        all_workout_exercises = WorkoutExercise.objects.filter(daily_workout=daily_workout)
-
-        # 일일 총 시간 재계산
-        daily_total_seconds = sum(
-            int(we.total_duration.total_seconds()) for we in all_workout_exercises if we.total_duration
-        )
-        daily_workout.total_duration = timedelta(seconds=daily_total_seconds)
-
-        # 일일 총 칼로리 재계산
-        daily_workout.total_calories = sum(we.total_calories for we in all_workout_exercises)
-        daily_workout.save()
+        # 세트 수정 및 운동/일일 총합 재계산
+        ExerciseSetService.update_set(exercise_set, **changes)
 
         duration_minutes = int(exercise_set.duration.total_seconds()) // 60
         duration_seconds = int(exercise_set.duration.total_seconds()) % 60
@@ -640,38 +808,8 @@ def exercise_set_update(request, member_id, workout_exercise_id, set_id):
 
 
 def exercise_set_delete(request, member_id, workout_exercise_id, set_id):
+    # 권한 검증은 exercise_set_view의 IsSelfOrAssignedTrainer에서 처리
     try:
-        current_user = request.user
-
-        # 권한 검증 
-        User = get_user_model()
-
-        if current_user.user_type == 'trainer':
-            if current_user.id != member_id:
-                try:
-                    target_user = User.objects.get(id=member_id, user_type='member')
-                except User.DoesNotExist:
-                    return Response({
-                        'success': False,
-                        'message': '해당 회원을 찾을 수 없습니다.'
-                    }, status=status.HTTP_404_NOT_FOUND)
-                except DatabaseError:
-                    return Response({
-                        'success': False,
-                        'message': '데이터베이스 연결 오류가 발생했습니다.'
-                    }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
-        elif current_user.user_type == 'member':
-            if current_user.id != member_id:
-                return Response({
-                    'success': False,
-                    'message': '본인의 운동 기록만 삭제할 수 있습니다.'
-                }, status=status.HTTP_403_FORBIDDEN)
-        else:
-            return Response({
-                'success': False,
-                'message': '유효하지 않은 사용자 타입입니다.'
-            }, status=status.HTTP_400_BAD_REQUEST)
-
         # 세트 조회
         try:
             exercise_set = get_object_or_404(
@@ -681,7 +819,7 @@ def exercise_set_delete(request, member_id, workout_exercise_id, set_id):
                 ),
                 id=set_id,
                 workout_exercise_id=workout_exercise_id,
-                workout_exercise__daily_workout__member_id=member_id
+                member_id=member_id
             )
         except Exception as e:
             return Response({
@@ -706,9 +844,9 @@ def exercise_set_delete(request, member_id, workout_exercise_id, set_id):
             'exercise_name': exercise_set.workout_exercise.exercise.exercise_name
         }
 
-        # 세트 삭제
+        # 세트 삭제 (삭제 기록, 남은 세트 번호 재정렬, 운동/일일 총합 재계산 포함)
         try:
-            exercise_set.delete()
+            ExerciseSetService.delete_set(exercise_set)
             
         except IntegrityError as e:
             return Response({
@@ -722,54 +860,6 @@ def exercise_set_delete(request, member_id, workout_exercise_id, set_id):
                 'message': '데이터베이스 연결 오류가 발생했습니다.'
             }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
 
-        # 남은 세트들의 번호 재정렬
-        try:
-            remaining_sets = ExerciseSet.objects.filter(
-                workout_exercise=workout_exercise
-            ).order_by('set_number')
-            
-            for index, es in enumerate(remaining_sets, 1):
-                if es.set_number != index:
-                    es.set_number = index
-                    es.save()
-                    
-        except DatabaseError as e:
-            return Response({
-                'success': False,
-                'message': '세트 번호 재정렬 중 오류가 발생했습니다.'
-            }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
-
-        # WorkoutExercise 총합 재계산
-        try:
-            exercise_sets = ExerciseSet.objects.filter(workout_exercise=workout_exercise)
-            
-            workout_exercise.total_sets = exercise_sets.count()
-            
-            total_seconds = sum(
-                int(es.duration.total_seconds()) for es in exercise_sets if es.duration
-            )
-            workout_exercise.total_duration = timedelta(seconds=total_seconds)
-            
-            workout_exercise.total_calories = sum(es.calories for es in exercise_sets)
-            workout_exercise.save()
-
-            # DailyWorkout 총합 재계산
-            daily_workout = workout_exercise.daily_workout
-            all_workout_exercises = WorkoutExercise.objects.filter(daily_workout=daily_workout)
-            
-            daily_total_seconds = sum(
-                int(we.total_duration.total_seconds()) for we in all_workout_exercises if we.total_duration
-            )
-            daily_workout.total_duration = timedelta(seconds=daily_total_seconds)
-            daily_workout.total_calories = sum(we.total_calories for we in all_workout_exercises)
-            daily_workout.save()
-
-        except DatabaseError as e:
-            return Response({
-                'success': False,
-                'message': '총합 재계산 중 데이터베이스 오류가 발생했습니다.'
-            }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
-
         # 성공 응답 (추가됨)
         return Response({
             'success': True,
@@ -801,9 +891,9 @@ def exercise_set_delete(request, member_id, workout_exercise_id, set_id):
                 "repetitions": {"type": "integer", "description": "횟수 (예: 15)"},
                 "weight_kg": {"type": "number", "description": "중량 (예: 12.0)"},
                 "duration_sec": {"type": "integer", "description": "시간 초 단위 (예: 390)"},
-                "calories": {"type": "integer", "description": "칼로리 (예: 120)"},
+                "calories": {"type": "integer", "description": "칼로리 (예: 120, 생략 시 MET × 회원 몸무게 × 시간으로 계산)"},
             },
-            "required": ["repetitions", "weight_kg", "duration_sec", "calories"]
+            "required": ["repetitions", "weight_kg", "duration_sec"]
         }
     },
     responses={
@@ -817,44 +907,14 @@ def exercise_set_delete(request, member_id, workout_exercise_id, set_id):
     tags=["운동 관리"]
 )
 @api_view(['POST'])
-@permission_classes([IsAuthenticated])
+@permission_classes([IsAuthenticated, IsSelfOrAssignedTrainer])
+@idempotent
 def exercise_set_create_view(request, member_id, workout_exercise_id):  # 추가됨: 기존 운동에 세트 추가
     try:
-        current_user = request.user
         data = request.data
 
-        # 권한 검증
-        
-        User = get_user_model()
-
-        if current_user.user_type == 'trainer':
-            if current_user.id != member_id:
-                try:
-                    target_user = User.objects.get(id=member_id, user_type='member')
-                except User.DoesNotExist:
-                    return Response({
-                        'success': False,
-                        'message': '해당 회원을 찾을 수 없습니다.'
-                    }, status=status.HTTP_404_NOT_FOUND)
-                except DatabaseError:
-                    return Response({
-                        'success': False,
-                        'message': '데이터베이스 연결 오류가 발생했습니다.'
-                    }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
-        elif current_user.user_type == 'member':
-            if current_user.id != member_id:
-                return Response({
-                    'success': False,
-                    'message': '본인의 운동 기록만 추가할 수 있습니다.'
-                }, status=status.HTTP_403_FORBIDDEN)
-        else:
-            return Response({
-                'success': False,
-                'message': '유효하지 않은 사용자 타입입니다.'
-            }, status=status.HTTP_400_BAD_REQUEST)
-
         # 필수 필드 검증
-        required_fields = ['repetitions', 'weight_kg', 'duration_sec', 'calories']
+        required_fields = ['repetitions', 'weight_kg', 'duration_sec']
         missing_fields = [field for field in required_fields if field not in data]
         if missing_fields:
             return Response({
@@ -867,9 +927,10 @@ def exercise_set_create_view(request, member_id, workout_exercise_id):  # 추가
             repetitions = int(data['repetitions'])
             weight_kg = float(data['weight_kg'])
             duration_sec = int(data['duration_sec'])
-            calories = int(data['calories'])
+            # 칼로리를 생략하면 서버에서 계산
+            calories = int(data['calories']) if data.get('calories') is not None else None
             
-            if repetitions <= 0 or weight_kg < 0 or duration_sec <= 0 or calories < 0:
+            if repetitions <= 0 or weight_kg < 0 or duration_sec <= 0 or (calories is not None and calories < 0):
                 raise ValueError("값은 양수여야 합니다.")
                 
         except (ValueError, TypeError) as e:
@@ -883,7 +944,7 @@ def exercise_set_create_view(request, member_id, workout_exercise_id):  # 추가
             workout_exercise = get_object_or_404(
                 WorkoutExercise.objects.select_related('daily_workout'),
                 id=workout_exercise_id,
-                daily_workout__member_id=member_id
+                member_id=member_id
             )
         except Exception as e:  # 수정됨: 구체적 예외 처리
             return Response({
@@ -891,18 +952,10 @@ def exercise_set_create_view(request, member_id, workout_exercise_id):  # 추가
                 'message': '운동 정보를 찾을 수 없습니다.'
             }, status=status.HTTP_404_NOT_FOUND)
 
-        # 세트 번호 자동 계산
+        # ExerciseSet 생성 (세트 번호 자동 계산, 운동/일일 총합 갱신)
         try:
-            last_set = ExerciseSet.objects.filter(
-                workout_exercise=workout_exercise
-            ).order_by('-set_number').first()
-            
-            next_set_number = (last_set.set_number + 1) if last_set else 1
-
-            # ExerciseSet 생성
-            exercise_set = ExerciseSet.objects.create(
-                workout_exercise=workout_exercise,
-                set_number=next_set_number,
+            exercise_set = ExerciseSetService.create_set(
+                workout_exercise,
                 repetitions=repetitions,
                 weight_kg=weight_kg,
                 duration=timedelta(seconds=duration_sec),
@@ -921,31 +974,6 @@ def exercise_set_create_view(request, member_id, workout_exercise_id):  # 추가
                 'message': '입력값 유효성 검사에 실패했습니다.'
             }, status=status.HTTP_400_BAD_REQUEST)
 
-        # WorkoutExercise 총합 업데이트
-        try:
-            exercise_sets = ExerciseSet.objects.filter(workout_exercise=workout_exercise)
-            
-            workout_exercise.total_sets = exercise_sets.count()
-            
-            total_seconds = sum(
-                int(es.duration.total_seconds()) for es in exercise_sets if es.duration
-            )
-            workout_exercise.total_duration = timedelta(seconds=total_seconds)
-            
-            workout_exercise.total_calories = sum(es.calories for es in exercise_sets)
-            workout_exercise.save()
-
-            # DailyWorkout 총합 업데이트
-            daily_workout = workout_exercise.daily_workout
-            all_workout_exercises = WorkoutExercise.objects.filter(daily_workout=daily_workout)
-            
-            daily_total_seconds = sum(
-                int(we.total_duration.total_seconds()) for we in all_workout_exercises if we.total_duration
-            )
-            daily_workout.total_duration = timedelta(seconds=daily_total_seconds)
-            daily_workout.total_calories = sum(we.total_calories for we in all_workout_exercises)
-            daily_workout.save()
-
         except DatabaseError as e:
             return Response({
                 'success': False,
@@ -988,4 +1016,514 @@ def exercise_set_create_view(request, member_id, workout_exercise_id):  # 추가
         return Response({
             'success': False,
             'message': '세트 추가 중 예상치 못한 오류가 발생했습니다.'
-        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
\ No newline at end of file
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+# 오프라인 동기화
+@extend_schema(
+    methods=['GET'],
+    summary="오프라인 동기화 - 변경 사항 조회",
+    description="커서 이후 변경된 일일 운동/운동 항목/세트와 삭제 기록을 조회합니다. 응답의 cursor를 다음 요청에 사용합니다.",
+    parameters=[
+        OpenApiParameter(
+            name='cursor',
+            type=OpenApiTypes.STR,
+            location=OpenApiParameter.QUERY,
+            description='이전 동기화 응답의 cursor (없으면 전체 동기화)',
+            required=False
+        )
+    ],
+    responses={
+        200: OpenApiResponse(description="조회 성공"),
+        400: OpenApiResponse(description="잘못된 커서"),
+        401: OpenApiResponse(description="인증 필요"),
+        403: OpenApiResponse(description="권한 없음")
+    },
+    tags=["운동 관리"]
+)
+@extend_schema(
+    methods=['POST'],
+    summary="오프라인 동기화 - 변경 사항 일괄 반영",
+    description="오프라인에서 쌓인 세트 생성/수정/삭제를 순서대로 반영한 뒤 커서 이후 변경 사항을 함께 반환합니다.",
+    request={
+        "application/json": {
+            "type": "object",
+            "properties": {
+                "cursor": {"type": "string", "description": "이전 동기화 응답의 cursor"},
+                "changes": {
+                    "type": "array",
+                    "description": "변경 사항 목록 (op: create/update/delete, client_id: 클라이언트 식별자)",
+                    "items": {"type": "object"}
+                }
+            }
+        }
+    },
+    responses={
+        200: OpenApiResponse(description="반영 성공 (변경별 결과 포함)"),
+        400: OpenApiResponse(description="잘못된 요청"),
+        401: OpenApiResponse(description="인증 필요"),
+        403: OpenApiResponse(description="권한 없음")
+    },
+    tags=["운동 관리"]
+)
+@api_view(['GET', 'POST'])
+@permission_classes([IsAuthenticated, IsSelfOrAssignedTrainer])
+def member_sync_view(request, member_id):
+    try:
+        results = None
+        if request.method == 'POST':
+            cursor = request.data.get('cursor')
+            results = apply_changes(request.user, member_id, request.data.get('changes', []))
+        else:
+            cursor = request.query_params.get('cursor')
+
+        sync_data = get_changes(member_id, cursor)
+        if results is not None:
+            sync_data['results'] = results
+
+        return Response({
+            'success': True,
+            'data': sync_data
+        }, status=status.HTTP_200_OK)
+
+    except SyncError as e:
+        return Response({
+            'success': False,
+            'message': str(e)
+        }, status=status.HTTP_400_BAD_REQUEST)
+
+    except DatabaseError:
+        return Response({
+            'success': False,
+            'message': '데이터베이스 오류가 발생했습니다. 잠시 후 다시 시도해주세요.'
+        }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+
+
+
+# 운동 기록 내보내기
+@extend_schema(
+    summary="운동 기록 내보내기",
+    description="회원의 전체 세트 기록(보관된 세트 포함)을 CSV 또는 NDJSON 파일로 스트리밍합니다.",
+    parameters=[
+        OpenApiParameter(
+            name='file_format',
+            type=OpenApiTypes.STR,
+            location=OpenApiParameter.QUERY,
+            description='파일 형식 (csv, ndjson - 기본값: csv)',
+            required=False
+        ),
+        OpenApiParameter(
+            name='gzip',
+            type=OpenApiTypes.BOOL,
+            location=OpenApiParameter.QUERY,
+            description='gzip 압축 여부 (기본값: false)',
+            required=False
+        )
+    ],
+    responses={
+        200: OpenApiResponse(description="파일 스트리밍"),
+        400: OpenApiResponse(description="지원하지 않는 형식"),
+        401: OpenApiResponse(description="인증 필요"),
+        403: OpenApiResponse(description="권한 없음")
+    },
+    tags=["운동 관리"]
+)
+@api_view(['GET'])
+@permission_classes([IsAuthenticated, IsSelfOrAssignedTrainer])
+def member_export_view(request, member_id):
+    # DRF의 format 쿼리 파라미터(렌더러 선택)와 겹치지 않도록 file_format 사용
+    export_format = request.query_params.get('file_format', 'csv')
+    if export_format not in EXPORT_FORMATS:
+        return Response({
+            'success': False,
+            'message': '지원하지 않는 형식입니다. (csv, ndjson)'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    compress = request.query_params.get('gzip', '').lower() in ('1', 'true')
+
+    content_type = 'application/gzip' if compress else EXPORT_FORMATS[export_format][0]
+    response = StreamingHttpResponse(
+        export_member_sets(member_id, export_format, compress),
+        content_type=content_type
+    )
+    filename = get_export_filename(member_id, export_format, compress)
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+# 운동 기록 가져오기
+@extend_schema(
+    summary="운동 기록 가져오기 (CSV)",
+    description="CSV 파일(workout_date, exercise_name, body_part, equipment, set_number, repetitions, weight_kg, duration_sec, calories)의 세트 기록을 회원의 운동 기록으로 일괄 등록합니다. 운동 목록에 없는 운동은 오류 행으로 처리하며, 트레이너/관리자만 create_exercises로 새 운동을 등록할 수 있습니다. 대용량 파일은 import_workouts 명령을 사용합니다.",
+    request={
+        "multipart/form-data": {
+            "type": "object",
+            "properties": {
+                "file": {"type": "string", "format": "binary", "description": "CSV 파일 (UTF-8)"},
+                "create_exercises": {"type": "boolean", "description": "운동 목록에 없는 운동을 새로 등록 (트레이너/관리자만, 기본값: false)"}
+            },
+            "required": ["file"]
+        }
+    },
+    responses={
+        200: OpenApiResponse(description="가져오기 완료 (행 수, 오류 행, 처리 속도 포함)"),
+        400: OpenApiResponse(description="파일 누락 또는 형식 오류"),
+        401: OpenApiResponse(description="인증 필요"),
+        403: OpenApiResponse(description="권한 없음")
+    },
+    tags=["운동 관리"]
+)
+@api_view(['POST'])
+@permission_classes([IsAuthenticated, IsSelfOrAssignedTrainer])
+@parser_classes([MultiPartParser])
+def member_import_view(request, member_id):
+    upload = request.FILES.get('file')
+    if upload is None:
+        return Response({
+            'success': False,
+            'message': 'file 필드에 CSV 파일이 필요합니다.'
+        }, status=status.HTTP_400_BAD_REQUEST)
+
+    # 공용 운동 목록에 새 운동 등록은 트레이너/관리자가 명시적으로 요청한 경우만 허용
+    create_exercises = str(request.data.get('create_exercises', '')).lower() in ('1', 'true')
+    if create_exercises and not can_manage_exercise_catalogue(request.user):
+        return Response({
+            'success': False,
+            'message': '새 운동 등록은 트레이너 또는 관리자만 할 수 있습니다.'
+        }, status=status.HTTP_403_FORBIDDEN)
+
+    # 트레이너가 올리면 본인, 회원이 올리면 담당 트레이너가 등록한 기록으로 저장
+    trainer_id = request.user.id if request.user.user_type == 'trainer' else None
+    importer = WorkoutImporter(member_id=member_id, trainer_id=trainer_id, create_exercises=create_exercises)
+    try:
+        # 업로드 파일(임시 파일)을 한 줄씩 읽음
+        result = importer.run(io.TextIOWrapper(upload.file, encoding='utf-8-sig', newline=''))
+    except (WorkoutImportError, UnicodeDecodeError, csv.Error) as e:
+        message = str(e) if isinstance(e, WorkoutImportError) else 'CSV 파일을 읽을 수 없습니다. (UTF-8)'
+        return Response({
+            'success': False,
+            'message': message
+        }, status=status.HTTP_400_BAD_REQUEST)
+    except DatabaseError:
+        return Response({
+            'success': False,
+            'message': '데이터베이스 오류가 발생했습니다. 잠시 후 다시 시도해주세요.'
+        }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+
+    return Response({
+        'success': True,
+        'message': f"세트 {result['imported_sets']}개를 가져왔습니다.",
+        'data': result
+    }, status=status.HTTP_200_OK)
+
+# 트레이너 데이 보드
+@extend_schema(
+    summary="트레이너 데이 보드",
+    description="트레이너의 담당 회원 전체의 기간 내 운동 요약을 한 번에 조회합니다. 운동 기록이 없는 회원도 빈 목록으로 포함됩니다.",
+    parameters=[
+        OpenApiParameter(
+            name='start_date',
+            type=OpenApiTypes.DATE,
+            location=OpenApiParameter.QUERY,
+            description='시작 날짜 (YYYY-MM-DD - 기본값: 오늘)',
+            required=False
+        ),
+        OpenApiParameter(
+            name='end_date',
+            type=OpenApiTypes.DATE,
+            location=OpenApiParameter.QUERY,
+            description='종료 날짜 (YYYY-MM-DD - 기본값: 시작 날짜)',
+            required=False
+        ),
+        OpenApiParameter(
+            name='exercises',
+            type=OpenApiTypes.BOOL,
+            location=OpenApiParameter.QUERY,
+            description='운동 항목별 내역 포함 여부 (기본값: false)',
+            required=False
+        )
+    ],
+    responses={
+        200: OpenApiResponse(description="조회 성공"),
+        400: OpenApiResponse(description="잘못된 기간"),
+        401: OpenApiResponse(description="인증 필요"),
+        403: OpenApiResponse(description="트레이너만 조회 가능")
+    },
+    tags=["운동 관리"]
+)
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def trainer_day_board_view(request):
+    if request.user.user_type != 'trainer':
+        return Response({
+            'success': False,
+            'message': '트레이너만 조회할 수 있습니다.'
+        }, status=status.HTTP_403_FORBIDDEN)
+
+    try:
+        start_date = date.fromisoformat(request.query_params['start_date']) \
+            if 'start_date' in request.query_params else timezone.localdate()
+        end_date = date.fromisoformat(request.query_params['end_date']) \
+            if 'end_date' in request.query_params else start_date
+    except ValueError:
+        return Response({
+            'success': False,
+            'message': '날짜는 YYYY-MM-DD 형식이어야 합니다.'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    if end_date < start_date or (end_date - start_date).days >= settings.DAY_BOARD_MAX_DAYS:
+        return Response({
+            'success': False,
+            'message': f'기간은 시작 날짜부터 최대 {settings.DAY_BOARD_MAX_DAYS}일까지 조회할 수 있습니다.'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    include_exercises = request.query_params.get('exercises', '').lower() in ('1', 'true')
+
+    members = WorkoutRecordService.get_trainer_day_board(request.user.id, start_date, end_date, include_exercises)
+    return Response({
+        'success': True,
+        'data': {
+            'start_date': start_date.isoformat(),
+            'end_date': end_date.isoformat(),
+            'members': members,
+            'member_count': len(members)
+        }
+    }, status=status.HTTP_200_OK)
+
+
+# 운동 캘린더 히트맵
+@extend_schema(
+    summary="운동 캘린더 히트맵",
+    description=(
+        "회원의 1년치 운동 여부와 강도를 압축해 반환합니다. "
+        "bitmap은 1월 1일부터 하루 1비트(바이트 내 최상위 비트부터), intensity는 하루 1바이트(세트 수, 최대 255)이며 둘 다 base64입니다. "
+        "ETag/If-None-Match를 지원합니다."
+    ),
+    parameters=[
+        OpenApiParameter(
+            name='year',
+            type=OpenApiTypes.INT,
+            location=OpenApiParameter.QUERY,
+            description='조회할 연도 (기본값: 올해)',
+            required=False
+        )
+    ],
+    responses={
+        200: OpenApiResponse(description="조회 성공"),
+        304: OpenApiResponse(description="변경 없음"),
+        400: OpenApiResponse(description="잘못된 연도"),
+        401: OpenApiResponse(description="인증 필요"),
+        403: OpenApiResponse(description="권한 없음")
+    },
+    tags=["운동 관리"]
+)
+@api_view(['GET'])
+@permission_classes([IsAuthenticated, IsSelfOrAssignedTrainer])
+def member_heatmap_view(request, member_id):
+    try:
+        year = int(request.query_params.get('year', timezone.localdate().year))
+    except ValueError:
+        year = None
+    if year is None or not 1900 <= year <= 2100:
+        return Response({
+            'success': False,
+            'message': 'year는 1900~2100 사이의 숫자여야 합니다.'
+        }, status=status.HTTP_400_BAD_REQUEST)
+
+    heatmap, version = get_heatmap(member_id, year)
+    etag = f'"heatmap-{member_id}-{year}-{version}"'
+    if request.headers.get('If-None-Match') == etag:
+        response = HttpResponseNotModified()
+    else:
+        response = Response({
+            'success': True,
+            'data': heatmap
+        }, status=status.HTTP_200_OK)
+    response['ETag'] = etag
+    # 매번 ETag로 재검증 (세트 변경 시 버전이 바뀜)
+    response['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+# 트레이너별 주간 리더보드
+@extend_schema(
+    summary="주간 리더보드",
+    description="트레이너의 담당 회원 주간 순위를 조회합니다. 트레이너는 상위 N명, 회원은 본인 순위만 조회합니다.",
+    parameters=[
+        OpenApiParameter(
+            name='metric',
+            type=OpenApiTypes.STR,
+            location=OpenApiParameter.QUERY,
+            description='순위 지표 (volume, sessions, calories - 기본값: volume)',
+            required=False
+        ),
+        OpenApiParameter(
+            name='week',
+            type=OpenApiTypes.DATE,
+            location=OpenApiParameter.QUERY,
+            description='조회할 주에 속한 날짜 (YYYY-MM-DD - 기본값: 이번 주)',
+            required=False
+        ),
+        OpenApiParameter(
+            name='limit',
+            type=OpenApiTypes.INT,
+            location=OpenApiParameter.QUERY,
+            description='상위 인원 수 (기본값: 10, 최대 100)',
+            required=False
+        )
+    ],
+    responses={
+        200: OpenApiResponse(description="조회 성공"),
+        400: OpenApiResponse(description="잘못된 파라미터"),
+        401: OpenApiResponse(description="인증 필요")
+    },
+    tags=["운동 관리"]
+)
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def leaderboard_view(request):
+    metric = request.query_params.get('metric', 'volume')
+    if metric not in LEADERBOARD_METRICS:
+        return Response({
+            'success': False,
+            'message': f"지원하지 않는 지표입니다. ({', '.join(LEADERBOARD_METRICS)})"
+        }, status=status.HTTP_400_BAD_REQUEST)
+    try:
+        week = request.query_params.get('week')
+        week_start = get_week_start(week) if week else get_current_week_start()
+        limit = int(request.query_params.get('limit', 0)) or None
+    except ValueError:
+        return Response({
+            'success': False,
+            'message': 'week은 YYYY-MM-DD, limit은 숫자여야 합니다.'
+        }, status=status.HTTP_400_BAD_REQUEST)
+
+    # 트레이너는 담당 회원 상위 N명, 회원은 다른 회원 정보 없이 본인 순위만
+    if request.user.user_type == 'trainer':
+        entries = get_leaderboard(request.user.id, week_start, metric, limit)
+        my_rank = None
+    else:
+        entries = []
+        my_rank = get_member_rank(request.user.id, week_start, metric)
+
+    return Response({
+        'success': True,
+        'data': {
+            'week_start': week_start.isoformat(),
+            'metric': metric,
+            'entries': entries,
+            'my_rank': my_rank
+        }
+    }, status=status.HTTP_200_OK)
+
+
+def _authenticate_live_request(request, member_id):
+    # Authorization 헤더의 JWT 또는 ?ticket= 의 1회용 구독 티켓으로 인증
+    # (EventSource는 헤더를 지정할 수 없음 - 액세스 토큰을 쿼리로 받으면 프록시/접근 로그에 남으므로 티켓만 허용)
+    authentication = JWTAuthentication()
+    header = authentication.get_header(request)
+    if header:
+        raw_token = authentication.get_raw_token(header)
+        if not raw_token:
+            return None
+        try:
+            validated_token = authentication.get_validated_token(raw_token)
+            return authentication.get_user(validated_token)
+        except (InvalidToken, AuthenticationFailed):
+            return None
+
+    ticket = request.GET.get('ticket')
+    user_id = redeem_stream_ticket(ticket, member_id) if ticket else None
+    if user_id is None:
+        return None
+    return get_user_model().objects.filter(id=user_id, is_active=True).first()
+
+
+def _format_sse(event_type, data):
+    return f'event: {event_type}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n'
+
+
+async def _live_event_stream(member_id):
+    # 회원 채널을 구독해 오늘 운동의 세트 이벤트를 전송, 이벤트가 없으면 주기적으로 heartbeat 전송
+    backend = get_live_backend()
+    channel = member_channel(member_id)
+    subscription = backend.subscribe(channel)
+    try:
+        yield f'retry: {settings.WORKOUT_LIVE_RETRY_MS}\n' + _format_sse('ready', {'member_id': member_id})
+
+        while True:
+            try:
+                event = await subscription.get(timeout=settings.WORKOUT_LIVE_HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                yield ': keepalive\n\n'
+                continue
+
+            # 현재(오늘) 운동 기록의 이벤트만 전달
+            if event['workout_date'] != timezone.now().date().isoformat():
+                continue
+            yield _format_sse(event['type'], event)
+
+    finally:
+        # 연결 종료 시 구독 해제
+        backend.unsubscribe(channel, subscription)
+
+
+# 실시간 피드 구독 티켓 발급
+@extend_schema(
+    summary="실시간 피드 구독 티켓 발급",
+    description=(
+        "실시간 운동 피드(SSE) 구독에 사용할 1회용 티켓을 발급합니다. "
+        "티켓은 해당 회원 피드 전용이며 짧은 시간 후 만료됩니다. EventSource로 `live/?ticket=<ticket>`에 접속하세요."
+    ),
+    responses={
+        201: OpenApiResponse(description="발급 성공"),
+        401: OpenApiResponse(description="인증 필요"),
+        403: OpenApiResponse(description="권한 없음")
+    },
+    tags=["운동 관리"]
+)
+@api_view(['POST'])
+@permission_classes([IsAuthenticated, IsSelfOrAssignedTrainer])
+def member_live_ticket_view(request, member_id):
+    ticket = issue_stream_ticket(request.user.id, member_id)
+    return Response({
+        'success': True,
+        'data': {
+            'ticket': ticket,
+            'expires_in': settings.WORKOUT_LIVE_TICKET_TTL
+        }
+    }, status=status.HTTP_201_CREATED)
+
+
+# 실시간 운동 피드 (Server-Sent Events)
+# DRF는 비동기 뷰를 지원하지 않으므로 Django 비동기 뷰로 구현 - ASGI에서 연결당 스레드 없이 대기
+# WSGI에서는 연결마다 워커 스레드를 계속 점유하므로 ASGI 요청만 허용
+async def member_live_feed_view(request, member_id):
+    if request.method != 'GET':
+        return JsonResponse({
+            'success': False,
+            'message': '허용되지 않은 요청 방식입니다.'
+        }, status=status.HTTP_405_METHOD_NOT_ALLOWED)
+
+    if not isinstance(request, ASGIRequest):
+        return JsonResponse({
+            'success': False,
+            'message': '실시간 피드는 ASGI 서버에서만 제공됩니다.'
+        }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+
+    user = await sync_to_async(_authenticate_live_request)(request, member_id)
+    if user is None:
+        return JsonResponse({
+            'success': False,
+            'message': '인증이 필요합니다.'
+        }, status=status.HTTP_401_UNAUTHORIZED)
+
+    if not await sync_to_async(can_access_member)(user, member_id):
+        return JsonResponse({
+            'success': False,
+            'message': '해당 회원의 운동 기록에 접근할 권한이 없습니다.'
+        }, status=status.HTTP_403_FORBIDDEN)
+
+    response = StreamingHttpResponse(_live_event_stream(member_id), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'  # 프록시 버퍼링 비활성화
+    return response